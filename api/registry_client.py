@@ -11,15 +11,21 @@ Authentication is handled via JWT tokens retrieved from AWS SSM Parameter Store
 the get-m2m-token.sh script.
 """
 
+import asyncio
 import json
 import logging
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, TypeVar
 from urllib.parse import quote
 
+import httpx
 import requests
 from pydantic import BaseModel, ConfigDict, Field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +35,114 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Constants
+DEFAULT_TIMEOUT_SECONDS = 120
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_POOL_SIZE = 20
+DEFAULT_BATCH_CONCURRENCY = 10
+
+# Only idempotent requests are retried automatically; a retried POST could
+# register or toggle something twice
+RETRY_ALLOWED_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = (502, 503, 504)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _uses_json_body(
+    endpoint: str,
+) -> bool:
+    """
+    Determine whether an endpoint expects a JSON body instead of form data.
+
+    Agent, Management, Search, Federation, Skills, Virtual Servers, version, and
+    group import endpoints use JSON. Server registration uses form data.
+
+    Args:
+        endpoint: API endpoint path
+
+    Returns:
+        True if the request body should be sent as JSON
+    """
+    return (
+        endpoint.startswith("/api/agents")
+        or endpoint.startswith("/api/management")
+        or endpoint.startswith("/api/search")
+        or endpoint.startswith("/api/federation")
+        or endpoint.startswith("/api/peers")
+        or endpoint.startswith("/api/skills")
+        or endpoint.startswith("/api/virtual-servers")
+        or endpoint == "/api/servers/groups/import"
+        or "/auth-credential" in endpoint
+        or "/versions" in endpoint
+    )
+
+
+def _registration_form_data(
+    registration: "InternalServiceRegistration",
+) -> dict[str, Any]:
+    """
+    Convert a service registration into the form fields the register endpoint expects.
+
+    Args:
+        registration: Service registration data
+
+    Returns:
+        Form data with tags joined by commas and metadata encoded as JSON
+    """
+    data = registration.model_dump(exclude_none=True, by_alias=True)
+
+    # Convert tags list to comma-separated string for form encoding
+    if "tags" in data and isinstance(data["tags"], list):
+        data["tags"] = ",".join(data["tags"])
+
+    # Convert metadata dict to JSON string for form encoding
+    if "metadata" in data and isinstance(data["metadata"], dict):
+        data["metadata"] = json.dumps(data["metadata"])
+
+    return data
+
+
+def _create_session(
+    max_retries: int,
+    pool_size: int,
+) -> requests.Session:
+    """
+    Create a requests session with connection pooling and retries.
+
+    Args:
+        max_retries: Retries for connection errors and 502/503/504 responses
+        pool_size: Number of keep-alive connections kept per host
+
+    Returns:
+        Configured session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _log_validation_error(
+    response: requests.Response | httpx.Response,
+) -> None:
+    """Log the validation details of a 422 response, if it has a JSON body."""
+    try:
+        error_detail = response.json()
+        logger.error(f"Validation error details: {json.dumps(error_detail, indent=2)}")
+    except Exception as e:
+        logger.warning(f"Could not parse 422 error response as JSON: {e}")
+
+
 class HealthStatus(str, Enum):
     """Health status enumeration for servers."""
 
@@ -1227,18 +1341,32 @@ class RegistryClient:
     - Management API: IAM/user management, M2M accounts, user CRUD operations
 
     Authentication is handled via JWT tokens passed to the constructor.
+
+    Requests share one keep-alive session. Idempotent requests are retried on
+    connection errors and 502/503/504 responses. The client can be used as a
+    context manager to close the session when done.
     """
 
-    def __init__(self, registry_url: str, token: str):
+    def __init__(
+        self,
+        registry_url: str,
+        token: str,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ):
         """
         Initialize the Registry Client.
 
         Args:
             registry_url: Base URL of the registry (e.g., https://registry.mycorp.click)
             token: JWT access token for authentication
+            max_retries: Retries for idempotent requests on transient failures
+            pool_size: Number of keep-alive connections to the registry
         """
         self.registry_url = registry_url.rstrip("/")
         self._token = token
+        self._session = _create_session(max_retries=max_retries, pool_size=pool_size)
+        self._pool_size = pool_size
 
         # Redact token in logs - show only first 8 characters
         redacted_token = f"{token[:8]}..." if len(token) > 8 else "***"
@@ -1253,6 +1381,16 @@ class RegistryClient:
         """
         return {"Authorization": f"Bearer {self._token}"}
 
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "RegistryClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def _make_request(
         self,
         method: str,
@@ -1281,43 +1419,133 @@ class RegistryClient:
         logger.debug(f"{method} {url}")
 
         # Determine content type based on endpoint
-        # Agent, Management, Search, Federation, Skills, Virtual Servers, version, and group import endpoints use JSON
-        # Server registration uses form data
-        if (
-            endpoint.startswith("/api/agents")
-            or endpoint.startswith("/api/management")
-            or endpoint.startswith("/api/search")
-            or endpoint.startswith("/api/federation")
-            or endpoint.startswith("/api/peers")
-            or endpoint.startswith("/api/skills")
-            or endpoint.startswith("/api/virtual-servers")
-            or endpoint == "/api/servers/groups/import"
-            or "/auth-credential" in endpoint
-            or "/versions" in endpoint
-        ):
+        if _uses_json_body(endpoint):
             # Send as JSON for agent, management, search, federation, and import endpoints
-            response = requests.request(
-                method=method, url=url, headers=headers, json=data, params=params, timeout=120
+            response = self._session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=data,
+                params=params,
+                timeout=DEFAULT_TIMEOUT_SECONDS,
             )
         else:
             # Send as form-encoded for server registration
-            response = requests.request(
-                method=method, url=url, headers=headers, data=data, params=params, timeout=120
+            response = self._session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                data=data,
+                params=params,
+                timeout=DEFAULT_TIMEOUT_SECONDS,
             )
 
         try:
             response.raise_for_status()
-        except requests.HTTPError as e:
+        except requests.HTTPError:
             # For 422 errors, try to extract validation details
             if response.status_code == 422:
-                try:
-                    error_detail = response.json()
-                    logger.error(f"Validation error details: {json.dumps(error_detail, indent=2)}")
-                except Exception as e:
-                    logger.warning(f"Could not parse 422 error response as JSON: {e}")
+                _log_validation_error(response)
             raise
         return response
 
+    def _run_batch(
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        max_concurrency: int,
+    ) -> list[R | Exception]:
+        """
+        Call func for each item on a bounded thread pool sharing this client's session.
+
+        Args:
+            func: Function to call for each item
+            items: Items to process
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            Results in input order; a failed call yields its exception instead
+        """
+        items = list(items)
+        workers = max(1, min(max_concurrency, self._pool_size, len(items) or 1))
+
+        def _call(item: T) -> R | Exception:
+            try:
+                return func(item)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_call, items))
+
+    def bulk_register_services(
+        self,
+        registrations: Iterable[InternalServiceRegistration],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[ServiceResponse | Exception]:
+        """
+        Register many services concurrently.
+
+        Args:
+            registrations: Service registration data
+            max_concurrency: Maximum number of registrations in flight
+
+        Returns:
+            Service responses in input order; failed registrations yield their exception
+        """
+        return self._run_batch(self.register_service, registrations, max_concurrency)
+
+    def bulk_toggle_services(
+        self,
+        service_paths: Iterable[str],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[ToggleResponse | Exception]:
+        """
+        Toggle many services concurrently.
+
+        Args:
+            service_paths: Paths of services to toggle
+            max_concurrency: Maximum number of toggles in flight
+
+        Returns:
+            Toggle responses in input order; failed toggles yield their exception
+        """
+        return self._run_batch(self.toggle_service, service_paths, max_concurrency)
+
+    def get_many_agents(
+        self,
+        paths: Iterable[str],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[AgentDetail | Exception]:
+        """
+        Get details for many agents concurrently.
+
+        Args:
+            paths: Agent paths
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            Agent details in input order; failed lookups yield their exception
+        """
+        return self._run_batch(self.get_agent, paths, max_concurrency)
+
+    def get_many_skills(
+        self,
+        paths: Iterable[str],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[SkillCard | Exception]:
+        """
+        Get details for many skills concurrently.
+
+        Args:
+            paths: Skill paths or names
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            Skill cards in input order; failed lookups yield their exception
+        """
+        return self._run_batch(self.get_skill, paths, max_concurrency)
+
     def register_service(self, registration: InternalServiceRegistration) -> ServiceResponse:
         """
         Register a new service in the registry.
@@ -1333,16 +1561,7 @@ class RegistryClient:
         """
         logger.info(f"Registering service: {registration.service_path}")
 
-        # Convert model to dict
-        data = registration.model_dump(exclude_none=True, by_alias=True)
-
-        # Convert tags list to comma-separated string for form encoding
-        if "tags" in data and isinstance(data["tags"], list):
-            data["tags"] = ",".join(data["tags"])
-
-        # Convert metadata dict to JSON string for form encoding
-        if "metadata" in data and isinstance(data["metadata"], dict):
-            data["metadata"] = json.dumps(data["metadata"])
+        data = _registration_form_data(registration)
 
         response = self._make_request(method="POST", endpoint="/api/servers/register", data=data)
 
@@ -1459,6 +1678,27 @@ class RegistryClient:
             logger.error(f"Raw response data: {json.dumps(response_data, indent=2, default=str)}")
             raise
 
+    def list_services_with_tools(self) -> list[dict[str, Any]]:
+        """
+        List all services in the registry including their tool lists.
+
+        Unlike list_services(), the raw server documents are returned, so
+        fields such as tool_list are kept.
+
+        Returns:
+            Server documents as returned by /api/servers
+
+        Raises:
+            requests.HTTPError: If list operation fails
+        """
+        logger.info("Listing all services with tool lists")
+
+        response = self._make_request(method="GET", endpoint="/api/servers")
+
+        servers = response.json().get("servers", [])
+        logger.info(f"Retrieved {len(servers)} services")
+        return servers
+
     def healthcheck(self) -> dict[str, Any]:
         """
         Perform health check on all services.
@@ -3645,6 +3885,457 @@ class RegistryClient:
         return result
 
 
+class AsyncRegistryClient:
+    """
+    Asynchronous MCP Gateway Registry API client built on httpx.
+
+    Mirrors the RegistryClient methods used by bulk tooling (server registration,
+    removal, toggling and listing, agent and skill lookup and toggling) and adds
+    batch helpers that run many requests with bounded concurrency over one
+    connection pool. Other endpoints are available on RegistryClient.
+
+    Use as an async context manager, or call close() when done.
+    """
+
+    def __init__(
+        self,
+        registry_url: str,
+        token: str,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ):
+        """
+        Initialize the async Registry Client.
+
+        Args:
+            registry_url: Base URL of the registry (e.g., https://registry.mycorp.click)
+            token: JWT access token for authentication
+            max_retries: Retries for failed connection attempts
+            pool_size: Maximum number of connections to the registry
+        """
+        self.registry_url = registry_url.rstrip("/")
+        self._token = token
+        self._client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=max_retries),
+        )
+
+        # Redact token in logs - show only first 8 characters
+        redacted_token = f"{token[:8]}..." if len(token) > 8 else "***"
+        logger.info(
+            f"Initialized AsyncRegistryClient for {self.registry_url} (token: {redacted_token})"
+        )
+
+    def _get_headers(self) -> dict[str, str]:
+        """
+        Get request headers with JWT token.
+
+        Returns:
+            Dictionary of HTTP headers
+        """
+        return {"Authorization": f"Bearer {self._token}"}
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncRegistryClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """
+        Make HTTP request to the Registry API.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data (sent as form-encoded for server endpoints)
+            params: Query parameters
+
+        Returns:
+            Response object
+
+        Raises:
+            httpx.HTTPStatusError: If request fails
+        """
+        url = f"{self.registry_url}{endpoint}"
+        logger.debug(f"{method} {url}")
+
+        if _uses_json_body(endpoint):
+            response = await self._client.request(
+                method, url, headers=self._get_headers(), json=data, params=params
+            )
+        else:
+            response = await self._client.request(
+                method, url, headers=self._get_headers(), data=data, params=params
+            )
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            if response.status_code == 422:
+                _log_validation_error(response)
+            raise
+        return response
+
+    async def _run_batch(
+        self,
+        func: Callable[[T], Awaitable[R]],
+        items: Iterable[T],
+        max_concurrency: int,
+    ) -> list[R | Exception]:
+        """
+        Await func for each item with at most max_concurrency calls in flight.
+
+        Args:
+            func: Coroutine function to call for each item
+            items: Items to process
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            Results in input order; a failed call yields its exception instead
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _call(item: T) -> R | Exception:
+            async with semaphore:
+                try:
+                    return await func(item)
+                except Exception as e:
+                    return e
+
+        return await asyncio.gather(*(_call(item) for item in items))
+
+    async def register_service(
+        self,
+        registration: InternalServiceRegistration,
+    ) -> ServiceResponse:
+        """
+        Register a new service in the registry.
+
+        Args:
+            registration: Service registration data
+
+        Returns:
+            Service response with registration details
+
+        Raises:
+            httpx.HTTPStatusError: If registration fails
+        """
+        logger.info(f"Registering service: {registration.service_path}")
+
+        response = await self._make_request(
+            method="POST",
+            endpoint="/api/servers/register",
+            data=_registration_form_data(registration),
+        )
+
+        logger.info(f"Service registered successfully: {registration.service_path}")
+        return ServiceResponse(**response.json())
+
+    async def remove_service(
+        self,
+        service_path: str,
+    ) -> dict[str, Any]:
+        """
+        Remove a service from the registry.
+
+        Args:
+            service_path: Path of service to remove
+
+        Returns:
+            Response data
+
+        Raises:
+            httpx.HTTPStatusError: If removal fails
+        """
+        logger.info(f"Removing service: {service_path}")
+
+        response = await self._make_request(
+            method="POST", endpoint="/api/servers/remove", data={"path": service_path}
+        )
+
+        logger.info(f"Service removed successfully: {service_path}")
+        return response.json()
+
+    async def toggle_service(
+        self,
+        service_path: str,
+    ) -> ToggleResponse:
+        """
+        Toggle service enabled/disabled status.
+
+        Args:
+            service_path: Path of service to toggle
+
+        Returns:
+            Toggle response with current status
+
+        Raises:
+            httpx.HTTPStatusError: If toggle fails
+        """
+        logger.info(f"Toggling service: {service_path}")
+
+        response = await self._make_request(
+            method="POST", endpoint="/api/servers/toggle", data={"service_path": service_path}
+        )
+
+        result = ToggleResponse(**response.json())
+        logger.info(f"Service toggled: {service_path} -> enabled={result.is_enabled}")
+        return result
+
+    async def list_services(self) -> ServerListResponse:
+        """
+        List all services in the registry.
+
+        Returns:
+            Server list response
+
+        Raises:
+            httpx.HTTPStatusError: If list operation fails
+        """
+        logger.info("Listing all services")
+
+        response = await self._make_request(method="GET", endpoint="/api/servers")
+
+        result = ServerListResponse(**response.json())
+        logger.info(f"Retrieved {len(result.servers)} services")
+        return result
+
+    async def healthcheck(self) -> dict[str, Any]:
+        """
+        Perform health check on all services.
+
+        Returns:
+            Health check response with service statuses
+
+        Raises:
+            httpx.HTTPStatusError: If health check fails
+        """
+        logger.info("Performing health check on all services")
+
+        response = await self._make_request(method="GET", endpoint="/api/servers/health")
+
+        result = response.json()
+        logger.info(f"Health check completed: {result.get('status', 'unknown')}")
+        return result
+
+    async def anthropic_list_servers(
+        self,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> AnthropicServerList:
+        """
+        List all MCP servers using the Anthropic Registry API format (v0.1).
+
+        Args:
+            cursor: Pagination cursor (opaque string from previous response)
+            limit: Maximum number of results per page (default: 100, max: 1000)
+
+        Returns:
+            Anthropic ServerList with servers and pagination metadata
+
+        Raises:
+            httpx.HTTPStatusError: If list operation fails
+        """
+        logger.info("Listing servers via Anthropic Registry API (v0.1)")
+
+        params = {}
+        if cursor:
+            params["cursor"] = cursor
+        if limit:
+            params["limit"] = limit
+
+        response = await self._make_request(method="GET", endpoint="/v0.1/servers", params=params)
+
+        result = AnthropicServerList(**response.json())
+        logger.info(f"Retrieved {len(result.servers)} servers via Anthropic API")
+        return result
+
+    async def get_agent(
+        self,
+        path: str,
+    ) -> AgentDetail:
+        """
+        Get detailed information about a specific agent.
+
+        Args:
+            path: Agent path (e.g., /code-reviewer)
+
+        Returns:
+            Agent detail
+
+        Raises:
+            httpx.HTTPStatusError: If agent not found (404) or unauthorized (403)
+        """
+        logger.info(f"Getting agent details: {path}")
+
+        response = await self._make_request(method="GET", endpoint=f"/api/agents{path}")
+
+        result = AgentDetail(**response.json())
+        logger.info(f"Retrieved agent details: {path}")
+        return result
+
+    async def toggle_agent(
+        self,
+        path: str,
+        enabled: bool,
+    ) -> AgentToggleResponse:
+        """
+        Toggle agent enabled/disabled status.
+
+        Args:
+            path: Agent path
+            enabled: True to enable, False to disable
+
+        Returns:
+            Agent toggle response
+
+        Raises:
+            httpx.HTTPStatusError: If toggle fails (404 for not found, 403 for permission denied)
+        """
+        logger.info(f"Toggling agent {path} to {'enabled' if enabled else 'disabled'}")
+
+        response = await self._make_request(
+            method="POST",
+            endpoint=f"/api/agents{path}/toggle",
+            params={"enabled": str(enabled).lower()},
+        )
+
+        return AgentToggleResponse(**response.json())
+
+    async def get_skill(
+        self,
+        path: str,
+    ) -> SkillCard:
+        """
+        Get details for a specific skill.
+
+        Args:
+            path: Skill path or name
+
+        Returns:
+            SkillCard with skill details
+
+        Raises:
+            httpx.HTTPStatusError: If skill not found (404)
+        """
+        api_path = path.replace("/skills/", "/") if path.startswith("/skills/") else f"/{path}"
+        logger.info(f"Getting skill: {api_path}")
+
+        response = await self._make_request(method="GET", endpoint=f"/api/skills{api_path}")
+
+        return SkillCard(**response.json())
+
+    async def toggle_skill(
+        self,
+        path: str,
+        enabled: bool,
+    ) -> SkillToggleResponse:
+        """
+        Toggle skill enabled/disabled state.
+
+        Args:
+            path: Skill path or name
+            enabled: New enabled state
+
+        Returns:
+            SkillToggleResponse with new state
+
+        Raises:
+            httpx.HTTPStatusError: If skill not found (404)
+        """
+        api_path = path.replace("/skills/", "/") if path.startswith("/skills/") else f"/{path}"
+        logger.info(f"Toggling skill {api_path} to enabled={enabled}")
+
+        response = await self._make_request(
+            method="POST", endpoint=f"/api/skills{api_path}/toggle", data={"enabled": enabled}
+        )
+
+        return SkillToggleResponse(**response.json())
+
+    async def bulk_register_services(
+        self,
+        registrations: Iterable[InternalServiceRegistration],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[ServiceResponse | Exception]:
+        """
+        Register many services concurrently.
+
+        Args:
+            registrations: Service registration data
+            max_concurrency: Maximum number of registrations in flight
+
+        Returns:
+            Service responses in input order; failed registrations yield their exception
+        """
+        return await self._run_batch(self.register_service, registrations, max_concurrency)
+
+    async def bulk_toggle_services(
+        self,
+        service_paths: Iterable[str],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[ToggleResponse | Exception]:
+        """
+        Toggle many services concurrently.
+
+        Args:
+            service_paths: Paths of services to toggle
+            max_concurrency: Maximum number of toggles in flight
+
+        Returns:
+            Toggle responses in input order; failed toggles yield their exception
+        """
+        return await self._run_batch(self.toggle_service, service_paths, max_concurrency)
+
+    async def get_many_agents(
+        self,
+        paths: Iterable[str],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[AgentDetail | Exception]:
+        """
+        Get details for many agents concurrently.
+
+        Args:
+            paths: Agent paths
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            Agent details in input order; failed lookups yield their exception
+        """
+        return await self._run_batch(self.get_agent, paths, max_concurrency)
+
+    async def get_many_skills(
+        self,
+        paths: Iterable[str],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[SkillCard | Exception]:
+        """
+        Get details for many skills concurrently.
+
+        Args:
+            paths: Skill paths or names
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            Skill cards in input order; failed lookups yield their exception
+        """
+        return await self._run_batch(self.get_skill, paths, max_concurrency)
+
+
 def _format_tool_result(
     tool: ToolSearchResult,
 ) -> dict[str, Any]:
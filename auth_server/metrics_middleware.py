@@ -8,28 +8,27 @@ This middleware automatically tracks detailed authentication metrics including:
 - Error analysis with specific reasons
 """
 
-import asyncio
 import hashlib
 import json
 import logging
 import os
 import time
 import uuid
-from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
-# Import metrics client - use HTTP API instead of local import
-import httpx
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from registry.metrics.emitter import get_metrics_emitter
+from registry.middleware.request_context import bind_request_context
 
 logger = logging.getLogger(__name__)
 
 
-class AuthMetricsMiddleware(BaseHTTPMiddleware):
+class AuthMetricsMiddleware:
     """
-    Comprehensive middleware to collect detailed authentication and tool execution metrics.
+    Comprehensive pure ASGI middleware to collect detailed authentication and tool execution metrics.
 
     Tracks:
     - Authentication flow with detailed validation steps
@@ -39,12 +38,17 @@ class AuthMetricsMiddleware(BaseHTTPMiddleware):
     - User activity patterns (hashed for privacy)
     """
 
-    def __init__(self, app, service_name: str = "auth-server"):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, service_name: str = "auth-server"):
+        self.app = app
         self.service_name = service_name
         self.metrics_url = os.getenv("METRICS_SERVICE_URL", "http://localhost:8890")
         self.api_key = os.getenv("METRICS_API_KEY", "")
-        self.client = httpx.AsyncClient(timeout=5.0)
+        # Metrics are queued and sent in batches by a background flusher
+        self.emitter = get_metrics_emitter(
+            service_name=service_name,
+            metrics_url=self.metrics_url,
+            api_key=self.api_key,
+        )
 
         # Track request contexts for detailed metrics
         self.request_contexts: dict[str, dict[str, Any]] = {}
@@ -158,16 +162,19 @@ class AuthMetricsMiddleware(BaseHTTPMiddleware):
 
         return tool_info
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and collect comprehensive metrics.
         """
         # Skip metrics collection for non-validation endpoints
-        if not request.url.path.startswith("/validate"):
-            return await call_next(request)
+        if scope["type"] != "http" or not scope["path"].startswith("/validate"):
+            await self.app(scope, receive, send)
+            return
 
-        # Start timing and generate request ID
-        start_time = time.perf_counter()
+        context, send = bind_request_context(scope, send)
+        request = context.request
+
+        # Generate request ID; timing starts when the context is created
         current_timestamp = time.time()
         request_id = f"req_{uuid.uuid4().hex[:16]}"
 
@@ -176,31 +183,34 @@ class AuthMetricsMiddleware(BaseHTTPMiddleware):
         user_hash = ""
         auth_method = "unknown"
         tool_info = {}
+        session_key = None
+        method = "unknown"
 
         # Extract server name from original URL header
-        original_url = request.headers.get("X-Original-URL")
+        original_url = context.headers.get("X-Original-URL")
         if original_url:
             server_name = self.extract_server_name_from_url(original_url)
 
         # Extract detailed tool/method information
         tool_info = await self.extract_tool_and_method_info(request)
 
-        # Process the request
-        response = None
+        # Process the request; status and headers are captured by the shared context
         success = False
         error_code = None
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send)
 
             # Determine success based on response status
-            success = response.status_code == 200
+            status_code = context.status_code or 500
+            success = status_code == 200
 
             if success:
                 # Extract user info from response headers if available
-                username = response.headers.get("X-Username", "")
+                response_headers = context.response_headers
+                username = response_headers.get("X-Username", "")
                 user_hash = self.hash_username(username)
-                auth_method = response.headers.get("X-Auth-Method", "unknown")
+                auth_method = response_headers.get("X-Auth-Method", "unknown")
 
                 # Track session timing for protocol flow analysis
                 session_key = (
@@ -221,7 +231,7 @@ class AuthMetricsMiddleware(BaseHTTPMiddleware):
                 if method == "initialize" and tool_info.get("client_info"):
                     self.session_client_info[session_key] = tool_info["client_info"]
             else:
-                error_code = str(response.status_code)
+                error_code = str(status_code)
                 session_key = f"{server_name}:anonymous"
 
         except Exception as e:
@@ -233,52 +243,43 @@ class AuthMetricsMiddleware(BaseHTTPMiddleware):
             raise
 
         finally:
-            # Calculate duration
-            duration_ms = (time.perf_counter() - start_time) * 1000
+            duration_ms = context.duration_ms
 
-            # Emit comprehensive metrics asynchronously (fire and forget)
+            # Queue comprehensive metrics on the batching emitter (no I/O here)
             # 1. Main auth metric
-            asyncio.create_task(
-                self._emit_auth_metric(
+            await self._emit_auth_metric(
+                success=success,
+                method=auth_method,
+                duration_ms=duration_ms,
+                server_name=server_name,
+                user_hash=user_hash,
+                error_code=error_code,
+                request_id=request_id,
+            )
+
+            # 2. Tool execution metric (if applicable)
+            if tool_info.get("method") and tool_info["method"] != "unknown":
+                await self._emit_tool_execution_metric(
+                    tool_info=tool_info,
+                    server_name=server_name,
                     success=success,
-                    method=auth_method,
                     duration_ms=duration_ms,
-                    server_name=server_name,
                     user_hash=user_hash,
                     error_code=error_code,
                     request_id=request_id,
-                )
-            )
-
-            # 2. Tool execution metric (if applicable)
-            if tool_info.get("method") and tool_info["method"] != "unknown":
-                asyncio.create_task(
-                    self._emit_tool_execution_metric(
-                        tool_info=tool_info,
-                        server_name=server_name,
-                        success=success,
-                        duration_ms=duration_ms,
-                        user_hash=user_hash,
-                        error_code=error_code,
-                        request_id=request_id,
-                        auth_method=auth_method,
-                    )
+                    auth_method=auth_method,
                 )
 
             # 3. Protocol flow latency metric (if we can calculate it)
             if success and session_key in self.session_timings:
-                asyncio.create_task(
-                    self._emit_protocol_latency_metric(
-                        session_key=session_key,
-                        current_method=method,
-                        server_name=server_name,
-                        user_hash=user_hash,
-                        request_id=request_id,
-                    )
+                await self._emit_protocol_latency_metric(
+                    session_key=session_key,
+                    current_method=method,
+                    server_name=server_name,
+                    user_hash=user_hash,
+                    request_id=request_id,
                 )
 
-        return response
-
     async def _emit_auth_metric(
         self,
         success: bool,
@@ -290,37 +291,29 @@ class AuthMetricsMiddleware(BaseHTTPMiddleware):
         request_id: str = None,
     ):
         """
-        Emit authentication metric asynchronously.
+        Queue authentication metric for the next batch.
         """
         try:
             if not self.api_key:
                 return
 
-            payload = {
-                "service": self.service_name,
-                "version": "1.0.0",
-                "metrics": [
-                    {
-                        "type": "auth_request",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "value": 1.0,
-                        "duration_ms": duration_ms,
-                        "dimensions": {
-                            "success": success,
-                            "method": method,
-                            "server": server_name,
-                            "user_hash": user_hash,
-                        },
-                        "metadata": {
-                            "error_code": error_code,
-                            "request_id": request_id or f"req_{uuid.uuid4().hex[:16]}",
-                        },
-                    }
-                ],
-            }
-
-            await self.client.post(
-                f"{self.metrics_url}/metrics", json=payload, headers={"X-API-Key": self.api_key}
+            self.emitter.enqueue(
+                {
+                    "type": "auth_request",
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "value": 1.0,
+                    "duration_ms": duration_ms,
+                    "dimensions": {
+                        "success": success,
+                        "method": method,
+                        "server": server_name,
+                        "user_hash": user_hash,
+                    },
+                    "metadata": {
+                        "error_code": error_code,
+                        "request_id": request_id or f"req_{uuid.uuid4().hex[:16]}",
+                    },
+                }
             )
         except Exception as e:
             logger.debug(f"Failed to emit auth metric: {e}")
@@ -386,11 +379,7 @@ class AuthMetricsMiddleware(BaseHTTPMiddleware):
                 },
             }
 
-            payload = {"service": self.service_name, "version": "1.0.0", "metrics": [metric_data]}
-
-            await self.client.post(
-                f"{self.metrics_url}/metrics", json=payload, headers={"X-API-Key": self.api_key}
-            )
+            self.emitter.enqueue(metric_data)
         except Exception as e:
             logger.debug(f"Failed to emit tool execution metric: {e}")
 
@@ -491,17 +480,9 @@ class AuthMetricsMiddleware(BaseHTTPMiddleware):
                         }
                     )
 
-            # Emit metrics if we have any
-            if latency_metrics:
-                payload = {
-                    "service": self.service_name,
-                    "version": "1.0.0",
-                    "metrics": latency_metrics,
-                }
-
-                await self.client.post(
-                    f"{self.metrics_url}/metrics", json=payload, headers={"X-API-Key": self.api_key}
-                )
+            # Queue metrics if we have any
+            for latency_metric in latency_metrics:
+                self.emitter.enqueue(latency_metric)
 
             # Cleanup is now handled by _cleanup_sessions_if_needed method
 
@@ -23,7 +23,6 @@ from typing import Any
 from urllib.parse import urlparse
 
 import boto3
-import httpx
 import jwt
 import requests
 import uvicorn
@@ -48,6 +47,8 @@ from registry.audit.models import Identity, MCPServer
 from registry.audit.service import AuditLogger
 from registry.common.scopes_loader import reload_scopes_config
 from registry.core.config import settings
+from registry.core.http_clients import CLIENT_IDP, get_http_client, http_clients
+from registry.metrics.emitter import shutdown_metrics_emitters
 from registry.repositories.factory import get_scope_repository
 from registry.utils.request_utils import get_client_ip
 
@@ -657,10 +658,15 @@ async def lifespan(app: FastAPI):
         # Fall back to empty config
         SCOPES_CONFIG = {"group_mappings": {}}
 
+    # Pooled clients for OAuth2 token and userinfo calls to identity providers
+    http_clients.startup()
+
     yield
 
-    # Shutdown: Add cleanup code here if needed in the future
+    # Shutdown: send any metrics still queued for the metrics service
     logger.info("Shutting down auth server")
+    await shutdown_metrics_emitters()
+    await http_clients.aclose()
 
 
 # Create FastAPI app
@@ -2702,32 +2708,32 @@ async def exchange_code_for_token(
             os.environ.get("AUTH_SERVER_URL", "http://localhost:8888").rstrip("/") + ROOT_PATH
         )
 
-    async with httpx.AsyncClient() as client:
-        token_data = {
-            "grant_type": provider_config["grant_type"],
-            "client_id": provider_config["client_id"],
-            "client_secret": provider_config["client_secret"],
-            "code": code,
-            "redirect_uri": f"{auth_server_url}/oauth2/callback/{provider}",
-        }
+    client = get_http_client(CLIENT_IDP)
+    token_data = {
+        "grant_type": provider_config["grant_type"],
+        "client_id": provider_config["client_id"],
+        "client_secret": provider_config["client_secret"],
+        "code": code,
+        "redirect_uri": f"{auth_server_url}/oauth2/callback/{provider}",
+    }
 
-        headers = {"Accept": "application/json"}
-        if provider == "github":
-            headers["Accept"] = "application/json"
+    headers = {"Accept": "application/json"}
+    if provider == "github":
+        headers["Accept"] = "application/json"
 
-        response = await client.post(provider_config["token_url"], data=token_data, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    response = await client.post(provider_config["token_url"], data=token_data, headers=headers)
+    response.raise_for_status()
+    return response.json()
 
 
 async def get_user_info(access_token: str, provider_config: dict) -> dict:
     """Get user information from OAuth2 provider"""
-    async with httpx.AsyncClient() as client:
-        headers = {"Authorization": f"Bearer {access_token}"}
+    client = get_http_client(CLIENT_IDP)
+    headers = {"Authorization": f"Bearer {access_token}"}
 
-        response = await client.get(provider_config["user_info_url"], headers=headers)
-        response.raise_for_status()
-        return response.json()
+    response = await client.get(provider_config["user_info_url"], headers=headers)
+    response.raise_for_status()
+    return response.json()
 
 
 def map_user_info(user_info: dict, provider_config: dict) -> dict:
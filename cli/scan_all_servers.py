@@ -12,24 +12,32 @@ Usage:
     uv run python cli/scan_all_servers.py --base-url http://localhost
     uv run python cli/scan_all_servers.py --analyzers yara,llm
     uv run python cli/scan_all_servers.py --token-file .oauth-tokens/ingress.json
+    uv run python cli/scan_all_servers.py --workers 8 --timeout 600
 """
 
 import argparse
+import hashlib
 import json
 import logging
 import subprocess  # nosec B404
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-# Add project root to path to import registry client
+# Add project root to path to import registry client and registry utilities
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 sys.path.insert(0, str(PROJECT_ROOT / "api"))
+sys.path.insert(0, str(PROJECT_ROOT))
 
 from registry_client import RegistryClient
 
+from registry.utils.tool_hash import compute_tool_list_hash
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -42,10 +50,118 @@ logger = logging.getLogger(__name__)
 DEFAULT_TOKEN_FILE = PROJECT_ROOT / ".oauth-tokens" / "ingress.json"
 DEFAULT_BASE_URL = "http://localhost"
 DEFAULT_ANALYZERS = "yara"
+DEFAULT_WORKERS = 4
+DEFAULT_SCAN_TIMEOUT = 300
+DEFAULT_CACHE_TTL_HOURS = 24
+SCAN_CACHE_FILE = PROJECT_ROOT / "security_scans" / ".scan_cache.json"
+
+# Scanner processes currently running in worker threads, terminated on Ctrl+C
+_active_scans: set[subprocess.Popen] = set()
+_active_scans_lock = threading.Lock()
+
+
+def _terminate_active_scans() -> None:
+    """Terminate every scanner subprocess that is still running."""
+    with _active_scans_lock:
+        processes = list(_active_scans)
+    for process in processes:
+        if process.poll() is None:
+            logger.warning(f"Terminating scanner process {process.pid}")
+            process.terminate()
+
+
+def _scan_cache_key(server_url: str, tool_list_hash: str, analyzers: str) -> str:
+    """Build the cache key for a scan of one server with one set of analyzers."""
+    return hashlib.sha256(f"{server_url}|{tool_list_hash}|{analyzers}".encode()).hexdigest()
+
+
+def _load_scan_cache() -> dict[str, Any]:
+    """Load cached scan results from disk, returning an empty cache on any error."""
+    if not SCAN_CACHE_FILE.exists():
+        return {}
+    try:
+        with open(SCAN_CACHE_FILE) as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable scan cache {SCAN_CACHE_FILE}: {e}")
+        return {}
+
+
+def _save_scan_cache(cache: dict[str, Any]) -> None:
+    """Write cached scan results to disk."""
+    try:
+        SCAN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = SCAN_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(cache, f, indent=2)
+        tmp_file.replace(SCAN_CACHE_FILE)
+    except Exception as e:
+        logger.warning(f"Failed to save scan cache: {e}")
+
+
+def _fetch_tool_list_hashes(client: RegistryClient) -> dict[str, str]:
+    """Get a tool-list hash for every server path known to the registry.
+
+    The Anthropic v0.1 listing only carries tool counts, so the full tool lists
+    come from the registry's /api/servers endpoint.
+
+    Args:
+        client: Registry client
+
+    Returns:
+        Mapping of server path to tool-list hash (servers without tools are omitted)
+    """
+    try:
+        servers = client.list_services_with_tools()
+    except Exception as e:
+        logger.warning(f"Could not fetch tool lists, result cache disabled for this run: {e}")
+        return {}
+
+    hashes = {}
+    for server in servers:
+        tool_list_hash = compute_tool_list_hash(server.get("tool_list"))
+        if server.get("path") and tool_list_hash:
+            hashes[server["path"].rstrip("/")] = tool_list_hash
+    return hashes
+
+
+def _run_scanner_process(
+    cmd: list[str],
+    timeout: int | None,
+) -> subprocess.CompletedProcess:
+    """Run the scanner, tracking the process so an interrupt can terminate it.
+
+    Raises:
+        subprocess.TimeoutExpired: If the scanner runs longer than timeout;
+            the process is killed before raising
+    """
+    process = subprocess.Popen(  # nosec B603 - internal script invoked via uv run with validated args
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=str(PROJECT_ROOT),
+    )
+    with _active_scans_lock:
+        _active_scans.add(process)
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        raise
+    finally:
+        with _active_scans_lock:
+            _active_scans.discard(process)
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
 
 
 def _run_security_scan(
-    server_url: str, analyzers: str, api_key: str | None = None, access_token: str | None = None
+    server_url: str,
+    analyzers: str,
+    api_key: str | None = None,
+    access_token: str | None = None,
+    timeout: int | None = None,
 ) -> dict[str, Any]:
     """Run security scan on a server using mcp_security_scanner.py directly.
 
@@ -54,6 +170,7 @@ def _run_security_scan(
         analyzers: Comma-separated list of analyzers (e.g., 'yara', 'yara,llm')
         api_key: Optional API key for LLM analyzer
         access_token: Optional access token for authenticated MCP servers
+        timeout: Optional timeout in seconds; the scanner is killed when exceeded
 
     Returns:
         Dictionary with scan results including:
@@ -110,9 +227,7 @@ def _run_security_scan(
     logger.info(f"Running: {' '.join(cmd_for_log)}")
 
     try:
-        result = subprocess.run(  # nosec B603 - internal script invoked via uv run with validated args
-            cmd, capture_output=True, text=True, check=False, cwd=str(PROJECT_ROOT)
-        )
+        result = _run_scanner_process(cmd, timeout)
 
         # Log output
         if result.stdout:
@@ -180,6 +295,18 @@ def _run_security_scan(
 
         return scan_result
 
+    except subprocess.TimeoutExpired:
+        logger.error(f"✗ Scan of {server_url} timed out after {timeout} seconds")
+        return {
+            "success": False,
+            "scan_output_file": None,
+            "critical_issues": 0,
+            "high_severity": 0,
+            "medium_severity": 0,
+            "low_severity": 0,
+            "is_safe": False,
+            "error_message": f"Scan timed out after {timeout} seconds",
+        }
     except Exception as e:
         logger.error(f"Failed to run scan: {e}")
         return {
@@ -359,15 +486,30 @@ def _generate_markdown_report(
 
 
 def _scan_all_servers(
-    base_url: str, token_file: Path, analyzers: str = DEFAULT_ANALYZERS, api_key: str | None = None
+    base_url: str,
+    token_file: Path,
+    analyzers: str = DEFAULT_ANALYZERS,
+    api_key: str | None = None,
+    workers: int = DEFAULT_WORKERS,
+    timeout: int | None = DEFAULT_SCAN_TIMEOUT,
+    use_cache: bool = True,
+    cache_ttl_hours: float = DEFAULT_CACHE_TTL_HOURS,
 ) -> dict[str, Any]:
     """Scan all enabled servers.
 
+    Scans run in a pool of worker threads, each driving one scanner subprocess.
+    Servers whose URL, tool list and analyzers match a cached successful scan
+    younger than the cache TTL are not scanned again.
+
     Args:
         base_url: Base URL of the registry
         token_file: Path to token file
         analyzers: Comma-separated list of analyzers
         api_key: Optional API key for LLM analyzer
+        workers: Number of scans to run concurrently
+        timeout: Per-scan timeout in seconds
+        use_cache: Whether to reuse cached results for unchanged servers
+        cache_ttl_hours: Maximum age of a cached result that may be reused
 
     Returns:
         Dictionary with scan statistics
@@ -434,7 +576,6 @@ def _scan_all_servers(
     # Scan each server
     stats = {"total": len(enabled_servers), "passed": 0, "failed": 0}
 
-    scan_results = []
     scan_timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
 
     logger.info("")
@@ -445,6 +586,14 @@ def _scan_all_servers(
 
     # Note: access_token already loaded above for RegistryClient
 
+    tool_list_hashes = _fetch_tool_list_hashes(client) if use_cache else {}
+    scan_cache = _load_scan_cache() if use_cache else {}
+    cache_ttl_seconds = cache_ttl_hours * 3600
+
+    # Results are stored by position so the report keeps the registry order
+    scan_results: list[dict[str, Any] | None] = [None] * len(enabled_servers)
+    jobs = []
+
     for idx, server in enumerate(enabled_servers, 1):
         # Server is AnthropicServerDetail with direct attribute access
         server_name = server.name
@@ -459,45 +608,88 @@ def _scan_all_servers(
             logger.warning(
                 f"[{idx}/{stats['total']}] {server_name}: No path found in metadata, skipping"
             )
-            stats["failed"] += 1
-            scan_results.append(
-                {
-                    "server_name": server_name,
-                    "server_url": "N/A",
-                    "success": False,
-                    "is_safe": False,
-                    "critical_issues": 0,
-                    "high_severity": 0,
-                    "medium_severity": 0,
-                    "low_severity": 0,
-                    "error_message": "No path found in metadata",
-                }
-            )
+            scan_results[idx - 1] = {
+                "server_name": server_name,
+                "server_url": "N/A",
+                "success": False,
+                "is_safe": False,
+                "critical_issues": 0,
+                "high_severity": 0,
+                "medium_severity": 0,
+                "low_severity": 0,
+                "error_message": "No path found in metadata",
+            }
             continue
 
+        tool_list_hash = tool_list_hashes.get(server_path.rstrip("/"))
+
         # Construct the gateway proxy URL using the path and base_url
         if not server_path.endswith("/"):
             server_path = server_path + "/"
         server_url = f"{base_url}{server_path}mcp"
 
-        logger.info("-" * 80)
-        logger.info(f"[{idx}/{stats['total']}] Scanning: {server_name}")
-        logger.info(f"URL: {server_url}")
-        logger.info(f"Analyzers: {analyzers}")
+        cache_key = None
+        if tool_list_hash:
+            cache_key = _scan_cache_key(server_url, tool_list_hash, analyzers)
+            cached = scan_cache.get(cache_key)
+            if cached and time.time() - cached.get("cached_at", 0) < cache_ttl_seconds:
+                logger.info(
+                    f"[{idx}/{stats['total']}] {server_name}: unchanged since last scan, "
+                    "reusing cached result"
+                )
+                scan_results[idx - 1] = {
+                    **cached["result"],
+                    "server_name": server_name,
+                    "server_url": server_url,
+                }
+                continue
+
+        jobs.append((idx, server_name, server_url, cache_key))
 
-        # Run scan with access token for authentication
-        scan_result = _run_security_scan(server_url, analyzers, api_key, access_token)
-        scan_result["server_name"] = server_name
-        scan_result["server_url"] = server_url
-        scan_results.append(scan_result)
+    logger.info(f"Running {len(jobs)} scans with {workers} workers (timeout: {timeout}s)")
 
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    interrupted = False
+    try:
+        futures = {
+            executor.submit(
+                _run_security_scan, server_url, analyzers, api_key, access_token, timeout
+            ): (idx, server_name, server_url, cache_key)
+            for idx, server_name, server_url, cache_key in jobs
+        }
+
+        for future in as_completed(futures):
+            idx, server_name, server_url, cache_key = futures[future]
+            scan_result = future.result()
+            scan_result["server_name"] = server_name
+            scan_result["server_url"] = server_url
+            scan_results[idx - 1] = scan_result
+
+            logger.info(
+                f"[{idx}/{stats['total']}] {server_name}: "
+                f"{'safe' if scan_result['is_safe'] else 'UNSAFE or failed'}"
+            )
+
+            if cache_key and scan_result["success"]:
+                scan_cache[cache_key] = {"cached_at": time.time(), "result": scan_result}
+    except KeyboardInterrupt:
+        interrupted = True
+        logger.warning("Interrupted, cancelling pending scans")
+        executor.shutdown(wait=False, cancel_futures=True)
+        _terminate_active_scans()
+        raise
+    finally:
+        if not interrupted:
+            executor.shutdown(wait=True)
+        if use_cache:
+            _save_scan_cache(scan_cache)
+
+    for scan_result in scan_results:
         if scan_result["success"] and scan_result["is_safe"]:
             stats["passed"] += 1
         else:
             stats["failed"] += 1
 
-        logger.info("")
-
     return {
         "stats": stats,
         "scan_results": scan_results,
@@ -525,6 +717,9 @@ Examples:
     # Use custom token file
     uv run python cli/scan_all_servers.py --token-file .oauth-tokens/custom.json
 
+    # Scan 8 servers at a time and rescan everything, ignoring cached results
+    uv run python cli/scan_all_servers.py --workers 8 --no-cache
+
     # Production example
     uv run python cli/scan_all_servers.py \\
         --base-url https://registry.us-east-1.example.com \\
@@ -552,6 +747,29 @@ Examples:
     parser.add_argument(
         "--api-key", help="LLM API key (optional, can also use MCP_SCANNER_LLM_API_KEY env var)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of servers to scan concurrently (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=DEFAULT_SCAN_TIMEOUT,
+        help=f"Per-server scan timeout in seconds (default: {DEFAULT_SCAN_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Scan every server even if its tool list is unchanged since the last scan",
+    )
+    parser.add_argument(
+        "--cache-ttl-hours",
+        type=float,
+        default=DEFAULT_CACHE_TTL_HOURS,
+        help=f"Reuse cached results younger than this (default: {DEFAULT_CACHE_TTL_HOURS})",
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
     args = parser.parse_args()
@@ -566,6 +784,10 @@ Examples:
         token_file=args.token_file,
         analyzers=args.analyzers,
         api_key=args.api_key,
+        workers=args.workers,
+        timeout=args.timeout,
+        use_cache=not args.no_cache,
+        cache_ttl_hours=args.cache_ttl_hours,
     )
 
     stats = results["stats"]
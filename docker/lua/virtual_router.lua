@@ -293,6 +293,44 @@ local function _collect_backend_locations(mapping)
 end
 
 
+-- Warm the L1 cache with the L2 backend sessions of every given location in
+-- one call, so the per-backend lookups below do not each hit the registry.
+local function _prefetch_backend_sessions(client_session_id, backend_locations)
+    if not client_session_id then
+        return
+    end
+
+    local missing = {}
+    for _, loc in ipairs(backend_locations) do
+        if not session_cache:get("bsess:" .. client_session_id .. ":" .. loc) then
+            missing[#missing + 1] = loc
+        end
+    end
+    if #missing < 2 then
+        return
+    end
+
+    local res = ngx.location.capture("/_internal/sessions/backend-lookup", {
+        method = ngx.HTTP_POST,
+        body = cjson.encode({
+            client_session_id = client_session_id,
+            backend_keys = missing,
+        }),
+    })
+    if not res or res.status ~= 200 then
+        return
+    end
+
+    local ok, data = pcall(cjson.decode, res.body)
+    if ok and type(data.sessions) == "table" then
+        for loc, backend_session_id in pairs(data.sessions) do
+            session_cache:set("bsess:" .. client_session_id .. ":" .. loc,
+                backend_session_id, SESSION_CACHE_TTL)
+        end
+    end
+end
+
+
 -- Fetch tools/list from a single backend via ngx.location.capture.
 -- Returns the tools array from the backend, or empty table on failure.
 -- On stale session error (status >= 400), invalidates and retries once.
@@ -396,6 +434,7 @@ local function _handle_tools_list(request_id, mapping, user_scopes_str, client_s
         enriched_tools = {}
         local backend_locations = _collect_backend_locations(mapping)
         local fetch_ok = false
+        _prefetch_backend_sessions(client_session_id, backend_locations)
 
         for _, backend_loc in ipairs(backend_locations) do
             local backend_tools = _fetch_backend_tools_list(backend_loc, client_session_id, server_id)
@@ -485,6 +524,7 @@ local function _proxy_list_to_backends(method_name, result_key, mapping, client_
     local aggregated = setmetatable({}, empty_array_mt)
     local lookup = {}
     local backend_locations = _collect_backend_locations(mapping)
+    _prefetch_backend_sessions(client_session_id, backend_locations)
 
     for _, backend_loc in ipairs(backend_locations) do
         local req_body = cjson.encode({
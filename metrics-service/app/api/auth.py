@@ -4,11 +4,23 @@ import logging
 from ..storage.database import MetricsStorage
 from ..utils.helpers import hash_api_key
 from ..core.rate_limiter import rate_limiter
+from ..core.api_keys import api_key_cache, api_key_usage
 
 logger = logging.getLogger(__name__)
 security = HTTPBearer()
 
 
+async def _get_key_info(key_hash: str) -> dict | None:
+    """Get API key metadata from the in-memory cache, loading it on a miss."""
+    key_info = api_key_cache.get(key_hash)
+    if key_info is None:
+        storage = MetricsStorage()
+        key_info = await storage.get_api_key(key_hash)
+        if key_info:
+            api_key_cache.put(key_hash, key_info)
+    return key_info
+
+
 async def verify_api_key(request: Request) -> str:
     """Verify API key from X-API-Key header and check rate limits."""
     api_key = request.headers.get("X-API-Key")
@@ -19,9 +31,8 @@ async def verify_api_key(request: Request) -> str:
     # Hash the provided API key
     key_hash = hash_api_key(api_key)
 
-    # Verify against database
-    storage = MetricsStorage()
-    key_info = await storage.get_api_key(key_hash)
+    # Verify against cached key metadata (database on a cache miss)
+    key_info = await _get_key_info(key_hash)
 
     if not key_info:
         raise HTTPException(status_code=401, detail="Invalid API key")
@@ -44,8 +55,8 @@ async def verify_api_key(request: Request) -> str:
             },
         )
 
-    # Update last used timestamp
-    await storage.update_api_key_usage(key_hash)
+    # Record usage; timestamps are written in batches by a background task
+    api_key_usage.record(key_hash)
 
     # Add rate limit headers
     request.state.rate_limit_remaining = remaining
@@ -61,9 +72,7 @@ async def get_rate_limit_status(api_key: str) -> dict:
     """Get current rate limit status for an API key."""
     key_hash = hash_api_key(api_key)
 
-    # Get key info from database
-    storage = MetricsStorage()
-    key_info = await storage.get_api_key(key_hash)
+    key_info = await _get_key_info(key_hash)
 
     if not key_info:
         raise HTTPException(status_code=401, detail="Invalid API key")
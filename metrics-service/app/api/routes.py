@@ -1,10 +1,18 @@
 from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from datetime import UTC, datetime
 from typing import List, Dict, Any, Optional
 import uuid
 import logging
 from ..core.models import MetricRequest, MetricResponse, ErrorResponse
 from ..core.processor import MetricsProcessor
 from ..core.retention import retention_manager
+from ..core.rollups import (
+    ROLLUP_GROUP_COLUMNS,
+    ROLLUP_TABLES,
+    bucket_start,
+    build_series,
+    pick_resolution,
+)
 from ..api.auth import verify_api_key, get_rate_limit_status
 from ..utils.helpers import generate_request_id, generate_api_key, hash_api_key
 from ..storage.database import MetricsStorage
@@ -72,6 +80,103 @@ async def flush_metrics(
         raise HTTPException(status_code=500, detail=f"Failed to flush metrics: {str(e)}")
 
 
+@router.get("/metrics/query")
+async def query_metrics(
+    start: datetime,
+    end: datetime | None = None,
+    resolution: str | None = None,
+    group_by: str = "service",
+    percentiles: str = "50,95,99",
+    metric_type: str | None = None,
+    service: str | None = None,
+    tool: str | None = None,
+    server: str | None = None,
+    client: str | None = None,
+    method: str | None = None,
+    api_key: str = Depends(verify_api_key),
+):
+    """Query aggregated metrics from the 1m/1h/1d rollup tables.
+
+    Args:
+        start: Start of the time range (ISO 8601, naive values are UTC)
+        end: End of the time range, exclusive (defaults to now)
+        resolution: "1m", "1h" or "1d"; picked from the range length if omitted
+        group_by: Comma-separated dimensions: service, metric_type, tool,
+            server, client, method (empty for a single series)
+        percentiles: Comma-separated duration percentiles to estimate
+        metric_type: Only include this metric type
+        service: Only include this service
+        tool: Only include this tool
+        server: Only include this server
+        client: Only include this client
+        method: Only include this method
+        api_key: API key for authentication.
+
+    Raises:
+        HTTPException: 400 for an invalid range, resolution, group-by or percentile.
+        HTTPException: 500 for other errors.
+    """
+    end = end or datetime.now(UTC)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=UTC)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=UTC)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+
+    resolution = resolution or pick_resolution(start, end)
+    if resolution not in ROLLUP_TABLES:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid resolution: '{resolution}'. Use 1m, 1h or 1d"
+        )
+
+    group_names = [name.strip() for name in group_by.split(",") if name.strip()]
+    invalid = [name for name in group_names if name not in ROLLUP_GROUP_COLUMNS]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid group_by: {invalid}. Allowed: {sorted(ROLLUP_GROUP_COLUMNS)}",
+        )
+
+    try:
+        percentile_values = [float(p) for p in percentiles.split(",") if p.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid percentiles: '{percentiles}'")
+    if any(not 0 <= p <= 100 for p in percentile_values):
+        raise HTTPException(status_code=400, detail="Percentiles must be between 0 and 100")
+
+    filters = {
+        name: value
+        for name, value in {
+            "metric_type": metric_type,
+            "service": service,
+            "tool": tool,
+            "server": server,
+            "client": client,
+            "method": method,
+        }.items()
+        if value is not None
+    }
+
+    try:
+        rows = await processor.storage.query_rollups(
+            resolution,
+            bucket_start(start, resolution),
+            end.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S"),
+            filters,
+        )
+        return {
+            "resolution": resolution,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "group_by": group_names,
+            "series": build_series(rows, group_names, percentile_values),
+        }
+    except Exception as e:
+        logger.error(f"Error querying metrics: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to query metrics: {str(e)}")
+
+
 @router.get("/rate-limit")
 async def get_rate_limit(request: Request):
     """Get current rate limit status for the API key."""
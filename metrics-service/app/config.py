@@ -22,9 +22,32 @@ class Settings:
     OTEL_PROMETHEUS_PORT: int = int(os.getenv("OTEL_PROMETHEUS_PORT", "9465"))
     OTEL_OTLP_ENDPOINT: str | None = os.getenv("OTEL_OTLP_ENDPOINT")
 
+    # OTel label cardinality limits: dimensions exported as labels, labels
+    # exported only as one of OTEL_LABEL_HASH_BUCKETS hash buckets, distinct
+    # values kept per label and label sets kept per instrument
+    OTEL_LABEL_ALLOWLIST: list = [
+        x.strip()
+        for x in os.getenv(
+            "OTEL_LABEL_ALLOWLIST",
+            "service,metric_type,success,method,server,server_name,tool_name,client_name,"
+            "endpoint,status_code,healthy,operation,resource_type,metric_name",
+        ).split(",")
+        if x.strip()
+    ]
+    OTEL_HASHED_LABELS: list = [
+        x.strip() for x in os.getenv("OTEL_HASHED_LABELS", "user_hash").split(",") if x.strip()
+    ]
+    OTEL_LABEL_HASH_BUCKETS: int = int(os.getenv("OTEL_LABEL_HASH_BUCKETS", "16"))
+    OTEL_MAX_LABEL_VALUES: int = int(os.getenv("OTEL_MAX_LABEL_VALUES", "100"))
+    OTEL_MAX_SERIES_PER_INSTRUMENT: int = int(os.getenv("OTEL_MAX_SERIES_PER_INSTRUMENT", "2000"))
+
     # API Security
     METRICS_RATE_LIMIT: int = int(os.getenv("METRICS_RATE_LIMIT", "1000"))
     API_KEY_HASH_ALGORITHM: str = os.getenv("API_KEY_HASH_ALGORITHM", "sha256")
+    # How long verified key metadata is cached in memory (0 disables the cache)
+    # and how often batched last-used timestamps are written to the database
+    API_KEY_CACHE_TTL_SECONDS: float = float(os.getenv("API_KEY_CACHE_TTL_SECONDS", "60"))
+    API_KEY_USAGE_FLUSH_SECONDS: float = float(os.getenv("API_KEY_USAGE_FLUSH_SECONDS", "60"))
 
     # Histogram bucket boundaries for duration metrics (seconds)
     HISTOGRAM_BUCKET_BOUNDARIES: list = [
@@ -40,5 +63,11 @@ class Settings:
     FLUSH_INTERVAL_SECONDS: int = int(os.getenv("FLUSH_INTERVAL_SECONDS", "30"))
     MAX_REQUEST_SIZE: str = os.getenv("MAX_REQUEST_SIZE", "10MB")
 
+    # Retention cleanup: rows deleted per transaction, pause between batches so
+    # ingestion can take the write lock, and free pages reclaimed per vacuum step
+    RETENTION_DELETE_BATCH_SIZE: int = int(os.getenv("RETENTION_DELETE_BATCH_SIZE", "5000"))
+    RETENTION_BATCH_PAUSE_SECONDS: float = float(os.getenv("RETENTION_BATCH_PAUSE_SECONDS", "0.05"))
+    RETENTION_VACUUM_PAGES: int = int(os.getenv("RETENTION_VACUUM_PAGES", "1000"))
+
 
 settings = Settings()
@@ -0,0 +1,97 @@
+"""In-memory API key metadata cache and batched usage tracking.
+
+Verifying an API key on the ingest path used to read the key from SQLite
+and write its last_used_at on every request. Key metadata is now cached for
+a short TTL (and invalidated when a key is created or changed), and usage
+timestamps are collected in memory and written in one batch periodically,
+so an authenticated request does no database I/O while its key is cached.
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ApiKeyCache:
+    """TTL cache of API key metadata keyed by key hash.
+
+    Only keys found in the database are cached, so unknown keys cannot grow
+    the cache. A TTL of 0 or less disables caching.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        # {key_hash: (expires_at, key_info)}
+        self._entries: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+    def get(self, key_hash: str) -> Dict[str, Any] | None:
+        """Return cached key metadata, or None if missing or expired."""
+        entry = self._entries.get(key_hash)
+        if entry is None:
+            return None
+        expires_at, key_info = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key_hash]
+            return None
+        return key_info
+
+    def put(self, key_hash: str, key_info: Dict[str, Any]) -> None:
+        """Cache key metadata for the configured TTL."""
+        if self.ttl_seconds > 0:
+            self._entries[key_hash] = (time.monotonic() + self.ttl_seconds, key_info)
+
+    def invalidate(self, key_hash: str | None = None) -> None:
+        """Drop one cached key, or every cached key if no hash is given."""
+        if key_hash is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key_hash, None)
+
+
+class ApiKeyUsageTracker:
+    """Collect last-used timestamps per key and write them in batches."""
+
+    def __init__(self):
+        # {key_hash: last used timestamp, UTC, in SQLite datetime('now') format}
+        self._pending: Dict[str, str] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of keys with an unwritten usage timestamp."""
+        return len(self._pending)
+
+    def record(self, key_hash: str) -> None:
+        """Note that a key was used now."""
+        self._pending[key_hash] = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+
+    async def flush(self, storage) -> int:
+        """Write pending usage timestamps in one transaction.
+
+        Args:
+            storage: MetricsStorage to write to
+
+        Returns:
+            Number of keys written
+        """
+        if not self._pending:
+            return 0
+
+        usage, self._pending = self._pending, {}
+        try:
+            await storage.update_api_keys_usage(usage)
+        except Exception:
+            # Keep the timestamps for the next flush unless a newer one arrived
+            for key_hash, last_used_at in usage.items():
+                self._pending.setdefault(key_hash, last_used_at)
+            raise
+        return len(usage)
+
+
+# Global cache and usage tracker instances
+api_key_cache = ApiKeyCache(settings.API_KEY_CACHE_TTL_SECONDS)
+api_key_usage = ApiKeyUsageTracker()
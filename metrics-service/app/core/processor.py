@@ -1,10 +1,11 @@
 import asyncio
 import logging
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from ..core.models import MetricRequest, Metric, MetricType
 from ..storage.database import MetricsStorage
 from ..core.validator import validator
+from ..otel.cardinality import label_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +64,7 @@ class MetricsProcessor:
         for warning in validation_result.warnings:
             logger.warning(f"Metrics validation warning: {warning}")
 
+        accepted_metrics = []
         for metric in request.metrics:
             try:
                 # Additional runtime validation
@@ -71,16 +73,10 @@ class MetricsProcessor:
                     result.errors.append(f"Invalid metric: {metric.type}")
                     continue
 
-                # Emit to OpenTelemetry if available
-                if self.otel:
-                    try:
-                        await self._emit_to_otel(metric, request.service)
-                    except Exception as e:
-                        logger.warning(f"Failed to emit to OTel: {e}")
-
                 # Store in SQLite (buffered)
                 await self._buffer_for_storage(metric, request, request_id)
 
+                accepted_metrics.append(metric)
                 result.accepted += 1
 
             except Exception as e:
@@ -88,51 +84,66 @@ class MetricsProcessor:
                 result.errors.append(f"Error processing metric: {str(e)}")
                 logger.error(f"Error processing metric: {e}")
 
+        # Emit to OpenTelemetry if available
+        if self.otel and accepted_metrics:
+            self._emit_batch_to_otel(accepted_metrics, request.service)
+
         return result
 
     def _validate_metric(self, metric: Metric) -> bool:
         """Validate metric data."""
-        if metric.value is None:
-            return False
-        if metric.type not in MetricType:
-            return False
-        return True
-
-    async def _emit_to_otel(self, metric: Metric, service: str):
-        """Emit metric to OpenTelemetry instruments."""
-        if not self.otel:
-            return
-
-        labels = {
-            "service": service,
-            "metric_type": metric.type.value,
-            **{k: _normalize_label_value(v) for k, v in metric.dimensions.items()},
-        }
-
-        # Route to appropriate OTel instrument
-        if metric.type == MetricType.AUTH_REQUEST:
-            self.otel.auth_counter.add(metric.value, labels)
-            if metric.duration_ms:
-                self.otel.auth_histogram.record(metric.duration_ms / 1000, labels)
-
-        elif metric.type == MetricType.TOOL_DISCOVERY:
-            self.otel.discovery_counter.add(metric.value, labels)
-            if metric.duration_ms:
-                self.otel.discovery_histogram.record(metric.duration_ms / 1000, labels)
-
-        elif metric.type == MetricType.TOOL_EXECUTION:
-            self.otel.tool_counter.add(metric.value, labels)
-            if metric.duration_ms:
-                self.otel.tool_histogram.record(metric.duration_ms / 1000, labels)
+        return metric.value is not None and isinstance(metric.type, MetricType)
+
+    def _emit_batch_to_otel(self, metrics: List[Metric], service: str):
+        """Emit a batch of metrics to OpenTelemetry, grouped by type and label set.
+
+        Metrics sharing a type and dimensions get one label dictionary (with
+        cardinality limits applied), one counter add with their summed value
+        and one histogram record each.
+        """
+        groups: Dict[Tuple[MetricType, Tuple[Tuple[str, str], ...]], List[Metric]] = {}
+        for metric in metrics:
+            label_items = tuple(
+                (k, _normalize_label_value(v)) for k, v in metric.dimensions.items()
+            )
+            groups.setdefault((metric.type, label_items), []).append(metric)
+
+        for (metric_type, label_items), group in groups.items():
+            labels = label_limiter.limit(
+                metric_type.value,
+                {"service": service, "metric_type": metric_type.value, **dict(label_items)},
+            )
+            try:
+                self._emit_group(metric_type, group, labels)
+            except Exception as e:
+                logger.warning(f"Failed to emit to OTel: {e}")
 
-        elif metric.type == MetricType.PROTOCOL_LATENCY:
+    def _emit_group(self, metric_type: MetricType, metrics: List[Metric], labels: Dict[str, str]):
+        """Record metrics of one type and label set on their OTel instruments."""
+        # Route to appropriate OTel instruments
+        if metric_type == MetricType.PROTOCOL_LATENCY:
             # For protocol latency, record the value as latency seconds
-            self.otel.latency_histogram.record(metric.value, labels)
+            for metric in metrics:
+                self.otel.latency_histogram.record(metric.value, labels)
+            return
+
+        instruments = {
+            MetricType.AUTH_REQUEST: (self.otel.auth_counter, self.otel.auth_histogram),
+            MetricType.TOOL_DISCOVERY: (
+                self.otel.discovery_counter,
+                self.otel.discovery_histogram,
+            ),
+            MetricType.TOOL_EXECUTION: (self.otel.tool_counter, self.otel.tool_histogram),
+            MetricType.HEALTH_CHECK: (self.otel.health_counter, self.otel.health_histogram),
+        }.get(metric_type)
+        if instruments is None:
+            return
 
-        elif metric.type == MetricType.HEALTH_CHECK:
-            self.otel.health_counter.add(metric.value, labels)
+        counter, histogram = instruments
+        counter.add(sum(metric.value for metric in metrics), labels)
+        for metric in metrics:
             if metric.duration_ms:
-                self.otel.health_histogram.record(metric.duration_ms / 1000, labels)
+                histogram.record(metric.duration_ms / 1000, labels)
 
     async def _buffer_for_storage(self, metric: Metric, request: MetricRequest, request_id: str):
         """Buffer metric for batch SQLite storage."""
@@ -1,22 +1,37 @@
 """Rate limiting implementation for API keys."""
 
-import asyncio
+import math
 import time
 import logging
 from typing import Dict, Tuple
-from datetime import datetime, timedelta
-from ..storage.database import MetricsStorage
 
 logger = logging.getLogger(__name__)
 
 
 class RateLimiter:
-    """Token bucket rate limiter for API keys."""
+    """Token bucket rate limiter for API keys.
+
+    Each key has its own bucket refilled continuously (fractional tokens) at
+    rate_limit tokens per minute. Bucket updates never await, so they are
+    atomic on the event loop and requests for different keys never wait on
+    each other; no lock is needed.
+    """
 
     def __init__(self):
         # In-memory token buckets: {key_hash: (tokens, last_refill, rate_limit)}
-        self._buckets: Dict[str, Tuple[int, float, int]] = {}
-        self._lock = asyncio.Lock()
+        self._buckets: Dict[str, Tuple[float, float, int]] = {}
+
+    def _refill(self, key_hash: str, rate_limit: int, now: float) -> float:
+        """Tokens in a key's bucket at `now`, scaled to the current rate limit."""
+        tokens, last_refill, limit = self._buckets[key_hash]
+
+        # Scale existing tokens proportionally if the rate limit changed
+        if limit != rate_limit and limit > 0:
+            tokens = tokens * (rate_limit / limit)
+
+        # rate_limit tokens per minute, partial tokens carried over
+        elapsed = max(now - last_refill, 0.0)
+        return min(tokens + elapsed * rate_limit / 60.0, float(rate_limit))
 
     async def check_rate_limit(self, key_hash: str, rate_limit: int) -> Tuple[bool, int]:
         """
@@ -29,96 +44,64 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, remaining_tokens)
         """
-        async with self._lock:
-            now = time.time()
-
-            # Get or create bucket
-            if key_hash not in self._buckets:
-                # New bucket starts full, consume one token for this request
-                tokens = rate_limit - 1
-                self._buckets[key_hash] = (tokens, now, rate_limit)
-                return True, tokens
-            else:
-                tokens, last_refill, limit = self._buckets[key_hash]
-
-                # Update rate limit if it changed
-                if limit != rate_limit:
-                    # Scale existing tokens proportionally
-                    tokens = int(tokens * (rate_limit / limit))
-                    limit = rate_limit
-
-            # Refill tokens based on elapsed time
-            time_elapsed = now - last_refill
-            minutes_elapsed = time_elapsed / 60.0
-
-            # Add tokens for elapsed time (rate_limit tokens per minute)
-            tokens_to_add = int(minutes_elapsed * rate_limit)
-            tokens = min(tokens + tokens_to_add, rate_limit)
-
-            # Update last refill time if we added tokens
-            if tokens_to_add > 0:
-                last_refill = now
-
-            # Check if request is allowed
-            if tokens > 0:
-                tokens -= 1
-                self._buckets[key_hash] = (tokens, last_refill, rate_limit)
-                logger.debug(f"Rate limit check passed. Remaining: {tokens}")
-                return True, tokens
-            else:
-                self._buckets[key_hash] = (tokens, last_refill, rate_limit)
-                logger.warning(f"Rate limit exceeded for key: {key_hash[:8]}...")
-                return False, 0
+        now = time.time()
+
+        if key_hash not in self._buckets:
+            # New bucket starts full, consume one token for this request
+            tokens = float(rate_limit - 1)
+            self._buckets[key_hash] = (tokens, now, rate_limit)
+            return True, int(tokens)
+
+        tokens = self._refill(key_hash, rate_limit, now)
+
+        if tokens >= 1:
+            tokens -= 1
+            self._buckets[key_hash] = (tokens, now, rate_limit)
+            logger.debug(f"Rate limit check passed. Remaining: {int(tokens)}")
+            return True, int(tokens)
+
+        self._buckets[key_hash] = (tokens, now, rate_limit)
+        logger.warning(f"Rate limit exceeded for key: {key_hash[:8]}...")
+        return False, 0
 
     async def get_bucket_status(self, key_hash: str, rate_limit: int) -> Dict[str, int]:
         """Get current bucket status without consuming a token."""
-        async with self._lock:
-            now = time.time()
-
-            if key_hash not in self._buckets:
-                return {
-                    "available_tokens": rate_limit,
-                    "rate_limit": rate_limit,
-                    "reset_time_seconds": 0,
-                }
-
-            tokens, last_refill, limit = self._buckets[key_hash]
-
-            # Calculate tokens after refill
-            time_elapsed = now - last_refill
-            minutes_elapsed = time_elapsed / 60.0
-            tokens_to_add = int(minutes_elapsed * rate_limit)
-            current_tokens = min(tokens + tokens_to_add, rate_limit)
-
-            # Calculate time until bucket is full
-            if current_tokens < rate_limit:
-                tokens_needed = rate_limit - current_tokens
-                reset_time_seconds = int((tokens_needed / rate_limit) * 60)
-            else:
-                reset_time_seconds = 0
-
+        if key_hash not in self._buckets:
             return {
-                "available_tokens": current_tokens,
+                "available_tokens": rate_limit,
                 "rate_limit": rate_limit,
-                "reset_time_seconds": reset_time_seconds,
+                "reset_time_seconds": 0,
             }
 
-    async def cleanup_old_buckets(self, max_age_hours: int = 24):
-        """Remove buckets that haven't been used recently."""
-        async with self._lock:
-            now = time.time()
-            cutoff = now - (max_age_hours * 3600)
+        current_tokens = self._refill(key_hash, rate_limit, time.time())
 
-            old_keys = []
-            for key_hash, (_, last_refill, _) in self._buckets.items():
-                if last_refill < cutoff:
-                    old_keys.append(key_hash)
+        # Calculate time until bucket is full
+        if current_tokens < rate_limit:
+            tokens_needed = rate_limit - current_tokens
+            reset_time_seconds = math.ceil((tokens_needed / rate_limit) * 60)
+        else:
+            reset_time_seconds = 0
 
-            for key in old_keys:
-                del self._buckets[key]
+        return {
+            "available_tokens": int(current_tokens),
+            "rate_limit": rate_limit,
+            "reset_time_seconds": reset_time_seconds,
+        }
 
-            if old_keys:
-                logger.info(f"Cleaned up {len(old_keys)} old rate limit buckets")
+    async def cleanup_old_buckets(self, max_age_hours: int = 24):
+        """Remove buckets that haven't been used recently."""
+        cutoff = time.time() - (max_age_hours * 3600)
+
+        old_keys = [
+            key_hash
+            for key_hash, (_, last_refill, _) in self._buckets.items()
+            if last_refill < cutoff
+        ]
+        for key in old_keys:
+            del self._buckets[key]
+
+        if old_keys:
+            logger.info(f"Cleaned up {len(old_keys)} old rate limit buckets")
 
 
 # Global rate limiter instance
@@ -21,6 +21,9 @@ ALLOWED_TABLE_NAMES: Set[str] = {
     "tool_metrics",
     "metrics_hourly",
     "metrics_daily",
+    "metrics_rollup_1m",
+    "metrics_rollup_1h",
+    "metrics_rollup_1d",
     "api_key_usage_log",
 }
 
@@ -42,6 +45,9 @@ ALLOWED_TIMESTAMP_COLUMNS: Set[str] = {
 # Security: Regex pattern for valid SQL identifiers (alphanumeric and underscore only)
 _VALID_IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
+# PRAGMA auto_vacuum value for INCREMENTAL mode
+_AUTO_VACUUM_INCREMENTAL = 2
+
 # Flag to enable test tables - should only be set in test environments
 _test_tables_enabled: bool = False
 
@@ -159,6 +165,30 @@ class RetentionPolicy:
         self.is_active = is_active
         self.cleanup_query = cleanup_query
 
+    def get_cutoff(self) -> str:
+        """Get the ISO timestamp before which records are expired."""
+        return (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+
+    def get_batch_cleanup_query(self, cutoff: str, batch_size: int) -> tuple[str, tuple]:
+        """Get a query that deletes at most batch_size expired records.
+
+        Security note: table_name and timestamp_column are validated
+        against allowlists during __init__, preventing SQL injection.
+
+        Args:
+            cutoff: ISO timestamp from get_cutoff(), fixed for the whole cleanup
+            batch_size: Maximum number of records deleted by one execution
+
+        Returns:
+            Tuple of (query_string, parameters)
+        """
+        # nosec B608 - table_name and timestamp_column validated against allowlists in __init__
+        query = (
+            f"DELETE FROM {self.table_name} WHERE rowid IN ("  # nosec B608
+            f"SELECT rowid FROM {self.table_name} WHERE {self.timestamp_column} < ? LIMIT ?)"
+        )
+        return query, (cutoff, batch_size)
+
     def get_cleanup_query(self) -> tuple[str, tuple]:
         """Get the cleanup query and parameters for this policy.
 
@@ -233,6 +263,19 @@ class RetentionManager:
             timestamp_column="created_at",
         )
 
+        # Query API rollups, expired by bucket start
+        self.policies["metrics_rollup_1m"] = RetentionPolicy(
+            table_name="metrics_rollup_1m", retention_days=7, timestamp_column="timestamp"
+        )
+
+        self.policies["metrics_rollup_1h"] = RetentionPolicy(
+            table_name="metrics_rollup_1h", retention_days=365, timestamp_column="timestamp"
+        )
+
+        self.policies["metrics_rollup_1d"] = RetentionPolicy(
+            table_name="metrics_rollup_1d", retention_days=1095, timestamp_column="timestamp"
+        )
+
         # API usage logs
         self.policies["api_key_usage_log"] = RetentionPolicy(
             table_name="api_key_usage_log", retention_days=90, timestamp_column="created_at"
@@ -384,21 +427,20 @@ class RetentionManager:
 
         try:
             async with aiosqlite.connect(self.storage.db_path) as db:
-                # Get preview first
-                count_query, count_params = policy.get_count_query()
-                cursor = await db.execute(count_query, count_params)
-                count_result = await cursor.fetchone()
-                records_to_delete = count_result[0] if count_result else 0
+                if dry_run:
+                    count_query, count_params = policy.get_count_query()
+                    cursor = await db.execute(count_query, count_params)
+                    count_result = await cursor.fetchone()
+                    records_to_delete = count_result[0] if count_result else 0
 
-                if records_to_delete == 0:
-                    return {
-                        "table": table_name,
-                        "status": "completed",
-                        "records_deleted": 0,
-                        "reason": "no_records_to_delete",
-                    }
+                    if records_to_delete == 0:
+                        return {
+                            "table": table_name,
+                            "status": "completed",
+                            "records_deleted": 0,
+                            "reason": "no_records_to_delete",
+                        }
 
-                if dry_run:
                     return {
                         "table": table_name,
                         "status": "dry_run",
@@ -407,37 +449,73 @@ class RetentionManager:
 
                 # Execute cleanup
                 start_time = datetime.now()
+                records_deleted = await self._delete_expired(db, policy)
 
-                await db.execute("BEGIN IMMEDIATE")
-                try:
-                    cleanup_query, cleanup_params = policy.get_cleanup_query()
-                    cursor = await db.execute(cleanup_query, cleanup_params)
-                    records_deleted = cursor.rowcount
-                    await db.commit()
-
-                    end_time = datetime.now()
-                    duration = (end_time - start_time).total_seconds()
-
-                    logger.info(
-                        f"Cleaned up {records_deleted} records from {table_name} in {duration:.2f}s"
-                    )
-
+                if records_deleted == 0:
                     return {
                         "table": table_name,
                         "status": "completed",
-                        "records_deleted": records_deleted,
-                        "duration_seconds": duration,
-                        "retention_days": policy.retention_days,
+                        "records_deleted": 0,
+                        "reason": "no_records_to_delete",
                     }
 
-                except Exception as e:
-                    await db.rollback()
-                    raise e
+                end_time = datetime.now()
+                duration = (end_time - start_time).total_seconds()
+
+                logger.info(
+                    f"Cleaned up {records_deleted} records from {table_name} in {duration:.2f}s"
+                )
+
+                return {
+                    "table": table_name,
+                    "status": "completed",
+                    "records_deleted": records_deleted,
+                    "duration_seconds": duration,
+                    "retention_days": policy.retention_days,
+                }
 
         except Exception as e:
             logger.error(f"Failed to cleanup table {table_name}: {e}")
             return {"table": table_name, "status": "error", "error": str(e)}
 
+    async def _delete_expired(self, db: aiosqlite.Connection, policy: RetentionPolicy) -> int:
+        """Delete a policy's expired records in short transactions.
+
+        Each batch holds the write lock only for RETENTION_DELETE_BATCH_SIZE
+        rows, and the pause between batches lets ingestion writes through.
+        A custom cleanup_query cannot be split and runs as one statement.
+
+        Returns:
+            Number of records deleted
+        """
+        if policy.cleanup_query:
+            cleanup_query, cleanup_params = policy.get_cleanup_query()
+            return await self._execute_delete(db, cleanup_query, cleanup_params)
+
+        cutoff = policy.get_cutoff()
+        batch_size = settings.RETENTION_DELETE_BATCH_SIZE
+        cleanup_query, cleanup_params = policy.get_batch_cleanup_query(cutoff, batch_size)
+
+        records_deleted = 0
+        while True:
+            deleted = await self._execute_delete(db, cleanup_query, cleanup_params)
+            records_deleted += deleted
+            if deleted < batch_size:
+                return records_deleted
+            await asyncio.sleep(settings.RETENTION_BATCH_PAUSE_SECONDS)
+
+    async def _execute_delete(self, db: aiosqlite.Connection, query: str, params: tuple) -> int:
+        """Run one DELETE in its own write transaction and return the row count."""
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = await db.execute(query, params)
+            deleted = cursor.rowcount
+            await db.commit()
+            return deleted
+        except Exception:
+            await db.rollback()
+            raise
+
     async def cleanup_all_tables(self, dry_run: bool = False) -> Dict[str, Any]:
         """Run cleanup on all tables with active retention policies."""
         results = {}
@@ -456,15 +534,12 @@ class RetentionManager:
             if result["status"] == "completed" and "records_deleted" in result:
                 total_deleted += result["records_deleted"]
 
-        # Run VACUUM after cleanup to reclaim space
+        # Reclaim the pages freed by the cleanup
         if not dry_run and total_deleted > 0:
             try:
-                async with aiosqlite.connect(self.storage.db_path) as db:
-                    logger.info("Running VACUUM to reclaim disk space...")
-                    await db.execute("VACUUM")
-                    logger.info("VACUUM completed successfully")
+                await self.reclaim_free_pages()
             except Exception as e:
-                logger.error(f"Failed to run VACUUM: {e}")
+                logger.error(f"Failed to reclaim free pages: {e}")
 
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -488,6 +563,42 @@ class RetentionManager:
 
         return summary
 
+    async def reclaim_free_pages(self) -> int:
+        """Return free pages to the file system in small incremental vacuum steps.
+
+        Databases created with auto_vacuum=INCREMENTAL (see init_database) are
+        shrunk RETENTION_VACUUM_PAGES pages at a time with a pause between
+        steps. An older database without it is converted once by a full VACUUM.
+
+        Returns:
+            Number of pages reclaimed
+        """
+        async with aiosqlite.connect(self.storage.db_path) as db:
+            cursor = await db.execute("PRAGMA auto_vacuum")
+            auto_vacuum = (await cursor.fetchone())[0]
+
+            if auto_vacuum != _AUTO_VACUUM_INCREMENTAL:
+                logger.info("Enabling incremental auto_vacuum (one-time full VACUUM)...")
+                await db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                await db.execute("VACUUM")
+                logger.info("VACUUM completed successfully")
+                return 0
+
+            cursor = await db.execute("PRAGMA freelist_count")
+            free_pages = (await cursor.fetchone())[0]
+
+            reclaimed = 0
+            while reclaimed < free_pages:
+                step = min(free_pages - reclaimed, settings.RETENTION_VACUUM_PAGES)
+                # executescript steps the pragma to completion; execute() would
+                # free a single page
+                await db.executescript(f"PRAGMA incremental_vacuum({int(step)})")
+                reclaimed += step
+                await asyncio.sleep(settings.RETENTION_BATCH_PAUSE_SECONDS)
+
+            logger.info(f"Incremental vacuum reclaimed {reclaimed} pages")
+            return reclaimed
+
     async def update_policy(self, table_name: str, retention_days: int, is_active: bool = True):
         """Update retention policy for a table.
 
@@ -0,0 +1,330 @@
+"""Downsampled metric rollups for the query API.
+
+Every flushed batch of raw metrics is folded into 1-minute, 1-hour and
+1-day rollup rows keyed by time bucket and the dimensions dashboards group
+by (service, metric type, tool, server, client, method). Each row keeps
+counts, sums, min/max duration and a fixed-boundary duration histogram, so
+rows can be merged and percentiles estimated without reading raw events.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Rollup resolution -> bucket width
+ROLLUP_RESOLUTIONS: Dict[str, timedelta] = {
+    "1m": timedelta(minutes=1),
+    "1h": timedelta(hours=1),
+    "1d": timedelta(days=1),
+}
+
+# Rollup table per resolution (names are fixed, never taken from input)
+ROLLUP_TABLES: Dict[str, str] = {
+    "1m": "metrics_rollup_1m",
+    "1h": "metrics_rollup_1h",
+    "1d": "metrics_rollup_1d",
+}
+
+# Query API group-by name -> rollup column
+ROLLUP_GROUP_COLUMNS: Dict[str, str] = {
+    "service": "service",
+    "metric_type": "metric_type",
+    "tool": "tool_name",
+    "server": "server_name",
+    "client": "client_name",
+    "method": "method",
+}
+
+# Upper bounds (ms) of the duration histogram buckets; the last bucket is
+# unbounded. Fixed rather than configurable so stored rows stay mergeable.
+ROLLUP_DURATION_BOUNDARIES_MS: Tuple[float, ...] = (
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+    30000.0,
+    60000.0,
+)
+
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def bucket_start(timestamp: datetime, resolution: str) -> str:
+    """Truncate a timestamp to the start of its rollup bucket.
+
+    Naive timestamps are taken as UTC (the ingestion default).
+
+    Returns:
+        Bucket start as a sortable UTC ISO string without offset
+    """
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(UTC).replace(tzinfo=None)
+    timestamp = timestamp.replace(second=0, microsecond=0)
+    if resolution in ("1h", "1d"):
+        timestamp = timestamp.replace(minute=0)
+    if resolution == "1d":
+        timestamp = timestamp.replace(hour=0)
+    return timestamp.strftime(_TIMESTAMP_FORMAT)
+
+
+def pick_resolution(start: datetime, end: datetime) -> str:
+    """Choose the coarsest-needed resolution for a time range.
+
+    Up to 6 hours reads 1-minute rows, up to 14 days 1-hour rows and
+    anything longer 1-day rows, keeping a chart at a few hundred points.
+    """
+    span = end - start
+    if span <= timedelta(hours=6):
+        return "1m"
+    if span <= timedelta(days=14):
+        return "1h"
+    return "1d"
+
+
+def _duration_bucket(duration_ms: float) -> int:
+    """Index of the histogram bucket a duration falls into."""
+    for index, bound in enumerate(ROLLUP_DURATION_BOUNDARIES_MS):
+        if duration_ms <= bound:
+            return index
+    return len(ROLLUP_DURATION_BOUNDARIES_MS)
+
+
+def merge_histograms(first: str | None, second: str | None) -> str:
+    """Add two JSON histogram arrays element-wise (registered as a SQL function)."""
+    counts = [0] * (len(ROLLUP_DURATION_BOUNDARIES_MS) + 1)
+    for encoded in (first, second):
+        for index, value in enumerate(json.loads(encoded or "[]")):
+            counts[index] += value
+    return json.dumps(counts)
+
+
+def _is_failure(success: Any) -> bool:
+    """True if a success dimension reports a failure."""
+    if isinstance(success, str):
+        return success.lower() == "false"
+    return success is False
+
+
+@dataclass
+class RollupAccumulator:
+    """Mergeable aggregate of the metrics in one bucket and dimension set."""
+
+    count: int = 0
+    error_count: int = 0
+    sum_value: float = 0.0
+    duration_count: int = 0
+    sum_duration_ms: float = 0.0
+    min_duration_ms: float | None = None
+    max_duration_ms: float | None = None
+    duration_buckets: List[int] = field(
+        default_factory=lambda: [0] * (len(ROLLUP_DURATION_BOUNDARIES_MS) + 1)
+    )
+
+    def add_metric(self, value: float, duration_ms: float | None, failed: bool) -> None:
+        """Fold one raw metric into the aggregate."""
+        self.count += 1
+        self.error_count += int(failed)
+        self.sum_value += value
+        if duration_ms is not None:
+            self._add_durations(
+                1, duration_ms, duration_ms, duration_ms, [(_duration_bucket(duration_ms), 1)]
+            )
+
+    def merge_row(self, row: Dict[str, Any]) -> None:
+        """Fold a stored rollup row into the aggregate."""
+        self.count += row["count"]
+        self.error_count += row["error_count"]
+        self.sum_value += row["sum_value"]
+        if row["duration_count"]:
+            self._add_durations(
+                row["duration_count"],
+                row["sum_duration_ms"],
+                row["min_duration_ms"],
+                row["max_duration_ms"],
+                enumerate(json.loads(row["duration_buckets"])),
+            )
+
+    def _add_durations(
+        self,
+        count: int,
+        total_ms: float,
+        min_ms: float,
+        max_ms: float,
+        bucket_counts: Iterable[Tuple[int, int]],
+    ) -> None:
+        self.duration_count += count
+        self.sum_duration_ms += total_ms
+        self.min_duration_ms = (
+            min_ms if self.min_duration_ms is None else min(self.min_duration_ms, min_ms)
+        )
+        self.max_duration_ms = (
+            max_ms if self.max_duration_ms is None else max(self.max_duration_ms, max_ms)
+        )
+        for index, bucket_count in bucket_counts:
+            self.duration_buckets[index] += bucket_count
+
+    def percentile(self, percentile: float) -> float | None:
+        """Estimate a duration percentile by interpolating within its bucket.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Estimated duration in ms, or None without duration samples
+        """
+        if self.duration_count == 0:
+            return None
+
+        rank = percentile / 100 * self.duration_count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.duration_buckets):
+            if bucket_count == 0:
+                continue
+            if cumulative + bucket_count >= rank:
+                lower = ROLLUP_DURATION_BOUNDARIES_MS[index - 1] if index > 0 else 0.0
+                upper = (
+                    ROLLUP_DURATION_BOUNDARIES_MS[index]
+                    if index < len(ROLLUP_DURATION_BOUNDARIES_MS)
+                    else self.max_duration_ms
+                )
+                lower = max(lower, self.min_duration_ms)
+                upper = min(upper, self.max_duration_ms)
+                fraction = (rank - cumulative) / bucket_count
+                return round(lower + (upper - lower) * fraction, 3)
+            cumulative += bucket_count
+        return self.max_duration_ms
+
+    def to_point(self, percentiles: List[float]) -> Dict[str, Any]:
+        """Render the aggregate as a query API data point."""
+        point = {
+            "count": self.count,
+            "error_count": self.error_count,
+            "sum_value": self.sum_value,
+            "avg_duration_ms": (
+                round(self.sum_duration_ms / self.duration_count, 3)
+                if self.duration_count
+                else None
+            ),
+            "min_duration_ms": self.min_duration_ms,
+            "max_duration_ms": self.max_duration_ms,
+        }
+        for percentile in percentiles:
+            point[f"p{percentile:g}_duration_ms"] = self.percentile(percentile)
+        return point
+
+
+# (bucket start, metric_type, service, tool_name, server_name, client_name, method)
+RollupKey = Tuple[str, str, str, str, str, str, str]
+
+
+def build_rollups(
+    metrics_batch: List[Dict[str, Any]],
+) -> Dict[str, Dict[RollupKey, RollupAccumulator]]:
+    """Aggregate a batch of buffered metrics per resolution and rollup key.
+
+    Args:
+        metrics_batch: Buffered entries with "metric" and "request" as stored
+            by MetricsStorage.store_metrics_batch
+
+    Returns:
+        Resolution -> rollup key -> aggregate of the batch's metrics
+    """
+    rollups: Dict[str, Dict[RollupKey, RollupAccumulator]] = {
+        resolution: {} for resolution in ROLLUP_RESOLUTIONS
+    }
+    for metric_data in metrics_batch:
+        metric = metric_data["metric"]
+        request = metric_data["request"]
+        dimensions = metric.dimensions
+        timestamp = metric.timestamp or datetime.utcnow()
+        dimension_key = (
+            metric.type.value,
+            request.service,
+            str(dimensions.get("tool_name") or ""),
+            str(dimensions.get("server_name") or dimensions.get("server") or ""),
+            str(dimensions.get("client_name") or ""),
+            str(dimensions.get("method") or ""),
+        )
+        failed = _is_failure(dimensions.get("success"))
+
+        for resolution, buckets in rollups.items():
+            key = (bucket_start(timestamp, resolution), *dimension_key)
+            accumulator = buckets.get(key)
+            if accumulator is None:
+                accumulator = buckets[key] = RollupAccumulator()
+            accumulator.add_metric(metric.value, metric.duration_ms, failed)
+    return rollups
+
+
+def rollup_schema_sql() -> str:
+    """CREATE statements for the rollup tables and their indexes."""
+    statements = []
+    for table in ROLLUP_TABLES.values():
+        statements.append(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,  -- bucket start, UTC
+                metric_type TEXT NOT NULL,
+                service TEXT NOT NULL,
+                tool_name TEXT NOT NULL DEFAULT '',
+                server_name TEXT NOT NULL DEFAULT '',
+                client_name TEXT NOT NULL DEFAULT '',
+                method TEXT NOT NULL DEFAULT '',
+                count INTEGER NOT NULL DEFAULT 0,
+                error_count INTEGER NOT NULL DEFAULT 0,
+                sum_value REAL NOT NULL DEFAULT 0,
+                duration_count INTEGER NOT NULL DEFAULT 0,
+                sum_duration_ms REAL NOT NULL DEFAULT 0,
+                min_duration_ms REAL,
+                max_duration_ms REAL,
+                duration_buckets TEXT NOT NULL DEFAULT '[]',  -- JSON histogram counts
+                created_at TEXT DEFAULT (datetime('now')),
+                updated_at TEXT DEFAULT (datetime('now')),
+                UNIQUE(timestamp, metric_type, service, tool_name, server_name, client_name, method)
+            );
+        """)
+    return "".join(statements)
+
+
+def build_series(
+    rows: Iterable[Dict[str, Any]],
+    group_by: List[str],
+    percentiles: List[float],
+) -> List[Dict[str, Any]]:
+    """Merge rollup rows into one time series per group.
+
+    Args:
+        rows: Rollup rows ordered by timestamp
+        group_by: Query API group-by names (keys of ROLLUP_GROUP_COLUMNS)
+        percentiles: Duration percentiles to estimate for every point
+
+    Returns:
+        Series with their group values and points ordered by timestamp
+    """
+    grouped: Dict[Tuple[str, ...], Dict[str, RollupAccumulator]] = {}
+    for row in rows:
+        group = tuple(row[ROLLUP_GROUP_COLUMNS[name]] for name in group_by)
+        points = grouped.setdefault(group, {})
+        accumulator = points.get(row["timestamp"])
+        if accumulator is None:
+            accumulator = points[row["timestamp"]] = RollupAccumulator()
+        accumulator.merge_row(row)
+
+    return [
+        {
+            "group": dict(zip(group_by, group, strict=True)),
+            "points": [
+                {"timestamp": timestamp, **accumulator.to_point(percentiles)}
+                for timestamp, accumulator in points.items()
+            ],
+        }
+        for group, points in sorted(grouped.items())
+    ]
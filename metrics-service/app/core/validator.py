@@ -1,6 +1,8 @@
 """Data validation module for metrics service."""
 
 import re
+import json
+import math
 import logging
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timezone
@@ -72,8 +74,153 @@ class MetricsValidator:
     MIN_DURATION_MS = 0.0
     MAX_DURATION_MS = 86400000.0  # 24 hours in milliseconds
 
+    # Compiled fast-path checks: pattern and length limit in one regex
+    _SERVICE_NAME_FULL = re.compile(r"[a-zA-Z0-9_-]{1,100}")
+    _INSTANCE_ID_FULL = re.compile(r"[a-zA-Z0-9_.-]{1,100}")
+    _DIMENSION_KEY_FULL = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]{0,49}")
+    _SCALAR_TYPES = frozenset({str, int, float, bool})
+    _NUMERIC_TYPES = frozenset({int, float, bool})
+    MAX_METRICS_PER_REQUEST = 100
+
     def validate_metric_request(self, request: MetricRequest) -> ValidationResult:
-        """Validate a complete metric request."""
+        """Validate a complete metric request.
+
+        The whole batch is first checked in one pass by the compiled fast
+        path, which stops at the first error. Only rejected requests are
+        walked field by field to collect every error message.
+        """
+        warnings = self._check_request(request)
+        if warnings is not None:
+            result = ValidationResult()
+            result.warnings = warnings
+            return result
+        return self._validate_request_fields(request)
+
+    def _check_request(self, request: MetricRequest) -> List[str] | None:
+        """Check a request in one pass, failing fast.
+
+        Returns:
+            Warnings if the request is valid, None at the first error
+        """
+        warnings: List[str] = []
+        service = request.service
+        if not (isinstance(service, str) and self._SERVICE_NAME_FULL.fullmatch(service)):
+            return None
+
+        version = request.version
+        if version:
+            if not isinstance(version, str):
+                return None
+            if not self.VERSION_PATTERN.match(version):
+                warnings.append(f"Version '{version}' does not follow semantic versioning (x.y.z)")
+
+        instance_id = request.instance_id
+        if instance_id and not (
+            isinstance(instance_id, str) and self._INSTANCE_ID_FULL.fullmatch(instance_id)
+        ):
+            return None
+
+        metrics = request.metrics
+        if not metrics or len(metrics) > self.MAX_METRICS_PER_REQUEST:
+            return None
+
+        now = datetime.now(timezone.utc).timestamp()
+        max_future = now + 300  # 5 minutes clock skew
+        min_past = now - (7 * 24 * 3600)  # 7 days
+        numeric_types = self._NUMERIC_TYPES
+        min_value = self.MIN_METRIC_VALUE
+        max_value = self.MAX_METRIC_VALUE
+        max_duration = self.MAX_DURATION_MS
+
+        for i, metric in enumerate(metrics):
+            if not isinstance(metric.type, MetricType):
+                return None
+
+            timestamp = metric.timestamp
+            if not isinstance(timestamp, datetime):
+                return None
+            seconds = timestamp.timestamp()
+            if seconds > max_future:
+                return None
+            if seconds < min_past:
+                warnings.append(f"Timestamp is very old: {timestamp.isoformat()}")
+
+            # NaN fails both comparisons, infinity the range check
+            value = metric.value
+            if type(value) not in numeric_types or not (min_value <= value <= max_value):
+                return None
+
+            duration = metric.duration_ms
+            if duration is not None and (
+                type(duration) not in numeric_types or not (0.0 <= duration <= max_duration)
+            ):
+                return None
+
+            if metric.dimensions and not self._check_dimensions(
+                metric.dimensions, f"metrics[{i}].dimensions", warnings
+            ):
+                return None
+            if metric.metadata and not self._check_metadata(metric.metadata):
+                return None
+
+        return warnings
+
+    def _check_dimensions(
+        self, dimensions: Dict[str, Any], field: str, warnings: List[str]
+    ) -> bool:
+        """Fast-path dimension check; appends conversion warnings."""
+        if not isinstance(dimensions, dict) or len(dimensions) > self.MAX_DIMENSIONS:
+            return False
+
+        key_pattern = self._DIMENSION_KEY_FULL
+        scalar_types = self._SCALAR_TYPES
+        max_length = self.DIMENSION_VALUE_MAX_LENGTH
+        for key, value in dimensions.items():
+            if not (isinstance(key, str) and key_pattern.fullmatch(key)):
+                return False
+            if value is None:
+                continue
+            value_type = type(value)
+            if value_type is str:
+                if len(value) > max_length:
+                    return False
+                continue
+            if len(str(value)) > max_length:
+                return False
+            if value_type not in scalar_types and not isinstance(value, (str, int, float, bool)):
+                warnings.append(
+                    f"Dimension value at {field}.{key} will be converted to string: "
+                    f"{value_type.__name__}"
+                )
+        return True
+
+    def _check_metadata(self, metadata: Dict[str, Any]) -> bool:
+        """Fast-path metadata check."""
+        if not isinstance(metadata, dict) or len(metadata) > self.MAX_METADATA_FIELDS:
+            return False
+
+        key_max_length = self.METADATA_KEY_MAX_LENGTH
+        value_max_length = self.METADATA_VALUE_MAX_LENGTH
+        for key, value in metadata.items():
+            if not isinstance(key, str) or len(key) > key_max_length:
+                return False
+            if value is None:
+                continue
+            if isinstance(value, (dict, list)):
+                try:
+                    encoded = json.dumps(value)
+                except (TypeError, ValueError):
+                    return False
+            elif type(value) is str:
+                encoded = value
+            else:
+                encoded = str(value)
+            if len(encoded) > value_max_length:
+                return False
+        return True
+
+    def _validate_request_fields(self, request: MetricRequest) -> ValidationResult:
+        """Validate a request field by field, collecting every error."""
         result = ValidationResult()
 
         # Validate service name
@@ -90,9 +237,11 @@ class MetricsValidator:
         # Validate metrics array
         if not request.metrics:
             result.add_error("metrics", "At least one metric is required")
-        elif len(request.metrics) > 100:
+        elif len(request.metrics) > self.MAX_METRICS_PER_REQUEST:
             result.add_error(
-                "metrics", f"Too many metrics in request: {len(request.metrics)}, max 100"
+                "metrics",
+                f"Too many metrics in request: {len(request.metrics)}, "
+                f"max {self.MAX_METRICS_PER_REQUEST}",
             )
         else:
             for i, metric in enumerate(request.metrics):
@@ -218,8 +367,6 @@ class MetricsValidator:
 
         # Check for NaN or infinity
         if isinstance(value, float):
-            import math
-
             if math.isnan(value):
                 result.add_error(field, "Metric value cannot be NaN")
             elif math.isinf(value):
@@ -332,8 +479,6 @@ class MetricsValidator:
         # Convert to string for length validation if not already serializable
         if isinstance(value, (dict, list)):
             try:
-                import json
-
                 str_value = json.dumps(value)
             except (TypeError, ValueError):
                 result.add_error(field, f"Metadata value at {field} is not JSON serializable")
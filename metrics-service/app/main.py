@@ -6,6 +6,7 @@ from .config import settings
 from .api.routes import router as api_router
 from .storage.database import init_database, wait_for_database, MetricsStorage
 from .core.rate_limiter import rate_limiter
+from .core.api_keys import api_key_usage
 from .core.retention import retention_manager
 from .utils.helpers import hash_api_key
 import os
@@ -56,6 +57,7 @@ async def lifespan(app: FastAPI):
     cleanup_task = asyncio.create_task(rate_limit_cleanup_task())
     retention_task = asyncio.create_task(retention_cleanup_task())
     flush_task = asyncio.create_task(metrics_flush_task())
+    usage_task = asyncio.create_task(api_key_usage_flush_task())
     logger.info("Background tasks started")
 
     yield
@@ -64,13 +66,21 @@ async def lifespan(app: FastAPI):
     cleanup_task.cancel()
     retention_task.cancel()
     flush_task.cancel()
+    usage_task.cancel()
     try:
         await cleanup_task
         await retention_task
         await flush_task
+        await usage_task
     except asyncio.CancelledError:
         pass
 
+    # Write usage timestamps collected since the last periodic flush
+    try:
+        await api_key_usage.flush(MetricsStorage())
+    except Exception as e:
+        logger.error(f"Failed to flush API key usage on shutdown: {e}")
+
     logger.info("Shutting down Metrics Collection Service")
 
 
@@ -129,6 +139,21 @@ async def metrics_flush_task():
             await asyncio.sleep(5)  # Wait 5 seconds before retry
 
 
+async def api_key_usage_flush_task():
+    """Background task to write batched API key last-used timestamps."""
+    storage = MetricsStorage()
+
+    while True:
+        try:
+            await asyncio.sleep(settings.API_KEY_USAGE_FLUSH_SECONDS)
+            written = await api_key_usage.flush(storage)
+            logger.debug(f"API key usage written for {written} keys")
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.error(f"Error in API key usage flush task: {e}")
+
+
 async def setup_preshared_api_keys():
     """Setup pre-shared API keys from environment variables dynamically."""
     storage = MetricsStorage()
@@ -188,6 +213,7 @@ async def root():
         "status": "running",
         "endpoints": {
             "metrics": "/metrics",
+            "metrics-query": "/metrics/query",
             "health": "/health",
             "flush": "/flush",
             "rate-limit": "/rate-limit",
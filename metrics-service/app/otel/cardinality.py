@@ -0,0 +1,130 @@
+"""Label-cardinality limits applied before metrics reach OTel instruments.
+
+Every distinct label set recorded on a counter or histogram becomes a time
+series that the MeterProvider and the Prometheus reader keep for the life of
+the process, so free-form dimensions (search queries, user hashes, resource
+IDs) would grow memory without bound. Before a label set is recorded:
+
+- labels not on the allowlist are dropped,
+- labels configured as hashed are replaced by one of a fixed number of
+  stable hash buckets,
+- each label keeps at most a fixed number of distinct values per
+  instrument; later new values are collapsed to "other",
+- once an instrument has reached its series limit, new label sets are
+  folded into a single overflow series.
+
+Admitted values and series are never evicted: with cumulative temporality
+the SDK keeps every series it has seen, so forgetting one would not free
+memory. Frequent values appear early in real traffic and take the budget.
+"""
+
+import hashlib
+import logging
+from typing import Dict, FrozenSet, Iterable, Set, Tuple
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+OTHER_LABEL_VALUE = "other"
+
+# Label set used for series beyond an instrument's limit (OTel SDK convention)
+OVERFLOW_LABELS: Dict[str, str] = {"otel_metric_overflow": "true"}
+
+
+class LabelCardinalityLimiter:
+    """Bound the label sets recorded per OTel instrument."""
+
+    def __init__(
+        self,
+        allowed_labels: Iterable[str],
+        hashed_labels: Iterable[str],
+        max_values_per_label: int,
+        max_series_per_instrument: int,
+        hash_buckets: int,
+    ):
+        self.hashed_labels: FrozenSet[str] = frozenset(hashed_labels)
+        self.allowed_labels: FrozenSet[str] = frozenset(allowed_labels) | self.hashed_labels
+        self.max_values_per_label = max_values_per_label
+        self.max_series_per_instrument = max_series_per_instrument
+        self.hash_buckets = max(hash_buckets, 1)
+
+        # {(instrument, label): admitted values}
+        self._values: Dict[Tuple[str, str], Set[str]] = {}
+        # {instrument: label sets recorded so far}
+        self._series: Dict[str, Set[FrozenSet[Tuple[str, str]]]] = {}
+        # {instrument: label values collapsed to "other" or the overflow series}
+        self._collapsed: Dict[str, int] = {}
+
+    def limit(self, instrument: str, labels: Dict[str, str]) -> Dict[str, str]:
+        """Return the bounded label set to record on an instrument.
+
+        Args:
+            instrument: Instrument (or instrument family) the labels are for
+            labels: Normalized label set built from a metric's dimensions
+
+        Returns:
+            Label set with cardinality limits applied
+        """
+        limited = {}
+        for key, value in labels.items():
+            if key not in self.allowed_labels:
+                continue
+            if key in self.hashed_labels:
+                limited[key] = self._hash_bucket(value)
+            else:
+                limited[key] = self._admit_value(instrument, key, value)
+
+        series = self._series.setdefault(instrument, set())
+        series_key = frozenset(limited.items())
+        if series_key in series:
+            return limited
+        if len(series) < self.max_series_per_instrument:
+            series.add(series_key)
+            return limited
+
+        self._record_collapse(instrument)
+        return OVERFLOW_LABELS
+
+    def _admit_value(self, instrument: str, key: str, value: str) -> str:
+        """Keep a label value within the per-label budget, else collapse it."""
+        values = self._values.setdefault((instrument, key), set())
+        if value in values:
+            return value
+        if len(values) < self.max_values_per_label:
+            values.add(value)
+            return value
+        self._record_collapse(instrument)
+        return OTHER_LABEL_VALUE
+
+    def _hash_bucket(self, value: str) -> str:
+        """Map a value to one of hash_buckets stable buckets."""
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+        return f"h{int.from_bytes(digest, 'big') % self.hash_buckets}"
+
+    def _record_collapse(self, instrument: str) -> None:
+        count = self._collapsed.get(instrument, 0)
+        if count == 0:
+            logger.warning(
+                f"Label cardinality limit reached for {instrument}; "
+                f"new values are collapsed to '{OTHER_LABEL_VALUE}'"
+            )
+        self._collapsed[instrument] = count + 1
+
+    def series_counts(self) -> Dict[str, int]:
+        """Number of distinct label sets recorded per instrument."""
+        return {instrument: len(series) for instrument, series in self._series.items()}
+
+    def collapsed_counts(self) -> Dict[str, int]:
+        """Number of label values collapsed per instrument since startup."""
+        return dict(self._collapsed)
+
+
+# Global limiter instance
+label_limiter = LabelCardinalityLimiter(
+    allowed_labels=settings.OTEL_LABEL_ALLOWLIST,
+    hashed_labels=settings.OTEL_HASHED_LABELS,
+    max_values_per_label=settings.OTEL_MAX_LABEL_VALUES,
+    max_series_per_instrument=settings.OTEL_MAX_SERIES_PER_INSTRUMENT,
+    hash_buckets=settings.OTEL_LABEL_HASH_BUCKETS,
+)
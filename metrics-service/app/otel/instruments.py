@@ -1,7 +1,9 @@
 from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import MetricReader
 import logging
+from .cardinality import label_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -69,4 +71,31 @@ class MetricsInstruments:
             unit="s",
         )
 
+        # Label cardinality limiter instruments
+        self.label_series_gauge = self.meter.create_observable_gauge(
+            name="mcp_metrics_label_series",
+            callbacks=[_observe_label_series],
+            description="Distinct label sets recorded per metric type",
+            unit="1",
+        )
+
+        self.label_collapsed_counter = self.meter.create_observable_counter(
+            name="mcp_metrics_label_values_collapsed_total",
+            callbacks=[_observe_collapsed_labels],
+            description="Label values collapsed by the cardinality limiter per metric type",
+            unit="1",
+        )
+
         logger.info("OpenTelemetry metric instruments initialized")
+
+
+def _observe_label_series(options: CallbackOptions):
+    """Report the label cardinality limiter's series counts."""
+    for instrument, count in label_limiter.series_counts().items():
+        yield Observation(count, {"instrument": instrument})
+
+
+def _observe_collapsed_labels(options: CallbackOptions):
+    """Report label values collapsed by the cardinality limiter."""
+    for instrument, count in label_limiter.collapsed_counts().items():
+        yield Observation(count, {"instrument": instrument})
@@ -6,6 +6,14 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 from ..config import settings
+from ..core.rollups import (
+    ROLLUP_GROUP_COLUMNS,
+    ROLLUP_TABLES,
+    build_rollups,
+    merge_histograms,
+    rollup_schema_sql,
+)
+from ..core.api_keys import api_key_cache
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +86,10 @@ async def init_database():
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
     async with aiosqlite.connect(db_path) as db:
+        # Let retention cleanup shrink the file in small steps; only takes
+        # effect on a new database (RetentionManager converts older ones)
+        await db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+
         # Enable WAL mode for better concurrency
         await db.execute("PRAGMA journal_mode=WAL")
         await db.execute("PRAGMA synchronous=NORMAL")
@@ -192,6 +204,9 @@ async def init_database():
             CREATE INDEX IF NOT EXISTS idx_api_keys_service ON api_keys(service_name);
         """)
 
+        # Rollup tables behind the metrics query API
+        await db.executescript(rollup_schema_sql())
+
         await db.commit()
         logger.info("Database tables and indexes created successfully")
 
@@ -240,6 +255,8 @@ class MetricsStorage:
                     # Store in specialized table based on type
                     await self._store_specialized_metric(db, metric, request, request_id)
 
+                await self._store_rollups(db, metrics_batch)
+
                 await db.commit()
                 logger.debug(f"Stored batch of {len(metrics_batch)} metrics to container DB")
 
@@ -248,6 +265,94 @@ class MetricsStorage:
                 logger.error(f"Failed to store metrics batch: {e}")
                 raise
 
+    async def _store_rollups(self, db, metrics_batch: List[Dict[str, Any]]):
+        """Fold a batch into the 1m/1h/1d rollup tables in the batch's transaction."""
+        await db.create_function("merge_histograms", 2, merge_histograms, deterministic=True)
+
+        for resolution, rollups in build_rollups(metrics_batch).items():
+            table = ROLLUP_TABLES[resolution]
+            # nosec B608 - table comes from the fixed ROLLUP_TABLES mapping
+            await db.executemany(
+                f"""
+                INSERT INTO {table} (
+                    timestamp, metric_type, service, tool_name, server_name,
+                    client_name, method, count, error_count, sum_value,
+                    duration_count, sum_duration_ms, min_duration_ms,
+                    max_duration_ms, duration_buckets
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(
+                    timestamp, metric_type, service, tool_name, server_name,
+                    client_name, method
+                ) DO UPDATE SET
+                    count = count + excluded.count,
+                    error_count = error_count + excluded.error_count,
+                    sum_value = sum_value + excluded.sum_value,
+                    duration_count = duration_count + excluded.duration_count,
+                    sum_duration_ms = sum_duration_ms + excluded.sum_duration_ms,
+                    min_duration_ms = COALESCE(
+                        MIN(min_duration_ms, excluded.min_duration_ms),
+                        min_duration_ms, excluded.min_duration_ms
+                    ),
+                    max_duration_ms = COALESCE(
+                        MAX(max_duration_ms, excluded.max_duration_ms),
+                        max_duration_ms, excluded.max_duration_ms
+                    ),
+                    duration_buckets = merge_histograms(
+                        duration_buckets, excluded.duration_buckets
+                    ),
+                    updated_at = datetime('now')
+            """,  # nosec B608
+                [
+                    (
+                        *key,
+                        rollup.count,
+                        rollup.error_count,
+                        rollup.sum_value,
+                        rollup.duration_count,
+                        rollup.sum_duration_ms,
+                        rollup.min_duration_ms,
+                        rollup.max_duration_ms,
+                        json.dumps(rollup.duration_buckets),
+                    )
+                    for key, rollup in rollups.items()
+                ],
+            )
+
+    async def query_rollups(
+        self,
+        resolution: str,
+        start: str,
+        end: str,
+        filters: Dict[str, str],
+    ) -> List[Dict[str, Any]]:
+        """Read rollup rows in a time range.
+
+        Args:
+            resolution: Key of ROLLUP_TABLES
+            start: Inclusive lower bound of the bucket start (see bucket_start)
+            end: Exclusive upper bound of the bucket start
+            filters: Query API dimension name (key of ROLLUP_GROUP_COLUMNS) -> value
+
+        Returns:
+            Rollup rows ordered by bucket start
+        """
+        table = ROLLUP_TABLES[resolution]
+        conditions = ["timestamp >= ?", "timestamp < ?"]
+        params: List[Any] = [start, end]
+        for name, value in filters.items():
+            conditions.append(f"{ROLLUP_GROUP_COLUMNS[name]} = ?")
+            params.append(value)
+
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            # nosec B608 - table and columns come from fixed mappings, values are bound
+            cursor = await db.execute(
+                f"SELECT * FROM {table} WHERE {' AND '.join(conditions)}"  # nosec B608
+                " ORDER BY timestamp",
+                params,
+            )
+            return [dict(row) for row in await cursor.fetchall()]
+
     async def _store_specialized_metric(self, db, metric, request, request_id):
         """Store metric in specialized table based on type."""
         if metric.type.value == "auth_request":
@@ -344,16 +449,16 @@ class MetricsStorage:
                     }
                 return None
 
-    async def update_api_key_usage(self, key_hash: str):
-        """Update last_used_at timestamp for API key."""
+    async def update_api_keys_usage(self, usage: Dict[str, str]):
+        """Write batched last_used_at timestamps for several API keys.
+
+        Args:
+            usage: key_hash -> last used timestamp (UTC, "YYYY-MM-DD HH:MM:SS")
+        """
         async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                UPDATE api_keys 
-                SET last_used_at = datetime('now') 
-                WHERE key_hash = ?
-            """,
-                (key_hash,),
+            await db.executemany(
+                "UPDATE api_keys SET last_used_at = ? WHERE key_hash = ?",
+                [(last_used_at, key_hash) for key_hash, last_used_at in usage.items()],
             )
             await db.commit()
 
@@ -371,7 +476,8 @@ class MetricsStorage:
                     (key_hash, service_name, rate_limit),
                 )
                 await db.commit()
-                return True
+            api_key_cache.invalidate(key_hash)
+            return True
         except Exception as e:
             logger.error(f"Failed to create API key: {e}")
             return False
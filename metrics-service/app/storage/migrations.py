@@ -8,6 +8,7 @@ from typing import List, Dict, Any, Callable, Optional
 from pathlib import Path
 from ..config import settings
 from .database import MetricsStorage
+from ..core.rollups import ROLLUP_TABLES, rollup_schema_sql
 import aiosqlite
 
 logger = logging.getLogger(__name__)
@@ -372,6 +373,18 @@ class MigrationManager:
             )
         )
 
+        # Migration 6: Rollup tables for the metrics query API
+        self.migrations.append(
+            Migration(
+                version=6,
+                name="add_metric_rollup_tables",
+                up_sql=rollup_schema_sql(),
+                down_sql="".join(
+                    f"DROP TABLE IF EXISTS {table};\n" for table in ROLLUP_TABLES.values()
+                ),
+            )
+        )
+
     async def get_current_version(self) -> int:
         """Get the current schema version from the database."""
         try:
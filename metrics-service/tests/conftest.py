@@ -16,6 +16,7 @@ from app.config import Settings
 from app.storage.database import init_database, MetricsStorage
 from app.core.models import MetricType, Metric, MetricRequest
 from app.utils.helpers import hash_api_key
+from app.core.api_keys import api_key_cache, api_key_usage
 from datetime import datetime
 
 
@@ -27,6 +28,16 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_api_key_state():
+    """Clear cached API key metadata and pending usage between tests."""
+    api_key_cache.invalidate()
+    api_key_usage._pending.clear()
+    yield
+    api_key_cache.invalidate()
+    api_key_usage._pending.clear()
+
+
 @pytest.fixture
 def temp_db():
     """Create a temporary database for testing."""
@@ -96,7 +96,6 @@ class TestMetricsEndpoint:
             "rate_limit": 1000,
             "last_used_at": None,
         }
-        mock_storage.update_api_key_usage.return_value = None
         mock_storage_class.return_value = mock_storage
 
         # Mock processor for metrics processing
@@ -129,7 +128,6 @@ class TestMetricsEndpoint:
             "is_active": True,
             "rate_limit": 1000,
         }
-        mock_storage.update_api_key_usage.return_value = None
         mock_storage_class.return_value = mock_storage
 
         headers = {"X-API-Key": "test_key_123"}
@@ -148,7 +146,6 @@ class TestMetricsEndpoint:
             "is_active": True,
             "rate_limit": 1000,
         }
-        mock_storage.update_api_key_usage.return_value = None
         mock_storage_class.return_value = mock_storage
 
         headers = {"X-API-Key": "test_key_123"}
@@ -170,7 +167,6 @@ class TestMetricsEndpoint:
             "is_active": True,
             "rate_limit": 1000,
         }
-        mock_storage.update_api_key_usage.return_value = None
         mock_storage_class.return_value = mock_storage
 
         headers = {"X-API-Key": "test_key_123"}
@@ -201,7 +197,6 @@ class TestMetricsEndpoint:
             "rate_limit": 1000,
             "last_used_at": None,
         }
-        mock_storage.update_api_key_usage.return_value = None
         mock_storage_class.return_value = mock_storage
 
         # Mock processor's process_metrics to raise an error
@@ -224,7 +219,6 @@ class TestMetricsEndpoint:
             "is_active": True,
             "rate_limit": 1000,
         }
-        mock_storage.update_api_key_usage.return_value = None
         mock_storage_class.return_value = mock_storage
 
         # Mock processor for metrics processing
@@ -274,7 +268,6 @@ class TestFlushEndpoint:
             "rate_limit": 1000,
             "last_used_at": None,
         }
-        mock_storage.update_api_key_usage.return_value = None
         mock_storage_class.return_value = mock_storage
 
         # Mock processor for flush
@@ -6,6 +6,8 @@ from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
 from app.api.auth import verify_api_key
+from app.core.api_keys import api_key_cache, api_key_usage
+from app.storage.database import MetricsStorage
 from app.utils.helpers import hash_api_key
 from app.main import app
 
@@ -24,7 +26,6 @@ class TestAPIKeyVerification:
             "rate_limit": 1000,
             "last_used_at": None,
         }
-        mock_storage.update_api_key_usage.return_value = None
         mock_storage_class.return_value = mock_storage
 
         # Mock request with API key header
@@ -37,7 +38,7 @@ class TestAPIKeyVerification:
 
         assert result == "test-service"
         mock_storage.get_api_key.assert_called_once_with(hash_api_key("test_key_123"))
-        mock_storage.update_api_key_usage.assert_called_once()
+        assert hash_api_key("test_key_123") in api_key_usage._pending
 
     @patch("app.api.auth.MetricsStorage")
     async def test_verify_missing_api_key(self, mock_storage_class):
@@ -107,7 +108,6 @@ class TestAPIKeyVerification:
             "rate_limit": 1000,
             "last_used_at": "2024-01-01T00:00:00",
         }
-        mock_storage.update_api_key_usage.return_value = None
         mock_storage_class.return_value = mock_storage
 
         from unittest.mock import MagicMock
@@ -115,11 +115,96 @@ class TestAPIKeyVerification:
         mock_request = MagicMock()
         mock_request.headers = {"X-API-Key": "test_key_123"}
 
-        result = await verify_api_key(mock_request)
+        await verify_api_key(mock_request)
 
-        # Verify usage was updated with correct key hash
+        # Usage is recorded in memory, not written per request
         expected_hash = hash_api_key("test_key_123")
-        mock_storage.update_api_key_usage.assert_called_once_with(expected_hash)
+        assert expected_hash in api_key_usage._pending
+
+        # The periodic flush writes it in one batch
+        assert await api_key_usage.flush(mock_storage) == 1
+        usage = mock_storage.update_api_keys_usage.call_args.args[0]
+        assert list(usage) == [expected_hash]
+        assert api_key_usage.pending == 0
+
+    @patch("app.api.auth.MetricsStorage")
+    async def test_verify_api_key_uses_cache(self, mock_storage_class):
+        """Test that repeated verification reads the key from the cache."""
+        mock_storage = AsyncMock()
+        mock_storage.get_api_key.return_value = {
+            "service_name": "test-service",
+            "is_active": True,
+            "rate_limit": 1000,
+            "last_used_at": None,
+        }
+        mock_storage_class.return_value = mock_storage
+
+        from unittest.mock import MagicMock
+
+        mock_request = MagicMock()
+        mock_request.headers = {"X-API-Key": "test_key_123"}
+
+        assert await verify_api_key(mock_request) == "test-service"
+        assert await verify_api_key(mock_request) == "test-service"
+
+        mock_storage.get_api_key.assert_called_once()
+
+    @patch("app.api.auth.MetricsStorage")
+    async def test_invalid_api_key_is_not_cached(self, mock_storage_class):
+        """Test that unknown keys are looked up again once they are created."""
+        mock_storage = AsyncMock()
+        mock_storage.get_api_key.return_value = None
+        mock_storage_class.return_value = mock_storage
+
+        from unittest.mock import MagicMock
+
+        mock_request = MagicMock()
+        mock_request.headers = {"X-API-Key": "new_key"}
+
+        with pytest.raises(HTTPException):
+            await verify_api_key(mock_request)
+
+        mock_storage.get_api_key.return_value = {
+            "service_name": "new-service",
+            "is_active": True,
+            "rate_limit": 1000,
+            "last_used_at": None,
+        }
+        assert await verify_api_key(mock_request) == "new-service"
+
+
+class TestAPIKeyCacheStorage:
+    """Test cache invalidation and batched usage writes against SQLite."""
+
+    async def test_create_api_key_invalidates_cache(self, initialized_db):
+        """Test that creating a key drops stale cached metadata for it."""
+        key_hash = hash_api_key("rotated_key")
+        api_key_cache.put(key_hash, {"service_name": "stale"})
+
+        assert await MetricsStorage().create_api_key(key_hash, "test-service")
+
+        assert api_key_cache.get(key_hash) is None
+
+    async def test_usage_flush_updates_last_used(self, storage_with_api_key):
+        """Test that flushed usage timestamps land in the api_keys table."""
+        storage, test_api_key = storage_with_api_key
+        api_key_usage.record(test_api_key["hash"])
+
+        assert await api_key_usage.flush(storage) == 1
+
+        key_info = await storage.get_api_key(test_api_key["hash"])
+        assert key_info["last_used_at"] is not None
+
+    async def test_failed_usage_flush_is_retried(self):
+        """Test that usage timestamps are kept when the write fails."""
+        storage = AsyncMock()
+        storage.update_api_keys_usage.side_effect = Exception("database is locked")
+        api_key_usage.record("key_hash")
+
+        with pytest.raises(Exception, match="database is locked"):
+            await api_key_usage.flush(storage)
+
+        assert api_key_usage.pending == 1
 
 
 class TestAPIKeyHashingHelpers:
@@ -0,0 +1,98 @@
+"""Tests for the OTel label cardinality limiter."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.models import Metric, MetricType
+from app.core.processor import MetricsProcessor
+from app.otel.cardinality import OVERFLOW_LABELS, LabelCardinalityLimiter
+
+
+@pytest.fixture
+def limiter():
+    """Limiter with small budgets."""
+    return LabelCardinalityLimiter(
+        allowed_labels=["service", "tool_name", "success"],
+        hashed_labels=["user_hash"],
+        max_values_per_label=2,
+        max_series_per_instrument=5,
+        hash_buckets=4,
+    )
+
+
+class TestLabelCardinalityLimiter:
+    """Test allowlisting, hashing, value budgets and series limits."""
+
+    def test_drops_labels_not_on_allowlist(self, limiter):
+        """Free-form dimensions are not exported."""
+        labels = limiter.limit(
+            "tool_discovery", {"service": "registry", "query": "find weather tools"}
+        )
+
+        assert labels == {"service": "registry"}
+
+    def test_hashed_labels_use_stable_buckets(self, limiter):
+        """Hashed labels map to one of a fixed number of buckets."""
+        buckets = {
+            limiter.limit("auth_request", {"user_hash": f"user_{i}"})["user_hash"]
+            for i in range(50)
+        }
+        first = limiter.limit("auth_request", {"user_hash": "user_1"})
+        second = limiter.limit("auth_request", {"user_hash": "user_1"})
+
+        assert buckets <= {"h0", "h1", "h2", "h3"}
+        assert first == second
+
+    def test_values_beyond_budget_collapse_to_other(self, limiter):
+        """Each label keeps a bounded number of distinct values per instrument."""
+        seen = [
+            limiter.limit("tool_execution", {"tool_name": name})["tool_name"]
+            for name in ("search", "fetch", "delete", "search")
+        ]
+
+        assert seen == ["search", "fetch", "other", "search"]
+        # Budgets are per instrument
+        assert limiter.limit("health_check", {"tool_name": "delete"}) == {"tool_name": "delete"}
+        assert limiter.collapsed_counts() == {"tool_execution": 1}
+
+    def test_series_beyond_limit_go_to_overflow(self, limiter):
+        """New label sets past the series limit share one overflow series."""
+        for service in ("a", "b"):
+            for tool_name in ("search", "fetch"):
+                for success in ("true", "false"):
+                    labels = limiter.limit(
+                        "tool_execution",
+                        {"service": service, "tool_name": tool_name, "success": success},
+                    )
+
+        assert labels == OVERFLOW_LABELS
+        assert limiter.series_counts() == {"tool_execution": 5}
+        # Already recorded label sets keep their series
+        assert limiter.limit(
+            "tool_execution", {"service": "a", "tool_name": "search", "success": "true"}
+        ) == {"service": "a", "tool_name": "search", "success": "true"}
+
+
+class TestProcessorLabelLimits:
+    """Test that the processor applies the limiter before recording."""
+
+    @patch("app.core.processor.MetricsStorage")
+    async def test_discovery_query_is_not_a_label(self, mock_storage_class):
+        """Discovery queries and user hashes never reach OTel as raw labels."""
+        mock_storage_class.return_value = AsyncMock()
+        processor = MetricsProcessor()
+        processor.otel = MagicMock()
+
+        metric = Metric(
+            type=MetricType.TOOL_DISCOVERY,
+            value=1.0,
+            dimensions={"query": "weather in paris", "user_hash": "user_abc123"},
+        )
+
+        processor._emit_batch_to_otel([metric], "registry")
+
+        _, labels = processor.otel.discovery_counter.add.call_args.args
+        assert "query" not in labels
+        assert labels["user_hash"] != "user_abc123"
+        assert labels["service"] == "registry"
@@ -51,8 +51,8 @@ class TestAPIKeyManagement:
         result = await storage.get_api_key("nonexistent_hash")
         assert result is None
 
-    async def test_update_api_key_usage(self, storage_with_api_key):
-        """Test updating API key last usage timestamp."""
+    async def test_update_api_keys_usage(self, storage_with_api_key):
+        """Test writing batched API key last usage timestamps."""
         storage, api_key_info = storage_with_api_key
 
         # Get initial state
@@ -60,11 +60,12 @@ class TestAPIKeyManagement:
         initial_last_used = initial_info["last_used_at"]
 
         # Update usage
-        await storage.update_api_key_usage(api_key_info["hash"])
+        await storage.update_api_keys_usage({api_key_info["hash"]: "2024-01-02 03:04:05"})
 
         # Check that last_used_at was updated
         updated_info = await storage.get_api_key(api_key_info["hash"])
         assert updated_info["last_used_at"] != initial_last_used
+        assert updated_info["last_used_at"] == "2024-01-02 03:04:05"
 
 
 class TestMetricsStorage:
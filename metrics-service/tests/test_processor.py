@@ -284,7 +284,7 @@ class TestOTelEmission:
             dimensions={"success": True, "method": "oauth"},
         )
 
-        await processor._emit_to_otel(metric, "test-service")
+        processor._emit_batch_to_otel([metric], "test-service")
 
         # Verify counter was called
         processor.otel.auth_counter.add.assert_called_once_with(
@@ -323,7 +323,7 @@ class TestOTelEmission:
             dimensions={"query": "test search"},
         )
 
-        await processor._emit_to_otel(metric, "registry-service")
+        processor._emit_batch_to_otel([metric], "registry-service")
 
         processor.otel.discovery_counter.add.assert_called_once()
         processor.otel.discovery_histogram.record.assert_called_once()
@@ -343,7 +343,7 @@ class TestOTelEmission:
             dimensions={"tool_name": "calculator", "success": True},
         )
 
-        await processor._emit_to_otel(metric, "mcpgw-service")
+        processor._emit_batch_to_otel([metric], "mcpgw-service")
 
         processor.otel.tool_counter.add.assert_called_once()
         processor.otel.tool_histogram.record.assert_called_once()
@@ -353,11 +353,16 @@ class TestOTelEmission:
         """Test emission when OTel is not available."""
         processor = MetricsProcessor()
         processor.otel = None
+        processor._emit_batch_to_otel = MagicMock()
 
         metric = Metric(type=MetricType.AUTH_REQUEST, value=1.0)
+        request = MetricRequest(service="test-service", metrics=[metric])
 
         # Should not raise any exceptions
-        await processor._emit_to_otel(metric, "test-service")
+        result = await processor.process_metrics(request, "test_req_123", "test-service")
+
+        assert result.accepted == 1
+        processor._emit_batch_to_otel.assert_not_called()
 
 
 class TestBufferedStorage:
@@ -405,3 +410,45 @@ class TestBufferedStorage:
 
         # Storage should have been called
         mock_storage.store_metrics_batch.assert_called_once()
+
+    @patch("app.core.processor.MetricsStorage")
+    async def test_batch_emission_groups_by_type_and_labels(self, mock_storage_class):
+        """Test that metrics sharing a type and label set are emitted together."""
+        mock_storage_class.return_value = AsyncMock()
+        processor = MetricsProcessor()
+        processor.otel = MagicMock()
+
+        metrics = [
+            Metric(
+                type=MetricType.TOOL_EXECUTION,
+                value=1.0,
+                duration_ms=100.0,
+                dimensions={"tool_name": "search", "success": True},
+            ),
+            Metric(
+                type=MetricType.TOOL_EXECUTION,
+                value=2.0,
+                duration_ms=300.0,
+                dimensions={"tool_name": "search", "success": True},
+            ),
+            Metric(
+                type=MetricType.TOOL_EXECUTION,
+                value=1.0,
+                dimensions={"tool_name": "fetch", "success": True},
+            ),
+        ]
+
+        processor._emit_batch_to_otel(metrics, "registry")
+
+        search_labels = {
+            "service": "registry",
+            "metric_type": "tool_execution",
+            "tool_name": "search",
+            "success": "true",
+        }
+        assert processor.otel.tool_counter.add.call_count == 2
+        processor.otel.tool_counter.add.assert_any_call(3.0, search_labels)
+        assert [c.args for c in processor.otel.tool_histogram.record.call_args_list] == [
+            (0.1, search_labels),
+            (0.3, search_labels),
+        ]
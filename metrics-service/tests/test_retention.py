@@ -17,6 +17,7 @@ from app.core.retention import (
     _validate_timestamp_column,
     _validate_identifier,
 )
+from app.config import settings
 from app.storage.database import MetricsStorage
 from app.storage.migrations import MigrationManager
 import aiosqlite
@@ -293,6 +294,63 @@ class TestRetentionManager:
         assert new_manager.policies["custom_table"].retention_days == 120
         assert new_manager.policies["custom_table"].is_active is True
 
+    @pytest.mark.asyncio
+    async def test_cleanup_table_deletes_in_batches(self, manager, temp_db, monkeypatch):
+        """Expired records are deleted in batches of RETENTION_DELETE_BATCH_SIZE."""
+        monkeypatch.setattr(settings, "RETENTION_DELETE_BATCH_SIZE", 1)
+        monkeypatch.setattr(settings, "RETENTION_BATCH_PAUSE_SECONDS", 0)
+        manager.policies["test_metrics"] = RetentionPolicy(
+            table_name="test_metrics", retention_days=30
+        )
+        executed = []
+        original = manager._execute_delete
+
+        async def tracking_delete(db, query, params):
+            deleted = await original(db, query, params)
+            executed.append(deleted)
+            return deleted
+
+        monkeypatch.setattr(manager, "_execute_delete", tracking_delete)
+
+        result = await manager.cleanup_table("test_metrics", dry_run=False)
+
+        assert result["records_deleted"] == 2
+        assert executed == [1, 1, 0]
+        async with aiosqlite.connect(temp_db) as db:
+            cursor = await db.execute("SELECT value FROM test_metrics ORDER BY value")
+            assert [row[0] for row in await cursor.fetchall()] == [3.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_reclaim_free_pages_enables_incremental_vacuum(
+        self, manager, temp_db, monkeypatch
+    ):
+        """The first run converts the database; later runs vacuum incrementally."""
+        monkeypatch.setattr(settings, "RETENTION_VACUUM_PAGES", 2)
+        monkeypatch.setattr(settings, "RETENTION_BATCH_PAUSE_SECONDS", 0)
+
+        assert await manager.reclaim_free_pages() == 0
+
+        async with aiosqlite.connect(temp_db) as db:
+            cursor = await db.execute("PRAGMA auto_vacuum")
+            assert (await cursor.fetchone())[0] == 2
+            await db.executemany(
+                "INSERT INTO test_metrics (created_at, value) VALUES (?, ?)",
+                [("2000-01-01T00:00:00", "x" * 2000) for _ in range(50)],
+            )
+            await db.commit()
+            await db.execute("DELETE FROM test_metrics WHERE created_at = '2000-01-01T00:00:00'")
+            await db.commit()
+            cursor = await db.execute("PRAGMA freelist_count")
+            free_pages = (await cursor.fetchone())[0]
+
+        reclaimed = await manager.reclaim_free_pages()
+
+        assert free_pages > 2
+        assert reclaimed == free_pages
+        async with aiosqlite.connect(temp_db) as db:
+            cursor = await db.execute("PRAGMA freelist_count")
+            assert (await cursor.fetchone())[0] == 0
+
 
 class TestRetentionIntegration:
     """Integration tests for retention system."""
@@ -510,6 +568,9 @@ class TestAllowlistConfiguration:
             "tool_metrics",
             "metrics_hourly",
             "metrics_daily",
+            "metrics_rollup_1m",
+            "metrics_rollup_1h",
+            "metrics_rollup_1d",
             "api_key_usage_log",
         }
 
@@ -0,0 +1,200 @@
+"""Tests for metric rollups and the metrics query API."""
+
+import json
+from datetime import UTC, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import aiosqlite
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import routes
+from app.core.models import Metric, MetricRequest, MetricType
+from app.core.rollups import (
+    RollupAccumulator,
+    bucket_start,
+    build_rollups,
+    build_series,
+    pick_resolution,
+)
+from app.main import app
+from app.storage.database import MetricsStorage
+
+
+def _tool_batch(durations, tool_name="search", success=True, minute=30):
+    """Buffered tool execution metrics as passed to store_metrics_batch."""
+    request = MetricRequest(service="registry", metrics=[])
+    return [
+        {
+            "metric": Metric(
+                type=MetricType.TOOL_EXECUTION,
+                timestamp=datetime(2024, 1, 15, 10, minute, 12),
+                value=1.0,
+                duration_ms=duration,
+                dimensions={"tool_name": tool_name, "server_name": "docs", "success": success},
+            ),
+            "request": request,
+            "request_id": f"req_{index}",
+        }
+        for index, duration in enumerate(durations)
+    ]
+
+
+class TestRollupHelpers:
+    """Tests for bucketing, resolution choice and percentile estimates."""
+
+    def test_bucket_start_truncates_per_resolution(self):
+        """Buckets start at the minute, hour or day, in UTC."""
+        timestamp = datetime(2024, 1, 15, 10, 30, 12, tzinfo=timezone(timedelta(hours=2)))
+
+        assert bucket_start(timestamp, "1m") == "2024-01-15T08:30:00"
+        assert bucket_start(timestamp, "1h") == "2024-01-15T08:00:00"
+        assert bucket_start(timestamp, "1d") == "2024-01-15T00:00:00"
+
+    def test_pick_resolution_follows_range_length(self):
+        """Longer ranges read coarser rollups."""
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+
+        assert pick_resolution(start, start + timedelta(hours=1)) == "1m"
+        assert pick_resolution(start, start + timedelta(days=2)) == "1h"
+        assert pick_resolution(start, start + timedelta(days=30)) == "1d"
+
+    def test_percentiles_are_estimated_within_observed_range(self):
+        """Percentiles interpolate inside the histogram bucket and stay within min/max."""
+        accumulator = RollupAccumulator()
+        for duration in (1.0, 2.0, 3.0, 4.0, 40.0, 45.0, 48.0, 50.0, 400.0, 2000.0):
+            accumulator.add_metric(1.0, duration, failed=False)
+
+        p50 = accumulator.percentile(50)
+        p99 = accumulator.percentile(99)
+
+        assert 25.0 <= p50 <= 50.0
+        assert 1000.0 <= p99 <= 2000.0
+        assert accumulator.percentile(100) == 2000.0
+        assert RollupAccumulator().percentile(50) is None
+
+    def test_build_rollups_groups_by_bucket_and_dimensions(self):
+        """One aggregate per bucket and dimension set, failures counted."""
+        batch = _tool_batch([10.0, 20.0]) + _tool_batch([30.0], success=False, minute=31)
+
+        rollups = build_rollups(batch)
+
+        assert len(rollups["1m"]) == 2
+        (hourly,) = rollups["1h"].values()
+        assert hourly.count == 3
+        assert hourly.error_count == 1
+        assert hourly.min_duration_ms == 10.0
+        assert hourly.max_duration_ms == 30.0
+
+
+class TestRollupStorage:
+    """Tests for maintaining rollups at flush time."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_are_merged_into_existing_rows(self, initialized_db):
+        """A second flush into the same bucket adds to the stored row."""
+        storage = MetricsStorage()
+
+        await storage.store_metrics_batch(_tool_batch([10.0, 20.0]))
+        await storage.store_metrics_batch(_tool_batch([5.0, 300.0], success="false"))
+
+        async with aiosqlite.connect(initialized_db) as db:
+            db.row_factory = aiosqlite.Row
+            cursor = await db.execute("SELECT * FROM metrics_rollup_1h")
+            rows = [dict(row) for row in await cursor.fetchall()]
+
+        assert len(rows) == 1
+        row = rows[0]
+        assert row["timestamp"] == "2024-01-15T10:00:00"
+        assert row["tool_name"] == "search"
+        assert row["server_name"] == "docs"
+        assert row["count"] == 4
+        assert row["error_count"] == 2
+        assert row["min_duration_ms"] == 5.0
+        assert row["max_duration_ms"] == 300.0
+        assert sum(json.loads(row["duration_buckets"])) == 4
+
+    @pytest.mark.asyncio
+    async def test_query_rollups_filters_and_groups(self, initialized_db):
+        """Rows are filtered by dimension and merged into one series per group."""
+        storage = MetricsStorage()
+        await storage.store_metrics_batch(
+            _tool_batch([10.0, 20.0]) + _tool_batch([100.0], tool_name="fetch", minute=45)
+        )
+
+        rows = await storage.query_rollups(
+            "1m", "2024-01-15T10:00:00", "2024-01-15T11:00:00", {"server": "docs"}
+        )
+        series = build_series(rows, ["tool"], [50])
+
+        assert [s["group"] for s in series] == [{"tool": "fetch"}, {"tool": "search"}]
+        search_points = series[1]["points"]
+        assert search_points[0]["timestamp"] == "2024-01-15T10:30:00"
+        assert search_points[0]["count"] == 2
+        assert search_points[0]["avg_duration_ms"] == 15.0
+        assert "p50_duration_ms" in search_points[0]
+
+
+class TestMetricsQueryEndpoint:
+    """Tests for GET /metrics/query."""
+
+    @pytest.fixture
+    def authorized(self):
+        """Accept any API key."""
+        with patch("app.api.auth.MetricsStorage") as mock_storage_class:
+            mock_storage = AsyncMock()
+            mock_storage.get_api_key.return_value = {
+                "service_name": "dashboard",
+                "is_active": True,
+                "rate_limit": 1000,
+            }
+            mock_storage_class.return_value = mock_storage
+            yield {"X-API-Key": "test_key_123"}
+
+    @pytest.mark.asyncio
+    async def test_query_returns_series(self, initialized_db, authorized):
+        """A day-long query reads hourly rollups grouped by tool."""
+        storage = MetricsStorage()
+        await storage.store_metrics_batch(_tool_batch([10.0, 20.0]))
+        client = TestClient(app)
+
+        with patch.object(routes.processor, "storage", storage):
+            response = client.get(
+                "/metrics/query",
+                params={
+                    "start": "2024-01-15T00:00:00",
+                    "end": "2024-01-16T00:00:00",
+                    "group_by": "tool",
+                    "percentiles": "95",
+                },
+                headers=authorized,
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["resolution"] == "1h"
+        assert data["series"][0]["group"] == {"tool": "search"}
+        assert data["series"][0]["points"][0]["count"] == 2
+        assert data["series"][0]["points"][0]["p95_duration_ms"] is not None
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"group_by": "user_hash"},
+            {"resolution": "5m"},
+            {"percentiles": "abc"},
+            {"percentiles": "101"},
+            {"end": "2024-01-14T00:00:00"},
+        ],
+    )
+    def test_invalid_parameters_are_rejected(self, authorized, params):
+        """Unknown dimensions, resolutions, percentiles and empty ranges return 400."""
+        client = TestClient(app)
+
+        response = client.get(
+            "/metrics/query",
+            params={"start": "2024-01-15T00:00:00", **params},
+            headers=authorized,
+        )
+
+        assert response.status_code == 400
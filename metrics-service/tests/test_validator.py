@@ -386,3 +386,56 @@ class TestFullRequestValidation:
 
         assert not result.is_valid
         assert any("metrics[1]" in error.field for error in result.errors)
+
+    def test_fast_path_skips_field_walk_for_valid_request(self, validator):
+        """Test that a valid batch is accepted without the per-field validators."""
+        old = datetime.now(timezone.utc) - timedelta(days=10)
+        request = MetricRequest(
+            service="test-service",
+            version="latest",
+            metrics=[
+                Metric(type=MetricType.TOOL_EXECUTION, timestamp=old, value=1.0),
+                Metric(type=MetricType.AUTH_REQUEST, value=2.0, dimensions={"tags": ["a"]}),
+            ],
+        )
+        validator._validate_request_fields = None  # Would raise if called
+
+        result = validator.validate_metric_request(request)
+
+        assert result.is_valid
+        assert any("semantic versioning" in warning for warning in result.warnings)
+        assert any("very old" in warning for warning in result.warnings)
+        assert any("converted to string" in warning for warning in result.warnings)
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"value": float("nan")},
+            {"value": 1e13},
+            {"duration_ms": -1.0},
+            {"dimensions": {"k": "x" * 201}},
+            {"metadata": {"k": "x" * 1001}},
+        ],
+    )
+    def test_fast_path_rejections_report_field_errors(self, validator, overrides):
+        """Test that requests failing the fast path get detailed error messages."""
+        fields = {
+            "type": MetricType.AUTH_REQUEST,
+            "timestamp": datetime.now(timezone.utc),
+            "value": 1.0,
+            "duration_ms": None,
+            "dimensions": {},
+            "metadata": {},
+            **overrides,
+        }
+        request = MetricRequest.model_construct(
+            service="test-service",
+            version=None,
+            instance_id=None,
+            metrics=[Metric.model_construct(**fields)],
+        )
+
+        result = validator.validate_metric_request(request)
+
+        assert not result.is_valid
+        assert all(error.field.startswith("metrics[0]") for error in result.errors)
@@ -26,6 +26,7 @@ from pydantic import BaseModel
 from ..audit import set_audit_action
 from ..auth.dependencies import nginx_proxied_auth
 from ..core.config import settings
+from ..core.http_clients import CLIENT_BACKEND, get_http_client
 from ..repositories.factory import get_search_repository
 from ..repositories.interfaces import SearchRepositoryBase
 from ..schemas.agent_models import (
@@ -35,7 +36,7 @@ from ..schemas.agent_models import (
     AgentRegistrationRequest,
 )
 from ..services.agent_service import agent_service
-from ..utils.request_utils import get_client_ip
+from ..utils.request_utils import conditional_json_response, get_client_ip
 
 
 def get_search_repo() -> SearchRepositoryBase:
@@ -482,7 +483,7 @@ async def list_agents(
         user_context: Authenticated user context
 
     Returns:
-        List of agent info objects
+        List of agent info objects, with an ETag for conditional requests
     """
     # Set audit action for agent list
     set_audit_action(request, "list", "agent", description="List all agents")
@@ -553,10 +554,13 @@ async def list_agents(
         f"(out of {len(all_agents)} total)"
     )
 
-    return {
-        "agents": [agent.model_dump() for agent in filtered_agents],
-        "total_count": len(filtered_agents),
-    }
+    return conditional_json_response(
+        request,
+        {
+            "agents": [agent.model_dump() for agent in filtered_agents],
+            "total_count": len(filtered_agents),
+        },
+    )
 
 
 # IMPORTANT: Specific routes with path suffixes (/health, /rate, /rating, /toggle)
@@ -605,8 +609,8 @@ async def check_agent_health(
     start_time = datetime.now(UTC)
 
     try:
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-            response = await client.get(ping_url)
+        client = get_http_client(CLIENT_BACKEND)
+        response = await client.get(ping_url, timeout=timeout_seconds)
         status_code = response.status_code
         response_time_ms = int((datetime.now(UTC) - start_time).total_seconds() * 1000)
         if response.status_code == 200:
@@ -1080,28 +1084,21 @@ async def discover_agents_by_skills(
 
     logger.info(f"User {user_context['username']} discovering agents with skills: {skills}")
 
-    all_agents = await agent_service.get_all_agents()
-    accessible_agents = _filter_agents_by_access(all_agents, user_context)
+    # Enabled agents with at least one required skill, from the inverted skill index
+    candidates = agent_service.find_agents_by_skills(skills, tags)
+    accessible_paths = {
+        agent.path
+        for agent in _filter_agents_by_access([agent for agent, _, _ in candidates], user_context)
+    }
 
     matched_agents = []
     required_skills = set(s.lower() for s in skills)
     required_tags = set(t.lower() for t in tags) if tags else set()
 
-    for agent in accessible_agents:
-        if not agent_service.is_agent_enabled(agent.path):
+    for agent, skill_matches, tag_matches in candidates:
+        if agent.path not in accessible_paths:
             continue
 
-        agent_skills = set(skill.id.lower() for skill in agent.skills) | set(
-            skill.name.lower() for skill in agent.skills
-        )
-
-        skill_matches = required_skills & agent_skills
-        if not skill_matches:
-            continue
-
-        agent_tags = set(t.lower() for t in agent.tags)
-        tag_matches = required_tags & agent_tags if required_tags else set()
-
         skill_match_score = len(skill_matches) / len(required_skills)
         tag_match_score = len(tag_matches) / len(required_tags) if required_tags else 0.0
 
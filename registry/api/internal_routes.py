@@ -16,6 +16,8 @@ from registry.schemas.backend_session_models import (
     CreateClientSessionRequest,
     CreateClientSessionResponse,
     GetBackendSessionResponse,
+    GetBackendSessionsRequest,
+    GetBackendSessionsResponse,
     StoreSessionRequest,
 )
 
@@ -104,7 +106,7 @@ async def get_backend_session(
 
     The session_key is '<client_session_id>:<backend_key>'.
     Returns the backend_session_id if found, 404 otherwise.
-    Also bumps last_used_at atomically.
+    Also records the access so last_used_at is bumped.
     """
     repo = _get_repo()
 
@@ -129,6 +131,28 @@ async def get_backend_session(
     return GetBackendSessionResponse(backend_session_id=backend_session_id)
 
 
+@router.post(
+    "/internal/sessions/backend-lookup",
+    response_model=GetBackendSessionsResponse,
+)
+async def get_backend_sessions(
+    request: GetBackendSessionsRequest,
+):
+    """Look up the backend sessions of one client for several backends.
+
+    Lets the Lua router resolve every backend of a virtual server with one
+    call. Backends without a session are omitted from the response.
+    """
+    repo = _get_repo()
+
+    sessions = await repo.get_backend_sessions(
+        client_session_id=request.client_session_id,
+        backend_keys=request.backend_keys,
+    )
+
+    return GetBackendSessionsResponse(sessions=sessions)
+
+
 @router.put(
     "/internal/sessions/backend/{session_key:path}",
     status_code=200,
@@ -20,7 +20,9 @@ from ..health.service import health_service
 from ..schemas.anthropic_schema import ErrorResponse, ServerList, ServerResponse
 from ..services.server_service import server_service
 from ..services.transform_service import (
+    cursor_to_name_key,
     transform_to_server_list,
+    transform_to_server_page,
     transform_to_server_response,
 )
 
@@ -67,35 +69,23 @@ async def list_servers(
         f"{REGISTRY_CONSTANTS.ANTHROPIC_API_VERSION} API: Listing servers for user '{user_context['username']}' (cursor={cursor}, limit={limit})"
     )
 
-    # Get servers based on user permissions (same logic as existing /servers endpoint)
-    if user_context["is_admin"]:
-        # Admin sees all servers
-        all_servers = await server_service.get_all_servers()
-        logger.debug(f"Admin user accessing all {len(all_servers)} servers")
-    else:
-        # Regular user sees only accessible servers
-        all_servers = await server_service.get_all_servers_with_permissions(
-            user_context["accessible_servers"]
-        )
-        logger.debug(f"User accessing {len(all_servers)} accessible servers")
-
-    # For API, we don't need UI service filtering - accessible_servers already handles MCP server permissions
-    # No additional filtering needed here - the get_all_servers_with_permissions already filtered by accessible_servers
-    filtered_servers = []
-
-    for path, server_info in all_servers.items():
-        # Add health status and enabled state for transformation
-        health_data = health_service._get_service_health_data(path, server_info)
-
-        server_info_with_status = server_info.copy()
-        server_info_with_status["health_status"] = health_data["status"]
-        server_info_with_status["last_checked_iso"] = health_data["last_checked_iso"]
-        server_info_with_status["is_enabled"] = await server_service.is_service_enabled(path)
+    # Keyset pagination: fetch one extra server to know whether another page follows
+    page_size = limit or 100
+    accessible_servers = None if user_context["is_admin"] else user_context["accessible_servers"]
+    page_servers = await server_service.list_servers_page(
+        after=cursor_to_name_key(cursor),
+        limit=page_size + 1,
+        accessible_servers=accessible_servers,
+    )
 
-        filtered_servers.append(server_info_with_status)
+    for server_info in page_servers:
+        # Add health status for transformation (is_enabled comes from the repository)
+        health_data = health_service._get_service_health_data(server_info["path"], server_info)
+        server_info["health_status"] = health_data["status"]
+        server_info["last_checked_iso"] = health_data["last_checked_iso"]
 
-    # Transform to Anthropic format with pagination
-    server_list = transform_to_server_list(filtered_servers, cursor=cursor, limit=limit or 100)
+    # Transform to Anthropic format; unchanged servers reuse their cached ServerResponse
+    server_list = transform_to_server_page(page_servers, limit=page_size)
 
     logger.info(
         f"{REGISTRY_CONSTANTS.ANTHROPIC_API_VERSION} API: Returning {len(server_list.servers)} servers (hasMore={server_list.metadata.nextCursor is not None})"
@@ -4,7 +4,6 @@ import logging
 import os
 from typing import Annotated
 
-import httpx
 from fastapi import APIRouter, Cookie, Depends, Form, HTTPException, Request, status
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
@@ -15,10 +14,12 @@ from ..auth.dependencies import enhanced_auth, nginx_proxied_auth
 from ..auth.internal import validate_internal_auth
 from ..constants import VALID_AUTH_SCHEMES
 from ..core.config import settings
+from ..core.http_clients import CLIENT_INTERNAL, get_http_client
 from ..core.schemas import AuthCredentialUpdateRequest
 from ..services.security_scanner import security_scanner_service
 from ..services.server_service import server_service
 from ..utils.credential_encryption import encrypt_credential_in_server_dict
+from ..utils.request_utils import conditional_json_response
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +77,7 @@ async def _perform_security_scan_on_registration(
             headers=headers_json,
             timeout=scan_config.scan_timeout_seconds,
             mcp_endpoint=server_entry.get("mcp_endpoint"),
+            tool_list=server_entry.get("tool_list"),
         )
 
         # Handle unsafe servers
@@ -390,7 +392,7 @@ async def get_servers_json(
                 }
             )
 
-    return {"servers": service_data}
+    return conditional_json_response(request, {"servers": service_data})
 
 
 @router.post("/toggle/{service_path:path}")
@@ -2122,56 +2124,55 @@ async def generate_user_token(
         }
 
         # Call auth server internal API (no authentication needed since both are trusted internal services)
-        async with httpx.AsyncClient() as client:
-            headers = {"Content-Type": "application/json"}
-
-            auth_server_url = settings.auth_server_url
-            response = await client.post(
-                f"{auth_server_url}/internal/tokens",
-                json=auth_request,
-                headers=headers,
-                timeout=10.0,
-            )
-
-            if response.status_code == 200:
-                token_data = response.json()
-                logger.info(f"Successfully generated token for user '{user_context['username']}'")
-
-                # Format response to match expected structure (including refresh token)
-                formatted_response = {
-                    "success": True,
-                    "tokens": {
-                        "access_token": token_data.get("access_token"),
-                        "refresh_token": token_data.get("refresh_token"),
-                        "expires_in": token_data.get("expires_in"),
-                        "refresh_expires_in": token_data.get("refresh_expires_in"),
-                        "token_type": token_data.get("token_type", "Bearer"),
-                        "scope": token_data.get("scope", ""),
-                    },
-                    "keycloak_url": getattr(settings, "keycloak_url", None)
-                    or "http://keycloak:8080",
-                    "realm": getattr(settings, "keycloak_realm", None) or "mcp-gateway",
-                    "client_id": "user-generated",
-                    # Legacy fields for backward compatibility
-                    "token_data": token_data,
-                    "user_scopes": user_context["scopes"],
-                    "requested_scopes": requested_scopes or user_context["scopes"],
-                }
+        client = get_http_client(CLIENT_INTERNAL)
+        headers = {"Content-Type": "application/json"}
+
+        auth_server_url = settings.auth_server_url
+        response = await client.post(
+            f"{auth_server_url}/internal/tokens",
+            json=auth_request,
+            headers=headers,
+            timeout=10.0,
+        )
+
+        if response.status_code == 200:
+            token_data = response.json()
+            logger.info(f"Successfully generated token for user '{user_context['username']}'")
+
+            # Format response to match expected structure (including refresh token)
+            formatted_response = {
+                "success": True,
+                "tokens": {
+                    "access_token": token_data.get("access_token"),
+                    "refresh_token": token_data.get("refresh_token"),
+                    "expires_in": token_data.get("expires_in"),
+                    "refresh_expires_in": token_data.get("refresh_expires_in"),
+                    "token_type": token_data.get("token_type", "Bearer"),
+                    "scope": token_data.get("scope", ""),
+                },
+                "keycloak_url": getattr(settings, "keycloak_url", None) or "http://keycloak:8080",
+                "realm": getattr(settings, "keycloak_realm", None) or "mcp-gateway",
+                "client_id": "user-generated",
+                # Legacy fields for backward compatibility
+                "token_data": token_data,
+                "user_scopes": user_context["scopes"],
+                "requested_scopes": requested_scopes or user_context["scopes"],
+            }
 
-                return formatted_response
-            else:
-                error_detail = "Unknown error"
-                try:
-                    error_response = response.json()
-                    error_detail = error_response.get("detail", "Unknown error")
-                except:
-                    error_detail = response.text
-
-                logger.warning(f"Auth server returned error {response.status_code}: {error_detail}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Token generation failed: {error_detail}",
-                )
+            return formatted_response
+        else:
+            error_detail = "Unknown error"
+            try:
+                error_response = response.json()
+                error_detail = error_response.get("detail", "Unknown error")
+            except:
+                error_detail = response.text
+
+            logger.warning(f"Auth server returned error {response.status_code}: {error_detail}")
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"Token generation failed: {error_detail}",
+            )
 
     except HTTPException:
         raise
@@ -3706,6 +3707,7 @@ async def rescan_server(
             headers=None,
             timeout=None,
             mcp_endpoint=server_info.get("mcp_endpoint"),
+            force=True,
         )
 
         # Return the scan result data
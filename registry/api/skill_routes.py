@@ -24,6 +24,7 @@ from fastapi import (
     Request,
     status,
 )
+from fastapi.responses import Response
 from pydantic import BaseModel
 
 from ..audit.context import set_audit_action
@@ -49,6 +50,7 @@ from ..services.skill_service import (
 )
 from ..services.tool_validation_service import get_tool_validation_service
 from ..utils.path_utils import normalize_skill_path
+from ..utils.request_utils import conditional_json_response
 
 # Configure logging
 logging.basicConfig(
@@ -137,11 +139,15 @@ async def discover_skills(
 
 @router.get("", summary="List all skills")
 async def list_skills(
+    request: Request,
     user_context: Annotated[dict, Depends(nginx_proxied_auth)],
     include_disabled: bool = Query(False, description="Include disabled skills"),
     tag: str | None = Query(None, description="Filter by tag"),
-) -> dict:
-    """List all registered skills with visibility filtering."""
+) -> Response:
+    """List all registered skills with visibility filtering.
+
+    The response carries an ETag, so pollers can revalidate with If-None-Match.
+    """
     service = get_skill_service()
     skills = await service.list_skills_for_user(
         user_context=user_context,
@@ -151,10 +157,13 @@ async def list_skills(
     logger.info(
         f"Returning {len(skills)} skills for user {user_context.get('username', 'unknown')}"
     )
-    return {
-        "skills": [skill.model_dump(mode="json") for skill in skills],
-        "total_count": len(skills),
-    }
+    return conditional_json_response(
+        request,
+        {
+            "skills": [skill.model_dump(mode="json") for skill in skills],
+            "total_count": len(skills),
+        },
+    )
 
 
 @router.post("/parse-skill-md", summary="Parse SKILL.md content from URL")
@@ -308,40 +317,21 @@ async def get_skill_content(
             detail="URL failed SSRF validation - private/internal addresses are not allowed",
         )
 
+    # Served from the SKILL.md content cache when fresh, revalidated otherwise
     try:
-        import httpx
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(str(raw_url), follow_redirects=True, timeout=30.0)
-
-            # SSRF protection: validate final URL after redirects
-            final_url = str(response.url)
-            if final_url != str(raw_url) and not _is_safe_url(final_url):
-                logger.warning(
-                    f"SSRF protection: Blocked redirect from {raw_url} to unsafe URL {final_url}"
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Redirect to unsafe URL blocked: {final_url}",
-                )
-
-            if response.status_code >= 400:
-                raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY,
-                    detail=f"Failed to fetch SKILL.md: HTTP {response.status_code}",
-                )
-
-            return {
-                "content": response.text,
-                "url": str(raw_url),
-            }
-    except httpx.RequestError as e:
-        logger.error(f"Failed to fetch SKILL.md from {raw_url}: {e}")
+        content = await service.get_skill_md_content(str(raw_url))
+    except SkillUrlValidationError as e:
+        logger.error(f"Failed to fetch SKILL.md from {raw_url}: {e.reason}")
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to fetch SKILL.md: {e}",
+            detail=f"Failed to fetch SKILL.md: {e.reason}",
         )
 
+    return {
+        "content": content,
+        "url": str(raw_url),
+    }
+
 
 @router.get(
     "/{skill_path:path}/tools",
@@ -11,6 +11,7 @@ from datetime import UTC, datetime
 from fastapi import APIRouter, HTTPException
 
 from ..core.config import settings
+from ..core.http_clients import CLIENT_INTERNAL, get_http_client
 from ..version import __version__
 
 logger = logging.getLogger(__name__)
@@ -115,34 +116,32 @@ async def _get_auth_status() -> dict:
 
     # Try to ping the auth server health endpoint
     try:
-        import httpx
-
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            # Try common health check endpoints
-            health_endpoints = [
-                f"{auth_url}/health",
-                f"{auth_url}/healthcheck",
-                f"{auth_url}/.well-known/openid-configuration",
-            ]
-
-            for endpoint in health_endpoints:
-                try:
-                    response = await client.get(endpoint)
-                    if response.status_code < 500:  # 2xx, 3xx, 4xx are all "reachable"
-                        return {
-                            "provider": provider,
-                            "status": "Healthy",
-                            "url": auth_url,
-                        }
-                except Exception:
-                    continue
-
-            # If all endpoints failed, auth server is unhealthy
-            return {
-                "provider": provider,
-                "status": "Unhealthy",
-                "url": auth_url,
-            }
+        client = get_http_client(CLIENT_INTERNAL)
+        # Try common health check endpoints
+        health_endpoints = [
+            f"{auth_url}/health",
+            f"{auth_url}/healthcheck",
+            f"{auth_url}/.well-known/openid-configuration",
+        ]
+
+        for endpoint in health_endpoints:
+            try:
+                response = await client.get(endpoint, timeout=5.0)
+                if response.status_code < 500:  # 2xx, 3xx, 4xx are all "reachable"
+                    return {
+                        "provider": provider,
+                        "status": "Healthy",
+                        "url": auth_url,
+                    }
+            except Exception:
+                continue
+
+        # If all endpoints failed, auth server is unhealthy
+        return {
+            "provider": provider,
+            "status": "Unhealthy",
+            "url": auth_url,
+        }
 
     except Exception as e:
         logger.error(f"Auth server health check failed: {e}")
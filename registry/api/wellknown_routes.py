@@ -1,22 +1,152 @@
+import json
 import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
 
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import JSONResponse, Response
 
 from ..constants import HealthStatus
 from ..core.config import RegistryMode, settings
 from ..health.service import health_service
 from ..services.server_service import server_service
+from ..utils.request_utils import compute_etag, etag_matches
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Rendered documents kept per (proto, host, base URL); the Host header is
+# client-controlled, so the number of variants is bounded
+DISCOVERY_DOCUMENT_MAX_VARIANTS = 16
+
+
+@dataclass(frozen=True)
+class _DiscoveryCatalog:
+    """Enabled servers as of one catalog load."""
+
+    generation: Any
+    loaded_at: float
+    servers: list[dict]
+
+
+@dataclass(frozen=True)
+class _RenderedDocument:
+    """A discovery document serialized once, with the state it was rendered from."""
+
+    loaded_at: float
+    health: tuple[str, ...]
+    body: bytes
+    etag: str
+
+
+_catalog: _DiscoveryCatalog | None = None
+_documents: OrderedDict[tuple[str, str, str], _RenderedDocument] = OrderedDict()
+
+
+async def _get_catalog() -> _DiscoveryCatalog:
+    """Return the enabled servers, reloading them only when the catalog may have changed.
+
+    Changes made through server_service bump its catalog generation; the
+    wellknown_cache_ttl bound covers writes by other registry instances.
+    """
+    global _catalog
+
+    generation = server_service.catalog_generation
+    now = time.monotonic()
+    if (
+        _catalog is not None
+        and _catalog.generation == generation
+        and now - _catalog.loaded_at < settings.wellknown_cache_ttl
+    ):
+        return _catalog
+
+    all_servers = await server_service.get_all_servers()
+    enabled_servers = []
+    for server_path, server_info in all_servers.items():
+        # For now, include all enabled servers
+        # TODO: Add discoverability flag to server configs if needed
+        if await server_service.is_service_enabled(server_path):
+            enabled_servers.append(server_info)
+
+    _catalog = _DiscoveryCatalog(generation=generation, loaded_at=now, servers=enabled_servers)
+    return _catalog
+
+
+def _render_document(
+    response_data: dict,
+) -> bytes:
+    """Serialize a discovery document the way JSONResponse would."""
+    return json.dumps(
+        response_data,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _get_rendered_document(
+    catalog: _DiscoveryCatalog,
+    request: Request,
+) -> _RenderedDocument:
+    """Return the serialized document for this request's host, rendering it if stale."""
+    key = (
+        request.headers.get("x-forwarded-proto", request.url.scheme),
+        request.headers.get("host", "localhost:7860"),
+        str(request.base_url),
+    )
+    health = tuple(
+        _get_normalized_health_status(server_info.get("path", ""))
+        for server_info in catalog.servers
+    )
+
+    document = _documents.get(key)
+    if (
+        document is not None
+        and document.loaded_at == catalog.loaded_at
+        and document.health == health
+    ):
+        _documents.move_to_end(key)
+        return document
+
+    discoverable_servers = [
+        _format_server_discovery(server_info, request) for server_info in catalog.servers
+    ]
+    response_data = {
+        "version": "1.0",
+        "servers": discoverable_servers,
+        "registry": {
+            "name": "Enterprise MCP Gateway",
+            "description": "Centralized MCP server registry for enterprise tools",
+            "version": "1.0.0",
+            "contact": {
+                "url": str(request.base_url).rstrip("/"),
+                "support": "mcp-support@company.com",
+            },
+        },
+    }
+    body = _render_document(response_data)
+    document = _RenderedDocument(
+        loaded_at=catalog.loaded_at,
+        health=health,
+        body=body,
+        etag=compute_etag(body),
+    )
+
+    _documents[key] = document
+    _documents.move_to_end(key)
+    while len(_documents) > DISCOVERY_DOCUMENT_MAX_VARIANTS:
+        _documents.popitem(last=False)
+
+    logger.info(f"Rendered well-known discovery document with {len(discoverable_servers)} servers")
+    return document
+
 
 @router.get("/mcp-servers")
-async def get_wellknown_mcp_servers(
-    request: Request, user_context: dict | None = None
-) -> JSONResponse:
+async def get_wellknown_mcp_servers(request: Request, user_context: dict | None = None) -> Response:
     """
     Main endpoint handler for /.well-known/mcp-servers
     Returns JSON with all discoverable MCP servers
@@ -47,41 +177,19 @@ async def get_wellknown_mcp_servers(
         logger.info("Returning empty server list - skills-only mode")
         return JSONResponse(content=response_data, headers=headers)
 
-    # Step 2: Get all servers from server_service
-    all_servers = await server_service.get_all_servers()
-
-    # Step 3: Filter based on discoverability and permissions
-    discoverable_servers = []
-    for server_path, server_info in all_servers.items():
-        # For now, include all enabled servers
-        # TODO: Add discoverability flag to server configs if needed
-        if await server_service.is_service_enabled(server_path):
-            formatted_server = _format_server_discovery(server_info, request)
-            discoverable_servers.append(formatted_server)
-
-    # Step 4: Format response
-    response_data = {
-        "version": "1.0",
-        "servers": discoverable_servers,
-        "registry": {
-            "name": "Enterprise MCP Gateway",
-            "description": "Centralized MCP server registry for enterprise tools",
-            "version": "1.0.0",
-            "contact": {
-                "url": str(request.base_url).rstrip("/"),
-                "support": "mcp-support@company.com",
-            },
-        },
-    }
+    # Step 2: Reuse the pre-rendered document unless the catalog or health changed
+    catalog = await _get_catalog()
+    document = _get_rendered_document(catalog, request)
 
-    # Step 5: Return JSONResponse with cache headers
+    # Step 3: Answer revalidations with 304 and everything else with the cached bytes
     headers = {
         "Cache-Control": f"public, max-age={settings.wellknown_cache_ttl}",
-        "Content-Type": "application/json",
+        "ETag": document.etag,
     }
+    if etag_matches(request, document.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    logger.info(f"Returned {len(discoverable_servers)} servers for well-known discovery")
-    return JSONResponse(content=response_data, headers=headers)
+    return Response(content=document.body, media_type="application/json", headers=headers)
 
 
 def _format_server_discovery(server_info: dict, request: Request) -> dict:
@@ -1,5 +1,5 @@
 """
-FastAPI middleware for audit logging.
+ASGI middleware for audit logging.
 
 This module provides middleware that captures request/response
 envelope and identity context for every API request, creating
@@ -7,16 +7,12 @@ structured audit records.
 """
 
 import logging
-import time
-import uuid
-from collections.abc import Callable
 from datetime import UTC, datetime
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from ..utils.request_utils import get_client_ip
+from ..middleware.request_context import RequestContext, bind_request_context
 from .models import (
     Action,
     Authorization,
@@ -34,13 +30,17 @@ from .service import AuditLogger
 logger = logging.getLogger(__name__)
 
 
-class AuditMiddleware(BaseHTTPMiddleware):
+class AuditMiddleware:
     """
     Middleware that captures request/response data for audit logging.
 
     Creates structured audit records for every API request, including
     identity context, request/response details, and optional action context.
 
+    Implemented as a pure ASGI middleware: the response is streamed through
+    untouched and the record is written once the application has finished
+    sending it. Request data comes from the shared RequestContext.
+
     Attributes:
         audit_logger: The AuditLogger service for writing events
         exclude_paths: List of paths to exclude from logging
@@ -66,7 +66,7 @@ class AuditMiddleware(BaseHTTPMiddleware):
             log_health_checks: Whether to log health check endpoints (default: False)
             log_static_assets: Whether to log static asset requests (default: False)
         """
-        super().__init__(app)
+        self.app = app
         self.audit_logger = audit_logger
         self.exclude_paths = exclude_paths or []
         self.log_health_checks = log_health_checks
@@ -249,50 +249,56 @@ class AuditMiddleware(BaseHTTPMiddleware):
 
         return None
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
         """
-        Process the request and create an audit record.
+        Pass the request through and create an audit record for it.
 
         Args:
-            request: The FastAPI request object
-            call_next: The next middleware/handler in the chain
-
-        Returns:
-            The response from the next handler
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
-        # Check if this request should be logged
-        if not self._should_log(request.url.path):
-            return await call_next(request)
-
-        # Generate or extract request ID
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-        correlation_id = request.headers.get("X-Correlation-ID")
+        if scope["type"] != "http" or not self._should_log(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
-        # Start timing
-        start_time = time.perf_counter()
+        context, send = bind_request_context(scope, send)
+        await self.app(scope, receive, send)
 
-        # Process the request
-        response = await call_next(request)
+        if context.status_code is not None:
+            await self._log_request(context)
 
-        # Calculate duration
-        duration_ms = (time.perf_counter() - start_time) * 1000
+    async def _log_request(
+        self,
+        context: RequestContext,
+    ) -> None:
+        """
+        Build and write the audit record for a completed request.
 
-        # Extract client IP (validated against spoofed/malformed headers)
-        client_ip = get_client_ip(request)
+        Args:
+            context: Shared request context with the captured response status
+        """
+        request = context.request
+        headers = context.headers
 
         # Get content length from request headers (may be None)
         request_content_length = None
-        if "content-length" in request.headers:
+        if "content-length" in headers:
             try:
-                request_content_length = int(request.headers["content-length"])
+                request_content_length = int(headers["content-length"])
             except (ValueError, TypeError):
                 pass
 
         # Get content length from response headers (may be None)
         response_content_length = None
-        if "content-length" in response.headers:
+        if context.response_headers and "content-length" in context.response_headers:
             try:
-                response_content_length = int(response.headers["content-length"])
+                response_content_length = int(context.response_headers["content-length"])
             except (ValueError, TypeError):
                 pass
 
@@ -300,21 +306,21 @@ class AuditMiddleware(BaseHTTPMiddleware):
         try:
             record = RegistryApiAccessRecord(
                 timestamp=datetime.now(UTC),
-                request_id=request_id,
-                correlation_id=correlation_id,
+                request_id=context.request_id,
+                correlation_id=headers.get("X-Correlation-ID"),
                 identity=self._extract_identity(request),
                 request=AuditRequest(
-                    method=request.method,
-                    path=request.url.path,
+                    method=context.method,
+                    path=context.path,
                     query_params=dict(request.query_params),
-                    client_ip=client_ip,
-                    forwarded_for=request.headers.get("X-Forwarded-For"),
-                    user_agent=request.headers.get("User-Agent"),
+                    client_ip=context.client_ip,
+                    forwarded_for=headers.get("X-Forwarded-For"),
+                    user_agent=headers.get("User-Agent"),
                     content_length=request_content_length,
                 ),
                 response=AuditResponse(
-                    status_code=response.status_code,
-                    duration_ms=duration_ms,
+                    status_code=context.status_code,
+                    duration_ms=context.duration_ms,
                     content_length=response_content_length,
                 ),
                 action=self._extract_action(request),
@@ -328,8 +334,6 @@ class AuditMiddleware(BaseHTTPMiddleware):
             # Don't let audit logging failures break the request
             logger.error(f"Failed to create audit record: {e}")
 
-        return response
-
 
 def add_audit_middleware(
     app,
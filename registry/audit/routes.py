@@ -12,9 +12,12 @@ from __future__ import annotations
 import asyncio
 import csv
 import io
+import json
 import logging
 import re
 import time
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable
 from datetime import UTC, datetime, timedelta
 from typing import Annotated, Any
 
@@ -23,7 +26,8 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from ..auth.dependencies import enhanced_auth
-from ..repositories.audit_repository import DocumentDBAuditRepository
+from ..core.config import settings
+from ..repositories.audit_repository import DocumentDBAuditRepository, normalize_username
 
 logger = logging.getLogger(__name__)
 
@@ -318,42 +322,26 @@ async def get_filter_options(
     )
 
 
-@router.get("/statistics", response_model=AuditStatisticsResponse)
-async def get_statistics(
-    user_context: Annotated[dict[str, Any], Depends(require_admin)],
-    stream: str = Query(
-        "registry_api",
-        pattern="^(registry_api|mcp_access)$",
-        description="Log stream type",
-    ),
-    days: int = Query(
-        7,
-        ge=1,
-        le=30,
-        description="Number of days to include in statistics",
-    ),
-    username: str | None = Query(
-        None,
-        description="Filter statistics to a specific username",
-    ),
-) -> AuditStatisticsResponse:
-    """Get aggregated audit statistics for the dashboard. Requires admin access."""
-    start_time = time.time()
+def _raw_statistics_tasks(
+    repository: DocumentDBAuditRepository,
+    stream: str,
+    log_type: str,
+    cutoff: datetime,
+    username: str | None,
+) -> list[Awaitable[Any]]:
+    """
+    Build the statistics queries that scan raw audit events.
 
-    log_type_map = {
-        "registry_api": "registry_api_access",
-        "mcp_access": "mcp_server_access",
-    }
-    log_type = log_type_map.get(stream, stream)
-    cutoff = datetime.now(UTC) - timedelta(days=days)
+    Used when rollups are disabled. Results are ordered as: total count,
+    top users, top operations, timeline, status distribution, per-user
+    activity and (MCP stream only) top servers.
+    """
     base_match: dict[str, Any] = {"log_type": log_type, "timestamp": {"$gte": cutoff}}
 
     if username:
         escaped_username = re.escape(username)
         base_match["identity.username"] = {"$regex": f"^{escaped_username}$", "$options": "i"}
 
-    repository = get_audit_repository()
-
     # Build all pipelines upfront
     op_field = "$mcp_request.method" if stream == "mcp_access" else "$action.operation"
 
@@ -402,9 +390,8 @@ async def get_statistics(
             {"$group": {"_id": "$bucket", "count": {"$sum": 1}}},
         ]
 
-    # Run ALL pipelines concurrently with asyncio.gather()
     # Note: audit data is bounded by TTL (default 7 days), so collection size is naturally limited
-    tasks = [
+    tasks: list[Awaitable[Any]] = [
         repository.count(base_match),
         repository.aggregate(
             [
@@ -479,6 +466,168 @@ async def get_statistics(
             )
         )
 
+    return tasks
+
+
+def _rollup_window_match(
+    log_type: str,
+    cutoff: datetime,
+    username: str | None,
+) -> dict[str, Any]:
+    """
+    Build the rollup match covering [cutoff, now].
+
+    Whole days after cutoff are read from daily rollups, the partial first
+    day from hourly rollups, so the window stays accurate to the hour while
+    reading at most 24 hourly buckets per dimension combination.
+    """
+    hour_start = cutoff.replace(minute=0, second=0, microsecond=0)
+    day_start = cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+    if day_start < hour_start:
+        day_start += timedelta(days=1)
+
+    match: dict[str, Any] = {
+        "log_type": log_type,
+        "$or": [
+            {"granularity": "day", "bucket": {"$gte": day_start}},
+            {"granularity": "hour", "bucket": {"$gte": hour_start, "$lt": day_start}},
+        ],
+    }
+    if username:
+        # Rollup usernames are normalized at write time, so this is an index-friendly equality
+        match["username"] = normalize_username(username)
+    return match
+
+
+async def _sum_rollup_count(
+    repository: DocumentDBAuditRepository,
+    match: dict[str, Any],
+) -> int:
+    """Sum pre-aggregated rollup counts for the given match."""
+    rows = await repository.aggregate_rollups(
+        [
+            {"$match": match},
+            {"$group": {"_id": None, "total": {"$sum": "$count"}}},
+        ]
+    )
+    return rows[0].get("total", 0) if rows else 0
+
+
+def _rollup_statistics_tasks(
+    repository: DocumentDBAuditRepository,
+    stream: str,
+    log_type: str,
+    cutoff: datetime,
+    username: str | None,
+) -> list[Awaitable[Any]]:
+    """
+    Build the statistics queries served from hourly/daily rollups.
+
+    Returns the same result shape as _raw_statistics_tasks, but each
+    pipeline reads a few hundred pre-aggregated rows instead of every
+    raw event in the window.
+    """
+    match = _rollup_window_match(log_type, cutoff, username)
+
+    def _top(field: str) -> Awaitable[list[dict[str, Any]]]:
+        return repository.aggregate_rollups(
+            [
+                {"$match": match},
+                {"$group": {"_id": field, "count": {"$sum": "$count"}}},
+                {"$sort": {"count": -1}},
+                {"$limit": 10},
+            ]
+        )
+
+    tasks: list[Awaitable[Any]] = [
+        _sum_rollup_count(repository, match),
+        _top("$username"),
+        _top("$operation"),
+        repository.aggregate_rollups(
+            [
+                {"$match": match},
+                {
+                    "$group": {
+                        "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$bucket"}},
+                        "count": {"$sum": "$count"},
+                    }
+                },
+                {"$sort": {"_id": 1}},
+            ]
+        ),
+        # Rollups already store the bucketed status (2xx/4xx/5xx or MCP success/error)
+        repository.aggregate_rollups(
+            [
+                {"$match": match},
+                {"$group": {"_id": "$status", "count": {"$sum": "$count"}}},
+            ]
+        ),
+        repository.aggregate_rollups(
+            [
+                {"$match": match},
+                {
+                    "$group": {
+                        "_id": {"user": "$username", "op": "$operation"},
+                        "count": {"$sum": "$count"},
+                    }
+                },
+                {"$sort": {"count": -1}},
+                {
+                    "$group": {
+                        "_id": "$_id.user",
+                        "total": {"$sum": "$count"},
+                        "operations": {"$push": {"name": "$_id.op", "count": "$count"}},
+                    }
+                },
+                {"$sort": {"total": -1}},
+                {"$limit": 10},
+            ]
+        ),
+    ]
+
+    if stream == "mcp_access":
+        tasks.append(_top("$server"))
+
+    return tasks
+
+
+@router.get("/statistics", response_model=AuditStatisticsResponse)
+async def get_statistics(
+    user_context: Annotated[dict[str, Any], Depends(require_admin)],
+    stream: str = Query(
+        "registry_api",
+        pattern="^(registry_api|mcp_access)$",
+        description="Log stream type",
+    ),
+    days: int = Query(
+        7,
+        ge=1,
+        le=30,
+        description="Number of days to include in statistics",
+    ),
+    username: str | None = Query(
+        None,
+        description="Filter statistics to a specific username",
+    ),
+) -> AuditStatisticsResponse:
+    """Get aggregated audit statistics for the dashboard. Requires admin access."""
+    start_time = time.time()
+
+    log_type_map = {
+        "registry_api": "registry_api_access",
+        "mcp_access": "mcp_server_access",
+    }
+    log_type = log_type_map.get(stream, stream)
+    cutoff = datetime.now(UTC) - timedelta(days=days)
+
+    repository = get_audit_repository()
+
+    if settings.audit_statistics_use_rollups:
+        tasks = _rollup_statistics_tasks(repository, stream, log_type, cutoff, username)
+    else:
+        tasks = _raw_statistics_tasks(repository, stream, log_type, cutoff, username)
+
+    # Run ALL pipelines concurrently with asyncio.gather()
     results = await asyncio.gather(*tasks)
 
     # Unpack results
@@ -556,7 +705,8 @@ async def get_statistics(
 
     elapsed = time.time() - start_time
     logger.info(
-        f"Audit statistics computed in {elapsed:.2f}s (stream={stream}, days={days})"
+        f"Audit statistics computed in {elapsed:.2f}s (stream={stream}, days={days}, "
+        f"rollups={settings.audit_statistics_use_rollups})"
     )
 
     return AuditStatisticsResponse(
@@ -748,80 +898,110 @@ async def get_audit_event(
         )
 
 
-def _generate_jsonl(events: list[dict[str, Any]]):
-    """Generate JSONL output from events."""
-    import json
+# Rows encoded per yielded chunk; keeps chunks reasonably large without buffering the export
+EXPORT_CHUNK_ROWS = 500
+
+# Documents fetched per Motor cursor round trip during export
+EXPORT_CURSOR_BATCH_SIZE = 1000
+
+CSV_FIELDNAMES = [
+    "timestamp",
+    "request_id",
+    "log_type",
+    "username",
+    "auth_method",
+    "is_admin",
+    "method",
+    "path",
+    "status_code",
+    "duration_ms",
+    "operation",
+    "resource_type",
+    "resource_id",
+    "auth_decision",
+]
+
+
+def _csv_row(event: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a nested audit event into a CSV row."""
+    row = {
+        "timestamp": event.get("timestamp", ""),
+        "request_id": event.get("request_id", ""),
+        "log_type": event.get("log_type", ""),
+        "username": event.get("identity", {}).get("username", ""),
+        "auth_method": event.get("identity", {}).get("auth_method", ""),
+        "is_admin": event.get("identity", {}).get("is_admin", False),
+        "method": event.get("request", {}).get("method", ""),
+        "path": event.get("request", {}).get("path", ""),
+        "status_code": event.get("response", {}).get("status_code", ""),
+        "duration_ms": event.get("response", {}).get("duration_ms", ""),
+        "operation": event.get("action", {}).get("operation", "") if event.get("action") else "",
+        "resource_type": event.get("action", {}).get("resource_type", "")
+        if event.get("action")
+        else "",
+        "resource_id": event.get("action", {}).get("resource_id", "")
+        if event.get("action")
+        else "",
+        "auth_decision": event.get("authorization", {}).get("decision", "")
+        if event.get("authorization")
+        else "",
+    }
+
+    # Convert datetime to string if needed
+    if isinstance(row["timestamp"], datetime):
+        row["timestamp"] = row["timestamp"].isoformat()
 
-    for event in events:
+    return row
+
+
+async def _generate_jsonl(events: AsyncIterable[dict[str, Any]]) -> AsyncIterator[str]:
+    """Encode events to JSONL incrementally, yielding one chunk per EXPORT_CHUNK_ROWS events."""
+    lines: list[str] = []
+    async for event in events:
         # Convert datetime objects to ISO format strings
         if "timestamp" in event and isinstance(event["timestamp"], datetime):
             event["timestamp"] = event["timestamp"].isoformat()
-        yield json.dumps(event) + "\n"
+        lines.append(json.dumps(event, default=str) + "\n")
 
+        if len(lines) >= EXPORT_CHUNK_ROWS:
+            yield "".join(lines)
+            lines = []
 
-def _generate_csv(events: list[dict[str, Any]]):
-    """Generate CSV output from events."""
-    if not events:
-        yield ""
-        return
+    if lines:
+        yield "".join(lines)
 
-    output = io.StringIO()
 
-    # Define CSV columns (flattened structure)
-    fieldnames = [
-        "timestamp",
-        "request_id",
-        "log_type",
-        "username",
-        "auth_method",
-        "is_admin",
-        "method",
-        "path",
-        "status_code",
-        "duration_ms",
-        "operation",
-        "resource_type",
-        "resource_id",
-        "auth_decision",
-    ]
-
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-
-    for event in events:
-        # Flatten nested structure
-        row = {
-            "timestamp": event.get("timestamp", ""),
-            "request_id": event.get("request_id", ""),
-            "log_type": event.get("log_type", ""),
-            "username": event.get("identity", {}).get("username", ""),
-            "auth_method": event.get("identity", {}).get("auth_method", ""),
-            "is_admin": event.get("identity", {}).get("is_admin", False),
-            "method": event.get("request", {}).get("method", ""),
-            "path": event.get("request", {}).get("path", ""),
-            "status_code": event.get("response", {}).get("status_code", ""),
-            "duration_ms": event.get("response", {}).get("duration_ms", ""),
-            "operation": event.get("action", {}).get("operation", "")
-            if event.get("action")
-            else "",
-            "resource_type": event.get("action", {}).get("resource_type", "")
-            if event.get("action")
-            else "",
-            "resource_id": event.get("action", {}).get("resource_id", "")
-            if event.get("action")
-            else "",
-            "auth_decision": event.get("authorization", {}).get("decision", "")
-            if event.get("authorization")
-            else "",
-        }
-
-        # Convert datetime to string if needed
-        if isinstance(row["timestamp"], datetime):
-            row["timestamp"] = row["timestamp"].isoformat()
+async def _generate_csv(events: AsyncIterable[dict[str, Any]]) -> AsyncIterator[str]:
+    """Encode events to CSV incrementally, yielding one chunk per EXPORT_CHUNK_ROWS events."""
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=CSV_FIELDNAMES)
+    rows = 0
+
+    async for event in events:
+        if rows == 0:
+            writer.writeheader()
+        writer.writerow(_csv_row(event))
+        rows += 1
+
+        if rows % EXPORT_CHUNK_ROWS == 0:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+
+    if output.tell():
+        yield output.getvalue()
+    elif rows == 0:
+        yield ""
 
-        writer.writerow(row)
 
-    yield output.getvalue()
+async def _gzip_stream(chunks: AsyncIterable[str]) -> AsyncIterator[bytes]:
+    """Gzip-compress a stream of text chunks without buffering the whole payload."""
+    compressor = zlib.compressobj(wbits=31)  # wbits=31 selects the gzip container
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk.encode("utf-8"))
+        if compressed:
+            yield compressed
+    yield compressor.flush()
 
 
 @router.get("/export")
@@ -886,18 +1066,24 @@ async def export_audit_events(
         le=100000,
         description="Maximum events to export",
     ),
+    compress: bool = Query(
+        False,
+        description="Gzip-compress the export file",
+    ),
 ) -> StreamingResponse:
     """
     Export filtered audit events as JSONL or CSV file.
 
     Returns a downloadable file containing audit events matching
-    the specified filters.
+    the specified filters. Events are read from the database cursor
+    in batches and encoded incrementally, so the export streams
+    immediately and uses constant memory regardless of limit.
 
     Requires admin access.
     """
     logger.info(
         f"Admin '{user_context.get('username')}' exporting audit events: "
-        f"format={format}, stream={stream}, limit={limit}"
+        f"format={format}, stream={stream}, limit={limit}, compress={compress}"
     )
 
     query = _build_query(
@@ -916,13 +1102,13 @@ async def export_audit_events(
     repository = get_audit_repository()
 
     try:
-        # Get events for export (no offset, just limit)
-        events = await repository.find(
+        # Stream events from the cursor (no offset, just limit)
+        events = repository.iter_find(
             query=query,
             limit=limit,
-            offset=0,
             sort_field="timestamp",
             sort_order=-1,
+            batch_size=EXPORT_CURSOR_BATCH_SIZE,
         )
 
         # Generate timestamp for filename
@@ -930,21 +1116,24 @@ async def export_audit_events(
         filename = f"audit-export-{timestamp}.{format}"
 
         if format == "jsonl":
-            return StreamingResponse(
-                _generate_jsonl(events),
-                media_type="application/x-ndjson",
-                headers={
-                    "Content-Disposition": f"attachment; filename={filename}",
-                },
-            )
+            content = _generate_jsonl(events)
+            media_type = "application/x-ndjson"
         else:  # csv
-            return StreamingResponse(
-                _generate_csv(events),
-                media_type="text/csv",
-                headers={
-                    "Content-Disposition": f"attachment; filename={filename}",
-                },
-            )
+            content = _generate_csv(events)
+            media_type = "text/csv"
+
+        if compress:
+            content = _gzip_stream(content)
+            media_type = "application/gzip"
+            filename = f"{filename}.gz"
+
+        return StreamingResponse(
+            content,
+            media_type=media_type,
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}",
+            },
+        )
     except Exception as e:
         logger.error(f"Error exporting audit events: {e}", exc_info=True)
         raise HTTPException(
@@ -3,13 +3,13 @@ import re
 import urllib.parse
 from typing import Annotated
 
-import httpx
 from fastapi import APIRouter, Cookie, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from prometheus_client import Counter
 
 from ..core.config import settings
+from ..core.http_clients import CLIENT_INTERNAL, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -57,21 +57,19 @@ def _validate_jwt_format(token: str) -> bool:
 async def get_oauth2_providers():
     """Fetch available OAuth2 providers from auth server"""
     try:
-        async with httpx.AsyncClient() as client:
-            logger.info(
-                f"Fetching OAuth2 providers from {settings.auth_server_url}/oauth2/providers"
+        client = get_http_client(CLIENT_INTERNAL)
+        logger.info(f"Fetching OAuth2 providers from {settings.auth_server_url}/oauth2/providers")
+        response = await client.get(f"{settings.auth_server_url}/oauth2/providers", timeout=5.0)
+        logger.info(f"OAuth2 providers response: status={response.status_code}")
+        if response.status_code == 200:
+            data = response.json()
+            providers = data.get("providers", [])
+            logger.info(f"Successfully fetched {len(providers)} OAuth2 providers: {providers}")
+            return providers
+        else:
+            logger.warning(
+                f"Auth server returned non-200 status: {response.status_code}, body: {response.text}"
             )
-            response = await client.get(f"{settings.auth_server_url}/oauth2/providers", timeout=5.0)
-            logger.info(f"OAuth2 providers response: status={response.status_code}")
-            if response.status_code == 200:
-                data = response.json()
-                providers = data.get("providers", [])
-                logger.info(f"Successfully fetched {len(providers)} OAuth2 providers: {providers}")
-                return providers
-            else:
-                logger.warning(
-                    f"Auth server returned non-200 status: {response.status_code}, body: {response.text}"
-                )
     except Exception as e:
         logger.warning(f"Failed to fetch OAuth2 providers from auth server: {e}", exc_info=True)
     return []
@@ -16,6 +16,63 @@ import yaml
 logger = logging.getLogger(__name__)
 
 
+def build_scopes_config(
+    groups: list[dict[str, Any]],
+) -> tuple[dict[str, Any], dict[str, list[str]]]:
+    """
+    Build the scopes configuration and its lookup tables from group documents.
+
+    All lookups are built in a single pass over the groups:
+    - "group_mappings": IdP group -> scope names
+    - <scope name>: scope -> server access rules
+    - "UI-Scopes": scope -> UI permissions
+    - server name -> scope names with a rule for that server (returned
+      separately, since every other key of the config is a scope name)
+
+    Args:
+        groups: Group dictionaries as returned by load_all_groups()
+
+    Returns:
+        Tuple of the scopes.yml-shaped config (with "group_mappings", scope
+        definitions and "UI-Scopes") and the server -> scopes table
+    """
+    # Dicts used as ordered sets, so repeated mappings are deduplicated in O(1)
+    group_mappings: dict[str, dict[str, None]] = {}
+    server_scopes: dict[str, dict[str, None]] = {}
+    scopes_config: dict[str, list[dict[str, Any]]] = {}
+    ui_scopes: dict[str, Any] = {}
+
+    for group_data in groups:
+        group_name = group_data.get("scope_name")
+        if not group_name:
+            continue
+
+        # Group mappings: Keycloak group → list of scope names
+        for keycloak_group in group_data.get("group_mappings", []):
+            group_mappings.setdefault(keycloak_group, {})[group_name] = None
+
+        # Server access scopes: scope_name → server_access list
+        server_access = group_data.get("server_access", [])
+        if server_access:
+            scopes_config[group_name] = server_access
+            for rule in server_access:
+                if isinstance(rule, dict) and rule.get("server"):
+                    server_scopes.setdefault(rule["server"], {})[group_name] = None
+
+        # UI permissions: scope_name → ui_permissions dict
+        ui_permissions = group_data.get("ui_permissions", {})
+        if ui_permissions:
+            ui_scopes[group_name] = ui_permissions
+
+    # Build the complete config structure
+    config: dict[str, Any] = {
+        "group_mappings": {group: list(scopes) for group, scopes in group_mappings.items()},
+        "UI-Scopes": ui_scopes,
+    }
+    config.update(scopes_config)
+    return config, {server: list(scopes) for server, scopes in server_scopes.items()}
+
+
 async def load_scopes_from_repository(
     max_retries: int = 5, initial_delay: float = 2.0
 ) -> dict[str, Any]:
@@ -42,50 +99,16 @@ async def load_scopes_from_repository(
 
             scope_repo = get_scope_repository()
 
-            # Load all scopes
-            await scope_repo.load_all()
-
-            # Get all groups and build scopes configuration
-            groups_dict = await scope_repo.list_groups()
-
-            group_mappings = {}
-            scopes_config = {}
-            ui_scopes = {}
-
-            # Build scopes config from repository
-            for group_name in groups_dict.keys():
-                # Get full group details
-                group_data = await scope_repo.get_group(group_name)
-                if not group_data:
-                    continue
-
-                # Group mappings: Keycloak group → list of scope names
-                keycloak_groups = group_data.get("group_mappings", [])
-                for keycloak_group in keycloak_groups:
-                    if keycloak_group not in group_mappings:
-                        group_mappings[keycloak_group] = []
-                    if group_name not in group_mappings[keycloak_group]:
-                        group_mappings[keycloak_group].append(group_name)
-
-                # Server access scopes: scope_name → server_access list
-                server_access = group_data.get("server_access", [])
-                if server_access:
-                    scopes_config[group_name] = server_access
-
-                # UI permissions: scope_name → ui_permissions dict
-                ui_permissions = group_data.get("ui_permissions", {})
-                if ui_permissions:
-                    ui_scopes[group_name] = ui_permissions
+            # Load every group (and refresh the repository cache) in one pass
+            groups = await scope_repo.load_all_groups()
+            config, server_scopes = build_scopes_config(groups)
 
             logger.info(
-                f"Loaded from repository: {len(group_mappings)} group mappings, "
-                f"{len(scopes_config)} scope definitions, {len(ui_scopes)} UI scopes"
+                f"Loaded from repository: {len(config['group_mappings'])} group mappings, "
+                f"{len(groups)} groups, {len(config['UI-Scopes'])} UI scopes, "
+                f"{len(server_scopes)} servers with scope rules"
             )
 
-            # Build the complete config structure
-            config = {"group_mappings": group_mappings, "UI-Scopes": ui_scopes}
-            config.update(scopes_config)
-
             return config
 
         except (ConnectionRefusedError, OSError) as e:
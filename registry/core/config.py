@@ -57,6 +57,10 @@ class Settings(BaseSettings):
     # Default 40 may miss documents in small collections; 100 gives near-exact recall.
     vector_search_ef_search: int = 100
 
+    # Startup search reindex (DocumentDB skips entities whose content hash is unchanged)
+    search_index_batch_size: int = 32  # Texts embedded per model call
+    search_index_concurrency: int = 4  # Embedding batches in flight at once
+
     # LiteLLM-specific settings (only used when embeddings_provider='litellm')
     # For Bedrock: Set to None and configure AWS credentials via standard methods
     # (IAM roles, AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY env vars, or ~/.aws/credentials)
@@ -70,6 +74,30 @@ class Settings(BaseSettings):
         300  # 5 minutes for automatic background checks (configurable via env var)
     )
     health_check_timeout_seconds: int = 2  # Very fast timeout for user-driven actions
+    tool_discovery_max_concurrency: int = 8  # Background tool fetches running at once
+
+    # Shared outbound HTTP clients
+    http_internal_timeout_seconds: float = 10.0  # Auth server and other internal services
+    http_internal_max_connections: int = 20
+    http_backend_timeout_seconds: float = 5.0  # MCP servers, agents and skill hosts
+    http_backend_max_connections: int = 100
+    http_backend_max_keepalive_connections: int = 20
+    http_idp_timeout_seconds: float = 10.0  # External identity providers
+    http_idp_max_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+
+    # Skill health refresh (periodic batch probe of SKILL.md URLs)
+    skill_health_check_interval_seconds: int = 3600  # 0 disables the periodic refresh
+    skill_health_check_concurrency: int = 10
+    skill_url_verdict_ttl_seconds: int = 300  # SSRF/DNS verdict cache used by the refresh only
+    skill_url_verdict_cache_size: int = 1024  # Hosts kept in the verdict cache (LRU)
+    skill_md_cache_ttl_seconds: int = 300  # Serve cached SKILL.md without revalidating
+    skill_md_cache_expire_days: int = 30  # Cached SKILL.md bodies not fetched since are dropped
+
+    # Virtual MCP session store (in-process cache and batched last_used_at bumps)
+    backend_session_cache_ttl_seconds: int = 30  # 0 disables the in-process session cache
+    backend_session_cache_max_entries: int = 10000
+    backend_session_touch_interval_seconds: int = 60  # Bump last_used_at at most this often
 
     # WebSocket performance settings
     max_websocket_connections: int = 100  # Reasonable limit for development/testing
@@ -82,12 +110,20 @@ class Settings(BaseSettings):
     enable_wellknown_discovery: bool = True
     wellknown_cache_ttl: int = 300  # 5 minutes
 
+    # Virtual server tool resolution: how long backend tool lists and resolved
+    # tool lists are reused before re-reading them (bounds staleness from
+    # writes made by other registry replicas)
+    virtual_server_tools_cache_ttl: int = 60
+
     # Security scanning settings (MCP Servers)
     security_scan_enabled: bool = True
     security_scan_on_registration: bool = True
     security_block_unsafe_servers: bool = True
     security_analyzers: str = "yara"  # Comma-separated: yara, llm, or yara,llm
     security_scan_timeout: int = 60  # 1 minute
+    security_scan_max_concurrency: int = 4  # Max mcp-scanner subprocesses running at once
+    security_scan_max_per_backend: int = 2  # Max concurrent scans against one backend host
+    security_scan_cache_ttl: int = 86400  # Reuse results for unchanged tool lists (0 disables)
     security_add_pending_tag: bool = True
     mcp_scanner_llm_api_key: str = ""  # Optional LLM API key for advanced analysis
 
@@ -138,6 +174,9 @@ class Settings(BaseSettings):
     # Audit Logging MongoDB Configuration
     audit_log_mongodb_enabled: bool = True  # Enable/disable MongoDB storage for audit logs
     audit_log_mongodb_ttl_days: int = 7  # Days to retain audit events in MongoDB (default 7 days)
+    audit_statistics_use_rollups: bool = (
+        True  # Serve /audit/statistics from hourly/daily rollups instead of raw events
+    )
 
     # Deployment Mode Configuration
     deployment_mode: DeploymentMode = Field(
@@ -155,6 +194,8 @@ class Settings(BaseSettings):
 
     # Storage Backend Configuration
     storage_backend: str = "file"  # Options: "file", "documentdb"
+    # File backend: coalesce server state writes made within this window (0 writes immediately)
+    file_state_write_delay_seconds: float = 0.5
 
     # DocumentDB Configuration (only used when storage_backend="documentdb")
     documentdb_host: str = "localhost"
@@ -0,0 +1,226 @@
+"""
+Shared outbound HTTP clients for the registry and the auth server.
+
+Outbound calls reuse one pooled httpx.AsyncClient per destination profile
+instead of opening a new client (and new connections, DNS lookups and TLS
+handshakes) per call:
+
+- internal: registry <-> auth server and other co-located services
+- backend: registered MCP servers, agents and skill hosts
+- idp: external identity providers (OAuth2 token and userinfo endpoints)
+
+Each profile has its own connection limits and default timeout. Clients are
+created on application startup, closed on shutdown, and expose pool
+utilization as Prometheus gauges. Callers may still pass a per-request
+timeout to override the profile default.
+"""
+
+import logging
+from dataclasses import dataclass
+from http.cookiejar import CookieJar
+from typing import Any
+
+import httpx
+
+from .config import settings
+from .metrics import HTTP_CLIENT_POOL_CONNECTIONS, HTTP_CLIENT_POOL_QUEUED_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+
+CLIENT_INTERNAL = "internal"
+CLIENT_BACKEND = "backend"
+CLIENT_IDP = "idp"
+
+_EMPTY_POOL_STATS = {"connections": 0, "active": 0, "idle": 0, "queued": 0}
+
+
+@dataclass(frozen=True)
+class HttpClientProfile:
+    """Connection limits and default timeout for one shared client."""
+
+    timeout_seconds: float
+    max_connections: int
+    max_keepalive_connections: int
+
+
+def _default_profiles() -> dict[str, HttpClientProfile]:
+    """Build the client profiles from settings."""
+    return {
+        CLIENT_INTERNAL: HttpClientProfile(
+            timeout_seconds=settings.http_internal_timeout_seconds,
+            max_connections=settings.http_internal_max_connections,
+            max_keepalive_connections=settings.http_internal_max_connections,
+        ),
+        CLIENT_BACKEND: HttpClientProfile(
+            timeout_seconds=settings.http_backend_timeout_seconds,
+            max_connections=settings.http_backend_max_connections,
+            max_keepalive_connections=settings.http_backend_max_keepalive_connections,
+        ),
+        CLIENT_IDP: HttpClientProfile(
+            timeout_seconds=settings.http_idp_timeout_seconds,
+            max_connections=settings.http_idp_max_connections,
+            max_keepalive_connections=settings.http_idp_max_connections,
+        ),
+    }
+
+
+class _NoCookieJar(CookieJar):
+    """Cookie jar that never stores cookies.
+
+    Shared clients serve many unrelated requests, so a Set-Cookie from one
+    upstream must not be replayed on another caller's request.
+    """
+
+    def set_cookie(self, cookie) -> None:
+        pass
+
+    def extract_cookies(self, response, request) -> None:
+        pass
+
+
+class HttpClientRegistry:
+    """Owns the shared httpx.AsyncClient instances, one per profile."""
+
+    def __init__(
+        self,
+        profiles: dict[str, HttpClientProfile] | None = None,
+    ):
+        self._profiles = profiles
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    @property
+    def profiles(self) -> dict[str, HttpClientProfile]:
+        """Client profiles, read from settings on first use."""
+        if self._profiles is None:
+            self._profiles = _default_profiles()
+        return self._profiles
+
+    def _create_client(
+        self,
+        name: str,
+    ) -> httpx.AsyncClient:
+        """Create the pooled client for a profile."""
+        profile = self.profiles[name]
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(profile.timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=profile.max_connections,
+                max_keepalive_connections=profile.max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry_seconds,
+            ),
+            cookies=_NoCookieJar(),
+        )
+
+    def get(
+        self,
+        name: str,
+    ) -> httpx.AsyncClient:
+        """
+        Get the shared client for a profile, creating it if needed.
+
+        Clients are normally created by startup(); lazy creation covers
+        scripts and tests that run without the application lifespan.
+
+        Args:
+            name: Profile name (CLIENT_INTERNAL, CLIENT_BACKEND or CLIENT_IDP)
+
+        Returns:
+            Shared AsyncClient. Callers must not close it.
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._create_client(name)
+            self._clients[name] = client
+        return client
+
+    def startup(self) -> None:
+        """Create every client and register its pool gauges. Called from the lifespan."""
+        for name in self.profiles:
+            self.get(name)
+            self._register_pool_metrics(name)
+        logger.info(f"Shared HTTP clients ready: {sorted(self._clients)}")
+
+    async def aclose(self) -> None:
+        """Close every client and its connection pool. Called on shutdown."""
+        for name, client in list(self._clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close shared HTTP client '{name}': {e}")
+        self._clients.clear()
+
+    def _register_pool_metrics(
+        self,
+        name: str,
+    ) -> None:
+        """Expose a client's pool utilization as gauges evaluated at scrape time."""
+
+        def _stat(key: str):
+            return lambda: self._client_stats(name)[key]
+
+        HTTP_CLIENT_POOL_CONNECTIONS.labels(client=name, state="active").set_function(
+            _stat("active")
+        )
+        HTTP_CLIENT_POOL_CONNECTIONS.labels(client=name, state="idle").set_function(_stat("idle"))
+        HTTP_CLIENT_POOL_QUEUED_REQUESTS.labels(client=name).set_function(_stat("queued"))
+
+    def _client_stats(
+        self,
+        name: str,
+    ) -> dict[str, int]:
+        """Pool stats for one profile, zero if its client is not open."""
+        client = self._clients.get(name)
+        if client is None:
+            return dict(_EMPTY_POOL_STATS)
+        return _pool_stats(client)
+
+    def get_pool_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Get connection pool utilization for every open client.
+
+        Returns:
+            Mapping of profile name to counts of total, active and idle
+            connections and requests queued waiting for a connection
+        """
+        return {name: _pool_stats(client) for name, client in self._clients.items()}
+
+
+def _pool_stats(
+    client: httpx.AsyncClient,
+) -> dict[str, int]:
+    """Read connection counts from the client's httpcore pool.
+
+    The pool is not public httpx API, so anything unexpected (a custom
+    transport, or internals renamed by an httpx/httpcore upgrade) yields
+    zero counts instead of breaking a metrics scrape.
+    """
+    stats = dict(_EMPTY_POOL_STATS)
+    pool: Any = getattr(getattr(client, "_transport", None), "_pool", None)
+    if pool is None or client.is_closed:
+        return stats
+
+    try:
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for connection in connections if connection.is_idle())
+        queued = sum(1 for request in list(getattr(pool, "_requests", [])) if request.is_queued())
+    except (AttributeError, TypeError) as e:
+        logger.debug(f"Connection pool stats unavailable: {e}")
+        return stats
+
+    stats["connections"] = len(connections)
+    stats["idle"] = idle
+    stats["active"] = len(connections) - idle
+    stats["queued"] = queued
+    return stats
+
+
+# Global registry instance
+http_clients = HttpClientRegistry()
+
+
+def get_http_client(
+    name: str,
+) -> httpx.AsyncClient:
+    """Get a shared outbound HTTP client by profile name."""
+    return http_clients.get(name)
@@ -8,6 +8,7 @@ Copied directly from main_old.py working implementation.
 import asyncio
 import logging
 import re
+from collections import OrderedDict
 from typing import (
     TypedDict,
 )
@@ -19,6 +20,8 @@ from mcp.client.streamable_http import streamablehttp_client
 
 logger = logging.getLogger(__name__)
 
+TRANSPORT_CACHE_MAX_ENTRIES = 1024
+
 
 class MCPServerInfo(TypedDict, total=False):
     """Server info returned from MCP initialize response."""
@@ -27,11 +30,83 @@ class MCPServerInfo(TypedDict, total=False):
     version: str
 
 
+class TransportDetection(TypedDict):
+    """Transport and endpoint that last worked for a server URL.
+
+    Stored on the server document as ``detected_transport`` so that
+    connections after a restart skip probing as well.
+    """
+
+    url: str
+    transport: str
+    endpoint: str | None
+
+
 class MCPConnectionResult(TypedDict, total=False):
     """Result of connecting to an MCP server."""
 
     tools: list[dict]
     server_info: MCPServerInfo
+    transport: TransportDetection
+
+
+# Detected transports per server URL, least recently used first. An entry is
+# dropped as soon as a connection using it fails, so the next call probes again.
+_transport_cache: OrderedDict[str, TransportDetection] = OrderedDict()
+
+
+def get_cached_transport(
+    base_url: str,
+    server_info: dict = None,
+) -> TransportDetection | None:
+    """
+    Get the transport detected earlier for a server URL.
+
+    Falls back to the detection persisted on the server document, which is
+    only trusted if it was made for the same URL.
+
+    Args:
+        base_url: The base URL of the MCP server
+        server_info: Optional server configuration dict
+
+    Returns:
+        The cached detection, or None if the transport has to be probed
+    """
+    cached = _transport_cache.get(base_url)
+    if cached is not None:
+        _transport_cache.move_to_end(base_url)
+        return cached
+
+    persisted = server_info.get("detected_transport") if server_info else None
+    if (
+        isinstance(persisted, dict)
+        and persisted.get("url") == base_url
+        and persisted.get("transport") in ("streamable-http", "sse")
+    ):
+        return remember_transport(base_url, persisted["transport"], persisted.get("endpoint"))
+    return None
+
+
+def remember_transport(
+    base_url: str,
+    transport: str,
+    endpoint: str | None = None,
+) -> TransportDetection:
+    """Cache the transport and endpoint that worked for a server URL."""
+    detection = TransportDetection(url=base_url, transport=transport, endpoint=endpoint)
+    _transport_cache[base_url] = detection
+    _transport_cache.move_to_end(base_url)
+    while len(_transport_cache) > TRANSPORT_CACHE_MAX_ENTRIES:
+        _transport_cache.popitem(last=False)
+    return detection
+
+
+def invalidate_transport(
+    base_url: str,
+) -> None:
+    """Forget the detected transport for a server URL after a failed connection."""
+    if _transport_cache.pop(base_url, None) is not None:
+        logger.info(f"Invalidated cached transport for {base_url}")
 
 
 def normalize_sse_endpoint_url(endpoint_url: str) -> str:
@@ -197,6 +272,12 @@ async def detect_server_transport_aware(base_url: str, server_info: dict = None)
             logger.debug("Server supports streamable-http (preferred)")
             return "streamable-http"
 
+    # Reuse a transport detected on an earlier connection
+    cached = get_cached_transport(base_url, server_info)
+    if cached is not None:
+        logger.debug(f"Using cached {cached['transport']} transport for {base_url}")
+        return cached["transport"]
+
     # Fall back to auto-detection
     return await detect_server_transport(base_url)
 
@@ -205,6 +286,9 @@ async def detect_server_transport(base_url: str) -> str:
     """
     Detect which transport a server supports by testing endpoints.
     Returns the preferred transport type.
+
+    A successful probe is cached per URL until a connection using the
+    detected transport fails.
     """
     # If URL already has a transport endpoint, detect from it
     if base_url.endswith("/sse") or "/sse/" in base_url:
@@ -214,11 +298,17 @@ async def detect_server_transport(base_url: str) -> str:
         logger.debug(f"Server URL {base_url} already has MCP endpoint")
         return "streamable-http"
 
+    cached = get_cached_transport(base_url)
+    if cached is not None:
+        logger.debug(f"Using cached {cached['transport']} transport for {base_url}")
+        return cached["transport"]
+
     # Test streamable-http first (default preference)
     try:
         mcp_url = base_url.rstrip("/") + "/mcp/"
         async with streamablehttp_client(url=mcp_url) as connection:
             logger.debug(f"Server at {base_url} supports streamable-http transport")
+            remember_transport(base_url, "streamable-http", mcp_url)
             return "streamable-http"
     except Exception as e:
         logger.debug(f"Streamable-HTTP test failed for {base_url}: {e}")
@@ -228,6 +318,7 @@ async def detect_server_transport(base_url: str) -> str:
         sse_url = base_url.rstrip("/") + "/sse"
         async with sse_client(sse_url) as connection:
             logger.debug(f"Server at {base_url} supports SSE transport")
+            remember_transport(base_url, "sse", sse_url)
             return "sse"
     except Exception as e:
         logger.debug(f"SSE test failed for {base_url}: {e}")
@@ -262,9 +353,9 @@ async def get_tools_from_server_with_transport(
 
     try:
         if transport == "streamable-http":
-            return await _get_tools_streamable_http(base_url)
+            tools = await _get_tools_streamable_http(base_url)
         elif transport == "sse":
-            return await _get_tools_sse(base_url)
+            tools = await _get_tools_sse(base_url)
         else:
             logger.error(f"Unsupported transport type: {transport}")
             return None
@@ -273,7 +364,11 @@ async def get_tools_from_server_with_transport(
         logger.error(
             f"MCP Check Error: Failed to get tool list from {base_url} with {transport}: {type(e).__name__} - {e}"
         )
-        return None
+        tools = None
+
+    if tools is None:
+        invalidate_transport(base_url)
+    return tools
 
 
 async def _get_tools_streamable_http(base_url: str, server_info: dict = None) -> list[dict] | None:
@@ -354,6 +449,15 @@ async def _get_tools_streamable_http(base_url: str, server_info: dict = None) ->
         # Try with /mcp suffix first, then without if it fails
         endpoints_to_try = [base_url.rstrip("/") + "/mcp/", base_url.rstrip("/") + "/"]
 
+        # Connect straight to the endpoint that worked last time
+        cached = get_cached_transport(base_url, server_info)
+        if (
+            cached is not None
+            and cached["transport"] == "streamable-http"
+            and cached["endpoint"] in endpoints_to_try
+        ):
+            endpoints_to_try = [cached["endpoint"]]
+
         for mcp_url in endpoints_to_try:
             try:
                 logger.info(f"MCP Client: Trying streamable-http endpoint: {mcp_url}")
@@ -367,6 +471,7 @@ async def _get_tools_streamable_http(base_url: str, server_info: dict = None) ->
                         tools_response = await asyncio.wait_for(session.list_tools(), timeout=15.0)
 
                         logger.info(f"MCP Client: Successfully connected to {mcp_url}")
+                        remember_transport(base_url, "streamable-http", mcp_url)
                         return _extract_tool_details(tools_response)
 
             except TimeoutError:
@@ -550,9 +655,9 @@ async def get_tools_from_server_with_server_info(
 
     try:
         if transport == "streamable-http":
-            return await _get_tools_streamable_http(base_url, server_info)
+            tools = await _get_tools_streamable_http(base_url, server_info)
         elif transport == "sse":
-            return await _get_tools_sse(base_url, server_info)
+            tools = await _get_tools_sse(base_url, server_info)
         else:
             logger.error(f"Unsupported transport type: {transport}")
             return None
@@ -561,7 +666,11 @@ async def get_tools_from_server_with_server_info(
         logger.error(
             f"MCP Check Error: Failed to get tool list from {base_url} with {transport}: {type(e).__name__} - {e}"
         )
-        return None
+        tools = None
+
+    if tools is None:
+        invalidate_transport(base_url)
+    return tools
 
 
 async def get_mcp_connection_result(
@@ -594,13 +703,17 @@ async def get_mcp_connection_result(
 
     # Determine the MCP endpoint URL
     explicit_endpoint = server_info.get("mcp_endpoint") if server_info else None
+    cached = get_cached_transport(base_url, server_info)
 
     if explicit_endpoint:
         mcp_url = explicit_endpoint
     elif base_url.endswith("/mcp") or "/mcp/" in base_url:
         mcp_url = base_url
+    elif cached and cached["transport"] == "streamable-http" and cached["endpoint"]:
+        mcp_url = cached["endpoint"]
     else:
         mcp_url = base_url.rstrip("/") + "/mcp/"
+    endpoint = mcp_url
 
     # Handle anthropic-registry servers
     if (
@@ -646,7 +759,11 @@ async def get_mcp_connection_result(
                             f"version={mcp_server_info.get('version')}"
                         )
 
-                    return MCPConnectionResult(tools=tools or [], server_info=mcp_server_info)
+                    return MCPConnectionResult(
+                        tools=tools or [],
+                        server_info=mcp_server_info,
+                        transport=remember_transport(base_url, transport, endpoint),
+                    )
 
         elif transport == "sse":
             # For SSE transport
@@ -683,7 +800,11 @@ async def get_mcp_connection_result(
                             f"version={mcp_server_info.get('version')}"
                         )
 
-                    return MCPConnectionResult(tools=tools or [], server_info=mcp_server_info)
+                    return MCPConnectionResult(
+                        tools=tools or [],
+                        server_info=mcp_server_info,
+                        transport=remember_transport(base_url, transport, sse_url),
+                    )
 
         else:
             logger.error(f"Unsupported transport type: {transport}")
@@ -691,12 +812,14 @@ async def get_mcp_connection_result(
 
     except TimeoutError:
         logger.error(f"MCP Check Error: Timeout connecting to {mcp_url}")
+        invalidate_transport(base_url)
         return None
     except Exception as e:
         logger.error(
             f"MCP Check Error: Failed to get connection result from {base_url}: "
             f"{type(e).__name__} - {e}"
         )
+        invalidate_transport(base_url)
         return None
 
 
@@ -51,3 +51,16 @@ PEER_TOKEN_MISSING = Gauge(
 PEER_SYNC_DURATION_SECONDS = Gauge(
     "peer_sync_duration_seconds", "Duration of peer sync operations", ["peer_id", "success"]
 )
+
+# Shared outbound HTTP client pool metrics
+HTTP_CLIENT_POOL_CONNECTIONS = Gauge(
+    "registry_http_client_pool_connections",
+    "Connections held by a shared outbound HTTP client pool",
+    ["client", "state"],  # state: active, idle
+)
+
+HTTP_CLIENT_POOL_QUEUED_REQUESTS = Gauge(
+    "registry_http_client_pool_queued_requests",
+    "Requests waiting for a connection from a shared outbound HTTP client pool",
+    ["client"],
+)
@@ -880,12 +880,19 @@ map "$uri:$http_x_mcp_server_version" $versioned_backend {{
         """
         try:
             from registry.repositories.factory import get_server_repository
+            from registry.services.virtual_server_service import load_backend_tools
 
             server_repo = get_server_repository()
 
             mappings_dir = Path("/etc/nginx/lua/virtual_mappings")
             mappings_dir.mkdir(parents=True, exist_ok=True)
 
+            # Name-indexed tools of every referenced backend, each read once
+            backend_tools = await load_backend_tools(
+                server_repo,
+                [tm.backend_server_path for vs in virtual_servers for tm in vs.tool_mappings],
+            )
+
             for vs in virtual_servers:
                 server_id = vs.path.replace("/virtual/", "", 1)
 
@@ -903,17 +910,13 @@ map "$uri:$http_x_mcp_server_version" $versioned_backend {{
                     tool_display_name = tm.alias if tm.alias else tm.tool_name
 
                     # Get tool metadata from the backend server
-                    server_info = await server_repo.get(tm.backend_server_path)
+                    st = backend_tools.get(tm.backend_server_path, {}).get(tm.tool_name)
                     description = tm.description_override or ""
                     input_schema: dict[str, Any] = {}
 
-                    if server_info:
-                        server_tools = server_info.get("tool_list", [])
-                        for st in server_tools:
-                            if st.get("name") == tm.tool_name:
-                                description = tm.description_override or st.get("description", "")
-                                input_schema = st.get("inputSchema", st.get("input_schema", {}))
-                                break
+                    if st:
+                        description = tm.description_override or st.get("description", "")
+                        input_schema = st.get("inputSchema", st.get("input_schema", {}))
 
                     input_schema = _ensure_mcp_compliant_schema(input_schema)
 
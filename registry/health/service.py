@@ -2,8 +2,10 @@ import asyncio
 import json
 import logging
 import os
+from collections.abc import Coroutine
 from datetime import UTC, datetime
 from time import time
+from typing import Any
 
 import httpx
 from fastapi import WebSocket
@@ -12,6 +14,7 @@ from registry.constants import HealthStatus
 
 from ..core.config import settings
 from ..core.endpoint_utils import get_endpoint_url_from_server_info
+from ..core.http_clients import CLIENT_BACKEND, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -200,6 +203,10 @@ class HealthMonitoringService:
         # Background task management
         self.health_check_task: asyncio.Task | None = None
 
+        # Tool discovery: at most one in-flight fetch per server, bounded overall
+        self._tool_discovery_tasks: dict[str, asyncio.Task] = {}
+        self._tool_discovery_semaphore = asyncio.Semaphore(settings.tool_discovery_max_concurrency)
+
         # Performance optimizations
         self._cached_health_data: dict = {}
         self._cache_timestamp = 0
@@ -250,6 +257,13 @@ class HealthMonitoringService:
             except asyncio.CancelledError:
                 pass
 
+        discovery_tasks = list(self._tool_discovery_tasks.values())
+        for task in discovery_tasks:
+            task.cancel()
+        if discovery_tasks:
+            await asyncio.gather(*discovery_tasks, return_exceptions=True)
+        self._tool_discovery_tasks.clear()
+
         # Close all WebSocket connections
         connections = list(self.websocket_manager.connections)
         close_tasks = []
@@ -340,8 +354,6 @@ class HealthMonitoringService:
 
     async def _perform_health_checks(self):
         """Perform health checks on all enabled services."""
-        import httpx
-
         from ..services.server_service import server_service
 
         enabled_services = await server_service.get_enabled_services()
@@ -356,29 +368,25 @@ class HealthMonitoringService:
         status_changed = False
 
         # Perform actual health checks concurrently for better performance
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(settings.health_check_timeout_seconds)
-        ) as client:
-            # Batch process enabled services
-            check_tasks = []
-            for service_path in enabled_services:
-                server_info = await server_service.get_server_info(
-                    service_path, include_credentials=True
-                )
-                if server_info and server_info.get("proxy_pass_url"):
-                    check_tasks.append(
-                        self._check_single_service(client, service_path, server_info)
-                    )
+        client = get_http_client(CLIENT_BACKEND)
+        # Batch process enabled services
+        check_tasks = []
+        for service_path in enabled_services:
+            server_info = await server_service.get_server_info(
+                service_path, include_credentials=True
+            )
+            if server_info and server_info.get("proxy_pass_url"):
+                check_tasks.append(self._check_single_service(client, service_path, server_info))
 
-            # Execute all health checks concurrently
-            if check_tasks:
-                results = await asyncio.gather(*check_tasks, return_exceptions=True)
+        # Execute all health checks concurrently
+        if check_tasks:
+            results = await asyncio.gather(*check_tasks, return_exceptions=True)
 
-                # Check if any status changed
-                for result in results:
-                    if isinstance(result, bool) and result:  # True indicates status changed
-                        status_changed = True
-                        break
+            # Check if any status changed
+            for result in results:
+                if isinstance(result, bool) and result:  # True indicates status changed
+                    status_changed = True
+                    break
 
         # Only broadcast if something actually changed
         if status_changed:
@@ -446,7 +454,9 @@ class HealthMonitoringService:
                             )
 
                 if should_fetch_tools:
-                    asyncio.create_task(self._update_tools_background(service_path, proxy_pass_url))
+                    # server_info was loaded with credentials for this check, so the
+                    # discovery can reuse it instead of reading the server again
+                    self._schedule_tool_discovery(service_path, proxy_pass_url, server_info)
             else:
                 new_status = status_detail  # Detailed error message from transport check
 
@@ -704,7 +714,10 @@ class HealthMonitoringService:
                         "[TRACE] Detected MCP endpoint in URL, using standard HTTP handling"
                     )
                     response = await client.get(
-                        proxy_pass_url, headers=headers, follow_redirects=True
+                        proxy_pass_url,
+                        headers=headers,
+                        follow_redirects=True,
+                        timeout=settings.health_check_timeout_seconds,
                     )
 
                     # Check for auth failures first
@@ -775,7 +788,11 @@ class HealthMonitoringService:
                 logger.info(f"[TRACE] Sending ping to endpoint: {endpoint}")
                 logger.info(f"[TRACE] Headers being sent: {self._mask_sensitive_headers(headers)}")
                 response = await client.post(
-                    endpoint, headers=headers, content=ping_payload, follow_redirects=True
+                    endpoint,
+                    headers=headers,
+                    content=ping_payload,
+                    follow_redirects=True,
+                    timeout=settings.health_check_timeout_seconds,
                 )
                 logger.info(f"[TRACE] Response status: {response.status_code}")
 
@@ -878,7 +895,11 @@ class HealthMonitoringService:
                 logger.info(f"[TRACE] Trying default endpoint: {endpoint}")
                 logger.info(f"[TRACE] Headers being sent: {self._mask_sensitive_headers(headers)}")
                 response = await client.post(
-                    endpoint, headers=headers, content=ping_payload, follow_redirects=True
+                    endpoint,
+                    headers=headers,
+                    content=ping_payload,
+                    follow_redirects=True,
+                    timeout=settings.health_check_timeout_seconds,
                 )
                 logger.info(f"[TRACE] Response status: {response.status_code}")
                 if self._is_mcp_endpoint_healthy_streamable(response):
@@ -1039,12 +1060,74 @@ class HealthMonitoringService:
         # All other status codes (404, 500, etc.) are considered unhealthy
         return False
 
-    async def _update_tools_background(self, service_path: str, proxy_pass_url: str):
-        """Update tool list in the background without blocking health checks."""
+    def _schedule_tool_discovery(
+        self,
+        service_path: str,
+        proxy_pass_url: str,
+        server_info: dict | None = None,
+    ) -> bool:
+        """
+        Schedule a background tool fetch unless one is already pending for the server.
+
+        Fetches are keyed by service path, so repeated health transitions for one
+        server coalesce into the fetch already in flight, and at most
+        tool_discovery_max_concurrency fetches connect to servers at once.
+
+        Args:
+            service_path: Server path
+            proxy_pass_url: URL of the MCP server
+            server_info: Server info with credentials, if the caller already loaded it
+
+        Returns:
+            True if a new fetch was scheduled, False if one was already pending
+        """
+        pending = self._tool_discovery_tasks.get(service_path)
+        if pending is not None and not pending.done():
+            logger.debug(f"Tool discovery already pending for {service_path}, skipping")
+            return False
+
+        task = asyncio.create_task(
+            self._run_tool_discovery(
+                self._update_tools_background(service_path, proxy_pass_url, server_info)
+            )
+        )
+        self._tool_discovery_tasks[service_path] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if self._tool_discovery_tasks.get(service_path) is done:
+                del self._tool_discovery_tasks[service_path]
+
+        task.add_done_callback(_forget)
+        return True
+
+    async def _run_tool_discovery(
+        self,
+        discovery: Coroutine[Any, Any, None],
+    ) -> None:
+        """Run a scheduled tool fetch once a discovery slot is free."""
+        try:
+            async with self._tool_discovery_semaphore:
+                await discovery
+        finally:
+            # Close the coroutine if the task was cancelled while waiting for a slot
+            discovery.close()
+
+    async def _update_tools_background(
+        self,
+        service_path: str,
+        proxy_pass_url: str,
+        server_info: dict | None = None,
+    ):
+        """Update tool list in the background without blocking health checks.
+
+        The stored tool list is only rewritten when its hash or the MCP server
+        version changed, and scopes are only updated when the tool names changed.
+        """
         try:
             logger.info(f"Starting background tool update for {service_path}")
             from ..core.mcp_client import mcp_client_service
             from ..services.server_service import server_service
+            from ..utils.tool_hash import compute_tool_list_hash
 
             # Wait a moment to ensure health check session is fully closed
             # This prevents connection conflicts with servers like currenttime and realserverfaketools
@@ -1052,9 +1135,10 @@ class HealthMonitoringService:
             await asyncio.sleep(0.5)
 
             # Get server info to pass transport configuration and credentials
-            server_info = await server_service.get_server_info(
-                service_path, include_credentials=True
-            )
+            if server_info is None:
+                server_info = await server_service.get_server_info(
+                    service_path, include_credentials=True
+                )
             logger.info(f"Fetching tools from {proxy_pass_url} for {service_path}")
 
             # Use the new connection result function to get both tools and server info
@@ -1064,6 +1148,11 @@ class HealthMonitoringService:
 
             tool_list = connection_result.get("tools") if connection_result else None
             mcp_server_info = connection_result.get("server_info") if connection_result else None
+            detected_transport = connection_result.get("transport") if connection_result else None
+
+            if connection_result is None and server_info and server_info.get("detected_transport"):
+                # The persisted transport no longer works; probe again next time
+                await self._clear_detected_transport(service_path)
 
             logger.info(
                 f"Tool fetch result for {service_path}: "
@@ -1094,9 +1183,16 @@ class HealthMonitoringService:
                             f"{current_mcp_version} -> {new_mcp_version}"
                         )
 
+                    tools_changed = compute_tool_list_hash(tool_list) != compute_tool_list_hash(
+                        current_tool_list
+                    )
+                    transport_changed = detected_transport is not None and dict(
+                        detected_transport
+                    ) != current_server_info.get("detected_transport")
                     needs_update = (
-                        current_tool_count != new_tool_count
-                        or not current_tool_list
+                        tools_changed
+                        or transport_changed
+                        or current_tool_count != new_tool_count
                         or current_mcp_version != new_mcp_version
                     )
 
@@ -1104,6 +1200,8 @@ class HealthMonitoringService:
                         updated_server_info = current_server_info.copy()
                         updated_server_info["tool_list"] = tool_list
                         updated_server_info["num_tools"] = new_tool_count
+                        if detected_transport is not None:
+                            updated_server_info["detected_transport"] = dict(detected_transport)
 
                         # Store MCP server info if available
                         if mcp_server_info:
@@ -1126,19 +1224,28 @@ class HealthMonitoringService:
 
                         await server_service.update_server(service_path, updated_server_info)
 
-                        # Update scopes.yml with newly discovered tools
+                        # Update scopes.yml only when the set of tool names changed
+                        tool_names = [tool["name"] for tool in tool_list if "name" in tool]
+                        current_tool_names = [
+                            tool["name"] for tool in current_tool_list or [] if "name" in tool
+                        ]
                         try:
                             from ..services.scope_service import update_server_scopes
 
-                            tool_names = [tool["name"] for tool in tool_list if "name" in tool]
-                            await update_server_scopes(
-                                service_path,
-                                current_server_info.get("server_name", "Unknown"),
-                                tool_names,
-                            )
-                            logger.info(
-                                f"Updated scopes for {service_path} with {len(tool_names)} discovered tools"
-                            )
+                            if sorted(tool_names) == sorted(current_tool_names):
+                                logger.debug(
+                                    f"Tool names unchanged for {service_path}, skipping scope update"
+                                )
+                            else:
+                                await update_server_scopes(
+                                    service_path,
+                                    current_server_info.get("server_name", "Unknown"),
+                                    tool_names,
+                                )
+                                logger.info(
+                                    f"Updated scopes for {service_path} with "
+                                    f"{len(tool_names)} discovered tools"
+                                )
                         except Exception as e:
                             logger.error(
                                 f"Failed to update scopes for {service_path} after tool discovery: {e}"
@@ -1150,6 +1257,20 @@ class HealthMonitoringService:
         except Exception as e:
             logger.warning(f"Failed to fetch tools for {service_path}: {e}")
 
+    async def _clear_detected_transport(
+        self,
+        service_path: str,
+    ) -> None:
+        """Remove the persisted transport detection from a server document."""
+        from ..services.server_service import server_service
+
+        current_server_info = await server_service.get_server_info(service_path)
+        if current_server_info and current_server_info.get("detected_transport"):
+            updated_server_info = current_server_info.copy()
+            updated_server_info["detected_transport"] = None
+            await server_service.update_server(service_path, updated_server_info)
+            logger.info(f"Cleared persisted transport for {service_path} after failed connection")
+
     async def get_all_health_status(self) -> dict:
         """Get health status for all services."""
         from ..services.server_service import server_service
@@ -1194,46 +1315,42 @@ class HealthMonitoringService:
         self.server_health_status[service_path] = HealthStatus.CHECKING
 
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(settings.health_check_timeout_seconds)
-            ) as client:
-                # Use transport-aware endpoint checking
-                is_healthy, status_detail = await self._check_server_endpoint_transport_aware(
-                    client, proxy_pass_url, server_info
+            client = get_http_client(CLIENT_BACKEND)
+            # Use transport-aware endpoint checking
+            is_healthy, status_detail = await self._check_server_endpoint_transport_aware(
+                client, proxy_pass_url, server_info
+            )
+
+            if is_healthy:
+                current_status = status_detail  # Could be "healthy" or "healthy-auth-expired"
+                logger.info(
+                    f"Health check successful for {service_path} ({proxy_pass_url}): {status_detail}"
                 )
 
-                if is_healthy:
-                    current_status = status_detail  # Could be "healthy" or "healthy-auth-expired"
+                # Schedule tool list fetch in background only for fully healthy status
+                logger.info(
+                    f"DEBUG: Health check status for {service_path}: status_detail='{status_detail}' (type: {type(status_detail)}) vs HealthStatus.HEALTHY='{HealthStatus.HEALTHY}' (type: {type(HealthStatus.HEALTHY)})"
+                )
+                if status_detail == HealthStatus.HEALTHY:
                     logger.info(
-                        f"Health check successful for {service_path} ({proxy_pass_url}): {status_detail}"
+                        f"DEBUG: Status detail matches HealthStatus.HEALTHY, triggering background tool update for {service_path}"
                     )
-
-                    # Schedule tool list fetch in background only for fully healthy status
-                    logger.info(
-                        f"DEBUG: Health check status for {service_path}: status_detail='{status_detail}' (type: {type(status_detail)}) vs HealthStatus.HEALTHY='{HealthStatus.HEALTHY}' (type: {type(HealthStatus.HEALTHY)})"
+                    self._schedule_tool_discovery(service_path, proxy_pass_url)
+                elif status_detail == HealthStatus.HEALTHY_AUTH_EXPIRED:
+                    logger.warning(
+                        f"Auth token expired for {service_path} but server is reachable"
                     )
-                    if status_detail == HealthStatus.HEALTHY:
-                        logger.info(
-                            f"DEBUG: Status detail matches HealthStatus.HEALTHY, triggering background tool update for {service_path}"
-                        )
-                        asyncio.create_task(
-                            self._update_tools_background(service_path, proxy_pass_url)
-                        )
-                    elif status_detail == HealthStatus.HEALTHY_AUTH_EXPIRED:
-                        logger.warning(
-                            f"Auth token expired for {service_path} but server is reachable"
-                        )
-                    else:
-                        logger.info(
-                            f"DEBUG: Status detail '{status_detail}' does not match HealthStatus.HEALTHY, NOT triggering background tool update"
-                        )
-
                 else:
-                    current_status = status_detail  # Detailed error from transport check
                     logger.info(
-                        f"Health check failed for {service_path} ({proxy_pass_url}): {status_detail}"
+                        f"DEBUG: Status detail '{status_detail}' does not match HealthStatus.HEALTHY, NOT triggering background tool update"
                     )
 
+            else:
+                current_status = status_detail  # Detailed error from transport check
+                logger.info(
+                    f"Health check failed for {service_path} ({proxy_pass_url}): {status_detail}"
+                )
+
         except httpx.TimeoutException:
             current_status = "unhealthy: timeout"
             logger.info(f"Health check timeout for {service_path}")
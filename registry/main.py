@@ -7,12 +7,13 @@ This main.py file serves as the application coordinator, importing and registeri
 domain routers while handling core app configuration.
 """
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
 
 # Import datetime for uptime tracking
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -58,20 +59,26 @@ from registry.core.config import (
     _validate_mode_combination,
     settings,
 )
+from registry.core.http_clients import http_clients
 from registry.core.metrics import DEPLOYMENT_MODE_INFO
 from registry.core.nginx_service import nginx_service
 from registry.health.routes import router as health_router
 from registry.health.service import health_service
+from registry.metrics.emitter import shutdown_metrics_emitters
 
 # Import registry mode middleware
 from registry.middleware.mode_filter import RegistryModeMiddleware
-from registry.repositories.factory import get_search_repository
+from registry.repositories.factory import (
+    get_backend_session_repository,
+    get_search_repository,
+)
 from registry.services.agent_service import agent_service
 from registry.services.peer_federation_service import get_peer_federation_service
 from registry.services.peer_sync_scheduler import get_peer_sync_scheduler
 
 # Import services for initialization
 from registry.services.server_service import server_service
+from registry.services.skill_service import get_skill_service
 
 # Import version
 from registry.version import __version__
@@ -167,6 +174,79 @@ def _initialize_deployment_metrics() -> None:
     ).set(1)
 
 
+async def _backfill_audit_rollups(audit_repository: Any) -> None:
+    """Rebuild closed audit statistics rollups from raw events since the last run.
+
+    Rollups are maintained incrementally by the audit writer; this covers
+    events written before rollups were introduced (or after the rollup
+    collection was dropped). A watermark records how far the last rebuild
+    got, so a backfill interrupted before completion is retried on the next
+    start, and later starts only recount the days closed since then.
+    """
+    try:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        until = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        since = await audit_repository.get_rollup_watermark()
+        if since is None:
+            since = until - timedelta(days=settings.audit_log_mongodb_ttl_days)
+
+        # The hour still filling is left to the live counters
+        written = await audit_repository.rebuild_rollups(since, now)
+        await audit_repository.set_rollup_watermark(until)
+        logger.info(
+            f"Backfilled {written} audit rollup documents from {since.isoformat()} "
+            f"(watermark now {until.isoformat()})"
+        )
+    except Exception as e:
+        logger.error(f"Audit rollup backfill failed: {e}", exc_info=True)
+
+
+async def _warm_search_index(
+    app: FastAPI,
+    search_repo: Any,
+    backend_name: str,
+) -> None:
+    """Bring the search index up to date with all registered servers and agents.
+
+    Runs after startup so readiness is not blocked on embedding. Enabled state
+    comes from the listed documents where the backend includes it, instead of
+    one state lookup per server, and the repository skips entities whose
+    content has not changed since they were last indexed.
+    """
+    try:
+        logger.info(f"📊 Updating {backend_name} index with all registered services...")
+        all_servers = await server_service.get_all_servers()
+        server_entries = []
+        for service_path, server_info in all_servers.items():
+            is_enabled = server_info.get("is_enabled")
+            if is_enabled is None:
+                is_enabled = await server_service.is_service_enabled(service_path)
+            server_entries.append((service_path, server_info, is_enabled))
+
+        indexed = await search_repo.index_servers(server_entries)
+        logger.info(
+            f"✅ {backend_name} index updated: {indexed} of {len(all_servers)} services re-indexed"
+        )
+
+        logger.info(f"📊 Updating {backend_name} index with all registered agents...")
+        all_agents = agent_service.list_agents()
+        agent_entries = [
+            (agent_card.path, agent_card, agent_service.is_agent_enabled(agent_card.path))
+            for agent_card in all_agents
+        ]
+        indexed = await search_repo.index_agents(agent_entries)
+        logger.info(
+            f"✅ {backend_name} index updated: {indexed} of {len(all_agents)} agents re-indexed"
+        )
+
+        app.state.search_index_status = "ready"
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        app.state.search_index_status = "degraded"
+        logger.error(f"Failed to update {backend_name} search index: {e}", exc_info=True)
+
+
 # Stats and deployment detection functions moved to registry/api/system_routes.py
 
 
@@ -202,11 +282,24 @@ async def lifespan(app: FastAPI):
     # Initialize Prometheus metrics
     _initialize_deployment_metrics()
 
+    # Create the pooled outbound HTTP clients shared by services and routes
+    http_clients.startup()
+
     # Initialize audit logger reference (middleware added at module level)
     audit_logger = getattr(app.state, "audit_logger", None)
     if audit_logger:
         logger.info(f"✅ Audit logging enabled. Writing to: {settings.audit_log_path}")
 
+    # Backfill audit statistics rollups in the background so startup is not delayed
+    audit_rollup_task = None
+    search_index_task = None
+    skill_health_task = None
+    session_touch_task = None
+    backend_session_repo = None
+    audit_repository = getattr(app.state, "audit_repository", None)
+    if audit_repository is not None and settings.audit_statistics_use_rollups:
+        audit_rollup_task = asyncio.create_task(_backfill_audit_rollups(audit_repository))
+
     try:
         # Load scopes configuration from repository
         logger.info("🔐 Loading scopes configuration from repository...")
@@ -225,42 +318,25 @@ async def lifespan(app: FastAPI):
         logger.info(f"🔍 Initializing {backend_name} search service...")
         await search_repo.initialize()
 
-        logger.info(f"📊 Updating {backend_name} index with all registered services...")
-        all_servers = await server_service.get_all_servers()
-        for service_path, server_info in all_servers.items():
-            is_enabled = await server_service.is_service_enabled(service_path)
-            try:
-                await search_repo.index_server(service_path, server_info, is_enabled)
-                logger.debug(f"Updated {backend_name} index for service: {service_path}")
-            except Exception as e:
-                logger.error(
-                    f"Failed to update {backend_name} index for service {service_path}: {e}",
-                    exc_info=True,
-                )
-
-        logger.info(f"✅ {backend_name} index updated with {len(all_servers)} services")
-
         logger.info("📋 Loading agent cards and state...")
         await agent_service.load_agents_and_state()
 
-        logger.info(f"📊 Updating {backend_name} index with all registered agents...")
-        all_agents = agent_service.list_agents()
-        for agent_card in all_agents:
-            is_enabled = agent_service.is_agent_enabled(agent_card.path)
-            try:
-                await search_repo.index_agent(agent_card.path, agent_card, is_enabled)
-                logger.debug(f"Updated {backend_name} index for agent: {agent_card.path}")
-            except Exception as e:
-                logger.error(
-                    f"Failed to update {backend_name} index for agent {agent_card.path}: {e}",
-                    exc_info=True,
-                )
-
-        logger.info(f"✅ {backend_name} index updated with {len(all_agents)} agents")
+        # Rebuild the search index in the background; search reports "warming" until done
+        app.state.search_index_status = "warming"
+        search_index_task = asyncio.create_task(_warm_search_index(app, search_repo, backend_name))
 
         logger.info("🏥 Initializing health monitoring service...")
         await health_service.initialize()
 
+        # Periodically probe SKILL.md URLs in one batch instead of one skill at a time
+        if settings.skill_health_check_interval_seconds > 0:
+            skill_health_task = asyncio.create_task(get_skill_service().run_health_refresh_loop())
+
+        # Write last_used_at bumps of virtual MCP sessions in batches instead of per read
+        backend_session_repo = get_backend_session_repository()
+        if backend_session_repo is not None:
+            session_touch_task = asyncio.create_task(backend_session_repo.run_touch_flush_loop())
+
         logger.info("🔗 Checking federation configuration...")
         from registry.repositories.factory import get_federation_config_repository
 
@@ -422,6 +498,24 @@ async def lifespan(app: FastAPI):
         peer_sync_scheduler = get_peer_sync_scheduler()
         await peer_sync_scheduler.stop()
 
+        if audit_rollup_task is not None and not audit_rollup_task.done():
+            audit_rollup_task.cancel()
+
+        if search_index_task is not None and not search_index_task.done():
+            search_index_task.cancel()
+
+        if skill_health_task is not None and not skill_health_task.done():
+            skill_health_task.cancel()
+
+        if session_touch_task is not None and not session_touch_task.done():
+            session_touch_task.cancel()
+
+        if backend_session_repo is not None:
+            await backend_session_repo.flush_touches()
+
+        # Write server state changes still waiting in the file backend's debounce window
+        await server_service.flush_pending_writes()
+
         # Shutdown audit logger if enabled
         if audit_logger is not None:
             logger.info("📝 Closing audit logger...")
@@ -429,6 +523,12 @@ async def lifespan(app: FastAPI):
 
         # Shutdown services gracefully
         await health_service.shutdown()
+
+        # Send any metrics still queued for the metrics service
+        await shutdown_metrics_emitters()
+
+        # Close pooled outbound HTTP clients after everything that uses them has stopped
+        await http_clients.aclose()
         logger.info("✅ Shutdown completed successfully!")
     except Exception as e:
         logger.error(f"❌ Error during shutdown: {e}", exc_info=True)
@@ -537,8 +637,9 @@ if settings.audit_log_enabled:
         mongodb_enabled=_mongodb_enabled,
         audit_repository=_audit_repository,
     )
-    # Store audit logger in app state for lifespan access
+    # Store audit logger and repository in app state for lifespan access
     app.state.audit_logger = _audit_logger
+    app.state.audit_repository = _audit_repository if _mongodb_enabled else None
 
     # Add audit middleware to the app
     add_audit_middleware(
@@ -650,6 +751,7 @@ async def health_check():
         "deployment_mode": settings.deployment_mode.value,
         "registry_mode": settings.registry_mode.value,
         "nginx_updates_enabled": settings.nginx_updates_enabled,
+        "search_index": getattr(app.state, "search_index_status", "warming"),
     }
 
 
@@ -12,17 +12,21 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 
-# Import HTTP client for metrics
-import httpx
 from fastapi import Depends
 
+from .emitter import get_metrics_emitter
 from .utils import extract_server_name_from_url
 
 logger = logging.getLogger(__name__)
 
 
 class MetricsClient:
-    """HTTP-based metrics client for registry service."""
+    """
+    Metrics client for registry service.
+
+    Metrics are queued on the shared per-service MetricsEmitter, which sends
+    them to the metrics service in batches from a background task.
+    """
 
     def __init__(
         self,
@@ -36,7 +40,13 @@ class MetricsClient:
         self.service_version = service_version
         self.metrics_url = metrics_url or os.getenv("METRICS_SERVICE_URL", "http://localhost:8890")
         self.api_key = api_key or os.getenv("METRICS_API_KEY", "")
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.emitter = get_metrics_emitter(
+            service_name=service_name,
+            service_version=service_version,
+            metrics_url=self.metrics_url,
+            api_key=self.api_key,
+            timeout=timeout,
+        )
 
     async def _emit_metric(
         self,
@@ -46,31 +56,22 @@ class MetricsClient:
         dimensions: dict[str, Any] | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> bool:
-        """Emit a metric to the metrics service."""
+        """Queue a metric for the next batch sent to the metrics service.
+
+        Returns:
+            True if the metric was queued, False if metrics are disabled or it was dropped
+        """
         try:
-            if not self.api_key:
-                return False
-
-            payload = {
-                "service": self.service_name,
-                "version": self.service_version,
-                "metrics": [
-                    {
-                        "type": metric_type,
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "value": value,
-                        "duration_ms": duration_ms,
-                        "dimensions": dimensions or {},
-                        "metadata": metadata or {},
-                    }
-                ],
-            }
-
-            response = await self.client.post(
-                f"{self.metrics_url}/metrics", json=payload, headers={"X-API-Key": self.api_key}
+            return self.emitter.enqueue(
+                {
+                    "type": metric_type,
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "value": value,
+                    "duration_ms": duration_ms,
+                    "dimensions": dimensions or {},
+                    "metadata": metadata or {},
+                }
             )
-
-            return response.status_code == 200
         except Exception as e:
             logger.debug(f"Failed to emit metric {metric_type}: {e}")
             return False
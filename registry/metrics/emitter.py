@@ -0,0 +1,271 @@
+"""
+Batching metrics emitter shared by the registry and the auth server.
+
+Metrics are appended to a bounded in-memory queue and sent to the metrics
+service in multi-metric batches by a single background flusher, over one
+keep-alive HTTP client. Recording a metric never performs I/O on the request
+path; when the queue is full new metrics are dropped and counted.
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+# Constants
+MAX_BATCH_SIZE = 100  # Metrics service rejects requests with more than 100 metrics
+DEFAULT_MAX_QUEUE_SIZE = int(os.getenv("METRICS_EMITTER_MAX_QUEUE_SIZE", "10000"))
+DEFAULT_BATCH_SIZE = int(os.getenv("METRICS_EMITTER_BATCH_SIZE", "100"))
+DEFAULT_FLUSH_INTERVAL_SECONDS = float(os.getenv("METRICS_EMITTER_FLUSH_INTERVAL", "1.0"))
+
+
+class MetricsEmitter:
+    """Bounded queue of metrics flushed to the metrics service in batches."""
+
+    def __init__(
+        self,
+        service_name: str,
+        service_version: str = "1.0.0",
+        metrics_url: str | None = None,
+        api_key: str | None = None,
+        timeout: float = 5.0,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ):
+        self.service_name = service_name
+        self.service_version = service_version
+        self.metrics_url = metrics_url or os.getenv("METRICS_SERVICE_URL", "http://localhost:8890")
+        self.api_key = api_key if api_key is not None else os.getenv("METRICS_API_KEY", "")
+        self.max_queue_size = max_queue_size
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+        self.flush_interval_seconds = flush_interval_seconds
+        self._timeout = timeout
+
+        self._queue: deque[dict[str, Any]] = deque()
+        self._client: httpx.AsyncClient | None = None
+        self._flusher_task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closed = False
+
+        # Counters
+        self.enqueued = 0
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Metrics are only sent when an API key is configured."""
+        return bool(self.api_key)
+
+    def enqueue(
+        self,
+        metric: dict[str, Any],
+    ) -> bool:
+        """
+        Queue a metric for the next batch.
+
+        Args:
+            metric: Metric payload as accepted by the metrics service
+
+        Returns:
+            True if the metric was queued, False if it was dropped
+        """
+        if not self.enabled or self._closed:
+            return False
+
+        if len(self._queue) >= self.max_queue_size:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    f"Metrics queue for {self.service_name} is full, "
+                    f"dropped {self.dropped} metrics so far"
+                )
+            return False
+
+        self._queue.append(metric)
+        self.enqueued += 1
+        self._ensure_flusher()
+
+        if len(self._queue) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher on the running event loop if needed."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. sync caller); the next async enqueue starts it
+            return
+
+        if self._flusher_task is not None and not self._flusher_task.done():
+            if self._loop is loop:
+                return
+            self._flusher_task.cancel()
+
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._client = None
+        self._flusher_task = loop.create_task(self._run_flusher())
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the keep-alive HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+            )
+        return self._client
+
+    async def _run_flusher(self) -> None:
+        """Send batches when the queue reaches batch_size or the flush interval elapses."""
+        wakeup = self._wakeup
+        while True:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=self.flush_interval_seconds)
+            except TimeoutError:
+                pass
+            wakeup.clear()
+            if self._closed:
+                return
+
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Metrics flush failed for {self.service_name}: {e}")
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        """Remove up to batch_size metrics from the head of the queue."""
+        count = min(self.batch_size, len(self._queue))
+        return [self._queue.popleft() for _ in range(count)]
+
+    async def flush(self) -> None:
+        """Send every queued metric in batches of at most batch_size."""
+        while self._queue:
+            batch = self._take_batch()
+            await self._send_batch(batch)
+
+    async def _send_batch(
+        self,
+        batch: list[dict[str, Any]],
+    ) -> bool:
+        """
+        POST one batch of metrics to the metrics service.
+
+        Args:
+            batch: Metrics to send
+
+        Returns:
+            True if the metrics service accepted the batch
+        """
+        payload = {
+            "service": self.service_name,
+            "version": self.service_version,
+            "metrics": batch,
+        }
+        try:
+            response = await self._get_client().post(
+                f"{self.metrics_url}/metrics",
+                json=payload,
+                headers={"X-API-Key": self.api_key},
+            )
+        except Exception as e:
+            self.failed += len(batch)
+            logger.debug(f"Failed to send {len(batch)} metrics for {self.service_name}: {e}")
+            return False
+
+        if response.status_code != 200:
+            self.failed += len(batch)
+            logger.debug(
+                f"Metrics service returned {response.status_code} for "
+                f"{len(batch)} metrics from {self.service_name}"
+            )
+            return False
+
+        self.sent += len(batch)
+        return True
+
+    def get_stats(self) -> dict[str, int]:
+        """Get emitter counters for diagnostics."""
+        return {
+            "queued": len(self._queue),
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    async def aclose(self) -> None:
+        """Stop the flusher, send any queued metrics and close the HTTP client."""
+        self._closed = True
+        task = self._flusher_task
+        if task is not None and not task.done() and self._loop is asyncio.get_running_loop():
+            # Let the flusher finish the batch it may be sending, then stop it
+            self._wakeup.set()
+            try:
+                await asyncio.wait_for(task, timeout=self._timeout)
+            except asyncio.CancelledError:
+                task.cancel()
+                current = asyncio.current_task()
+                if current is not None and current.cancelling():
+                    # Shutdown itself was cancelled; do not swallow it
+                    raise
+                # Otherwise only the flusher was cancelled, which is what we wanted
+            except Exception:
+                # Includes TimeoutError, after which wait_for has cancelled the flusher
+                task.cancel()
+        self._flusher_task = None
+
+        if self.enabled:
+            await self.flush()
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Global emitters, one per service name
+_emitters: dict[str, MetricsEmitter] = {}
+
+
+def get_metrics_emitter(
+    service_name: str = "registry",
+    **kwargs: Any,
+) -> MetricsEmitter:
+    """
+    Get the shared emitter for a service, creating it on first use.
+
+    Args:
+        service_name: Name reported to the metrics service
+        **kwargs: Emitter options, only used when the emitter is created
+
+    Returns:
+        Shared MetricsEmitter instance
+    """
+    emitter = _emitters.get(service_name)
+    if emitter is None:
+        emitter = MetricsEmitter(service_name=service_name, **kwargs)
+        _emitters[service_name] = emitter
+    return emitter
+
+
+async def shutdown_metrics_emitters() -> None:
+    """Flush and close every shared emitter. Called on application shutdown."""
+    for service_name, emitter in list(_emitters.items()):
+        try:
+            await emitter.aclose()
+            logger.info(f"Metrics emitter for {service_name} flushed: {emitter.get_stats()}")
+        except Exception as e:
+            logger.warning(f"Failed to flush metrics emitter for {service_name}: {e}")
+    _emitters.clear()
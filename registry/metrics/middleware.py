@@ -4,24 +4,22 @@ FastAPI middleware for registry metrics collection.
 Tracks registry operations, request headers, and API usage patterns.
 """
 
-import asyncio
 import logging
-import time
-from collections.abc import Callable
 from typing import Any
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from ..middleware.request_context import bind_request_context
 from .client import create_metrics_client
 from .utils import extract_headers_for_analysis, hash_user_id
 
 logger = logging.getLogger(__name__)
 
 
-class RegistryMetricsMiddleware(BaseHTTPMiddleware):
+class RegistryMetricsMiddleware:
     """
-    Middleware to collect registry operation and request metrics.
+    Pure ASGI middleware to collect registry operation and request metrics.
 
     Tracks:
     - Registry operations (server CRUD, search, health)
@@ -29,8 +27,8 @@ class RegistryMetricsMiddleware(BaseHTTPMiddleware):
     - API usage patterns
     """
 
-    def __init__(self, app, service_name: str = "registry"):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, service_name: str = "registry"):
+        self.app = app
         self.metrics_client = create_metrics_client(service_name=service_name)
 
     def extract_operation_info(self, request: Request) -> dict[str, Any]:
@@ -117,37 +115,44 @@ class RegistryMetricsMiddleware(BaseHTTPMiddleware):
 
         return True
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and collect metrics."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        context, send = bind_request_context(scope, send)
+        request = context.request
+
         # Skip tracking for certain endpoints
         if not self.should_track_request(request):
-            return await call_next(request)
-
-        # Start timing
-        start_time = time.perf_counter()
+            await self.app(scope, receive, send)
+            return
 
         # Extract operation information
         operation_info = self.extract_operation_info(request)
         if not operation_info:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Extract user and header information
         user_hash = self.extract_user_info(request)
-        headers_info = extract_headers_for_analysis(dict(request.headers))
+        headers_info = extract_headers_for_analysis(dict(context.headers))
 
-        # Process the request
-        response = None
+        # Process the request; the response streams through untouched and the
+        # status is read from the shared context afterwards
         success = False
         error_code = None
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send)
 
             # Determine success based on response status
-            success = 200 <= response.status_code < 400
+            status_code = context.status_code or 500
+            success = 200 <= status_code < 400
 
             if not success:
-                error_code = str(response.status_code)
+                error_code = str(status_code)
 
         except Exception as e:
             # Handle exceptions during request processing
@@ -158,43 +163,35 @@ class RegistryMetricsMiddleware(BaseHTTPMiddleware):
             raise
 
         finally:
-            # Calculate duration
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # Emit registry operation metric asynchronously
-            asyncio.create_task(
-                self._emit_registry_metric(
-                    operation=operation_info["operation"],
-                    resource_type=operation_info["resource_type"],
-                    success=success,
-                    duration_ms=duration_ms,
-                    resource_id=operation_info["resource_id"],
-                    user_id=user_hash,
-                    error_code=error_code,
-                )
+            duration_ms = context.duration_ms
+
+            # Queue metrics on the batching emitter; this does no I/O, so there is
+            # no need to spawn a task per metric
+            await self._emit_registry_metric(
+                operation=operation_info["operation"],
+                resource_type=operation_info["resource_type"],
+                success=success,
+                duration_ms=duration_ms,
+                resource_id=operation_info["resource_id"],
+                user_id=user_hash,
+                error_code=error_code,
             )
 
             # Emit headers analysis metric for nginx config insights
             if success and operation_info["resource_type"] != "health":
-                asyncio.create_task(
-                    self._emit_headers_metric(
-                        path=operation_info["path"],
-                        method=request.method,
-                        headers_info=headers_info,
-                        status_code=response.status_code if response else 500,
-                    )
+                await self._emit_headers_metric(
+                    path=operation_info["path"],
+                    method=context.method,
+                    headers_info=headers_info,
+                    status_code=context.status_code or 500,
                 )
 
             # If this is a search operation, emit discovery metric too
             if operation_info["resource_type"] == "search" and success:
-                asyncio.create_task(
-                    self._emit_discovery_metric_from_request(
-                        request=request, duration_ms=duration_ms
-                    )
+                await self._emit_discovery_metric_from_request(
+                    request=request, duration_ms=duration_ms
                 )
 
-        return response
-
     async def _emit_registry_metric(
         self,
         operation: str,
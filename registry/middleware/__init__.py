@@ -1,5 +1,11 @@
 """Middleware package for MCP Gateway Registry."""
 
 from .mode_filter import RegistryModeMiddleware
+from .request_context import RequestContext, bind_request_context, get_request_context
 
-__all__ = ["RegistryModeMiddleware"]
+__all__ = [
+    "RegistryModeMiddleware",
+    "RequestContext",
+    "bind_request_context",
+    "get_request_context",
+]
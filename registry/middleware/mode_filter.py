@@ -7,14 +7,13 @@ blocks /api/servers and /api/agents endpoints).
 """
 
 import logging
-from collections.abc import Callable
 
-from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ..core.config import RegistryMode, settings
 from ..core.metrics import MODE_BLOCKED_REQUESTS
+from .request_context import bind_request_context
 
 logger = logging.getLogger(__name__)
 
@@ -141,43 +140,59 @@ def _get_path_category(path: str) -> str:
     return "other"
 
 
-class RegistryModeMiddleware(BaseHTTPMiddleware):
-    """Middleware to filter requests based on registry mode."""
+class RegistryModeMiddleware:
+    """Pure ASGI middleware to filter requests based on registry mode."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and block if endpoint is disabled for current mode.
+    def __init__(
+        self,
+        app: ASGIApp,
+    ):
+        self.app = app
 
-        Args:
-            request: Incoming HTTP request
-            call_next: Next handler in middleware chain
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Pass the request through, or answer 403 if its endpoint is disabled in this mode.
 
-        Returns:
-            Response from next handler or 403 if blocked
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
-        path = request.url.path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
         mode = settings.registry_mode
 
         # Check if path is allowed for current mode
-        if not _is_path_allowed(path, mode):
-            # Log blocked request
-            client_host = request.client.host if request.client else "unknown"
-            logger.warning(
-                f"Blocked request to '{path}' - endpoint disabled in {mode.value} mode. "
-                f"Client: {client_host}"
-            )
-
-            # Increment metrics counter
-            category = _get_path_category(path)
-            MODE_BLOCKED_REQUESTS.labels(path_category=category, mode=mode.value).inc()
-
-            return JSONResponse(
-                status_code=403,
-                content={
-                    "detail": f"This endpoint is disabled in {mode.value} mode",
-                    "error": "endpoint_disabled",
-                    "registry_mode": mode.value,
-                    "path": path,
-                },
-            )
-
-        return await call_next(request)
+        if _is_path_allowed(path, mode):
+            await self.app(scope, receive, send)
+            return
+
+        context, send = bind_request_context(scope, send)
+
+        # Log blocked request
+        logger.warning(
+            f"Blocked request to '{path}' - endpoint disabled in {mode.value} mode. "
+            f"Client: {context.client_ip}"
+        )
+
+        # Increment metrics counter
+        category = _get_path_category(path)
+        MODE_BLOCKED_REQUESTS.labels(path_category=category, mode=mode.value).inc()
+
+        response = JSONResponse(
+            status_code=403,
+            content={
+                "detail": f"This endpoint is disabled in {mode.value} mode",
+                "error": "endpoint_disabled",
+                "registry_mode": mode.value,
+                "path": path,
+            },
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,116 @@
+"""
+Shared per-request context for the pure ASGI middlewares.
+
+The outermost middleware creates a RequestContext and stores it in the ASGI
+scope; inner middlewares reuse it. Headers, request ID, client IP and timing
+are extracted once, and the response status and headers are captured by a
+single send wrapper, so audit, metrics and mode filtering do not each wrap the
+request and response streams.
+"""
+
+import time
+import uuid
+from functools import cached_property
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.types import Message, Scope, Send
+
+from ..utils.request_utils import get_client_ip
+
+REQUEST_CONTEXT_SCOPE_KEY = "registry.request_context"
+
+
+class RequestContext:
+    """Request data shared by the middlewares handling one HTTP request."""
+
+    def __init__(
+        self,
+        scope: Scope,
+    ):
+        self.scope = scope
+        self.path: str = scope["path"]
+        self.method: str = scope["method"]
+        self.start_time = time.perf_counter()
+        self.status_code: int | None = None
+        self.response_headers: Headers | None = None
+
+    @cached_property
+    def headers(self) -> Headers:
+        """Request headers (case-insensitive)."""
+        return Headers(scope=self.scope)
+
+    @cached_property
+    def request(self) -> Request:
+        """Starlette Request view of the scope, for cookies, query params and state."""
+        return Request(self.scope)
+
+    @cached_property
+    def request_id(self) -> str:
+        """X-Request-ID from the client, or a generated one."""
+        return self.headers.get("X-Request-ID") or str(uuid.uuid4())
+
+    @cached_property
+    def client_ip(self) -> str:
+        """Validated client IP, preferring X-Forwarded-For."""
+        return get_client_ip(self.request)
+
+    @property
+    def user_context(self) -> dict[str, Any] | None:
+        """User context set on request.state by the auth dependency, if any."""
+        user_context = self.scope.get("state", {}).get("user_context")
+        return user_context if isinstance(user_context, dict) else None
+
+    @property
+    def duration_ms(self) -> float:
+        """Milliseconds since the request entered the middleware stack."""
+        return (time.perf_counter() - self.start_time) * 1000
+
+    def wrap_send(
+        self,
+        send: Send,
+    ) -> Send:
+        """Wrap send so the response status and headers are recorded on this context."""
+
+        async def _send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self.status_code = message["status"]
+                self.response_headers = Headers(raw=message.get("headers", []))
+            await send(message)
+
+        return _send
+
+
+def get_request_context(
+    scope: Scope,
+) -> RequestContext | None:
+    """Get the context bound to a scope, if a middleware created one."""
+    return scope.get(REQUEST_CONTEXT_SCOPE_KEY)
+
+
+def bind_request_context(
+    scope: Scope,
+    send: Send,
+) -> tuple[RequestContext, Send]:
+    """
+    Get the request context for a scope, creating it if this is the outermost middleware.
+
+    Only the middleware that creates the context wraps send; inner middlewares
+    pass their send through unchanged and read the status from the context
+    once the application returns.
+
+    Args:
+        scope: ASGI HTTP scope
+        send: ASGI send callable of the calling middleware
+
+    Returns:
+        Tuple of (context, send callable to pass to the next application)
+    """
+    context = scope.get(REQUEST_CONTEXT_SCOPE_KEY)
+    if context is not None:
+        return context, send
+
+    context = RequestContext(scope)
+    scope[REQUEST_CONTEXT_SCOPE_KEY] = context
+    return context, context.wrap_send(send)
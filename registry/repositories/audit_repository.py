@@ -8,10 +8,12 @@ warm storage requirements.
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any, Union
 
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReplaceOne, UpdateOne
 from pymongo.errors import DuplicateKeyError
 
 from ..audit.models import MCPServerAccessRecord, RegistryApiAccessRecord
@@ -22,6 +24,105 @@ logger = logging.getLogger(__name__)
 # Type alias for audit records
 AuditRecord = Union[RegistryApiAccessRecord, MCPServerAccessRecord]
 
+# Rollup granularities maintained alongside raw audit events
+ROLLUP_GRANULARITIES = ("hour", "day")
+
+
+def _normalize_event_doc(
+    doc: dict[str, Any],
+) -> dict[str, Any]:
+    """Make a raw audit document JSON-friendly (string _id, UTC-aware timestamp)."""
+    # Convert _id to string if it's an ObjectId
+    if "_id" in doc:
+        doc["_id"] = str(doc["_id"])
+    # Motor returns naive datetimes; re-attach UTC for correct serialization
+    if isinstance(doc.get("timestamp"), datetime) and doc["timestamp"].tzinfo is None:
+        doc["timestamp"] = doc["timestamp"].replace(tzinfo=UTC)
+    return doc
+
+
+def normalize_username(
+    username: str | None,
+) -> str:
+    """
+    Normalize a username for rollup keys and exact-match filters.
+
+    Usernames are stripped and lowercased at write time so that statistics
+    filters can use an equality match on an indexed field instead of a
+    case-insensitive regex.
+
+    Args:
+        username: Raw username from the audit record identity
+
+    Returns:
+        Normalized username, or empty string if none was provided
+    """
+    return (username or "").strip().lower()
+
+
+def _status_bucket(
+    status_code: int | None,
+) -> str:
+    """Map an HTTP status code to the dashboard status bucket."""
+    if status_code is None:
+        return "other"
+    if 200 <= status_code < 300:
+        return "2xx"
+    if 400 <= status_code < 500:
+        return "4xx"
+    if status_code >= 500:
+        return "5xx"
+    return "other"
+
+
+def _bucket_start(
+    timestamp: datetime,
+    granularity: str,
+) -> datetime:
+    """Truncate a timestamp to the start of its hourly or daily bucket (naive UTC)."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(UTC).replace(tzinfo=None)
+    if granularity == "day":
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+def _rollup_dimensions(
+    doc: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Extract rollup dimensions from a serialized audit event.
+
+    Registry API events use action.operation and a status-code bucket,
+    MCP access events use mcp_request.method, mcp_response.status and
+    mcp_server.name.
+
+    Args:
+        doc: Audit event document as written to MongoDB
+
+    Returns:
+        Dictionary with log_type, username, operation, status and server
+    """
+    log_type = doc.get("log_type")
+    identity = doc.get("identity") or {}
+
+    if log_type == "mcp_server_access":
+        operation = (doc.get("mcp_request") or {}).get("method")
+        status = (doc.get("mcp_response") or {}).get("status")
+        server = (doc.get("mcp_server") or {}).get("name")
+    else:
+        operation = (doc.get("action") or {}).get("operation")
+        status = _status_bucket((doc.get("response") or {}).get("status_code"))
+        server = None
+
+    return {
+        "log_type": log_type,
+        "username": normalize_username(identity.get("username")),
+        "operation": operation,
+        "status": status,
+        "server": server,
+    }
+
 
 class AuditRepositoryBase(ABC):
     """
@@ -55,6 +156,30 @@ class AuditRepositoryBase(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_find(
+        self,
+        query: dict[str, Any],
+        limit: int = 10000,
+        sort_field: str = "timestamp",
+        sort_order: int = -1,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream audit events matching the query without materializing them.
+
+        Args:
+            query: MongoDB query filter
+            limit: Maximum number of events to yield
+            sort_field: Field to sort by (default: timestamp)
+            sort_order: Sort order (-1 for descending, 1 for ascending)
+            batch_size: Number of documents fetched per cursor round trip
+
+        Returns:
+            Async iterator over audit event documents
+        """
+        pass
+
     @abstractmethod
     async def find_one(
         self,
@@ -137,6 +262,66 @@ class AuditRepositoryBase(ABC):
         """
         pass
 
+    @abstractmethod
+    async def aggregate_rollups(
+        self,
+        pipeline: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Run a MongoDB aggregation pipeline on the hourly/daily rollups.
+
+        Rollup documents carry log_type, granularity, bucket, username,
+        operation, status, server and a pre-aggregated count.
+
+        Args:
+            pipeline: MongoDB aggregation pipeline stages
+
+        Returns:
+            List of aggregation result documents
+        """
+        pass
+
+    @abstractmethod
+    async def get_rollup_watermark(self) -> datetime | None:
+        """
+        Get the time up to which rollups were last rebuilt from raw events.
+
+        Returns:
+            Watermark (naive UTC), or None if rollups were never rebuilt
+        """
+        pass
+
+    @abstractmethod
+    async def set_rollup_watermark(
+        self,
+        watermark: datetime,
+    ) -> None:
+        """
+        Record the time up to which rollups have been rebuilt from raw events.
+
+        Args:
+            watermark: End of the last completed rebuild
+        """
+        pass
+
+    @abstractmethod
+    async def rebuild_rollups(
+        self,
+        since: datetime,
+        until: datetime,
+    ) -> int:
+        """
+        Recompute closed rollup buckets from raw audit events.
+
+        Args:
+            since: Start of the compaction window (should be a day boundary)
+            until: Only buckets ending at or before this time are rebuilt
+
+        Returns:
+            Number of rollup documents written
+        """
+        pass
+
 
 class DocumentDBAuditRepository(AuditRepositoryBase):
     """
@@ -149,6 +334,9 @@ class DocumentDBAuditRepository(AuditRepositoryBase):
     def __init__(self):
         self._collection: AsyncIOMotorCollection | None = None
         self._collection_name = get_collection_name("audit_events")
+        self._rollup_collection: AsyncIOMotorCollection | None = None
+        self._rollup_collection_name = get_collection_name("audit_rollups")
+        self._rollup_state_collection_name = get_collection_name("audit_rollup_state")
 
     async def _get_collection(self) -> AsyncIOMotorCollection:
         """Get DocumentDB collection."""
@@ -157,6 +345,39 @@ class DocumentDBAuditRepository(AuditRepositoryBase):
             self._collection = db[self._collection_name]
         return self._collection
 
+    async def _get_rollup_collection(self) -> AsyncIOMotorCollection:
+        """Get DocumentDB rollup collection (same database as the raw events)."""
+        if self._rollup_collection is None:
+            collection = await self._get_collection()
+            self._rollup_collection = collection.database[self._rollup_collection_name]
+        return self._rollup_collection
+
+    async def _increment_rollups(
+        self,
+        doc: dict[str, Any],
+    ) -> None:
+        """Increment the hourly and daily rollup counters for an inserted event."""
+        timestamp = doc.get("timestamp")
+        if not isinstance(timestamp, datetime):
+            return
+
+        dimensions = _rollup_dimensions(doc)
+        operations = [
+            UpdateOne(
+                {
+                    **dimensions,
+                    "granularity": granularity,
+                    "bucket": _bucket_start(timestamp, granularity),
+                },
+                {"$inc": {"count": 1}},
+                upsert=True,
+            )
+            for granularity in ROLLUP_GRANULARITIES
+        ]
+
+        rollup_collection = await self._get_rollup_collection()
+        await rollup_collection.bulk_write(operations, ordered=False)
+
     async def find(
         self,
         query: dict[str, Any],
@@ -191,13 +412,7 @@ class DocumentDBAuditRepository(AuditRepositoryBase):
 
             events = []
             async for doc in cursor:
-                # Convert _id to string if it's an ObjectId
-                if "_id" in doc:
-                    doc["_id"] = str(doc["_id"])
-                # Motor returns naive datetimes; re-attach UTC for correct serialization
-                if isinstance(doc.get("timestamp"), datetime) and doc["timestamp"].tzinfo is None:
-                    doc["timestamp"] = doc["timestamp"].replace(tzinfo=UTC)
-                events.append(doc)
+                events.append(_normalize_event_doc(doc))
 
             logger.debug(f"DocumentDB READ: Found {len(events)} audit events")
             return events
@@ -205,6 +420,56 @@ class DocumentDBAuditRepository(AuditRepositoryBase):
             logger.error(f"Error finding audit events: {e}", exc_info=True)
             return []
 
+    async def iter_find(
+        self,
+        query: dict[str, Any],
+        limit: int = 10000,
+        sort_field: str = "timestamp",
+        sort_order: int = -1,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream audit events matching the query without materializing them.
+
+        Documents are pulled from the Motor cursor in batches of batch_size,
+        so memory use stays constant regardless of limit. Errors are logged
+        and re-raised, so a failure partway through aborts the stream instead
+        of looking like a complete (but truncated) result.
+
+        Args:
+            query: MongoDB query filter
+            limit: Maximum number of events to yield
+            sort_field: Field to sort by (default: timestamp)
+            sort_order: Sort order (-1 for descending, 1 for ascending)
+            batch_size: Number of documents fetched per cursor round trip
+
+        Yields:
+            Audit event documents
+
+        Raises:
+            Exception: If the query or the cursor fails
+        """
+        logger.debug(
+            f"DocumentDB READ: Streaming audit events with query={query}, "
+            f"limit={limit}, batch_size={batch_size}"
+        )
+        collection = await self._get_collection()
+
+        streamed = 0
+        try:
+            cursor = collection.find(query)
+            cursor = cursor.sort(sort_field, sort_order)
+            cursor = cursor.limit(limit).batch_size(batch_size)
+
+            async for doc in cursor:
+                streamed += 1
+                yield _normalize_event_doc(doc)
+        except Exception as e:
+            logger.error(f"Error streaming audit events after {streamed}: {e}", exc_info=True)
+            raise
+
+        logger.debug(f"DocumentDB READ: Streamed {streamed} audit events")
+
     async def find_one(
         self,
         query: dict[str, Any],
@@ -224,12 +489,7 @@ class DocumentDBAuditRepository(AuditRepositoryBase):
         try:
             doc = await collection.find_one(query)
             if doc:
-                # Convert _id to string if it's an ObjectId
-                if "_id" in doc:
-                    doc["_id"] = str(doc["_id"])
-                # Motor returns naive datetimes; re-attach UTC for correct serialization
-                if isinstance(doc.get("timestamp"), datetime) and doc["timestamp"].tzinfo is None:
-                    doc["timestamp"] = doc["timestamp"].replace(tzinfo=UTC)
+                _normalize_event_doc(doc)
                 logger.debug(
                     f"DocumentDB READ: Found audit event with request_id={doc.get('request_id')}"
                 )
@@ -325,7 +585,6 @@ class DocumentDBAuditRepository(AuditRepositoryBase):
 
             await collection.insert_one(doc)
             logger.info(f"DocumentDB WRITE: Inserted audit event request_id={record.request_id}")
-            return True
         except DuplicateKeyError:
             logger.debug(
                 f"DocumentDB WRITE: Skipped duplicate audit event for request_id={record.request_id}. "
@@ -336,3 +595,164 @@ class DocumentDBAuditRepository(AuditRepositoryBase):
         except Exception as e:
             logger.error(f"Error inserting audit event: {e}", exc_info=True)
             return False
+
+        # Only newly inserted events are rolled up so duplicates are not double counted.
+        # A rollup failure must not fail the audit write itself.
+        try:
+            await self._increment_rollups(doc)
+        except Exception as e:
+            logger.warning(
+                f"Failed to update audit rollups for request_id={record.request_id}: {e}"
+            )
+        return True
+
+    async def aggregate_rollups(
+        self,
+        pipeline: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Run a MongoDB aggregation pipeline on the audit rollups."""
+        logger.debug(
+            f"DocumentDB READ: Running rollup aggregation pipeline with {len(pipeline)} stages"
+        )
+        rollup_collection = await self._get_rollup_collection()
+        try:
+            results = []
+            async for doc in rollup_collection.aggregate(pipeline):
+                results.append(doc)
+            logger.debug(f"DocumentDB READ: Rollup aggregation returned {len(results)} results")
+            return results
+        except Exception as e:
+            logger.error(f"Error running rollup aggregation pipeline: {e}", exc_info=True)
+            return []
+
+    async def _get_rollup_state_collection(self) -> AsyncIOMotorCollection:
+        """Get the collection holding the rollup rebuild watermark."""
+        collection = await self._get_collection()
+        return collection.database[self._rollup_state_collection_name]
+
+    async def get_rollup_watermark(self) -> datetime | None:
+        """Get the time up to which rollups were last rebuilt from raw events."""
+        state_collection = await self._get_rollup_state_collection()
+        state = await state_collection.find_one({"_id": "rebuild"})
+        return state.get("watermark") if state else None
+
+    async def set_rollup_watermark(
+        self,
+        watermark: datetime,
+    ) -> None:
+        """Record the time up to which rollups have been rebuilt from raw events."""
+        state_collection = await self._get_rollup_state_collection()
+        await state_collection.replace_one(
+            {"_id": "rebuild"},
+            {"watermark": watermark, "updated_at": datetime.now(UTC)},
+            upsert=True,
+        )
+
+    async def rebuild_rollups(
+        self,
+        since: datetime,
+        until: datetime,
+    ) -> int:
+        """
+        Recompute closed rollup buckets from raw audit events.
+
+        Raw events are grouped server-side per granularity and the matching
+        rollup documents are replaced, so the operation is idempotent. It is
+        used to backfill rollups after an upgrade and can be run as a
+        periodic compactor. since should fall on a day boundary, otherwise
+        the first daily bucket is only partially recounted.
+
+        The bucket containing until (the current hour or day) is skipped:
+        inserts are still incrementing it, and replacing it with a count
+        taken from the raw events would race with and drop those $inc writes.
+
+        Args:
+            since: Start of the compaction window
+            until: Only buckets ending at or before this time are rebuilt
+
+        Returns:
+            Number of rollup documents written
+
+        Raises:
+            Exception: If the aggregation or the rollup write fails
+        """
+        logger.info(
+            f"DocumentDB WRITE: Rebuilding audit rollups from {since.isoformat()} "
+            f"to {until.isoformat()}"
+        )
+        collection = await self._get_collection()
+        rollup_collection = await self._get_rollup_collection()
+
+        is_mcp = {"$eq": ["$log_type", "mcp_server_access"]}
+        status_code = "$response.status_code"
+        status_bucket = {
+            "$switch": {
+                "branches": [
+                    {
+                        "case": {
+                            "$and": [{"$gte": [status_code, 200]}, {"$lt": [status_code, 300]}]
+                        },
+                        "then": "2xx",
+                    },
+                    {
+                        "case": {
+                            "$and": [{"$gte": [status_code, 400]}, {"$lt": [status_code, 500]}]
+                        },
+                        "then": "4xx",
+                    },
+                    {"case": {"$gte": [status_code, 500]}, "then": "5xx"},
+                ],
+                "default": "other",
+            }
+        }
+        dimensions = {
+            "log_type": "$log_type",
+            "username": {"$toLower": {"$trim": {"input": {"$ifNull": ["$identity.username", ""]}}}},
+            "operation": {"$cond": [is_mcp, "$mcp_request.method", "$action.operation"]},
+            "status": {"$cond": [is_mcp, "$mcp_response.status", status_bucket]},
+            "server": {"$cond": [is_mcp, "$mcp_server.name", None]},
+        }
+        day_parts = {
+            "year": {"$year": "$timestamp"},
+            "month": {"$month": "$timestamp"},
+            "day": {"$dayOfMonth": "$timestamp"},
+        }
+        bucket_parts = {
+            "hour": {**day_parts, "hour": {"$hour": "$timestamp"}},
+            "day": day_parts,
+        }
+
+        written = 0
+        try:
+            for granularity in ROLLUP_GRANULARITIES:
+                # Exclude the bucket that is still filling
+                closed_until = _bucket_start(until, granularity)
+                if closed_until <= _bucket_start(since, granularity):
+                    continue
+                pipeline = [
+                    {"$match": {"timestamp": {"$gte": since, "$lt": closed_until}}},
+                    {
+                        "$group": {
+                            "_id": {
+                                **dimensions,
+                                "bucket": {"$dateFromParts": bucket_parts[granularity]},
+                            },
+                            "count": {"$sum": 1},
+                        }
+                    },
+                ]
+
+                operations = []
+                async for row in collection.aggregate(pipeline):
+                    key = {**row["_id"], "granularity": granularity}
+                    operations.append(ReplaceOne(key, {**key, "count": row["count"]}, upsert=True))
+
+                if operations:
+                    await rollup_collection.bulk_write(operations, ordered=False)
+                    written += len(operations)
+
+            logger.info(f"DocumentDB WRITE: Rebuilt {written} audit rollup documents")
+        except Exception as e:
+            logger.error(f"Error rebuilding audit rollups: {e}", exc_info=True)
+            raise
+        return written
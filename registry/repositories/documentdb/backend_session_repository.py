@@ -4,14 +4,22 @@ DocumentDB (MongoDB) implementation for backend session repository.
 Stores per-client backend MCP session mappings in MongoDB with a TTL index
 on last_used_at for automatic cleanup of idle sessions. Uses compound keys
 (<client_session_id>:<backend_key>) as _id for fast lookups.
+
+Reads are served from a short-lived in-process cache and do not write:
+each access only records a last_used_at bump in memory, and pending bumps
+are written with one bulk_write per backend_session_touch_interval_seconds.
 """
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
 
 from motor.motor_asyncio import AsyncIOMotorCollection
-from pymongo import ASCENDING
+from pymongo import ASCENDING, UpdateOne
 
+from ...core.config import settings
 from ..interfaces import BackendSessionRepositoryBase
 from .client import get_collection_name, get_documentdb_client
 
@@ -48,6 +56,10 @@ class DocumentDBBackendSessionRepository(BackendSessionRepositoryBase):
         self._collection: AsyncIOMotorCollection | None = None
         self._collection_name = get_collection_name("backend_sessions")
         self._indexes_created = False
+        # _id -> (monotonic expiry, backend session ID or True for client sessions)
+        self._cache: OrderedDict[str, tuple[float, str | bool]] = OrderedDict()
+        # _id -> latest access time not yet written to last_used_at
+        self._pending_touches: dict[str, datetime] = {}
 
     async def _get_collection(self) -> AsyncIOMotorCollection:
         """Get DocumentDB collection, creating indexes on first access."""
@@ -92,15 +104,92 @@ class DocumentDBBackendSessionRepository(BackendSessionRepositoryBase):
         except Exception as e:
             logger.warning(f"Could not create indexes for {self._collection_name}: {e}")
 
+    def _cache_get(
+        self,
+        doc_id: str,
+    ) -> str | bool | None:
+        """Return a cached value, or None if it is missing or expired."""
+        entry = self._cache.get(doc_id)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._cache[doc_id]
+            return None
+        self._cache.move_to_end(doc_id)
+        return value
+
+    def _cache_put(
+        self,
+        doc_id: str,
+        value: str | bool,
+    ) -> None:
+        """Cache a value that exists in the database, evicting the least recently used."""
+        ttl = settings.backend_session_cache_ttl_seconds
+        if ttl <= 0:
+            return
+        self._cache[doc_id] = (time.monotonic() + ttl, value)
+        self._cache.move_to_end(doc_id)
+        while len(self._cache) > settings.backend_session_cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def _touch(
+        self,
+        doc_id: str,
+    ) -> None:
+        """Record an access; last_used_at is written by the next flush_touches()."""
+        self._pending_touches[doc_id] = datetime.now(UTC)
+
+    async def flush_touches(self) -> int:
+        """Write pending last_used_at bumps with a single unordered bulk_write.
+
+        $max keeps a newer last_used_at written by store_backend_session or
+        by another registry instance. Bumps that fail to write are kept for
+        the next flush.
+
+        Returns:
+            Number of sessions whose bump was written
+        """
+        if not self._pending_touches:
+            return 0
+
+        pending = self._pending_touches
+        self._pending_touches = {}
+        operations = [
+            UpdateOne({"_id": doc_id}, {"$max": {"last_used_at": used_at}})
+            for doc_id, used_at in pending.items()
+        ]
+
+        try:
+            collection = await self._get_collection()
+            await collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.error(f"Failed to flush {len(operations)} session touches: {e}")
+            for doc_id, used_at in pending.items():
+                newer = self._pending_touches.get(doc_id)
+                if newer is None or newer < used_at:
+                    self._pending_touches[doc_id] = used_at
+            return 0
+
+        logger.debug(f"Flushed last_used_at for {len(operations)} sessions")
+        return len(operations)
+
+    async def run_touch_flush_loop(self) -> None:
+        """Flush pending touches every backend_session_touch_interval_seconds until cancelled."""
+        interval = settings.backend_session_touch_interval_seconds
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush_touches()
+
     async def get_backend_session(
         self,
         client_session_id: str,
         backend_key: str,
     ) -> str | None:
-        """Get backend session ID and atomically bump last_used_at.
+        """Get backend session ID and record the access.
 
-        Uses find_one_and_update so the TTL is refreshed on every access,
-        keeping active sessions alive.
+        Served from the in-process cache when possible. The last_used_at
+        bump that keeps the session alive is batched by flush_touches().
 
         Args:
             client_session_id: Client-facing session ID
@@ -109,17 +198,61 @@ class DocumentDBBackendSessionRepository(BackendSessionRepositoryBase):
         Returns:
             Backend session ID if found, None otherwise
         """
-        collection = await self._get_collection()
         doc_id = _make_backend_session_id(client_session_id, backend_key)
 
-        result = await collection.find_one_and_update(
-            {"_id": doc_id},
-            {"$set": {"last_used_at": datetime.now(UTC)}},
-        )
+        backend_session_id = self._cache_get(doc_id)
+        if backend_session_id is None:
+            collection = await self._get_collection()
+            result = await collection.find_one({"_id": doc_id}, {"backend_session_id": 1})
+            if not result or not result.get("backend_session_id"):
+                return None
+            backend_session_id = result["backend_session_id"]
+            self._cache_put(doc_id, backend_session_id)
 
-        if result:
-            return result.get("backend_session_id")
-        return None
+        self._touch(doc_id)
+        return backend_session_id
+
+    async def get_backend_sessions(
+        self,
+        client_session_id: str,
+        backend_keys: list[str],
+    ) -> dict[str, str]:
+        """Get the backend session IDs of several backends with one query.
+
+        Args:
+            client_session_id: Client-facing session ID
+            backend_keys: Backend location keys
+
+        Returns:
+            Mapping of backend key to backend session ID; keys without a
+            session are omitted
+        """
+        sessions: dict[str, str] = {}
+        missing: dict[str, str] = {}
+        for backend_key in dict.fromkeys(backend_keys):
+            doc_id = _make_backend_session_id(client_session_id, backend_key)
+            cached = self._cache_get(doc_id)
+            if cached is None:
+                missing[doc_id] = backend_key
+            else:
+                sessions[backend_key] = cached
+                self._touch(doc_id)
+
+        if missing:
+            collection = await self._get_collection()
+            cursor = collection.find(
+                {"_id": {"$in": list(missing)}},
+                {"backend_session_id": 1},
+            )
+            async for doc in cursor:
+                backend_session_id = doc.get("backend_session_id")
+                if not backend_session_id:
+                    continue
+                sessions[missing[doc["_id"]]] = backend_session_id
+                self._cache_put(doc["_id"], backend_session_id)
+                self._touch(doc["_id"])
+
+        return sessions
 
     async def store_backend_session(
         self,
@@ -158,6 +291,8 @@ class DocumentDBBackendSessionRepository(BackendSessionRepositoryBase):
             doc,
             upsert=True,
         )
+        self._cache_put(doc_id, backend_session_id)
+        self._pending_touches.pop(doc_id, None)
         logger.debug(f"Stored backend session: {doc_id} -> {backend_session_id}")
 
     async def delete_backend_session(
@@ -173,6 +308,8 @@ class DocumentDBBackendSessionRepository(BackendSessionRepositoryBase):
         """
         collection = await self._get_collection()
         doc_id = _make_backend_session_id(client_session_id, backend_key)
+        self._cache.pop(doc_id, None)
+        self._pending_touches.pop(doc_id, None)
 
         result = await collection.delete_one({"_id": doc_id})
         if result.deleted_count > 0:
@@ -208,6 +345,7 @@ class DocumentDBBackendSessionRepository(BackendSessionRepositoryBase):
         }
 
         await collection.insert_one(doc)
+        self._cache_put(doc_id, True)
         logger.info(
             f"Created client session: {client_session_id} "
             f"for user={user_id} path={virtual_server_path}"
@@ -217,7 +355,7 @@ class DocumentDBBackendSessionRepository(BackendSessionRepositoryBase):
         self,
         client_session_id: str,
     ) -> bool:
-        """Check if a client session exists and bump last_used_at.
+        """Check if a client session exists and record the access.
 
         Args:
             client_session_id: Client-facing session ID
@@ -225,12 +363,14 @@ class DocumentDBBackendSessionRepository(BackendSessionRepositoryBase):
         Returns:
             True if session exists, False otherwise
         """
-        collection = await self._get_collection()
         doc_id = _make_client_session_id(client_session_id)
 
-        result = await collection.find_one_and_update(
-            {"_id": doc_id},
-            {"$set": {"last_used_at": datetime.now(UTC)}},
-        )
+        if self._cache_get(doc_id) is None:
+            collection = await self._get_collection()
+            result = await collection.find_one({"_id": doc_id}, {"_id": 1})
+            if result is None:
+                return False
+            self._cache_put(doc_id, True)
 
-        return result is not None
+        self._touch(doc_id)
+        return True
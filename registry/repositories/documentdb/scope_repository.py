@@ -29,39 +29,52 @@ class DocumentDBScopeRepository(ScopeRepositoryBase):
 
     async def load_all(self) -> None:
         """Load all scopes from DocumentDB."""
+        try:
+            await self.load_all_groups()
+        except Exception:
+            # Already logged; the cache has been reset to empty
+            pass
+
+    async def load_all_groups(self) -> list[dict[str, Any]]:
+        """Load every group document in one query and rebuild the scopes cache from it."""
         logger.info(f"Loading scopes from DocumentDB collection: {self._collection_name}")
         collection = await self._get_collection()
 
         try:
             cursor = collection.find({})
-            self._scopes_cache = {
+            scopes_cache: dict[str, Any] = {
                 "UI-Scopes": {},
                 "group_mappings": {},
             }
+            groups = []
 
             async for doc in cursor:
-                scope_name = doc.get("_id")
+                scope_name = doc.pop("_id")
+                doc["scope_name"] = scope_name
+                groups.append(doc)
 
                 # UI permissions: scope_name -> ui_permissions
                 if doc.get("ui_permissions"):
-                    self._scopes_cache["UI-Scopes"][scope_name] = doc.get("ui_permissions", {})
+                    scopes_cache["UI-Scopes"][scope_name] = doc.get("ui_permissions", {})
 
                 # Group mappings: keycloak_group -> [scope_names]
                 # Build reverse mapping from scope's group_mappings list
                 for keycloak_group in doc.get("group_mappings", []):
-                    if keycloak_group not in self._scopes_cache["group_mappings"]:
-                        self._scopes_cache["group_mappings"][keycloak_group] = []
-                    if scope_name not in self._scopes_cache["group_mappings"][keycloak_group]:
-                        self._scopes_cache["group_mappings"][keycloak_group].append(scope_name)
+                    mapped_scopes = scopes_cache["group_mappings"].setdefault(keycloak_group, [])
+                    if scope_name not in mapped_scopes:
+                        mapped_scopes.append(scope_name)
 
                 # Scope definitions: scope_name -> [access_rules]
                 if doc.get("server_access"):
-                    self._scopes_cache[scope_name] = doc.get("server_access", [])
+                    scopes_cache[scope_name] = doc.get("server_access", [])
 
-            logger.info("Loaded scopes from DocumentDB")
+            self._scopes_cache = scopes_cache
+            logger.info(f"Loaded {len(groups)} scope groups from DocumentDB")
+            return groups
         except Exception as e:
             logger.error(f"Error loading scopes from DocumentDB: {e}", exc_info=True)
             self._scopes_cache = {"UI-Scopes": {}, "group_mappings": {}}
+            raise
 
     async def get_ui_scopes(
         self,
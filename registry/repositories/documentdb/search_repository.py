@@ -1,10 +1,14 @@
 """DocumentDB-based repository for hybrid search (text + vector)."""
 
+import asyncio
+import hashlib
+import json
 import logging
 import re
 from typing import Any
 
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReplaceOne
 
 from ...core.config import embedding_config, settings
 from ...schemas.agent_models import AgentCard
@@ -298,6 +302,32 @@ def _build_text_boost_stage(
     }
 
 
+def _compute_content_hash(
+    doc: dict[str, Any],
+) -> str:
+    """Hash a search document's indexed content, excluding its embedding.
+
+    The embedding metadata (minus its creation timestamp) is part of the
+    hash, so switching the embeddings model also forces a re-embed.
+    """
+    content = {k: v for k, v in doc.items() if k not in ("embedding", "content_hash")}
+    content["embedding_metadata"] = {
+        k: v for k, v in doc.get("embedding_metadata", {}).items() if k != "created_at"
+    }
+    serialized = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _compute_embedding_hash(
+    text_for_embedding: str,
+    embedding_metadata: dict[str, Any],
+) -> str:
+    """Hash the inputs of an embedding: the text and the model that embeds it."""
+    model = {k: v for k, v in embedding_metadata.items() if k != "created_at"}
+    serialized = json.dumps({"text": text_for_embedding, "model": model}, sort_keys=True)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
 class DocumentDBSearchRepository(SearchRepositoryBase):
     """DocumentDB implementation with hybrid search (text + vector)."""
 
@@ -383,15 +413,13 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
         except Exception as e:
             logger.error(f"Failed to initialize search indexes: {e}", exc_info=True)
 
-    async def index_server(
+    def _build_server_document(
         self,
         path: str,
         server_info: dict[str, Any],
-        is_enabled: bool = False,
-    ) -> None:
-        """Index a server for search."""
-        collection = await self._get_collection()
-
+        is_enabled: bool,
+    ) -> dict[str, Any]:
+        """Build the search document for a server, without its embedding."""
         text_parts = [
             server_info.get("server_name", ""),
             server_info.get("description", ""),
@@ -407,18 +435,7 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
 
         text_for_embedding = " ".join(filter(None, text_parts))
 
-        try:
-            model = await self._get_embedding_model()
-            embedding = model.encode([text_for_embedding])[0].tolist()
-        except Exception as e:
-            logger.warning(
-                "Embedding model unavailable, indexing '%s' without embeddings: %s",
-                server_info.get("server_name", path),
-                e,
-            )
-            embedding = []
-
-        doc = {
+        return {
             "_id": path,
             "entity_type": "mcp_server",
             "path": path,
@@ -427,7 +444,6 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
             "tags": server_info.get("tags", []),
             "is_enabled": is_enabled,
             "text_for_embedding": text_for_embedding,
-            "embedding": embedding,
             "embedding_metadata": embedding_config.get_embedding_metadata(),
             "tools": [
                 {
@@ -442,21 +458,13 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
             "indexed_at": server_info.get("updated_at", server_info.get("registered_at")),
         }
 
-        try:
-            await collection.replace_one({"_id": path}, doc, upsert=True)
-            logger.info(f"Indexed server '{server_info.get('server_name')}' for search")
-        except Exception as e:
-            logger.error(f"Failed to index server in search: {e}", exc_info=True)
-
-    async def index_agent(
+    def _build_agent_document(
         self,
         path: str,
         agent_card: AgentCard,
-        is_enabled: bool = False,
-    ) -> None:
-        """Index an agent for search."""
-        collection = await self._get_collection()
-
+        is_enabled: bool,
+    ) -> dict[str, Any]:
+        """Build the search document for an agent, without its embedding."""
         text_parts = [
             agent_card.name,
             agent_card.description or "",
@@ -479,18 +487,7 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
 
         text_for_embedding = " ".join(filter(None, text_parts))
 
-        try:
-            model = await self._get_embedding_model()
-            embedding = model.encode([text_for_embedding])[0].tolist()
-        except Exception as e:
-            logger.warning(
-                "Embedding model unavailable, indexing agent '%s' without embeddings: %s",
-                agent_card.name,
-                e,
-            )
-            embedding = []
-
-        doc = {
+        return {
             "_id": path,
             "entity_type": "a2a_agent",
             "path": path,
@@ -499,19 +496,193 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
             "tags": agent_card.tags or [],
             "is_enabled": is_enabled,
             "text_for_embedding": text_for_embedding,
-            "embedding": embedding,
             "embedding_metadata": embedding_config.get_embedding_metadata(),
             "capabilities": agent_card.capabilities or [],
             "metadata": agent_card.model_dump(mode="json"),
             "indexed_at": agent_card.updated_at or agent_card.registered_at,
         }
 
+    async def _embed_document(
+        self,
+        doc: dict[str, Any],
+    ) -> None:
+        """Embed a single document in place, storing its content hash on success."""
+        try:
+            model = await self._get_embedding_model()
+            doc["embedding"] = model.encode([doc["text_for_embedding"]])[0].tolist()
+            doc["content_hash"] = _compute_content_hash(doc)
+        except Exception as e:
+            logger.warning(
+                "Embedding model unavailable, indexing '%s' without embeddings: %s",
+                doc["name"] or doc["path"],
+                e,
+            )
+            doc["embedding"] = []
+            # No hash, so the next incremental reindex retries the embedding
+            doc["content_hash"] = None
+
+    async def index_server(
+        self,
+        path: str,
+        server_info: dict[str, Any],
+        is_enabled: bool = False,
+    ) -> None:
+        """Index a server for search."""
+        collection = await self._get_collection()
+        doc = self._build_server_document(path, server_info, is_enabled)
+        await self._embed_document(doc)
+
+        try:
+            await collection.replace_one({"_id": path}, doc, upsert=True)
+            logger.info(f"Indexed server '{server_info.get('server_name')}' for search")
+        except Exception as e:
+            logger.error(f"Failed to index server in search: {e}", exc_info=True)
+
+    async def index_agent(
+        self,
+        path: str,
+        agent_card: AgentCard,
+        is_enabled: bool = False,
+    ) -> None:
+        """Index an agent for search."""
+        collection = await self._get_collection()
+        doc = self._build_agent_document(path, agent_card, is_enabled)
+        await self._embed_document(doc)
+
         try:
             await collection.replace_one({"_id": path}, doc, upsert=True)
             logger.info(f"Indexed agent '{agent_card.name}' for search")
         except Exception as e:
             logger.error(f"Failed to index agent in search: {e}", exc_info=True)
 
+    async def index_servers(
+        self,
+        entries: list[tuple[str, dict[str, Any], bool]],
+    ) -> int:
+        """Index servers in batches, skipping those whose content hash is unchanged."""
+        docs = [
+            self._build_server_document(path, server_info, is_enabled)
+            for path, server_info, is_enabled in entries
+        ]
+        return await self._index_documents_incrementally(docs)
+
+    async def index_agents(
+        self,
+        entries: list[tuple[str, AgentCard, bool]],
+    ) -> int:
+        """Index agents in batches, skipping those whose content hash is unchanged."""
+        docs = [
+            self._build_agent_document(path, agent_card, is_enabled)
+            for path, agent_card, is_enabled in entries
+        ]
+        return await self._index_documents_incrementally(docs)
+
+    async def _index_documents_incrementally(
+        self,
+        docs: list[dict[str, Any]],
+    ) -> int:
+        """
+        Embed and write only the documents whose content changed since they were indexed.
+
+        Stored content hashes are fetched in one query. Changed documents are
+        embedded in batches of search_index_batch_size texts per model call and
+        written with one bulk_write per batch; at most
+        search_index_concurrency batches run at once.
+
+        Args:
+            docs: Search documents without embeddings
+
+        Returns:
+            Number of documents re-indexed
+        """
+        if not docs:
+            return 0
+
+        collection = await self._get_collection()
+        for doc in docs:
+            doc["content_hash"] = _compute_content_hash(doc)
+
+        stored_hashes: dict[str, str] = {}
+        try:
+            cursor = collection.find(
+                {"_id": {"$in": [doc["_id"] for doc in docs]}},
+                {"content_hash": 1},
+            )
+            async for stored in cursor:
+                stored_hashes[stored["_id"]] = stored.get("content_hash")
+        except Exception as e:
+            logger.warning(f"Could not read stored content hashes, re-indexing all: {e}")
+
+        changed = [doc for doc in docs if stored_hashes.get(doc["_id"]) != doc["content_hash"]]
+        logger.info(
+            f"Search index: {len(docs) - len(changed)} of {len(docs)} entities unchanged, "
+            f"re-indexing {len(changed)}"
+        )
+        if not changed:
+            return 0
+
+        batch_size = max(1, settings.search_index_batch_size)
+        semaphore = asyncio.Semaphore(max(1, settings.search_index_concurrency))
+        batches = [changed[i : i + batch_size] for i in range(0, len(changed), batch_size)]
+
+        async def _index_batch(batch: list[dict[str, Any]]) -> int:
+            async with semaphore:
+                await self._embed_batch(batch)
+                try:
+                    await collection.bulk_write(
+                        [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in batch],
+                        ordered=False,
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to write {len(batch)} search documents: {e}", exc_info=True
+                    )
+                    return 0
+                return len(batch)
+
+        written = await asyncio.gather(*(_index_batch(batch) for batch in batches))
+        return sum(written)
+
+    async def _embed_batch(
+        self,
+        batch: list[dict[str, Any]],
+    ) -> None:
+        """Embed a batch of documents with one model call, off the event loop."""
+        try:
+            model = await self._get_embedding_model()
+            embeddings = await asyncio.to_thread(
+                model.encode, [doc["text_for_embedding"] for doc in batch]
+            )
+            for doc, embedding in zip(batch, embeddings, strict=True):
+                doc["embedding"] = embedding.tolist()
+        except Exception as e:
+            logger.warning(
+                f"Embedding model unavailable, indexing {len(batch)} entities "
+                f"without embeddings: {e}"
+            )
+            for doc in batch:
+                doc["embedding"] = []
+                # No hash, so the next incremental reindex retries the embedding
+                doc["content_hash"] = None
+
+    async def _get_reusable_embedding(
+        self,
+        collection: AsyncIOMotorCollection,
+        path: str,
+        embedding_hash: str,
+    ) -> list[float] | None:
+        """Get the stored embedding for a document if it was built from the same inputs."""
+        try:
+            stored = await collection.find_one({"_id": path}, {"embedding_hash": 1, "embedding": 1})
+        except Exception as e:
+            logger.warning(f"Could not read stored embedding for {path}: {e}")
+            return None
+
+        if stored and stored.get("embedding_hash") == embedding_hash and stored.get("embedding"):
+            logger.debug(f"Embedding inputs unchanged for {path}, reusing stored embedding")
+            return stored["embedding"]
+        return None
+
     async def index_skill(
         self,
         path: str,
@@ -546,18 +717,24 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
             text_parts.append(f"Author: {skill.metadata.author}")
 
         text_for_embedding = " ".join(filter(None, text_parts))
+        embedding_metadata = embedding_config.get_embedding_metadata()
+        embedding_hash = _compute_embedding_hash(text_for_embedding, embedding_metadata)
 
-        # Generate embedding
-        try:
-            model = await self._get_embedding_model()
-            embedding = model.encode([text_for_embedding])[0].tolist()
-        except Exception as e:
-            logger.warning(
-                "Embedding model unavailable, indexing skill '%s' without embeddings: %s",
-                skill.name,
-                e,
-            )
-            embedding = []
+        # Reuse the stored embedding unless the embedded text or model changed
+        embedding = await self._get_reusable_embedding(collection, path, embedding_hash)
+        if embedding is None:
+            try:
+                model = await self._get_embedding_model()
+                embedding = model.encode([text_for_embedding])[0].tolist()
+            except Exception as e:
+                logger.warning(
+                    "Embedding model unavailable, indexing skill '%s' without embeddings: %s",
+                    skill.name,
+                    e,
+                )
+                embedding = []
+                # No hash, so the next index_skill call retries the embedding
+                embedding_hash = None
 
         # Handle visibility enum
         visibility_value = skill.visibility
@@ -582,7 +759,8 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
             else None,
             "text_for_embedding": text_for_embedding,
             "embedding": embedding,
-            "embedding_metadata": embedding_config.get_embedding_metadata(),
+            "embedding_hash": embedding_hash,
+            "embedding_metadata": embedding_metadata,
             "metadata": {
                 "skill_md_url": str(skill.skill_md_url),
                 "skill_md_raw_url": str(skill.skill_md_raw_url) if skill.skill_md_raw_url else None,
@@ -616,7 +794,8 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
             is_enabled: Whether virtual server is enabled
         """
         # Lazy import to avoid circular dependency
-        from ...services.server_service import server_service
+        from ...services.virtual_server_service import load_backend_tools
+        from ..factory import get_server_repository
 
         collection = await self._get_collection()
 
@@ -625,20 +804,12 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
             {mapping.backend_server_path for mapping in virtual_server.tool_mappings}
         )
 
-        # Fetch tool descriptions from backend servers
-        # Build a map: backend_path -> {tool_name -> description}
-        backend_tool_descriptions: dict[str, dict[str, str]] = {}
-        for backend_path in backend_paths:
-            try:
-                server_info = await server_service.get_server_info(backend_path)
-                if server_info:
-                    tool_list = server_info.get("tool_list", [])
-                    backend_tool_descriptions[backend_path] = {
-                        tool.get("name", ""): tool.get("description", "") for tool in tool_list
-                    }
-            except Exception as e:
-                logger.warning(f"Failed to fetch tools from backend {backend_path}: {e}")
-                backend_tool_descriptions[backend_path] = {}
+        # Name-indexed tools of each backend: backend_path -> {tool_name -> tool}
+        try:
+            backend_tools = await load_backend_tools(get_server_repository(), backend_paths)
+        except Exception as e:
+            logger.warning(f"Failed to fetch tools from backends {backend_paths}: {e}")
+            backend_tools = {}
 
         # Compose text for embedding
         text_parts = [
@@ -661,8 +832,8 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
             if mapping.description_override:
                 description = mapping.description_override
             else:
-                backend_tools = backend_tool_descriptions.get(mapping.backend_server_path, {})
-                description = backend_tools.get(mapping.tool_name, "")
+                tool = backend_tools.get(mapping.backend_server_path, {}).get(mapping.tool_name)
+                description = tool.get("description", "") if tool else ""
 
             # Add description to embedding text
             if description:
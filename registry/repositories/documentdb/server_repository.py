@@ -5,14 +5,24 @@ from datetime import datetime
 from typing import Any
 
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, UpdateOne
 from pymongo.errors import DuplicateKeyError
 
-from ..interfaces import ServerRepositoryBase
+from ..interfaces import ServerRepositoryBase, server_name_key
 from .client import get_collection_name, get_documentdb_client
 
 logger = logging.getLogger(__name__)
 
 
+def _to_server_info(
+    doc: dict[str, Any],
+) -> dict[str, Any]:
+    """Convert a stored document to a server dict (path instead of _id, no sort key)."""
+    doc["path"] = doc.pop("_id")
+    doc.pop("name_key", None)
+    return doc
+
+
 class DocumentDBServerRepository(ServerRepositoryBase):
     """DocumentDB implementation of server repository."""
 
@@ -38,6 +48,26 @@ class DocumentDBServerRepository(ServerRepositoryBase):
         except Exception as e:
             logger.error(f"Error loading servers from DocumentDB: {e}", exc_info=True)
 
+        await self._ensure_name_index(collection)
+
+    async def _ensure_name_index(
+        self,
+        collection: AsyncIOMotorCollection,
+    ) -> None:
+        """Index the name_key sort field and backfill it on documents written without it."""
+        try:
+            await collection.create_index([("name_key", ASCENDING)], name="name_key_idx")
+
+            operations = [
+                UpdateOne({"_id": doc["_id"]}, {"$set": {"name_key": server_name_key(doc["_id"])}})
+                async for doc in collection.find({"name_key": {"$exists": False}}, {"_id": 1})
+            ]
+            if operations:
+                await collection.bulk_write(operations, ordered=False)
+                logger.info(f"Backfilled name_key on {len(operations)} servers")
+        except Exception as e:
+            logger.warning(f"Could not prepare name_key index on {self._collection_name}: {e}")
+
     async def get(
         self,
         path: str,
@@ -65,7 +95,7 @@ class DocumentDBServerRepository(ServerRepositoryBase):
                 server_info = await collection.find_one({"_id": alternate_path})
 
             if server_info:
-                server_info["path"] = server_info.pop("_id")
+                _to_server_info(server_info)
                 logger.debug(
                     f"DocumentDB READ: Found server '{server_info.get('server_name', 'unknown')}' at '{path}'"
                 )
@@ -87,9 +117,8 @@ class DocumentDBServerRepository(ServerRepositoryBase):
             cursor = collection.find({})
             servers = {}
             async for doc in cursor:
-                path = doc.pop("_id")
-                doc["path"] = path
-                servers[path] = doc
+                server_info = _to_server_info(doc)
+                servers[server_info["path"]] = server_info
             logger.info(
                 f"DocumentDB READ: Retrieved {len(servers)} servers from collection '{self._collection_name}'"
             )
@@ -98,6 +127,45 @@ class DocumentDBServerRepository(ServerRepositoryBase):
             logger.error(f"Error listing servers from DocumentDB: {e}", exc_info=True)
             return {}
 
+    async def list_page(
+        self,
+        after: str | None = None,
+        limit: int = 100,
+        name_keys: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List active servers in name order with a range query on name_key.
+
+        Args:
+            after: Only return servers whose server_name_key() is greater
+            limit: Maximum number of servers to return
+            name_keys: If given, only return servers with one of these keys
+
+        Returns:
+            Servers ordered by server_name_key()
+        """
+        collection = await self._get_collection()
+
+        query: dict[str, Any] = {"is_active": {"$ne": False}}
+        name_filter: dict[str, Any] = {}
+        if after is not None:
+            name_filter["$gt"] = after
+        if name_keys is not None:
+            name_filter["$in"] = list(name_keys)
+        if name_filter:
+            query["name_key"] = name_filter
+
+        try:
+            cursor = collection.find(query).sort("name_key", ASCENDING).limit(limit)
+            page = []
+            async for doc in cursor:
+                server_info = _to_server_info(doc)
+                server_info.setdefault("is_enabled", False)
+                page.append(server_info)
+            return page
+        except Exception as e:
+            logger.error(f"Error listing server page from DocumentDB: {e}", exc_info=True)
+            return []
+
     async def list_by_source(
         self,
         source: str,
@@ -119,9 +187,8 @@ class DocumentDBServerRepository(ServerRepositoryBase):
             cursor = collection.find({"source": source})
             servers = {}
             async for doc in cursor:
-                path = doc.pop("_id")
-                doc["path"] = path
-                servers[path] = doc
+                server_info = _to_server_info(doc)
+                servers[server_info["path"]] = server_info
             logger.info(
                 f"DocumentDB READ: Retrieved {len(servers)} servers with source='{source}' from collection '{self._collection_name}'"
             )
@@ -150,6 +217,7 @@ class DocumentDBServerRepository(ServerRepositoryBase):
         try:
             doc = {**server_info}
             doc["_id"] = path
+            doc["name_key"] = server_name_key(path)
             doc.pop("path", None)
 
             await collection.insert_one(doc)
@@ -333,3 +401,7 @@ class DocumentDBServerRepository(ServerRepositoryBase):
         except Exception as e:
             logger.error(f"Error counting servers in DocumentDB: {e}", exc_info=True)
             return 0
+
+    async def flush(self) -> None:
+        """No-op: every write goes to DocumentDB immediately."""
+        return None
@@ -9,14 +9,16 @@ Implements all recommendations:
 """
 
 import logging
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import (
     Any,
 )
 
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
 from pymongo.errors import DuplicateKeyError
 
+from ...core.config import settings
 from ...exceptions import (
     SkillAlreadyExistsError,
     SkillServiceError,
@@ -57,6 +59,8 @@ class DocumentDBSkillRepository(SkillRepositoryBase):
     def __init__(self):
         self._collection: AsyncIOMotorCollection | None = None
         self._collection_name = get_collection_name("agent_skills")
+        self._content_cache_collection: AsyncIOMotorCollection | None = None
+        self._content_cache_collection_name = get_collection_name("skill_md_cache")
         self._indexes_created = False
 
     async def _get_collection(self) -> AsyncIOMotorCollection:
@@ -66,6 +70,13 @@ class DocumentDBSkillRepository(SkillRepositoryBase):
             self._collection = db[self._collection_name]
         return self._collection
 
+    async def _get_content_cache_collection(self) -> AsyncIOMotorCollection:
+        """Get the SKILL.md content cache collection."""
+        if self._content_cache_collection is None:
+            db = await get_documentdb_client()
+            self._content_cache_collection = db[self._content_cache_collection_name]
+        return self._content_cache_collection
+
     async def ensure_indexes(self) -> None:
         """Create required indexes if not present."""
         if self._indexes_created:
@@ -94,6 +105,14 @@ class DocumentDBSkillRepository(SkillRepositoryBase):
                 [("visibility", 1), ("is_enabled", 1), ("registry_name", 1)]
             )
 
+            # Expire cached SKILL.md bodies that have not been fetched recently
+            content_cache = await self._get_content_cache_collection()
+            await content_cache.create_index(
+                "fetched_at",
+                name="fetched_at_ttl",
+                expireAfterSeconds=settings.skill_md_cache_expire_days * 24 * 60 * 60,
+            )
+
             self._indexes_created = True
             logger.info(f"Created indexes for {self._collection_name} collection")
         except Exception as e:
@@ -277,21 +296,32 @@ class DocumentDBSkillRepository(SkillRepositoryBase):
     async def update_many(
         self,
         updates: dict[str, dict[str, Any]],
+        upsert: bool = True,
     ) -> int:
-        """Update multiple skills by path, return count."""
+        """Update multiple skills by path with one bulk write, return count."""
         await self.ensure_indexes()
         collection = await self._get_collection()
 
         if not updates:
             return 0
 
-        count = 0
-        for path, update_data in updates.items():
-            update_data["updated_at"] = datetime.utcnow().isoformat()
-            result = await collection.update_one({"_id": path}, {"$set": update_data}, upsert=True)
-            if result.modified_count > 0 or result.upserted_id:
-                count += 1
+        updated_at = datetime.utcnow().isoformat()
+        operations = [
+            UpdateOne(
+                {"_id": path},
+                {"$set": {**update_data, "updated_at": updated_at}},
+                upsert=upsert,
+            )
+            for path, update_data in updates.items()
+        ]
+
+        try:
+            result = await collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.error(f"Failed to update skills in batch: {e}")
+            raise SkillServiceError(f"Batch update failed: {e}") from e
 
+        count = result.modified_count + result.upserted_count
         logger.info(f"Updated {count} skills in batch")
         return count
 
@@ -311,3 +341,44 @@ class DocumentDBSkillRepository(SkillRepositoryBase):
         except Exception as e:
             logger.error(f"Error counting skills in DocumentDB: {e}", exc_info=True)
             return 0
+
+    async def get_cached_content(
+        self,
+        url: str,
+    ) -> dict[str, Any] | None:
+        """Get the cached SKILL.md fetch result for a URL, if any.
+
+        fetched_at is stored as a datetime (for the TTL index) and returned
+        as epoch seconds.
+        """
+        await self.ensure_indexes()
+        collection = await self._get_content_cache_collection()
+        doc = await collection.find_one({"_id": url})
+        if doc:
+            doc.pop("_id", None)
+            fetched_at = doc.get("fetched_at")
+            if isinstance(fetched_at, datetime):
+                if fetched_at.tzinfo is None:
+                    fetched_at = fetched_at.replace(tzinfo=UTC)
+                doc["fetched_at"] = fetched_at.timestamp()
+        return doc
+
+    async def put_cached_content(
+        self,
+        entry: dict[str, Any],
+    ) -> None:
+        """Store a SKILL.md fetch result, keyed by its "url"."""
+        await self.ensure_indexes()
+        collection = await self._get_content_cache_collection()
+        doc = {**entry, "fetched_at": datetime.fromtimestamp(entry["fetched_at"], tz=UTC)}
+        await collection.replace_one({"_id": entry["url"]}, doc, upsert=True)
+
+    async def delete_cached_content(
+        self,
+        urls: list[str],
+    ) -> None:
+        """Drop cached SKILL.md fetch results for the given URLs."""
+        if not urls:
+            return
+        collection = await self._get_content_cache_collection()
+        await collection.delete_many({"_id": {"$in": urls}})
@@ -1,5 +1,6 @@
 """File-based agent repository implementation."""
 
+import asyncio
 import json
 import logging
 from datetime import UTC, datetime
@@ -7,6 +8,7 @@ from datetime import UTC, datetime
 from ...core.config import settings
 from ...schemas.agent_models import AgentCard
 from ..interfaces import AgentRepositoryBase
+from .json_store import read_json_files, write_json
 
 logger = logging.getLogger(__name__)
 
@@ -33,14 +35,17 @@ class FileAgentRepository(AgentRepositoryBase):
     async def get_all(self) -> dict[str, AgentCard]:
         """Load all agents from disk."""
         agents = {}
-        agent_files = [
-            f for f in self.agents_dir.glob("**/*_agent.json") if f.name != self.state_file.name
-        ]
-
-        for file in agent_files:
+        agent_files = await asyncio.to_thread(
+            lambda: [
+                f for f in self.agents_dir.glob("**/*_agent.json") if f.name != self.state_file.name
+            ]
+        )
+
+        for file, data in await asyncio.to_thread(read_json_files, agent_files):
+            if isinstance(data, Exception):
+                logger.error(f"Failed to load agent from {file}: {data}")
+                continue
             try:
-                with open(file) as f:
-                    data = json.load(f)
                 if isinstance(data, dict) and "path" in data and "name" in data:
                     agent = AgentCard(**data)
                     agents[agent.path] = agent
@@ -63,8 +68,7 @@ class FileAgentRepository(AgentRepositoryBase):
         filename = _path_to_filename(agent.path)
         file_path = self.agents_dir / filename
 
-        with open(file_path, "w") as f:
-            json.dump(agent.model_dump(mode="json"), f, indent=2)
+        await write_json(file_path, agent.model_dump(mode="json"))
 
         return agent
 
@@ -96,8 +100,7 @@ class FileAgentRepository(AgentRepositoryBase):
 
     async def save_state(self, state: dict[str, list[str]]) -> None:
         """Save agent state to disk."""
-        with open(self.state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        await write_json(self.state_file, state)
 
     async def is_enabled(self, path: str) -> bool:
         """Check if agent is enabled."""
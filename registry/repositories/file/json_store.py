@@ -0,0 +1,130 @@
+"""
+Atomic, non-blocking JSON persistence for the file storage backend.
+
+Files are written to a temporary file in the target directory, fsynced and
+renamed over the target, so a crash never leaves a truncated JSON file
+behind. Payloads are serialized on the event loop (the data may change
+right after the call) and the blocking I/O runs in a worker thread.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def write_text_atomic(
+    path: Path,
+    text: str,
+) -> None:
+    """Replace a file's content atomically (temp file + fsync + rename).
+
+    Args:
+        path: Target file; its directory must exist
+        text: New file content
+    """
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+
+async def write_json(
+    path: Path,
+    data: Any,
+    indent: int | None = 2,
+) -> None:
+    """Serialize data now and write it atomically in a worker thread.
+
+    Args:
+        path: Target file; its directory must exist
+        data: JSON-serializable payload
+        indent: Indentation of the written JSON (None for compact output)
+    """
+    text = json.dumps(data, indent=indent)
+    await asyncio.to_thread(write_text_atomic, path, text)
+
+
+def read_json_files(
+    paths: list[Path],
+) -> list[tuple[Path, Any]]:
+    """Parse several JSON files; meant to run in a worker thread.
+
+    Args:
+        paths: Files to read
+
+    Returns:
+        (path, parsed payload or the exception raised while reading it) per file
+    """
+    results: list[tuple[Path, Any]] = []
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                results.append((path, json.load(f)))
+        except Exception as e:
+            results.append((path, e))
+    return results
+
+
+class DebouncedWriter:
+    """Coalesce bursts of write requests into one write after a short delay.
+
+    schedule() marks the data dirty; the write runs delay_seconds later and
+    picks up every change made in the meantime. Writes never overlap, and a
+    change made while a write is running triggers one more write.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[], Awaitable[None]],
+        delay_seconds: float,
+    ):
+        self._write = write
+        self._delay_seconds = delay_seconds
+        self._dirty = False
+        self._task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> bool:
+        """True while a scheduled write has not run yet."""
+        return self._dirty
+
+    def schedule(self) -> None:
+        """Request a write; repeated requests before it runs are coalesced."""
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._dirty:
+            await asyncio.sleep(self._delay_seconds)
+            try:
+                await self._write_if_dirty()
+            except Exception as e:
+                logger.error(f"Debounced write failed: {e}", exc_info=True)
+
+    async def _write_if_dirty(self) -> None:
+        async with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            await self._write()
+
+    async def flush(self) -> None:
+        """Run a pending write now instead of waiting for the delay."""
+        await self._write_if_dirty()
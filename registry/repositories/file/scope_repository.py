@@ -301,6 +301,28 @@ class FileScopeRepository(ScopeRepositoryBase):
             logger.error(f"Failed to import group {group_name}: {e}", exc_info=True)
             return False
 
+    def _build_group(self, group_name: str) -> dict[str, Any]:
+        """Build the full group details for a group from the loaded scopes data."""
+        # Get server_access from main scopes data
+        server_access = self._scopes_data.get(group_name, [])
+
+        # Get group_mappings
+        group_mappings = self._scopes_data.get("group_mappings", {}).get(group_name, [group_name])
+
+        # Get ui_permissions
+        ui_permissions = self._scopes_data.get("UI-Scopes", {}).get(group_name, {})
+
+        return {
+            "scope_name": group_name,
+            "scope_type": "server_scope",
+            "description": "",  # File-based doesn't have separate description field
+            "server_access": server_access,
+            "group_mappings": group_mappings,
+            "ui_permissions": ui_permissions,
+            "created_at": "",
+            "updated_at": "",
+        }
+
     async def get_group(self, group_name: str) -> dict[str, Any]:
         """Get full details of a specific group."""
         try:
@@ -308,27 +330,7 @@ class FileScopeRepository(ScopeRepositoryBase):
                 logger.warning(f"Group {group_name} not found in scopes.yml")
                 return None
 
-            # Get server_access from main scopes data
-            server_access = self._scopes_data.get(group_name, [])
-
-            # Get group_mappings
-            group_mappings = self._scopes_data.get("group_mappings", {}).get(
-                group_name, [group_name]
-            )
-
-            # Get ui_permissions
-            ui_permissions = self._scopes_data.get("UI-Scopes", {}).get(group_name, {})
-
-            result = {
-                "scope_name": group_name,
-                "scope_type": "server_scope",
-                "description": "",  # File-based doesn't have separate description field
-                "server_access": server_access,
-                "group_mappings": group_mappings,
-                "ui_permissions": ui_permissions,
-                "created_at": "",
-                "updated_at": "",
-            }
+            result = self._build_group(group_name)
 
             logger.info(f"Retrieved full group details for {group_name} from scopes.yml")
             return result
@@ -337,6 +339,18 @@ class FileScopeRepository(ScopeRepositoryBase):
             logger.error(f"Failed to get group {group_name}: {e}", exc_info=True)
             return None
 
+    async def load_all_groups(self) -> list[dict[str, Any]]:
+        """Reload scopes.yml and return full details of every group."""
+        await self.load_all()
+
+        groups = [
+            self._build_group(key)
+            for key, value in self._scopes_data.items()
+            if key not in ("UI-Scopes", "group_mappings") and isinstance(value, list)
+        ]
+        logger.info(f"Loaded {len(groups)} groups from scopes.yml")
+        return groups
+
     async def list_groups(
         self,
     ) -> dict[str, Any]:
@@ -2,14 +2,21 @@
 File-based repository for MCP server storage.
 
 Extracts all file I/O logic from ServerService while maintaining identical behavior.
+Files are written atomically from a worker thread, and bursts of state changes
+are coalesced into one state file write.
 """
 
+import asyncio
+import bisect
 import json
 import logging
+from collections.abc import Iterator
+from pathlib import Path
 from typing import Any
 
 from ...core.config import settings
-from ..interfaces import ServerRepositoryBase
+from ..interfaces import ServerRepositoryBase, server_name_key
+from .json_store import DebouncedWriter, read_json_files, write_json
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +27,11 @@ class FileServerRepository(ServerRepositoryBase):
     def __init__(self):
         self._servers: dict[str, dict[str, Any]] = {}
         self._state: dict[str, bool] = {}
+        # (server_name_key, path) for every server, kept sorted for list_page
+        self._name_index: list[tuple[str, str]] = []
+        self._state_writer = DebouncedWriter(
+            self._save_state, settings.file_state_write_delay_seconds
+        )
 
     async def load_all(self) -> None:
         """Load server definitions and state from disk."""
@@ -28,40 +40,37 @@ class FileServerRepository(ServerRepositoryBase):
         settings.servers_dir.mkdir(parents=True, exist_ok=True)
 
         temp_servers = {}
-        server_files = list(settings.servers_dir.glob("**/*.json"))
+        server_files = await asyncio.to_thread(lambda: list(settings.servers_dir.glob("**/*.json")))
         logger.info(f"Found {len(server_files)} JSON files")
 
-        for server_file in server_files:
-            if server_file.name == settings.state_file_path.name:
+        server_files = [f for f in server_files if f.name != settings.state_file_path.name]
+        for server_file, server_info in await asyncio.to_thread(read_json_files, server_files):
+            if isinstance(server_info, Exception):
+                logger.error(f"Error loading {server_file}: {server_info}", exc_info=server_info)
                 continue
 
-            try:
-                with open(server_file) as f:
-                    server_info = json.load(f)
-
-                    if (
-                        isinstance(server_info, dict)
-                        and "path" in server_info
-                        and "server_name" in server_info
-                    ):
-                        server_path = server_info["path"]
-                        if server_path in temp_servers:
-                            logger.warning(f"Duplicate server path in {server_file}: {server_path}")
-
-                        server_info.setdefault("description", "")
-                        server_info.setdefault("tags", [])
-                        server_info.setdefault("num_tools", 0)
-                        server_info.setdefault("license", "N/A")
-                        server_info.setdefault("proxy_pass_url", None)
-                        server_info.setdefault("tool_list", [])
-
-                        temp_servers[server_path] = server_info
-                    else:
-                        logger.warning(f"Invalid server entry in {server_file}")
-            except Exception as e:
-                logger.error(f"Error loading {server_file}: {e}", exc_info=True)
+            if (
+                isinstance(server_info, dict)
+                and "path" in server_info
+                and "server_name" in server_info
+            ):
+                server_path = server_info["path"]
+                if server_path in temp_servers:
+                    logger.warning(f"Duplicate server path in {server_file}: {server_path}")
+
+                server_info.setdefault("description", "")
+                server_info.setdefault("tags", [])
+                server_info.setdefault("num_tools", 0)
+                server_info.setdefault("license", "N/A")
+                server_info.setdefault("proxy_pass_url", None)
+                server_info.setdefault("tool_list", [])
+
+                temp_servers[server_path] = server_info
+            else:
+                logger.warning(f"Invalid server entry in {server_file}")
 
         self._servers = temp_servers
+        self._name_index = sorted((server_name_key(path), path) for path in self._servers)
         logger.info(f"Loaded {len(self._servers)} server definitions")
 
         await self._load_state()
@@ -69,6 +78,22 @@ class FileServerRepository(ServerRepositoryBase):
     async def _load_state(self) -> None:
         """Load persisted service state from disk."""
         logger.info(f"Loading state from {settings.state_file_path}...")
+        loaded_state = await asyncio.to_thread(self._read_state_file)
+
+        self._state = {}
+        for path in self._servers.keys():
+            value = loaded_state.get(path)
+            if value is None:
+                if path.endswith("/"):
+                    value = loaded_state.get(path.rstrip("/"), False)
+                else:
+                    value = loaded_state.get(path + "/", False)
+            self._state[path] = value
+
+        logger.info(f"Initial service state loaded: {self._state}")
+
+    def _read_state_file(self) -> dict[str, Any]:
+        """Read the state file; runs in a worker thread."""
         loaded_state = {}
 
         try:
@@ -86,27 +111,27 @@ class FileServerRepository(ServerRepositoryBase):
             logger.error(f"Failed to read state file: {e}", exc_info=True)
             loaded_state = {}
 
-        self._state = {}
-        for path in self._servers.keys():
-            value = loaded_state.get(path)
-            if value is None:
-                if path.endswith("/"):
-                    value = loaded_state.get(path.rstrip("/"), False)
-                else:
-                    value = loaded_state.get(path + "/", False)
-            self._state[path] = value
-
-        logger.info(f"Initial service state loaded: {self._state}")
+        return loaded_state
 
     async def _save_state(self) -> None:
         """Persist service state to disk."""
         try:
-            with open(settings.state_file_path, "w") as f:
-                json.dump(self._state, f, indent=2)
+            await write_json(settings.state_file_path, self._state)
             logger.info(f"Persisted state to {settings.state_file_path}")
         except Exception as e:
             logger.error(f"Failed to persist state: {e}")
 
+    async def _schedule_state_save(self) -> None:
+        """Persist service state, coalescing writes within the configured delay."""
+        if settings.file_state_write_delay_seconds > 0:
+            self._state_writer.schedule()
+        else:
+            await self._save_state()
+
+    async def flush(self) -> None:
+        """Write a pending state change to disk now."""
+        await self._state_writer.flush()
+
     def _path_to_filename(
         self,
         path: str,
@@ -129,8 +154,7 @@ class FileServerRepository(ServerRepositoryBase):
             filename = self._path_to_filename(path)
             file_path = settings.servers_dir / filename
 
-            with open(file_path, "w") as f:
-                json.dump(server_info, f, indent=2)
+            await write_json(file_path, server_info)
 
             logger.info(f"Saved server '{server_info['server_name']}' to {file_path}")
             return True
@@ -158,6 +182,53 @@ class FileServerRepository(ServerRepositoryBase):
         """List all servers."""
         return self._servers.copy()
 
+    async def list_page(
+        self,
+        after: str | None = None,
+        limit: int = 100,
+        name_keys: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List active servers in name order, starting after a keyset cursor.
+
+        Args:
+            after: Only return servers whose server_name_key() is greater
+            limit: Maximum number of servers to return
+            name_keys: If given, only return servers with one of these keys
+
+        Returns:
+            Servers ordered by server_name_key(), with "is_enabled" set
+        """
+        if name_keys is None:
+            start = 0
+            if after is not None:
+                start = bisect.bisect_right(self._name_index, after, key=lambda entry: entry[0])
+            candidates = (self._name_index[i][1] for i in range(start, len(self._name_index)))
+        else:
+            candidates = self._paths_for_keys(sorted(set(name_keys)), after)
+
+        page = []
+        for path in candidates:
+            if len(page) >= limit:
+                break
+            server_info = self._servers[path]
+            if not server_info.get("is_active", True):
+                continue
+            page.append({**server_info, "is_enabled": await self.get_state(path)})
+        return page
+
+    def _paths_for_keys(
+        self,
+        sorted_keys: list[str],
+        after: str | None,
+    ) -> Iterator[str]:
+        """Yield the paths of the given sorted name keys that sort after a cursor."""
+        start = 0 if after is None else bisect.bisect_right(sorted_keys, after)
+        for key in sorted_keys[start:]:
+            index = bisect.bisect_left(self._name_index, (key, ""))
+            while index < len(self._name_index) and self._name_index[index][0] == key:
+                yield self._name_index[index][1]
+                index += 1
+
     async def list_by_source(
         self,
         source: str,
@@ -192,8 +263,9 @@ class FileServerRepository(ServerRepositoryBase):
 
         self._servers[path] = server_info
         self._state[path] = False
+        bisect.insort(self._name_index, (server_name_key(path), path))
 
-        await self._save_state()
+        await self._schedule_state_save()
 
         logger.info(f"New server registered: '{server_info['server_name']}' at '{path}'")
         return True
@@ -231,19 +303,19 @@ class FileServerRepository(ServerRepositoryBase):
             filename = self._path_to_filename(path)
             file_path = settings.servers_dir / filename
 
-            if file_path.exists():
-                file_path.unlink()
+            if await asyncio.to_thread(self._remove_file, file_path):
                 logger.info(f"Removed server file: {file_path}")
             else:
                 logger.warning(f"Server file not found: {file_path}")
 
             server_name = self._servers[path].get("server_name", "Unknown")
             del self._servers[path]
+            self._remove_from_name_index(path)
 
             if path in self._state:
                 del self._state[path]
 
-            await self._save_state()
+            await self._schedule_state_save()
 
             logger.info(f"Successfully removed server '{server_name}' from '{path}'")
             return True
@@ -280,18 +352,18 @@ class FileServerRepository(ServerRepositoryBase):
             # Remove the server file from disk
             filename = self._path_to_filename(key)
             file_path = settings.servers_dir / filename
-            if file_path.exists():
-                file_path.unlink()
+            if await asyncio.to_thread(self._remove_file, file_path):
                 logger.info("Removed server file: %s", file_path)
 
             # Remove from in-memory dicts
             del self._servers[key]
+            self._remove_from_name_index(key)
             if key in self._state:
                 del self._state[key]
             deleted_count += 1
 
         if deleted_count > 0:
-            await self._save_state()
+            await self._schedule_state_save()
             logger.info(
                 "delete_with_versions: removed %d document(s) for path '%s'",
                 deleted_count,
@@ -300,6 +372,26 @@ class FileServerRepository(ServerRepositoryBase):
 
         return deleted_count
 
+    @staticmethod
+    def _remove_file(
+        file_path: Path,
+    ) -> bool:
+        """Delete a file if it exists; runs in a worker thread."""
+        if not file_path.exists():
+            return False
+        file_path.unlink()
+        return True
+
+    def _remove_from_name_index(
+        self,
+        path: str,
+    ) -> None:
+        """Remove a path from the sorted name index."""
+        entry = (server_name_key(path), path)
+        index = bisect.bisect_left(self._name_index, entry)
+        if index < len(self._name_index) and self._name_index[index] == entry:
+            del self._name_index[index]
+
     async def get_state(
         self,
         path: str,
@@ -329,7 +421,7 @@ class FileServerRepository(ServerRepositoryBase):
             return False
 
         self._state[path] = enabled
-        await self._save_state()
+        await self._schedule_state_save()
 
         server_name = self._servers[path]["server_name"]
         logger.info(f"Toggled '{server_name}' ({path}) to {enabled}")
@@ -4,6 +4,7 @@ Repository base classes for data access abstraction.
 These abstract base classes define the contract that ALL repository implementations must follow.
 """
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -21,6 +22,19 @@ try:
 except ImportError:
     VirtualServerConfig = None
 
+logger = logging.getLogger(__name__)
+
+
+def server_name_key(
+    path: str,
+) -> str:
+    """Sort key of a server: its path without leading and trailing slashes.
+
+    Orders servers exactly like their public reverse-DNS names
+    ("<namespace>/<path>"), which share one namespace prefix.
+    """
+    return path.strip("/")
+
 
 class ServerRepositoryBase(ABC):
     """Abstract base class for MCP server data access."""
@@ -38,6 +52,28 @@ class ServerRepositoryBase(ABC):
         """List all servers."""
         pass
 
+    @abstractmethod
+    async def list_page(
+        self,
+        after: str | None = None,
+        limit: int = 100,
+        name_keys: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List active servers in name order, starting after a keyset cursor.
+
+        Inactive version documents are skipped. Each returned server carries
+        its current "is_enabled" state.
+
+        Args:
+            after: Only return servers whose server_name_key() is greater
+            limit: Maximum number of servers to return
+            name_keys: If given, only return servers with one of these keys
+
+        Returns:
+            Servers ordered by server_name_key()
+        """
+        pass
+
     @abstractmethod
     async def list_by_source(
         self,
@@ -127,6 +163,11 @@ class ServerRepositoryBase(ABC):
         """
         pass
 
+    @abstractmethod
+    async def flush(self) -> None:
+        """Persist any writes the repository has deferred. Called on shutdown."""
+        pass
+
 
 class AgentRepositoryBase(ABC):
     """Abstract base class for A2A agent data access."""
@@ -373,6 +414,20 @@ class ScopeRepositoryBase(ABC):
         """
         pass
 
+    @abstractmethod
+    async def load_all_groups(self) -> list[dict[str, Any]]:
+        """
+        Load full details of every group in a single pass over storage.
+
+        Used by the scopes loader instead of list_groups() followed by one
+        get_group() call per group. Also refreshes any in-memory scopes cache
+        the repository keeps, like load_all().
+
+        Returns:
+            List of group dictionaries in the same shape as get_group()
+        """
+        pass
+
     async def list_groups(self) -> dict[str, Any]:
         """
         List all groups with server counts.
@@ -796,6 +851,54 @@ class SearchRepositoryBase(ABC):
         """Perform search."""
         pass
 
+    async def index_servers(
+        self,
+        entries: list[tuple[str, dict[str, Any], bool]],
+    ) -> int:
+        """Index many servers, e.g. when rebuilding the index at startup.
+
+        Default implementation indexes them one at a time. Override in
+        implementations that can skip unchanged entries or batch embeddings.
+
+        Args:
+            entries: Tuples of (path, server_info, is_enabled)
+
+        Returns:
+            Number of servers indexed
+        """
+        indexed = 0
+        for path, server_info, is_enabled in entries:
+            try:
+                await self.index_server(path, server_info, is_enabled)
+                indexed += 1
+            except Exception as e:
+                logger.error(f"Failed to index server {path}: {e}", exc_info=True)
+        return indexed
+
+    async def index_agents(
+        self,
+        entries: list[tuple[str, AgentCard, bool]],
+    ) -> int:
+        """Index many agents, e.g. when rebuilding the index at startup.
+
+        Default implementation indexes them one at a time. Override in
+        implementations that can skip unchanged entries or batch embeddings.
+
+        Args:
+            entries: Tuples of (path, agent_card, is_enabled)
+
+        Returns:
+            Number of agents indexed
+        """
+        indexed = 0
+        for path, agent_card, is_enabled in entries:
+            try:
+                await self.index_agent(path, agent_card, is_enabled)
+                indexed += 1
+            except Exception as e:
+                logger.error(f"Failed to index agent {path}: {e}", exc_info=True)
+        return indexed
+
     async def index_skill(
         self,
         path: str,
@@ -1060,8 +1163,38 @@ class SkillRepositoryBase(ABC):
     async def update_many(
         self,
         updates: dict[str, dict[str, Any]],
+        upsert: bool = True,
     ) -> int:
-        """Update multiple skills by path, return count."""
+        """Update multiple skills by path in one batch, return count.
+
+        Args:
+            updates: Fields to set, keyed by skill path
+            upsert: Whether to create skills that do not exist
+        """
+        pass
+
+    @abstractmethod
+    async def get_cached_content(
+        self,
+        url: str,
+    ) -> dict[str, Any] | None:
+        """Get the cached SKILL.md fetch result for a URL, if any."""
+        pass
+
+    @abstractmethod
+    async def put_cached_content(
+        self,
+        entry: dict[str, Any],
+    ) -> None:
+        """Store a SKILL.md fetch result, keyed by its "url"."""
+        pass
+
+    @abstractmethod
+    async def delete_cached_content(
+        self,
+        urls: list[str],
+    ) -> None:
+        """Drop cached SKILL.md fetch results for the given URLs."""
         pass
 
     @abstractmethod
@@ -1094,7 +1227,7 @@ class BackendSessionRepositoryBase(ABC):
         client_session_id: str,
         backend_key: str,
     ) -> str | None:
-        """Get backend session ID and bump last_used_at atomically.
+        """Get backend session ID and record the access (bumps last_used_at).
 
         Args:
             client_session_id: Client-facing session ID
@@ -1105,6 +1238,33 @@ class BackendSessionRepositoryBase(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_backend_sessions(
+        self,
+        client_session_id: str,
+        backend_keys: list[str],
+    ) -> dict[str, str]:
+        """Get the backend session IDs of several backends and record the accesses.
+
+        Args:
+            client_session_id: Client-facing session ID
+            backend_keys: Backend location keys
+
+        Returns:
+            Mapping of backend key to backend session ID; keys without a
+            session are omitted
+        """
+        pass
+
+    @abstractmethod
+    async def flush_touches(self) -> int:
+        """Write pending last_used_at bumps recorded by reads.
+
+        Returns:
+            Number of sessions whose bump was written
+        """
+        pass
+
     @abstractmethod
     async def store_backend_session(
         self,
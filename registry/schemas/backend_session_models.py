@@ -132,3 +132,25 @@ class GetBackendSessionResponse(BaseModel):
         ...,
         description="Backend MCP session ID",
     )
+
+
+class GetBackendSessionsRequest(BaseModel):
+    """Request body for looking up several backend sessions of one client."""
+
+    client_session_id: str = Field(
+        ...,
+        description="Client-facing session ID",
+    )
+    backend_keys: list[str] = Field(
+        ...,
+        description="Backend location keys to resolve",
+    )
+
+
+class GetBackendSessionsResponse(BaseModel):
+    """Response body for a multi-key backend session lookup."""
+
+    sessions: dict[str, str] = Field(
+        default_factory=dict,
+        description="Backend key -> backend MCP session ID (keys without a session are omitted)",
+    )
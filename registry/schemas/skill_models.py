@@ -176,6 +176,10 @@ class SkillCard(BaseModel):
     content_updated_at: datetime | None = Field(
         None, description="When SKILL.md content was last updated"
     )
+    content_etag: str | None = Field(None, description="ETag of SKILL.md from the last probe")
+    content_last_modified: str | None = Field(
+        None, description="Last-Modified of SKILL.md from the last probe"
+    )
 
     # Timestamps
     created_at: datetime = Field(default_factory=_utc_now)
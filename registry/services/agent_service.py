@@ -26,7 +26,13 @@ class AgentService:
         self._repo: AgentRepositoryBase = get_agent_repository()
         self._search_repo: SearchRepositoryBase = get_search_repository()
         self.registered_agents: dict[str, AgentCard] = {}
-        self.agent_state: dict[str, list[str]] = {"enabled": [], "disabled": []}
+        self.agent_state: dict[str, set[str]] = {"enabled": set(), "disabled": set()}
+
+        # Inverted indexes for skill-based discovery: lowercase term -> agent paths
+        self._skill_index: dict[str, set[str]] = {}
+        self._tag_index: dict[str, set[str]] = {}
+        # Lowercase (skill terms, tags) per agent path, for scoring and unindexing
+        self._agent_terms: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
 
     async def load_agents_and_state(self) -> None:
         """Load agent cards and persisted state from repository."""
@@ -40,27 +46,119 @@ class AgentService:
         self.registered_agents = {agent.path: agent for agent in agents_list}
         logger.info(f"Successfully loaded {len(self.registered_agents)} agent cards")
 
+        self._rebuild_discovery_index()
+
         await self._load_agent_state()
 
     async def _load_agent_state(self) -> None:
         """Load persisted agent state from repository."""
         state_data = await self._repo.get_state()
+        enabled = set(state_data.get("enabled", []))
+        disabled = set(state_data.get("disabled", [])) - enabled
 
         # Initialize state for all registered agents
-        for path in self.registered_agents.keys():
-            if path not in state_data["enabled"] and path not in state_data["disabled"]:
-                state_data["disabled"].append(path)
+        disabled.update(self.registered_agents.keys() - enabled - disabled)
 
-        self.agent_state = state_data
-        await self._repo.save_state(state_data)
-        logger.info(
-            f"Agent state initialized: {len(state_data['enabled'])} enabled, "
-            f"{len(state_data['disabled'])} disabled"
-        )
+        self.agent_state = {"enabled": enabled, "disabled": disabled}
+        await self._persist_state()
+        logger.info(f"Agent state initialized: {len(enabled)} enabled, {len(disabled)} disabled")
 
     async def _persist_state(self) -> None:
         """Persist agent state to repository."""
-        await self._repo.save_state(self.agent_state)
+        # Repositories store state as JSON lists
+        await self._repo.save_state(
+            {
+                "enabled": sorted(self.agent_state["enabled"]),
+                "disabled": sorted(self.agent_state["disabled"]),
+            }
+        )
+
+    def _index_agent_terms(
+        self,
+        agent_card: AgentCard,
+    ) -> None:
+        """Add (or refresh) an agent in the skill and tag discovery indexes."""
+        path = agent_card.path
+        self._unindex_agent_terms(path)
+
+        skill_terms = frozenset(
+            term
+            for skill in agent_card.skills or []
+            for term in (skill.id.lower(), skill.name.lower())
+        )
+        tags = frozenset(tag.lower() for tag in agent_card.tags or [])
+
+        for term in skill_terms:
+            self._skill_index.setdefault(term, set()).add(path)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(path)
+        self._agent_terms[path] = (skill_terms, tags)
+
+    def _unindex_agent_terms(
+        self,
+        path: str,
+    ) -> None:
+        """Remove an agent from the skill and tag discovery indexes."""
+        terms = self._agent_terms.pop(path, None)
+        if terms is None:
+            return
+
+        skill_terms, tags = terms
+        for index, keys in ((self._skill_index, skill_terms), (self._tag_index, tags)):
+            for key in keys:
+                paths = index.get(key)
+                if paths is None:
+                    continue
+                paths.discard(path)
+                if not paths:
+                    del index[key]
+
+    def _rebuild_discovery_index(self) -> None:
+        """Rebuild the skill and tag discovery indexes from the registered agents."""
+        self._skill_index = {}
+        self._tag_index = {}
+        self._agent_terms = {}
+        for agent_card in self.registered_agents.values():
+            self._index_agent_terms(agent_card)
+
+    def find_agents_by_skills(
+        self,
+        skills: list[str],
+        tags: list[str] | None = None,
+    ) -> list[tuple[AgentCard, set[str], set[str]]]:
+        """
+        Find enabled agents with at least one of the given skills.
+
+        Uses the inverted skill index, so the cost depends on the number of
+        matching agents rather than the number of registered agents.
+
+        Args:
+            skills: Skill IDs or names (case-insensitive)
+            tags: Optional tags to report matches for (case-insensitive)
+
+        Returns:
+            List of (agent card, matched skill terms, matched tags) tuples
+        """
+        required_skills = {s.lower() for s in skills}
+        required_tags = {t.lower() for t in tags} if tags else set()
+
+        candidate_paths: set[str] = set()
+        for skill in required_skills:
+            candidate_paths |= self._skill_index.get(skill, set())
+
+        results = []
+        for path in candidate_paths:
+            if not self.is_agent_enabled(path):
+                continue
+            agent_skills, agent_tags = self._agent_terms[path]
+            results.append(
+                (
+                    self.registered_agents[path],
+                    required_skills & agent_skills,
+                    required_tags & agent_tags,
+                )
+            )
+        return results
 
     async def register_agent(
         self,
@@ -89,7 +187,8 @@ class AgentService:
 
         # Add to in-memory registry and default to disabled
         self.registered_agents[path] = agent_card
-        self.agent_state["disabled"].append(path)
+        self._index_agent_terms(agent_card)
+        self.agent_state["disabled"].add(path)
         await self._persist_state()
 
         # Index in search backend
@@ -203,6 +302,7 @@ class AgentService:
         try:
             updated_agent = AgentCard(**agent_dict)
             self.registered_agents[path] = updated_agent
+            self._index_agent_terms(updated_agent)
         except Exception as e:
             logger.warning(f"Failed to update in-memory agent cache: {e}")
 
@@ -250,6 +350,7 @@ class AgentService:
         # Save to repository
         updated_agent = await self._repo.save(updated_agent)
         self.registered_agents[path] = updated_agent
+        self._index_agent_terms(updated_agent)
 
         # Re-index in search backend
         try:
@@ -290,12 +391,11 @@ class AgentService:
 
             # Remove from in-memory registry
             del self.registered_agents[path]
+            self._unindex_agent_terms(path)
 
             # Remove from state
-            if path in self.agent_state["enabled"]:
-                self.agent_state["enabled"].remove(path)
-            if path in self.agent_state["disabled"]:
-                self.agent_state["disabled"].remove(path)
+            self.agent_state["enabled"].discard(path)
+            self.agent_state["disabled"].discard(path)
 
             await self._persist_state()
 
@@ -333,9 +433,8 @@ class AgentService:
             logger.info(f"Agent '{path}' is already enabled")
             return
 
-        if path in self.agent_state["disabled"]:
-            self.agent_state["disabled"].remove(path)
-        self.agent_state["enabled"].append(path)
+        self.agent_state["disabled"].discard(path)
+        self.agent_state["enabled"].add(path)
 
         await self._persist_state()
 
@@ -362,9 +461,8 @@ class AgentService:
             logger.info(f"Agent '{path}' is already disabled")
             return
 
-        if path in self.agent_state["enabled"]:
-            self.agent_state["enabled"].remove(path)
-        self.agent_state["disabled"].append(path)
+        self.agent_state["enabled"].discard(path)
+        self.agent_state["disabled"].add(path)
 
         await self._persist_state()
 
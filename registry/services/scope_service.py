@@ -10,10 +10,9 @@ from typing import (
     Any,
 )
 
-import httpx
-
 from ..auth.internal import generate_internal_token
 from ..core.config import settings
+from ..core.http_clients import CLIENT_INTERNAL, get_http_client
 from ..repositories.factory import get_scope_repository
 from .server_service import server_service
 
@@ -53,21 +52,21 @@ async def _trigger_auth_server_reload() -> bool:
             purpose="reload-scopes",
         )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.auth_server_url}/internal/reload-scopes",
-                headers={"Authorization": f"Bearer {token}"},
-                timeout=10.0,
-            )
+        client = get_http_client(CLIENT_INTERNAL)
+        response = await client.post(
+            f"{settings.auth_server_url}/internal/reload-scopes",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=10.0,
+        )
 
-            if response.status_code == 200:
-                logger.info("Successfully triggered auth server scope reload")
-                return True
-            else:
-                logger.error(
-                    f"Failed to reload auth server scopes: {response.status_code} - {response.text}"
-                )
-                return False
+        if response.status_code == 200:
+            logger.info("Successfully triggered auth server scope reload")
+            return True
+        else:
+            logger.error(
+                f"Failed to reload auth server scopes: {response.status_code} - {response.text}"
+            )
+            return False
 
     except Exception as e:
         logger.error(f"Failed to trigger auth server reload: {e}")
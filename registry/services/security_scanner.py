@@ -11,20 +11,28 @@ import json
 import logging
 import os
 import re
-import subprocess  # nosec B404
+import time
 from datetime import UTC, datetime
 from pathlib import Path
+from urllib.parse import urlparse
 
 from ..core.config import settings
 from ..core.endpoint_utils import get_endpoint_url
 from ..repositories.factory import get_security_scan_repository
 from ..schemas.security import SecurityScanConfig, SecurityScanResult
+from ..utils.tool_hash import compute_tool_list_hash
 
 logger = logging.getLogger(__name__)
 
 # Constants
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 OUTPUT_DIR = PROJECT_ROOT / "security_scans"
+SCAN_CACHE_MAX_ENTRIES = 1024
+
+
+def _get_backend_key(server_url: str) -> str:
+    """Return the host:port a scan will connect to, used for per-backend limits."""
+    return urlparse(server_url).netloc.lower() or server_url
 
 
 def _extract_bearer_token_from_headers(headers: str) -> str | None:
@@ -132,6 +140,17 @@ def _organize_findings_by_analyzer(tool_results: list) -> dict:
     return organized_results
 
 
+async def _kill_process(process: asyncio.subprocess.Process) -> None:
+    """Kill a scanner subprocess that is still running and reap it."""
+    if process.returncode is not None:
+        return
+    try:
+        process.kill()
+    except ProcessLookupError:
+        return
+    await process.wait()
+
+
 class SecurityScannerService:
     """Service for scanning MCP servers for security vulnerabilities."""
 
@@ -139,6 +158,12 @@ class SecurityScannerService:
         """Initialize the security scanner service."""
         self._ensure_output_directory()
         self._scan_repo = get_security_scan_repository()
+        # Bounds the number of mcp-scanner subprocesses running at once
+        self._scan_semaphore = asyncio.Semaphore(max(1, settings.security_scan_max_concurrency))
+        # Per-backend limits so one slow host cannot take every scan slot
+        self._backend_semaphores: dict[str, asyncio.Semaphore] = {}
+        # (server_url, tool_list_hash, analyzers) -> (cached_at, result)
+        self._result_cache: dict[tuple[str, str, str], tuple[float, SecurityScanResult]] = {}
 
     def _ensure_output_directory(self) -> Path:
         """Ensure output directory exists."""
@@ -157,6 +182,48 @@ class SecurityScannerService:
             add_security_pending_tag=settings.security_add_pending_tag,
         )
 
+    def _get_backend_semaphore(
+        self,
+        server_url: str,
+    ) -> asyncio.Semaphore:
+        """Get (or create) the concurrency limiter for the backend behind a URL."""
+        backend = _get_backend_key(server_url)
+        semaphore = self._backend_semaphores.get(backend)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, settings.security_scan_max_per_backend))
+            self._backend_semaphores[backend] = semaphore
+        return semaphore
+
+    def _get_cached_result(
+        self,
+        cache_key: tuple[str, str, str],
+    ) -> SecurityScanResult | None:
+        """Return a cached scan result if it has not expired."""
+        entry = self._result_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        cached_at, result = entry
+        if time.monotonic() - cached_at > settings.security_scan_cache_ttl:
+            self._result_cache.pop(cache_key, None)
+            return None
+        return result
+
+    def _store_cached_result(
+        self,
+        cache_key: tuple[str, str, str],
+        result: SecurityScanResult,
+    ) -> None:
+        """Cache a successful scan result, evicting the oldest entry when full."""
+        self._result_cache.pop(cache_key, None)
+        self._result_cache[cache_key] = (time.monotonic(), result)
+        while len(self._result_cache) > SCAN_CACHE_MAX_ENTRIES:
+            self._result_cache.pop(next(iter(self._result_cache)))
+
+    def clear_result_cache(self) -> None:
+        """Drop all cached scan results."""
+        self._result_cache.clear()
+
     async def scan_server(
         self,
         server_url: str,
@@ -166,6 +233,8 @@ class SecurityScannerService:
         headers: str | None = None,
         timeout: int | None = None,
         mcp_endpoint: str | None = None,
+        tool_list: list | None = None,
+        force: bool = False,
     ) -> SecurityScanResult:
         """
         Scan an MCP server for security vulnerabilities.
@@ -179,15 +248,16 @@ class SecurityScannerService:
             timeout: Scan timeout in seconds (overrides config)
             mcp_endpoint: Optional explicit MCP endpoint URL. If set, used directly
                 instead of appending /mcp to server_url.
+            tool_list: Optional known tool list. When provided, a previous successful
+                result for the same URL, tool list and analyzers is reused.
+            force: Always run the scanner, ignoring any cached result
 
         Returns:
-            SecurityScanResult containing scan results
-
-        Raises:
-            subprocess.TimeoutExpired: If scan times out
-            subprocess.CalledProcessError: If scanner command fails
-            ValueError: If invalid input provided
-            RuntimeError: If scan fails for other reasons
+            SecurityScanResult containing scan results. Scanner failures do not
+            raise: a timeout (asyncio.TimeoutError while waiting for the
+            scanner), a non-zero scanner exit code, invalid headers or
+            unparseable output are returned as a result with scan_failed=True
+            and the error in error_message.
         """
         config = self.get_scan_config()
 
@@ -207,18 +277,37 @@ class SecurityScannerService:
             mcp_endpoint=mcp_endpoint,
         )
 
+        cache_key = None
+        tool_list_hash = compute_tool_list_hash(tool_list)
+        if tool_list_hash and settings.security_scan_cache_ttl > 0:
+            cache_key = (server_url, tool_list_hash, analyzers)
+
+        if cache_key and not force:
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                logger.info(
+                    f"Skipping security scan for {server_url}: tool list and analyzers "
+                    f"unchanged since scan at {cached.scan_timestamp}"
+                )
+                result_path = server_path or server_url
+                if cached.server_path != result_path:
+                    cached = cached.model_copy(update={"server_path": result_path})
+                    await self._scan_repo.create(cached.model_dump())
+                return cached
+
         logger.info(f"Starting security scan for {server_url} with analyzers: {analyzers}")
 
         try:
-            # Run the scan in a thread pool to avoid blocking
-            raw_output = await asyncio.to_thread(
-                self._run_mcp_scanner,
-                server_url=server_url,
-                analyzers=analyzers,
-                api_key=api_key,
-                headers=headers,
-                timeout=timeout,
-            )
+            # Wait for a slot on this backend first, then for a global worker slot,
+            # so a busy backend does not hold worker slots while it queues
+            async with self._get_backend_semaphore(server_url), self._scan_semaphore:
+                raw_output = await self._run_mcp_scanner(
+                    server_url=server_url,
+                    analyzers=analyzers,
+                    api_key=api_key,
+                    headers=headers,
+                    timeout=timeout,
+                )
 
             # Analyze results
             is_safe, critical, high, medium, low = self._analyze_scan_results(raw_output)
@@ -243,6 +332,9 @@ class SecurityScannerService:
             # Save scan result via repository
             await self._scan_repo.create(result.model_dump())
 
+            if cache_key:
+                self._store_cached_result(cache_key, result)
+
             logger.info(
                 f"Security scan completed for {server_url}. "
                 f"Safe: {is_safe}, Critical: {critical}, High: {high}, Medium: {medium}, Low: {low}"
@@ -250,12 +342,8 @@ class SecurityScannerService:
 
             return result
 
-        except (
-            subprocess.TimeoutExpired,
-            subprocess.CalledProcessError,
-            ValueError,
-            RuntimeError,
-        ) as e:
+        except (TimeoutError, ValueError, RuntimeError) as e:
+            # _run_mcp_scanner reports timeouts and non-zero exit codes as RuntimeError
             logger.error(f"Security scan failed for {server_url}: {e}")
 
             # Create error output
@@ -322,7 +410,7 @@ class SecurityScannerService:
 
             return result
 
-    def _run_mcp_scanner(
+    async def _run_mcp_scanner(
         self,
         server_url: str,
         analyzers: str,
@@ -331,9 +419,10 @@ class SecurityScannerService:
         timeout: int | None = None,
     ) -> dict:
         """
-        Run mcp-scanner command and return raw output.
+        Run mcp-scanner as an async subprocess and return raw output.
 
-        This is a synchronous method that runs in a thread pool.
+        The subprocess is killed if the scan times out or the calling task is
+        cancelled, so abandoned scans do not keep running in the background.
 
         Args:
             server_url: URL of the MCP server to scan
@@ -346,10 +435,9 @@ class SecurityScannerService:
             Dictionary containing analysis results and tool results
 
         Raises:
-            subprocess.TimeoutExpired: If scan times out
-            subprocess.CalledProcessError: If scanner command fails
             ValueError: If headers are invalid or output cannot be parsed
-            RuntimeError: If scan fails for other reasons
+            RuntimeError: If the scan times out, the scanner fails or its output
+                cannot be parsed
         """
         logger.info(f"Running security scan on: {server_url}")
         logger.info(f"Using analyzers: {analyzers}")
@@ -377,44 +465,54 @@ class SecurityScannerService:
             env["MCP_SCANNER_LLM_API_KEY"] = api_key
 
         # Run scanner with timeout
+        process = await asyncio.create_subprocess_exec(  # nosec B603 - args are hardcoded flags passed to mcp-scanner tool
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
         try:
-            result = subprocess.run(  # nosec B603 - args are hardcoded flags passed to mcp-scanner tool
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                env=env,
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                process.communicate(),
                 timeout=timeout,
             )
+        except TimeoutError as e:
+            await _kill_process(process)
+            logger.error(f"Scanner command timed out after {timeout} seconds")
+            raise RuntimeError(f"Security scan timed out after {timeout} seconds") from e
+        except asyncio.CancelledError:
+            await _kill_process(process)
+            logger.warning(f"Security scan for {server_url} cancelled")
+            raise
 
-            # Log raw output for debugging
-            logger.debug(f"Raw scanner stdout:\n{result.stdout[:500]}")
-
-            # Parse JSON output - scanner outputs JSON array after log messages
-            stdout = result.stdout.strip()
-            tool_results = _parse_scanner_json_output(stdout)
-
-            # Wrap in expected format with analysis_results
-            raw_output = {"analysis_results": {}, "tool_results": tool_results}
+        stdout = stdout_bytes.decode("utf-8", errors="replace")
+        stderr = stderr_bytes.decode("utf-8", errors="replace")
 
-            # Extract findings from tool results and organize by analyzer
-            raw_output["analysis_results"] = _organize_findings_by_analyzer(tool_results)
+        if process.returncode != 0:
+            logger.error(f"Scanner command failed with exit code {process.returncode}")
+            logger.error(f"stderr: {stderr}")
+            raise RuntimeError(f"Security scanner failed: {stderr}")
 
-            logger.debug(f"Scanner output:\n{json.dumps(raw_output, indent=2, default=str)}")
-            return raw_output
+        # Log raw output for debugging
+        logger.debug(f"Raw scanner stdout:\n{stdout[:500]}")
 
-        except subprocess.TimeoutExpired as e:
-            logger.error(f"Scanner command timed out after {timeout} seconds")
-            raise RuntimeError(f"Security scan timed out after {timeout} seconds") from e
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Scanner command failed with exit code {e.returncode}")
-            logger.error(f"stderr: {e.stderr}")
-            raise RuntimeError(f"Security scanner failed: {e.stderr}") from e
+        try:
+            # Parse JSON output - scanner outputs JSON array after log messages
+            tool_results = _parse_scanner_json_output(stdout.strip())
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse scanner output as JSON: {e}")
-            logger.error(f"Raw stdout: {result.stdout[:1000]}")
+            logger.error(f"Raw stdout: {stdout[:1000]}")
             raise RuntimeError("Failed to parse security scanner output") from e
 
+        # Wrap in expected format with analysis_results
+        raw_output = {"analysis_results": {}, "tool_results": tool_results}
+
+        # Extract findings from tool results and organize by analyzer
+        raw_output["analysis_results"] = _organize_findings_by_analyzer(tool_results)
+
+        logger.debug(f"Scanner output:\n{json.dumps(raw_output, indent=2, default=str)}")
+        return raw_output
+
     def _analyze_scan_results(self, raw_output: dict) -> tuple[bool, int, int, int, int]:
         """
         Analyze scan results and extract severity counts.
@@ -3,11 +3,12 @@ import logging
 from typing import Any
 
 from ..repositories.factory import get_server_repository
-from ..repositories.interfaces import ServerRepositoryBase
+from ..repositories.interfaces import ServerRepositoryBase, server_name_key
 from ..utils.credential_encryption import (
     _migrate_auth_type_to_auth_scheme,
     strip_credentials_from_dict,
 )
+from .virtual_server_service import invalidate_backend_tools
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,25 @@ class ServerService:
         from ..repositories.factory import get_search_repository
 
         self._search_repo = get_search_repository()
+        self._catalog_generation = 0
+
+    @property
+    def catalog_generation(self) -> int:
+        """Counter bumped whenever this instance changes a server or its state.
+
+        Lets read-mostly views (e.g. well-known discovery) keep a rendered
+        copy until the catalog changes.
+        """
+        return self._catalog_generation
+
+    def _catalog_changed(
+        self,
+        path: str | None = None,
+    ) -> None:
+        """Drop caches derived from a server, or from all servers if path is None."""
+        self._catalog_generation += 1
+        # Virtual servers aggregating this server's tools must see the new tool list
+        invalidate_backend_tools(path)
 
     def _prepare_server_dict(
         self,
@@ -45,6 +65,11 @@ class ServerService:
         """Load server definitions and persisted state from repository."""
         # Delegate to repository - no longer maintains service-level cache
         await self._repo.load_all()
+        self._catalog_changed()
+
+    async def flush_pending_writes(self) -> None:
+        """Persist writes the repository has deferred. Called on shutdown."""
+        await self._repo.flush()
 
     async def register_server(
         self,
@@ -119,6 +144,7 @@ class ServerService:
         result = await self._repo.create(server_info)
 
         if result:
+            self._catalog_changed(path)
             # Index in search backend
             try:
                 is_enabled = await self._repo.get_state(path)
@@ -144,6 +170,7 @@ class ServerService:
         result = await self._repo.update(path, server_info)
 
         if result:
+            self._catalog_changed(path)
             # Update search index
             try:
                 is_enabled = await self._repo.get_state(path)
@@ -175,6 +202,7 @@ class ServerService:
         result = await self._repo.set_state(path, enabled)
 
         if result:
+            self._catalog_changed(path)
             # Trigger nginx config regeneration
             try:
                 from ..core.nginx_service import nginx_service
@@ -362,6 +390,33 @@ class ServerService:
             logger.info(f"[FILTER DEBUG] Filtered server paths: {list(filtered_servers.keys())}")
             return filtered_servers
 
+    async def list_servers_page(
+        self,
+        after: str | None = None,
+        limit: int = 100,
+        accessible_servers: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        List one keyset page of active servers in name order.
+
+        Args:
+            after: Sort key (path without surrounding slashes) to list after
+            limit: Maximum number of servers to return
+            accessible_servers: Optional list of server names the user can access.
+                               If None, all servers are listed (admin access).
+
+        Returns:
+            Servers with credentials stripped and "is_enabled" set
+        """
+        name_keys = None
+        if accessible_servers is not None:
+            name_keys = [server_name_key(server) for server in accessible_servers]
+
+        page = await self._repo.list_page(after=after, limit=limit, name_keys=name_keys)
+        for server_info in page:
+            self._prepare_server_dict(server_info, include_credentials=False)
+        return page
+
     async def user_can_access_server_path(self, path: str, accessible_servers: list[str]) -> bool:
         """
         Check if user can access a specific server by path.
@@ -425,6 +480,7 @@ class ServerService:
 
         # Reload from repository
         await self._repo.load_all()
+        self._catalog_changed()
 
         current_enabled_services = set(await self.get_enabled_services())
 
@@ -518,6 +574,7 @@ class ServerService:
         deleted_count = await self._repo.delete_with_versions(path)
 
         if deleted_count > 0:
+            self._catalog_changed(path)
             # Remove from search backend
             try:
                 await self._search_repo.remove_entity(path)
@@ -600,6 +657,7 @@ class ServerService:
         result = await self._repo.create(new_version_doc)
 
         if result:
+            self._catalog_changed(path)
             # Update active server's other_version_ids
             other_versions = active_server.get("other_version_ids", [])
             other_versions.append(new_version_id)
@@ -657,6 +715,7 @@ class ServerService:
         result = await self._repo.delete(version_id)
 
         if result:
+            self._catalog_changed(path)
             # Update active server's other_version_ids
             other_versions = active_server.get("other_version_ids", [])
             if version_id in other_versions:
@@ -743,6 +802,7 @@ class ServerService:
         await self._repo.delete(target_version_id)
         await self._repo.create(new_active)
         await self._repo.create(new_inactive)
+        self._catalog_changed(path)
 
         # Update search index: re-index with new active version
         try:
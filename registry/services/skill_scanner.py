@@ -10,6 +10,7 @@ import json
 import logging
 import os
 import re
+import shutil
 import subprocess  # nosec B404
 import tempfile
 from datetime import UTC, datetime
@@ -91,7 +92,13 @@ class SkillScannerService:
 
         logger.info(f"Starting skill security scan for {skill_path} with analyzers: {analyzers}")
 
+        cached_content_dir = None
         try:
+            if skill_md_url and not skill_content_path:
+                # Rescans read SKILL.md through the content cache instead of downloading it
+                cached_content_dir = await self._write_cached_skill_content(skill_md_url)
+                skill_content_path = cached_content_dir
+
             raw_output = await asyncio.to_thread(
                 self._run_skill_scanner,
                 skill_path=skill_path,
@@ -143,6 +150,33 @@ class SkillScannerService:
             await self.scan_repo.create(result.model_dump())
             return result
 
+        finally:
+            if cached_content_dir is not None:
+                shutil.rmtree(cached_content_dir, ignore_errors=True)
+
+    async def _write_cached_skill_content(
+        self,
+        skill_md_url: str,
+    ) -> str:
+        """
+        Write SKILL.md from the content cache to a temporary directory for scanning.
+
+        Args:
+            skill_md_url: URL to SKILL.md file
+
+        Returns:
+            Path to temporary directory containing SKILL.md
+
+        Raises:
+            SkillUrlValidationError: If the URL is not accessible or fails SSRF check
+        """
+        from .skill_service import get_skill_service
+
+        content = await get_skill_service().get_skill_md_content(skill_md_url)
+        temp_dir = tempfile.mkdtemp(prefix="skill_scan_")
+        (Path(temp_dir) / "SKILL.md").write_text(content)
+        return temp_dir
+
     def _run_skill_scanner(
         self,
         skill_path: str,
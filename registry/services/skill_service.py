@@ -7,10 +7,13 @@ Simplified design:
 - SKILL.md URL validation on registration
 """
 
+import asyncio
 import hashlib
 import ipaddress
 import logging
 import socket
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
 from typing import (
     Any,
@@ -19,6 +22,8 @@ from urllib.parse import urlparse
 
 import httpx
 
+from ..core.config import settings
+from ..core.http_clients import CLIENT_BACKEND, get_http_client
 from ..exceptions import (
     SkillUrlValidationError,
 )
@@ -61,6 +66,10 @@ TRUSTED_DOMAINS: frozenset = frozenset(
     }
 )
 
+# SSRF verdicts per (hostname, port) for the periodic health refresh, with the
+# monotonic time they expire, least recently used first
+_host_verdicts: OrderedDict[tuple[str, int], tuple[bool, float]] = OrderedDict()
+
 
 def _is_private_ip(
     ip_str: str,
@@ -98,6 +107,7 @@ def _is_private_ip(
 
 def _is_safe_url(
     url: str,
+    use_cached_verdict: bool = False,
 ) -> bool:
     """Check if a URL is safe to fetch (SSRF protection).
 
@@ -110,6 +120,9 @@ def _is_safe_url(
 
     Args:
         url: URL to validate
+        use_cached_verdict: Reuse a recent verdict for the host instead of
+            resolving it again. Only the periodic health refresh sets this;
+            registration and updates always re-resolve.
 
     Returns:
         True if the URL is safe to fetch, False otherwise
@@ -133,82 +146,182 @@ def _is_safe_url(
             logger.debug(f"SSRF protection: Trusted domain '{hostname_lower}'")
             return True
 
-        # Resolve hostname to IP addresses
-        try:
-            addr_info = socket.getaddrinfo(
-                hostname,
-                parsed.port or (443 if parsed.scheme == "https" else 80),
-                proto=socket.IPPROTO_TCP,
-            )
-        except socket.gaierror as e:
-            logger.warning(f"SSRF protection: Failed to resolve hostname '{hostname}': {e}")
-            return False
-
-        # Check all resolved IP addresses
-        for family, socktype, proto, canonname, sockaddr in addr_info:
-            ip_address = sockaddr[0]
-            if _is_private_ip(ip_address):
-                logger.warning(
-                    f"SSRF protection: Blocked URL resolving to private IP "
-                    f"'{ip_address}' for hostname '{hostname}'"
-                )
-                return False
-
-        return True
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        if use_cached_verdict:
+            return _is_safe_host_cached(hostname, port)
+        return _resolve_host_verdict(hostname, port)
 
     except Exception as e:
         logger.warning(f"SSRF protection: Error validating URL: {e}")
         return False
 
 
-async def _validate_skill_md_url(
+def _is_safe_host_cached(
+    hostname: str,
+    port: int,
+) -> bool:
+    """Check that a hostname does not resolve to a private address, with caching.
+
+    Verdicts are cached per host and port for skill_url_verdict_ttl_seconds,
+    so probing many skills on the same host resolves it once. The cache keeps
+    at most skill_url_verdict_cache_size hosts, evicting the least recently used.
+
+    Args:
+        hostname: Hostname to resolve
+        port: Port used for the lookup
+
+    Returns:
+        True if every resolved address is public, False otherwise
+    """
+    key = (hostname.lower(), port)
+    now = time.monotonic()
+    cached = _host_verdicts.get(key)
+    if cached is not None and cached[1] > now:
+        _host_verdicts.move_to_end(key)
+        return cached[0]
+
+    verdict = _resolve_host_verdict(hostname, port)
+    _host_verdicts[key] = (verdict, now + settings.skill_url_verdict_ttl_seconds)
+    _host_verdicts.move_to_end(key)
+    while len(_host_verdicts) > settings.skill_url_verdict_cache_size:
+        _host_verdicts.popitem(last=False)
+    return verdict
+
+
+def _resolve_host_verdict(
+    hostname: str,
+    port: int,
+) -> bool:
+    """Resolve a hostname and check every address it resolves to."""
+    try:
+        addr_info = socket.getaddrinfo(hostname, port, proto=socket.IPPROTO_TCP)
+    except socket.gaierror as e:
+        logger.warning(f"SSRF protection: Failed to resolve hostname '{hostname}': {e}")
+        return False
+
+    # Check all resolved IP addresses
+    for family, socktype, proto, canonname, sockaddr in addr_info:
+        ip_address = sockaddr[0]
+        if _is_private_ip(ip_address):
+            logger.warning(
+                f"SSRF protection: Blocked URL resolving to private IP "
+                f"'{ip_address}' for hostname '{hostname}'"
+            )
+            return False
+
+    return True
+
+
+async def _fetch_skill_md(
     url: str,
+    fetch_url: str,
 ) -> dict[str, Any]:
-    """Validate SKILL.md URL is accessible and get content hash.
+    """Fetch SKILL.md through the content cache in the skill repository.
+
+    Entries fetched within skill_md_cache_ttl_seconds are returned without a
+    request. Older entries are revalidated with their ETag/Last-Modified, so
+    an unchanged file costs a 304, and metadata is only re-extracted when
+    the content hash changes.
 
     Args:
-        url: URL to SKILL.md file
+        url: URL reported in errors (as provided by the user)
+        fetch_url: URL actually fetched
 
     Returns:
-        Dict with validation result and content hash
+        Cache entry with content, content_hash, etag, last_modified,
+        metadata (extracted name, description, version, tags) and fetched_at
 
     Raises:
         SkillUrlValidationError: If URL is not accessible or fails SSRF check
     """
+    repo = get_skill_repository()
+    try:
+        cached = await repo.get_cached_content(fetch_url)
+    except Exception as e:
+        logger.warning(f"SKILL.md cache lookup failed for {fetch_url}: {e}")
+        cached = None
+
+    now = time.time()
+    if cached and now - cached["fetched_at"] < settings.skill_md_cache_ttl_seconds:
+        return cached
+
     # SSRF protection: validate URL before making request
-    if not _is_safe_url(url):
+    if not _is_safe_url(fetch_url):
         raise SkillUrlValidationError(
             url, "URL failed SSRF validation - private/internal addresses are not allowed"
         )
 
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                str(url), follow_redirects=True, timeout=URL_VALIDATION_TIMEOUT
-            )
+        client = get_http_client(CLIENT_BACKEND)
+        response = await client.get(
+            fetch_url, headers=headers, follow_redirects=True, timeout=URL_VALIDATION_TIMEOUT
+        )
+    except httpx.RequestError as e:
+        raise SkillUrlValidationError(url, str(e)) from e
 
-            # SSRF protection: validate final URL after redirects
-            final_url = str(response.url)
-            if final_url != str(url) and not _is_safe_url(final_url):
-                logger.warning(
-                    f"SSRF protection: Blocked redirect from {url} to unsafe URL {final_url}"
-                )
-                raise SkillUrlValidationError(url, f"Redirect to unsafe URL blocked: {final_url}")
+    # SSRF protection: validate final URL after redirects
+    final_url = str(response.url)
+    if final_url != fetch_url and not _is_safe_url(final_url):
+        logger.warning(
+            f"SSRF protection: Blocked redirect from {fetch_url} to unsafe URL {final_url}"
+        )
+        raise SkillUrlValidationError(url, f"Redirect to unsafe URL blocked: {final_url}")
+
+    if response.status_code == 304 and cached:
+        entry = {**cached, "fetched_at": now}
+    elif response.status_code >= 400:
+        raise SkillUrlValidationError(url, f"HTTP {response.status_code}")
+    else:
+        content_hash = hashlib.sha256(response.content).hexdigest()[:16]
+        if cached and cached["content_hash"] == content_hash:
+            metadata = cached["metadata"]
+        else:
+            metadata = _extract_skill_md_metadata(response.text)
+        entry = {
+            "url": fetch_url,
+            "content": response.text,
+            "content_hash": content_hash,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "metadata": metadata,
+            "fetched_at": now,
+        }
 
-            if response.status_code >= 400:
-                raise SkillUrlValidationError(url, f"HTTP {response.status_code}")
+    try:
+        await repo.put_cached_content(entry)
+    except Exception as e:
+        logger.warning(f"Failed to cache SKILL.md for {fetch_url}: {e}")
+    return entry
 
-            # Generate content hash for versioning
-            content_hash = hashlib.sha256(response.content).hexdigest()[:16]
 
-            return {
-                "valid": True,
-                "content_version": content_hash,
-                "content_updated_at": datetime.now(UTC),
-            }
+async def _validate_skill_md_url(
+    url: str,
+) -> dict[str, Any]:
+    """Validate SKILL.md URL is accessible and get content hash.
 
-    except httpx.RequestError as e:
-        raise SkillUrlValidationError(url, str(e)) from e
+    Args:
+        url: URL to SKILL.md file
+
+    Returns:
+        Dict with validation result and content hash
+
+    Raises:
+        SkillUrlValidationError: If URL is not accessible or fails SSRF check
+    """
+    entry = await _fetch_skill_md(str(url), str(url))
+
+    return {
+        "valid": True,
+        "content_version": entry["content_hash"],
+        "content_updated_at": datetime.now(UTC),
+    }
 
 
 async def _parse_skill_md_content(
@@ -235,8 +348,6 @@ async def _parse_skill_md_content(
     Raises:
         SkillUrlValidationError: If URL is not accessible
     """
-    import re
-
     # Translate URL to get both user-provided and raw URL
     user_url, raw_url = translate_skill_url(url)
 
@@ -248,155 +359,147 @@ async def _parse_skill_md_content(
     if parsed_raw.scheme not in {"http", "https"} or not parsed_raw.hostname:
         raise SkillUrlValidationError(url, "URL must use http/https scheme and include a hostname")
 
-    # SSRF protection - check the raw URL we'll actually fetch
-    if not _is_safe_url(raw_url_str):
-        raise SkillUrlValidationError(
-            url, "URL failed SSRF validation - private/internal addresses are not allowed"
-        )
+    entry = await _fetch_skill_md(url, raw_url_str)
+    result: dict[str, Any] = {
+        **entry["metadata"],
+        "content_version": entry["content_hash"],
+        "skill_md_url": user_url,
+        "skill_md_raw_url": raw_url,
+    }
 
-    try:
-        async with httpx.AsyncClient() as client:
-            # Fetch from raw URL
-            response = await client.get(
-                raw_url_str, follow_redirects=True, timeout=URL_VALIDATION_TIMEOUT
-            )
+    logger.info(
+        f"Parsed SKILL.md from {user_url} (raw: {raw_url}): "
+        f"name={result.get('name')}, has_description={bool(result.get('description'))}"
+    )
+    return result
 
-            # SSRF protection: validate final URL after redirects
-            final_url = str(response.url)
-            if final_url != str(raw_url) and not _is_safe_url(final_url):
-                logger.warning(
-                    f"SSRF protection: Blocked redirect from {raw_url} to unsafe URL {final_url}"
-                )
-                raise SkillUrlValidationError(url, f"Redirect to unsafe URL blocked: {final_url}")
-
-            if response.status_code >= 400:
-                raise SkillUrlValidationError(url, f"HTTP {response.status_code}")
-
-            content = response.text
-            result: dict[str, Any] = {
-                "name": None,
-                "description": None,
-                "version": None,
-                "tags": [],
-                "content_version": hashlib.sha256(response.content).hexdigest()[:16],
-                "skill_md_url": user_url,
-                "skill_md_raw_url": raw_url,
-            }
 
-            # Try to parse YAML frontmatter from multiple formats:
-            # 1. Standard: --- at start of file
-            # 2. Code block with ---: ```yaml\n---\n...\n---\n```
-            # 3. Code block without ---: ```yaml\n...\n```
-            frontmatter = None
-            frontmatter_end_pos = 0
-
-            # Format 1: Standard frontmatter at start of file
-            frontmatter_match = re.match(r"^---\s*\n(.*?)\n---\s*\n", content, re.DOTALL)
-            if frontmatter_match:
-                frontmatter = frontmatter_match.group(1)
-                frontmatter_end_pos = frontmatter_match.end()
-            else:
-                # Format 2: YAML code block with --- markers inside
-                # Matches: ```yaml\n---\nkey: value\n---\n```
-                codeblock_with_markers = re.search(
-                    r"```ya?ml\s*\n---\s*\n(.*?)\n---\s*\n```",
-                    content,
-                    re.DOTALL | re.IGNORECASE,
-                )
-                if codeblock_with_markers:
-                    frontmatter = codeblock_with_markers.group(1)
-                    frontmatter_end_pos = codeblock_with_markers.end()
-                else:
-                    # Format 3: YAML code block without --- markers
-                    # Matches: ```yaml\nkey: value\n```
-                    codeblock_no_markers = re.search(
-                        r"```ya?ml\s*\n(.*?)\n```",
-                        content,
-                        re.DOTALL | re.IGNORECASE,
-                    )
-                    if codeblock_no_markers:
-                        frontmatter = codeblock_no_markers.group(1)
-                        frontmatter_end_pos = codeblock_no_markers.end()
-
-            if frontmatter:
-                # Parse simple YAML key: value pairs
-                for line in frontmatter.split("\n"):
-                    if ":" in line:
-                        key, value = line.split(":", 1)
-                        key = key.strip().lower()
-                        value = value.strip().strip('"').strip("'")
-                        if key == "name":
-                            result["name"] = value
-                        elif key == "description":
-                            result["description"] = value
-                        elif key == "version":
-                            result["version"] = value
-                        elif key == "tags":
-                            # Handle comma-separated or YAML list
-                            if value.startswith("["):
-                                value = value.strip("[]")
-                            result["tags"] = [
-                                t.strip().strip('"').strip("'")
-                                for t in value.split(",")
-                                if t.strip()
-                            ]
-
-                # Remove frontmatter from content for further parsing
-                content = content[frontmatter_end_pos:]
-
-            # Extract name from first H1 heading if not in frontmatter
-            if not result["name"]:
-                h1_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-                if h1_match:
-                    result["name"] = h1_match.group(1).strip()
-
-            # Extract description from first paragraph if not in frontmatter
-            if not result["description"]:
-                # Skip headings and find first non-empty paragraph
-                lines = content.split("\n")
-                paragraph_lines = []
-                in_paragraph = False
-
-                for line in lines:
-                    stripped = line.strip()
-                    # Skip headings and empty lines at start
-                    if stripped.startswith("#"):
-                        if in_paragraph:
-                            break
-                        continue
-                    if not stripped:
-                        if in_paragraph:
-                            break
-                        continue
-                    # Skip code blocks
-                    if stripped.startswith("```"):
-                        if in_paragraph:
-                            break
-                        continue
-
-                    in_paragraph = True
-                    paragraph_lines.append(stripped)
-
-                if paragraph_lines:
-                    result["description"] = " ".join(paragraph_lines)[:500]
-
-            # Convert name to slug format if found
-            if result["name"]:
-                # Convert "My Skill Name" to "my-skill-name"
-                name_slug = result["name"].lower()
-                name_slug = re.sub(r"[^a-z0-9]+", "-", name_slug)
-                name_slug = re.sub(r"-+", "-", name_slug)
-                name_slug = name_slug.strip("-")
-                result["name_slug"] = name_slug
-
-            logger.info(
-                f"Parsed SKILL.md from {user_url} (raw: {raw_url}): "
-                f"name={result.get('name')}, has_description={bool(result.get('description'))}"
-            )
-            return result
+def _extract_skill_md_metadata(
+    content: str,
+) -> dict[str, Any]:
+    """Extract name, description, version and tags from SKILL.md text.
 
-    except httpx.RequestError as e:
-        raise SkillUrlValidationError(url, str(e)) from e
+    Args:
+        content: SKILL.md content
+
+    Returns:
+        Dict with name, description, version, tags and, when a name was
+        found, name_slug
+    """
+    import re
+
+    result: dict[str, Any] = {
+        "name": None,
+        "description": None,
+        "version": None,
+        "tags": [],
+    }
+
+    # Try to parse YAML frontmatter from multiple formats:
+    # 1. Standard: --- at start of file
+    # 2. Code block with ---: ```yaml\n---\n...\n---\n```
+    # 3. Code block without ---: ```yaml\n...\n```
+    frontmatter = None
+    frontmatter_end_pos = 0
+
+    # Format 1: Standard frontmatter at start of file
+    frontmatter_match = re.match(r"^---\s*\n(.*?)\n---\s*\n", content, re.DOTALL)
+    if frontmatter_match:
+        frontmatter = frontmatter_match.group(1)
+        frontmatter_end_pos = frontmatter_match.end()
+    else:
+        # Format 2: YAML code block with --- markers inside
+        # Matches: ```yaml\n---\nkey: value\n---\n```
+        codeblock_with_markers = re.search(
+            r"```ya?ml\s*\n---\s*\n(.*?)\n---\s*\n```",
+            content,
+            re.DOTALL | re.IGNORECASE,
+        )
+        if codeblock_with_markers:
+            frontmatter = codeblock_with_markers.group(1)
+            frontmatter_end_pos = codeblock_with_markers.end()
+        else:
+            # Format 3: YAML code block without --- markers
+            # Matches: ```yaml\nkey: value\n```
+            codeblock_no_markers = re.search(
+                r"```ya?ml\s*\n(.*?)\n```",
+                content,
+                re.DOTALL | re.IGNORECASE,
+            )
+            if codeblock_no_markers:
+                frontmatter = codeblock_no_markers.group(1)
+                frontmatter_end_pos = codeblock_no_markers.end()
+
+    if frontmatter:
+        # Parse simple YAML key: value pairs
+        for line in frontmatter.split("\n"):
+            if ":" in line:
+                key, value = line.split(":", 1)
+                key = key.strip().lower()
+                value = value.strip().strip('"').strip("'")
+                if key == "name":
+                    result["name"] = value
+                elif key == "description":
+                    result["description"] = value
+                elif key == "version":
+                    result["version"] = value
+                elif key == "tags":
+                    # Handle comma-separated or YAML list
+                    if value.startswith("["):
+                        value = value.strip("[]")
+                    result["tags"] = [
+                        t.strip().strip('"').strip("'") for t in value.split(",") if t.strip()
+                    ]
+
+        # Remove frontmatter from content for further parsing
+        content = content[frontmatter_end_pos:]
+
+    # Extract name from first H1 heading if not in frontmatter
+    if not result["name"]:
+        h1_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+        if h1_match:
+            result["name"] = h1_match.group(1).strip()
+
+    # Extract description from first paragraph if not in frontmatter
+    if not result["description"]:
+        # Skip headings and find first non-empty paragraph
+        lines = content.split("\n")
+        paragraph_lines = []
+        in_paragraph = False
+
+        for line in lines:
+            stripped = line.strip()
+            # Skip headings and empty lines at start
+            if stripped.startswith("#"):
+                if in_paragraph:
+                    break
+                continue
+            if not stripped:
+                if in_paragraph:
+                    break
+                continue
+            # Skip code blocks
+            if stripped.startswith("```"):
+                if in_paragraph:
+                    break
+                continue
+
+            in_paragraph = True
+            paragraph_lines.append(stripped)
+
+        if paragraph_lines:
+            result["description"] = " ".join(paragraph_lines)[:500]
+
+    # Convert name to slug format if found
+    if result["name"]:
+        # Convert "My Skill Name" to "my-skill-name"
+        name_slug = result["name"].lower()
+        name_slug = re.sub(r"[^a-z0-9]+", "-", name_slug)
+        name_slug = re.sub(r"-+", "-", name_slug)
+        name_slug = name_slug.strip("-")
+        result["name_slug"] = name_slug
+
+    return result
 
 
 async def _check_skill_health(
@@ -410,8 +513,6 @@ async def _check_skill_health(
     Returns:
         Dict with health status
     """
-    import time
-
     start_time = time.perf_counter()
 
     # SSRF protection
@@ -424,34 +525,34 @@ async def _check_skill_health(
         }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.head(
-                str(url), follow_redirects=True, timeout=URL_VALIDATION_TIMEOUT
-            )
-
-            # SSRF protection: validate final URL after redirects
-            final_url = str(response.url)
-            if final_url != str(url) and not _is_safe_url(final_url):
-                logger.warning(
-                    f"SSRF protection: Blocked redirect from {url} to unsafe URL {final_url}"
-                )
-                response_time_ms = (time.perf_counter() - start_time) * 1000
-                return {
-                    "healthy": False,
-                    "status_code": None,
-                    "error": f"Redirect to unsafe URL blocked: {final_url}",
-                    "response_time_ms": round(response_time_ms, 2),
-                }
+        client = get_http_client(CLIENT_BACKEND)
+        response = await client.head(
+            str(url), follow_redirects=True, timeout=URL_VALIDATION_TIMEOUT
+        )
 
+        # SSRF protection: validate final URL after redirects
+        final_url = str(response.url)
+        if final_url != str(url) and not _is_safe_url(final_url):
+            logger.warning(
+                f"SSRF protection: Blocked redirect from {url} to unsafe URL {final_url}"
+            )
             response_time_ms = (time.perf_counter() - start_time) * 1000
-
             return {
-                "healthy": response.status_code < 400,
-                "status_code": response.status_code,
-                "error": None if response.status_code < 400 else f"HTTP {response.status_code}",
+                "healthy": False,
+                "status_code": None,
+                "error": f"Redirect to unsafe URL blocked: {final_url}",
                 "response_time_ms": round(response_time_ms, 2),
             }
 
+        response_time_ms = (time.perf_counter() - start_time) * 1000
+
+        return {
+            "healthy": response.status_code < 400,
+            "status_code": response.status_code,
+            "error": None if response.status_code < 400 else f"HTTP {response.status_code}",
+            "response_time_ms": round(response_time_ms, 2),
+        }
+
     except httpx.RequestError as e:
         # Log detailed exception on the server, but return a generic message to the client
         logger.error("Error while checking skill health for URL %s: %s", url, e)
@@ -464,6 +565,82 @@ async def _check_skill_health(
         }
 
 
+async def _probe_skill_md(
+    url: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> dict[str, Any]:
+    """Probe a SKILL.md URL with a conditional GET.
+
+    With validators from the previous probe, an unchanged file costs a 304
+    with no body. Otherwise the body is hashed so content changes are
+    detected in the same request that checks health.
+
+    Args:
+        url: URL to SKILL.md file
+        etag: ETag returned by the previous probe
+        last_modified: Last-Modified returned by the previous probe
+
+    Returns:
+        Dict with health status, plus "content_version" (None when unchanged)
+        and the "etag" and "last_modified" validators to send next time
+    """
+    start_time = time.perf_counter()
+    result: dict[str, Any] = {
+        "healthy": False,
+        "status_code": None,
+        "error": None,
+        "response_time_ms": 0,
+        "content_version": None,
+        "etag": etag,
+        "last_modified": last_modified,
+    }
+
+    if not _is_safe_url(url, use_cached_verdict=True):
+        result["error"] = "URL failed SSRF validation"
+        return result
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    try:
+        client = get_http_client(CLIENT_BACKEND)
+        response = await client.get(
+            url, headers=headers, follow_redirects=True, timeout=URL_VALIDATION_TIMEOUT
+        )
+    except httpx.RequestError as e:
+        logger.warning(f"Skill health probe failed for {url}: {e}")
+        result["error"] = "Unexpected error during health check"
+        result["response_time_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
+        return result
+
+    result["response_time_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
+    result["status_code"] = response.status_code
+
+    final_url = str(response.url)
+    if final_url != url and not _is_safe_url(final_url, use_cached_verdict=True):
+        logger.warning(f"SSRF protection: Blocked redirect from {url} to unsafe URL {final_url}")
+        result["error"] = f"Redirect to unsafe URL blocked: {final_url}"
+        return result
+
+    if response.status_code == 304:
+        result["healthy"] = True
+        return result
+
+    if response.status_code >= 400:
+        result["error"] = f"HTTP {response.status_code}"
+        return result
+
+    result["healthy"] = True
+    result["content_version"] = hashlib.sha256(response.content).hexdigest()[:16]
+    result["etag"] = response.headers.get("ETag")
+    result["last_modified"] = response.headers.get("Last-Modified")
+    return result
+
+
 def _build_skill_card(
     request: SkillRegistrationRequest,
     path: str,
@@ -750,9 +927,20 @@ class SkillService:
         """Delete a skill."""
         normalized = normalize_skill_path(path)
         repo = self._get_repo()
+        skill = await repo.get(normalized)
         success = await repo.delete(normalized)
 
         if success:
+            # Drop the cached SKILL.md body (keyed by the fetched URL)
+            if skill:
+                urls = {str(skill.skill_md_url)}
+                if skill.skill_md_raw_url:
+                    urls.add(str(skill.skill_md_raw_url))
+                try:
+                    await repo.delete_cached_content(sorted(urls))
+                except Exception as e:
+                    logger.warning(f"Failed to drop cached SKILL.md for {normalized}: {e}")
+
             # Remove from search index
             try:
                 search_repo = self._get_search_repo()
@@ -804,6 +992,24 @@ class SkillService:
         """
         return await _parse_skill_md_content(url)
 
+    async def get_skill_md_content(
+        self,
+        url: str,
+    ) -> str:
+        """Get SKILL.md text through the content cache.
+
+        Args:
+            url: Raw URL of the SKILL.md file
+
+        Returns:
+            SKILL.md content
+
+        Raises:
+            SkillUrlValidationError: If URL is not accessible or fails SSRF check
+        """
+        entry = await _fetch_skill_md(url, url)
+        return entry["content"]
+
     async def check_skill_health(
         self,
         path: str,
@@ -850,6 +1056,71 @@ class SkillService:
 
         return result
 
+    async def refresh_all_skill_health(
+        self,
+        concurrency: int | None = None,
+    ) -> dict[str, int]:
+        """Probe every skill's SKILL.md and persist the results in one bulk write.
+
+        Probes run with bounded concurrency and send the stored ETag and
+        Last-Modified, so unchanged files cost a 304. A changed file updates
+        content_version and content_updated_at along with the health fields.
+
+        Args:
+            concurrency: Maximum concurrent probes (default from settings)
+
+        Returns:
+            Counts of checked, healthy, unhealthy and changed skills
+        """
+        repo = self._get_repo()
+        skills = await repo.list_filtered(include_disabled=True)
+        semaphore = asyncio.Semaphore(concurrency or settings.skill_health_check_concurrency)
+
+        async def _probe(skill: SkillCard) -> tuple[SkillCard, dict[str, Any]]:
+            url = str(skill.skill_md_raw_url or skill.skill_md_url)
+            async with semaphore:
+                result = await _probe_skill_md(url, skill.content_etag, skill.content_last_modified)
+            return skill, result
+
+        results = await asyncio.gather(*(_probe(skill) for skill in skills))
+
+        checked_time = datetime.now(UTC).isoformat()
+        summary = {"checked": len(results), "healthy": 0, "unhealthy": 0, "changed": 0}
+        updates: dict[str, dict[str, Any]] = {}
+        for skill, result in results:
+            health_status = "healthy" if result["healthy"] else "unhealthy"
+            summary[health_status] += 1
+            update: dict[str, Any] = {
+                "health_status": health_status,
+                "last_checked_time": checked_time,
+                "content_etag": result["etag"],
+                "content_last_modified": result["last_modified"],
+            }
+            new_version = result["content_version"]
+            if new_version and new_version != skill.content_version:
+                update["content_version"] = new_version
+                update["content_updated_at"] = checked_time
+                summary["changed"] += 1
+            updates[skill.path] = update
+
+        if updates:
+            await repo.update_many(updates, upsert=False)
+
+        logger.info(f"Refreshed skill health: {summary}")
+        return summary
+
+    async def run_health_refresh_loop(self) -> None:
+        """Refresh skill health every skill_health_check_interval_seconds until cancelled."""
+        interval = settings.skill_health_check_interval_seconds
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh_all_skill_health()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Skill health refresh failed: {e}", exc_info=True)
+
     async def update_rating(
         self,
         path: str,
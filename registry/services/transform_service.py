@@ -5,6 +5,7 @@ This bridges our internal data model with the external Anthropic API format.
 """
 
 import logging
+from collections import OrderedDict
 from typing import Any
 
 from ..constants import REGISTRY_CONSTANTS
@@ -25,6 +26,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Most servers whose transformed ServerResponse is kept (least recently used are evicted)
+SERVER_RESPONSE_CACHE_MAX_ENTRIES = 4096
+
+# path -> (generation, ServerResponse); see _server_generation()
+_server_responses: OrderedDict[str, tuple[tuple, ServerResponse]] = OrderedDict()
+
+
 def _create_transport_config(server_info: dict[str, Any]) -> dict[str, Any]:
     """
     Create transport configuration from internal server info.
@@ -188,6 +196,106 @@ def transform_to_server_response(
     return ServerResponse(server=server_detail, meta=registry_meta)
 
 
+def _server_generation(server_info: dict[str, Any]) -> tuple:
+    """
+    Identify one version of a server's ServerResponse.
+
+    Covers every field transform_to_server_response() reads, so any
+    update, toggle or health change yields a new generation. Keep it in
+    sync when the transformation reads new fields.
+
+    Args:
+        server_info: Internal server data
+
+    Returns:
+        Hashable generation key
+    """
+    return (
+        server_info.get("server_name"),
+        server_info.get("description", ""),
+        server_info.get("proxy_pass_url", ""),
+        _determine_version(server_info),
+        server_info.get("is_enabled", False),
+        server_info.get("health_status", "unknown"),
+        server_info.get("last_checked_iso"),
+        server_info.get("num_tools", 0),
+        tuple(server_info.get("tags", [])),
+        server_info.get("license", "N/A"),
+    )
+
+
+def get_cached_server_response(server_info: dict[str, Any]) -> ServerResponse:
+    """
+    Get the ServerResponse of a server, transforming it only when its generation changed.
+
+    Args:
+        server_info: Internal server data with health and enabled state
+
+    Returns:
+        ServerResponse object (shared; callers must not modify it)
+    """
+    path = server_info.get("path", "")
+    generation = _server_generation(server_info)
+
+    cached = _server_responses.get(path)
+    if cached is not None and cached[0] == generation:
+        _server_responses.move_to_end(path)
+        return cached[1]
+
+    response = transform_to_server_response(server_info, include_registry_meta=True)
+    _server_responses[path] = (generation, response)
+    _server_responses.move_to_end(path)
+    while len(_server_responses) > SERVER_RESPONSE_CACHE_MAX_ENTRIES:
+        _server_responses.popitem(last=False)
+    return response
+
+
+def cursor_to_name_key(cursor: str | None) -> str | None:
+    """
+    Map a pagination cursor (a server name) to the repository sort key.
+
+    Args:
+        cursor: Server name returned as nextCursor by a previous page
+
+    Returns:
+        server_name_key() to list after, or None to start from the beginning
+        (also for cursors that are not names in our namespace)
+    """
+    prefix = f"{REGISTRY_CONSTANTS.ANTHROPIC_SERVER_NAMESPACE}/"
+    if not cursor or not cursor.startswith(prefix):
+        return None
+    return cursor[len(prefix) :]
+
+
+def transform_to_server_page(
+    page_servers: list[dict[str, Any]],
+    limit: int,
+) -> ServerList:
+    """
+    Transform one keyset page of servers to Anthropic ServerList format.
+
+    Args:
+        page_servers: Up to limit + 1 servers in name order; an extra server
+            means another page follows
+        limit: Page size
+
+    Returns:
+        ServerList object with pagination metadata
+    """
+    has_more = len(page_servers) > limit
+    page_servers = page_servers[:limit]
+
+    server_responses = [get_cached_server_response(server) for server in page_servers]
+
+    next_cursor = None
+    if has_more and page_servers:
+        next_cursor = _create_server_name(page_servers[-1])
+
+    metadata = PaginationMetadata(nextCursor=next_cursor, count=len(server_responses))
+
+    return ServerList(servers=server_responses, metadata=metadata)
+
+
 def transform_to_server_list(
     servers_data: list[dict[str, Any]],
     cursor: str | None = None,
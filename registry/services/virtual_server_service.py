@@ -8,11 +8,13 @@ regeneration for virtual servers that aggregate tools from multiple backends.
 import asyncio
 import logging
 import re
+import time
 from datetime import UTC, datetime
 from typing import (
     Optional,
 )
 
+from ..core.config import settings
 from ..exceptions import (
     VirtualServerNotFoundError,
     VirtualServerValidationError,
@@ -54,6 +56,125 @@ _virtual_server_service: Optional["VirtualServerService"] = None
 # Lock to serialize nginx config regeneration across concurrent mutations
 _nginx_reload_lock = asyncio.Lock()
 
+# Name-indexed tool lists per backend server document ("path", or
+# "path:version" for pinned versions): (loaded_at, {tool_name: tool})
+_backend_tools: dict[str, tuple[float, dict[str, dict]]] = {}
+
+# Resolved tool lists per virtual server path: (resolved_at, tools)
+_resolved_tools: dict[str, tuple[float, list[ResolvedTool]]] = {}
+
+# Bumped on every invalidation so a load that raced with a backend update
+# does not store the tool list it read before the update
+_backend_tools_generation = 0
+
+
+def invalidate_backend_tools(
+    server_path: str | None = None,
+) -> None:
+    """Drop cached tool indexes after a backend server changed.
+
+    Resolved virtual server tool lists are dropped as well, since any of
+    them may reference the backend.
+
+    Args:
+        server_path: Backend path whose document and versions changed,
+            or None to drop every backend
+    """
+    global _backend_tools_generation
+    _backend_tools_generation += 1
+    _resolved_tools.clear()
+    if server_path is None:
+        _backend_tools.clear()
+    else:
+        stale = [
+            key for key in _backend_tools if key == server_path or key.startswith(f"{server_path}:")
+        ]
+        for key in stale:
+            del _backend_tools[key]
+
+
+def _invalidate_resolved_tools(
+    path: str,
+) -> None:
+    """Drop the resolved tool list of a virtual server after it changed."""
+    global _backend_tools_generation
+    _backend_tools_generation += 1
+    _resolved_tools.pop(path, None)
+
+
+def _is_fresh(
+    cached_at: float,
+) -> bool:
+    """True while a cache entry is within virtual_server_tools_cache_ttl.
+
+    Writes made through this process invalidate entries right away; the
+    TTL bounds how long writes by other registry instances go unnoticed.
+    """
+    return time.monotonic() - cached_at < settings.virtual_server_tools_cache_ttl
+
+
+def _index_tools_by_name(
+    tool_list: list[dict] | None,
+) -> dict[str, dict]:
+    """Index a backend tool list by name, keeping the first tool of each name."""
+    index: dict[str, dict] = {}
+    for tool in tool_list or []:
+        name = tool.get("name")
+        if name:
+            index.setdefault(name, tool)
+    return index
+
+
+async def load_backend_tools(
+    server_repo: ServerRepositoryBase,
+    server_ids: list[str],
+) -> dict[str, dict[str, dict]]:
+    """Get name-indexed tool maps for backend server documents.
+
+    Each document is read at most once, concurrently, and kept until
+    invalidate_backend_tools() is called for its server or its entry is
+    older than virtual_server_tools_cache_ttl.
+
+    Args:
+        server_repo: Repository to read uncached server documents from
+        server_ids: Server paths, or "path:version" ids for pinned versions
+
+    Returns:
+        Mapping of server id to {tool_name: tool}. Servers that do not
+        exist are omitted.
+    """
+    wanted = list(dict.fromkeys(server_ids))
+    found = {}
+    for server_id in wanted:
+        entry = _backend_tools.get(server_id)
+        if entry is not None and _is_fresh(entry[0]):
+            found[server_id] = entry[1]
+    missing = [server_id for server_id in wanted if server_id not in found]
+    if missing:
+        generation = _backend_tools_generation
+        loaded_at = time.monotonic()
+        docs = await asyncio.gather(*(server_repo.get(server_id) for server_id in missing))
+        loaded = {
+            server_id: _index_tools_by_name(doc.get("tool_list"))
+            for server_id, doc in zip(missing, docs, strict=True)
+            if doc
+        }
+        if generation == _backend_tools_generation:
+            _backend_tools.update(
+                {server_id: (loaded_at, tools) for server_id, tools in loaded.items()}
+            )
+        found.update(loaded)
+    return found
+
+
+def _backend_document_id(
+    mapping: ToolMapping,
+) -> str:
+    """Server document a tool mapping reads its metadata from."""
+    if mapping.backend_version:
+        return f"{mapping.backend_server_path}:{mapping.backend_version}"
+    return mapping.backend_server_path
+
 
 def _generate_path_from_name(
     name: str,
@@ -173,6 +294,7 @@ class VirtualServerService:
         )
 
         result = await self._repo.create(config)
+        _invalidate_resolved_tools(config.path)
         logger.info(
             f"Created virtual server '{config.server_name}' at {config.path} "
             f"with {len(config.tool_mappings)} tools"
@@ -215,6 +337,7 @@ class VirtualServerService:
         result = await self._repo.update(path, updates)
 
         if result:
+            _invalidate_resolved_tools(path)
             await self._trigger_nginx_reload()
             await self._index_for_search(result)
             logger.info(f"Updated virtual server: {path}")
@@ -243,6 +366,7 @@ class VirtualServerService:
         success = await self._repo.delete(path)
 
         if success:
+            _invalidate_resolved_tools(path)
             await self._trigger_nginx_reload()
             await self._remove_from_search(path)
             logger.info(f"Deleted virtual server: {path}")
@@ -299,17 +423,29 @@ class VirtualServerService:
         Fetches tool metadata from backend servers and applies
         aliases, version pins, and scope overrides.
 
+        The result is kept until the virtual server or one of its
+        backends changes, or for virtual_server_tools_cache_ttl at most.
+
         Args:
             path: Virtual server path
 
         Returns:
             List of resolved tools with full metadata
         """
+        cached = _resolved_tools.get(path)
+        if cached is not None and _is_fresh(cached[0]):
+            return list(cached[1])
+
+        generation = _backend_tools_generation
+        resolved_at = time.monotonic()
         config = await self._repo.get(path)
         if not config:
             raise VirtualServerNotFoundError(path)
 
-        return await self._resolve_tool_list(config)
+        resolved = await self._resolve_tool_list(config)
+        if generation == _backend_tools_generation:
+            _resolved_tools[path] = (resolved_at, resolved)
+        return list(resolved)
 
     async def rate_virtual_server(
         self,
@@ -395,31 +531,30 @@ class VirtualServerService:
         """
         errors = []
 
+        backend_ids = [tm.backend_server_path for tm in tool_mappings]
+        backend_ids += [_backend_document_id(tm) for tm in tool_mappings if tm.backend_version]
+        backend_tools = await load_backend_tools(self._server_repo, backend_ids)
+
         for mapping in tool_mappings:
             # Check backend server exists
             server_path = mapping.backend_server_path
-            server_info = await self._server_repo.get(server_path)
+            tools_by_name = backend_tools.get(server_path)
 
-            if not server_info:
+            if tools_by_name is None:
                 errors.append(f"Backend server '{server_path}' does not exist")
                 continue
 
             # Check tool exists in backend
-            tool_list = server_info.get("tool_list", [])
-            tool_names = [t.get("name", "") for t in tool_list]
-
-            if mapping.tool_name not in tool_names:
+            if mapping.tool_name not in tools_by_name:
                 errors.append(
                     f"Tool '{mapping.tool_name}' not found in backend "
                     f"server '{server_path}'. Available tools: "
-                    f"{', '.join(tool_names[:10])}"
+                    f"{', '.join(list(tools_by_name)[:10])}"
                 )
 
             # Check version exists if pinned
             if mapping.backend_version:
-                version_id = f"{server_path}:{mapping.backend_version}"
-                version_info = await self._server_repo.get(version_id)
-                if not version_info:
+                if _backend_document_id(mapping) not in backend_tools:
                     errors.append(
                         f"Version '{mapping.backend_version}' not found "
                         f"for backend server '{server_path}'"
@@ -481,33 +616,25 @@ class VirtualServerService:
         for override in config.tool_scope_overrides:
             scope_overrides[override.tool_alias] = override.required_scopes
 
+        # Each backend document is read once; version pins read their version document
+        backend_tools = await load_backend_tools(
+            self._server_repo, [_backend_document_id(tm) for tm in config.tool_mappings]
+        )
+
         for mapping in config.tool_mappings:
             effective_name = _get_effective_tool_name(mapping)
 
             # Get tool metadata from backend
             server_path = mapping.backend_server_path
+            tools_by_name = backend_tools.get(_backend_document_id(mapping))
 
-            # If version is pinned, look up version-specific server doc
-            if mapping.backend_version:
-                version_id = f"{server_path}:{mapping.backend_version}"
-                server_info = await self._server_repo.get(version_id)
-            else:
-                server_info = await self._server_repo.get(server_path)
-
-            if not server_info:
+            if tools_by_name is None:
                 logger.warning(
                     f"Backend server '{server_path}' not found, skipping tool '{mapping.tool_name}'"
                 )
                 continue
 
-            # Find tool in backend's tool list
-            tool_list = server_info.get("tool_list", [])
-            tool_meta = None
-            for tool in tool_list:
-                if tool.get("name") == mapping.tool_name:
-                    tool_meta = tool
-                    break
-
+            tool_meta = tools_by_name.get(mapping.tool_name)
             if not tool_meta:
                 logger.warning(
                     f"Tool '{mapping.tool_name}' not found in backend '{server_path}', skipping"
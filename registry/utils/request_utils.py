@@ -1,13 +1,19 @@
 """
 Shared request utilities for extracting client information.
 
-Provides validated, safe extraction of client IP from proxied requests.
+Provides validated, safe extraction of client IP from proxied requests
+and helpers for ETag-based conditional responses.
 """
 
+import hashlib
 import ipaddress
+import json
 import logging
+from typing import Any
 
-from fastapi import Request
+from fastapi import Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
 
 logger = logging.getLogger(__name__)
 
@@ -38,3 +44,72 @@ def get_client_ip(request: Request) -> str:
         return request.client.host
 
     return "unknown"
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Compute a strong ETag for a response body.
+
+    Args:
+        body: Serialized response body
+
+    Returns:
+        Quoted ETag value suitable for the ETag header
+    """
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(
+    request: Request,
+    etag: str,
+) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an ETag.
+
+    Handles comma-separated lists, weak validators and the "*" wildcard.
+
+    Args:
+        request: FastAPI Request object
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client already has the current representation
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+def conditional_json_response(
+    request: Request,
+    payload: Any,
+) -> Response:
+    """
+    Serialize a JSON payload once and answer with 304 if the client has it.
+
+    Clients polling a listing (e.g. mcpgw) revalidate with If-None-Match and
+    skip downloading and re-parsing an unchanged payload.
+
+    Args:
+        request: FastAPI Request object
+        payload: JSON-encodable response payload
+
+    Returns:
+        200 JSON response with an ETag, or an empty 304 response
+    """
+    body = json.dumps(jsonable_encoder(payload)).encode("utf-8")
+    etag = compute_etag(body)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
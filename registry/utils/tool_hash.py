@@ -0,0 +1,26 @@
+"""Stable hashing of MCP server tool lists.
+
+Kept free of registry settings and services so that CLI scripts can import
+it without loading the registry application.
+"""
+
+import hashlib
+import json
+
+
+def compute_tool_list_hash(
+    tool_list: list | None,
+) -> str | None:
+    """
+    Compute a stable hash of a server's tool list.
+
+    Args:
+        tool_list: List of tool definitions as stored on the server document
+
+    Returns:
+        Hex digest of the canonical JSON form, or None if no tools are known
+    """
+    if not tool_list:
+        return None
+    canonical = json.dumps(tool_list, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
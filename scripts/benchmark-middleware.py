@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-request middleware overhead on /validate and /api/servers.
+
+Runs the same trivial endpoints through three stacks, in process via the
+httpx ASGI transport so no network or server process is involved:
+
+- bare: no middleware
+- asgi: the registry's pure ASGI middlewares (audit, registry metrics,
+  mode filter, auth metrics) sharing one request context
+- base-http: the same number of BaseHTTPMiddleware pass-through layers,
+  i.e. the minimum cost of the previous design
+
+Audit events are discarded and no metrics API key is set, so the numbers
+reflect middleware plumbing rather than logging or metrics I/O.
+
+Usage:
+    uv run python scripts/benchmark-middleware.py
+    uv run python scripts/benchmark-middleware.py --requests 5000 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Metrics emitters stay disabled without an API key
+os.environ.pop("METRICS_API_KEY", None)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Response  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from auth_server.metrics_middleware import AuthMetricsMiddleware  # noqa: E402
+from registry.audit import AuditLogger, AuditMiddleware  # noqa: E402
+from registry.metrics.middleware import RegistryMetricsMiddleware  # noqa: E402
+from registry.middleware import RegistryModeMiddleware  # noqa: E402
+
+# Configure logging with basicConfig
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+BENCHMARK_PATHS = ["/validate", "/api/servers"]
+SERVERS_PAYLOAD = {"servers": [{"path": f"/server-{i}", "name": f"server-{i}"} for i in range(20)]}
+
+
+class _PassThroughMiddleware(BaseHTTPMiddleware):
+    """BaseHTTPMiddleware layer that only forwards the request."""
+
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+def _create_app() -> FastAPI:
+    """Create an app with trivial /validate and /api/servers endpoints."""
+    app = FastAPI()
+
+    @app.get("/validate")
+    async def validate():
+        return Response(
+            status_code=200,
+            headers={"X-Username": "bench-user", "X-Auth-Method": "keycloak"},
+        )
+
+    @app.get("/api/servers")
+    async def list_servers():
+        return SERVERS_PAYLOAD
+
+    return app
+
+
+async def _discard_audit_event(record) -> None:
+    """Drop audit records so file I/O does not skew the measurement."""
+
+
+def _build_stacks() -> dict[str, FastAPI]:
+    """Build the app variants to compare."""
+    bare = _create_app()
+
+    asgi = _create_app()
+    audit_logger = AuditLogger(log_dir=tempfile.mkdtemp(prefix="bench-audit-"))
+    audit_logger.log_event = _discard_audit_event
+    # add_middleware prepends, so the audit middleware ends up outermost
+    asgi.add_middleware(AuthMetricsMiddleware)
+    asgi.add_middleware(RegistryModeMiddleware)
+    asgi.add_middleware(RegistryMetricsMiddleware)
+    asgi.add_middleware(AuditMiddleware, audit_logger=audit_logger)
+
+    base_http = _create_app()
+    for _ in range(4):
+        base_http.add_middleware(_PassThroughMiddleware)
+
+    return {"bare": bare, "asgi": asgi, "base-http": base_http}
+
+
+async def _run(
+    app: FastAPI,
+    path: str,
+    requests: int,
+    concurrency: int,
+) -> list[float]:
+    """Send requests to one path and return per-request latencies in microseconds."""
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def _one() -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(path, headers={"Authorization": "Bearer x"})
+                latencies.append((time.perf_counter() - start) * 1_000_000)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{path} returned {response.status_code}")
+
+        # Warm up routing and lazily created objects
+        for _ in range(min(100, requests)):
+            await _one()
+        latencies.clear()
+
+        await asyncio.gather(*(_one() for _ in range(requests)))
+
+    return latencies
+
+
+async def _main(
+    requests: int,
+    concurrency: int,
+) -> None:
+    """Run every stack against every path and print a summary table."""
+    stacks = _build_stacks()
+
+    print(f"{'path':<14} {'stack':<10} {'mean us':>9} {'p50 us':>9} {'p99 us':>9} {'req/s':>9}")
+    for path in BENCHMARK_PATHS:
+        for name, app in stacks.items():
+            start = time.perf_counter()
+            latencies = await _run(app, path, requests, concurrency)
+            elapsed = time.perf_counter() - start
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(
+                f"{path:<14} {name:<10} {statistics.mean(latencies):>9.0f} "
+                f"{statistics.median(latencies):>9.0f} {p99:>9.0f} {requests / elapsed:>9.0f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark registry middleware overhead")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per path and stack")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent requests")
+    args = parser.parse_args()
+
+    asyncio.run(_main(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
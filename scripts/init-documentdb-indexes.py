@@ -53,6 +53,8 @@ COLLECTION_EMBEDDINGS = "mcp_embeddings_1536"
 COLLECTION_SECURITY_SCANS = "mcp_security_scans"
 COLLECTION_FEDERATION_CONFIG = "mcp_federation_config"
 COLLECTION_AUDIT_EVENTS = "audit_events"
+COLLECTION_AUDIT_ROLLUPS = "audit_rollups"
+COLLECTION_SKILL_MD_CACHE = "skill_md_cache"
 
 
 async def _get_documentdb_connection_string(
@@ -268,6 +270,7 @@ async def _create_servers_indexes(
     """Create all indexes for servers collection."""
     indexes = [
         ("server_name", 1, False),
+        ("name_key", 1, False),
         ("is_enabled", 1, False),
         ("version", 1, False),
         ("tags", 1, False),
@@ -588,6 +591,88 @@ async def _create_audit_events_indexes(
         logger.error(f"Failed to create TTL index on {collection_name}: {e}")
 
 
+async def _create_audit_rollups_indexes(
+    collection,
+    collection_name: str,
+    recreate: bool,
+) -> None:
+    """Create all indexes for the audit statistics rollup collection.
+
+    Indexes support:
+    - Upserts keyed by the full rollup dimension set (unique)
+    - Dashboard reads by log type + granularity + bucket range
+    - Username-filtered reads (usernames are normalized at write time)
+    - TTL-based expiration of old buckets (default 31 days)
+    """
+    rollup_ttl_days = int(os.getenv("AUDIT_ROLLUP_TTL_DAYS", "31"))
+    index_configs = [
+        (
+            "rollup_key_idx",
+            [
+                ("log_type", 1),
+                ("granularity", 1),
+                ("bucket", 1),
+                ("username", 1),
+                ("operation", 1),
+                ("status", 1),
+                ("server", 1),
+            ],
+            {"unique": True},
+        ),
+        ("log_type_username_bucket_idx", [("log_type", 1), ("username", 1), ("bucket", 1)], {}),
+        (
+            "bucket_ttl",
+            [("bucket", 1)],
+            {"expireAfterSeconds": rollup_ttl_days * 24 * 60 * 60},
+        ),
+    ]
+
+    for index_name, index_spec, options in index_configs:
+        if recreate:
+            try:
+                await collection.drop_index(index_name)
+                logger.info(f"Dropped existing index '{index_name}' from {collection_name}")
+            except Exception as e:
+                logger.debug(f"No existing index '{index_name}' to drop: {e}")
+
+        try:
+            await collection.create_index(index_spec, name=index_name, **options)
+            logger.info(f"Created index '{index_name}' on {collection_name}")
+        except Exception as e:
+            logger.error(f"Failed to create index '{index_name}' on {collection_name}: {e}")
+
+
+async def _create_skill_md_cache_indexes(
+    collection,
+    collection_name: str,
+    recreate: bool,
+) -> None:
+    """Create the TTL index for the SKILL.md content cache.
+
+    Cached SKILL.md bodies not fetched for SKILL_MD_CACHE_EXPIRE_DAYS
+    (default 30) are removed.
+    """
+    index_name = "fetched_at_ttl"
+    expire_days = int(os.getenv("SKILL_MD_CACHE_EXPIRE_DAYS", "30"))
+
+    if recreate:
+        try:
+            await collection.drop_index(index_name)
+            logger.info(f"Dropped existing index '{index_name}' from {collection_name}")
+        except Exception as e:
+            logger.debug(f"No existing index '{index_name}' to drop: {e}")
+
+    try:
+        await collection.create_index(
+            [("fetched_at", 1)],
+            name=index_name,
+            expireAfterSeconds=expire_days * 24 * 60 * 60,
+        )
+        logger.info(f"Created TTL index '{index_name}' on {collection_name} ({expire_days} days)")
+    except Exception as e:
+        logger.error(f"Failed to create index '{index_name}' on {collection_name}: {e}")
+
+
 async def _print_collection_summary(
     db,
     namespace: str,
@@ -605,6 +690,8 @@ async def _print_collection_summary(
         f"{COLLECTION_SECURITY_SCANS}_{namespace}",
         f"{COLLECTION_FEDERATION_CONFIG}_{namespace}",
         f"{COLLECTION_AUDIT_EVENTS}_{namespace}",
+        f"{COLLECTION_AUDIT_ROLLUPS}_{namespace}",
+        f"{COLLECTION_SKILL_MD_CACHE}_{namespace}",
     ]
 
     for coll_name in collection_names:
@@ -663,6 +750,8 @@ async def _initialize_collections(
         (COLLECTION_SECURITY_SCANS, _create_security_scans_indexes),
         (COLLECTION_FEDERATION_CONFIG, _create_federation_config_indexes),
         (COLLECTION_AUDIT_EVENTS, _create_audit_events_indexes),
+        (COLLECTION_AUDIT_ROLLUPS, _create_audit_rollups_indexes),
+        (COLLECTION_SKILL_MD_CACHE, _create_skill_md_cache_indexes),
     ]
 
     for base_name, create_indexes_func in collection_configs:
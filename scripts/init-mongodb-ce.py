@@ -39,7 +39,9 @@ COLLECTION_EMBEDDINGS = "mcp_embeddings_1536"
 COLLECTION_SECURITY_SCANS = "mcp_security_scans"
 COLLECTION_FEDERATION_CONFIG = "mcp_federation_config"
 COLLECTION_AUDIT_EVENTS = "audit_events"
+COLLECTION_AUDIT_ROLLUPS = "audit_rollups"
 COLLECTION_SKILLS = "agent_skills"
+COLLECTION_SKILL_MD_CACHE = "skill_md_cache"
 
 
 def _get_config_from_env() -> dict:
@@ -123,6 +125,8 @@ async def _create_standard_indexes(
         await collection.create_index([("enabled", ASCENDING)])
         await collection.create_index([("tags", ASCENDING)])
         await collection.create_index([("manifest.serverInfo.name", ASCENDING)])
+        # Keyset pagination of the v0.1 /servers listing
+        await collection.create_index([("name_key", ASCENDING)], name="name_key_idx")
         logger.info(f"Created indexes for {full_name}")
 
     elif collection_name == COLLECTION_AGENTS:
@@ -203,6 +207,35 @@ async def _create_standard_indexes(
                 raise
         logger.info(f"Created indexes for {full_name} (TTL: {ttl_days} days)")
 
+    elif collection_name == COLLECTION_AUDIT_ROLLUPS:
+        # Unique key over all rollup dimensions for $inc upserts from the audit writer
+        await collection.create_index(
+            [
+                ("log_type", ASCENDING),
+                ("granularity", ASCENDING),
+                ("bucket", ASCENDING),
+                ("username", ASCENDING),
+                ("operation", ASCENDING),
+                ("status", ASCENDING),
+                ("server", ASCENDING),
+            ],
+            name="rollup_key_idx",
+            unique=True,
+        )
+        # Usernames are normalized at write time, so filtered statistics use equality
+        await collection.create_index(
+            [("log_type", ASCENDING), ("username", ASCENDING), ("bucket", ASCENDING)]
+        )
+
+        # Rollups outlive raw events so 30-day dashboard views keep working
+        rollup_ttl_days = int(os.getenv("AUDIT_ROLLUP_TTL_DAYS", "31"))
+        await collection.create_index(
+            [("bucket", ASCENDING)],
+            expireAfterSeconds=rollup_ttl_days * 24 * 60 * 60,
+            name="bucket_ttl",
+        )
+        logger.info(f"Created indexes for {full_name} (TTL: {rollup_ttl_days} days)")
+
     elif collection_name == COLLECTION_SKILLS:
         # Note: path is stored as _id, so no separate path index needed
         await collection.create_index([("name", ASCENDING)], unique=True)
@@ -213,6 +246,16 @@ async def _create_standard_indexes(
         await collection.create_index([("owner", ASCENDING)])
         logger.info(f"Created indexes for {full_name}")
 
+    elif collection_name == COLLECTION_SKILL_MD_CACHE:
+        # Cached SKILL.md bodies expire when not fetched for SKILL_MD_CACHE_EXPIRE_DAYS
+        expire_days = int(os.getenv("SKILL_MD_CACHE_EXPIRE_DAYS", "30"))
+        await collection.create_index(
+            [("fetched_at", ASCENDING)],
+            expireAfterSeconds=expire_days * 24 * 60 * 60,
+            name="fetched_at_ttl",
+        )
+        logger.info(f"Created indexes for {full_name} (TTL: {expire_days} days)")
+
 
 async def _load_default_scopes(
     db,
@@ -338,7 +381,9 @@ async def _initialize_mongodb_ce() -> None:
             COLLECTION_SECURITY_SCANS,
             COLLECTION_FEDERATION_CONFIG,
             COLLECTION_AUDIT_EVENTS,
+            COLLECTION_AUDIT_ROLLUPS,
             COLLECTION_SKILLS,
+            COLLECTION_SKILL_MD_CACHE,
         ]
 
         for coll_name in collections:
@@ -6,8 +6,14 @@ It acts as a thin protocol adapter, translating MCP tool calls into registry HTT
 All tools require bearer token authentication via the Authorization header.
 """
 
+import hashlib
 import logging
 import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
@@ -32,10 +38,167 @@ MAX_QUERY_LENGTH: int = 500
 MIN_TOP_N: int = 1
 MAX_TOP_N: int = 100
 
+# HTTP client settings (one pooled client is shared by all tools for the process lifetime)
+REGISTRY_TIMEOUT_SECONDS: float = 30.0
+REGISTRY_MAX_CONNECTIONS: int = int(os.getenv("MCPGW_MAX_CONNECTIONS", "20"))
+REGISTRY_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("MCPGW_MAX_KEEPALIVE_CONNECTIONS", "10"))
+
+# Response cache settings for registry list endpoints
+# Entries are scoped per bearer token, so users never see each other's filtered results.
+# After the TTL expires, entries are revalidated with If-None-Match instead of re-downloaded.
+CACHE_TTL_SECONDS: float = float(os.getenv("MCPGW_CACHE_TTL_SECONDS", "15"))
+CACHE_MAX_ENTRIES: int = int(os.getenv("MCPGW_CACHE_MAX_ENTRIES", "256"))
+
 logger.info(f"Registry URL: {REGISTRY_URL}")
 
+@dataclass
+class _CacheEntry:
+    """Cached, already-parsed registry response."""
+
+    value: Any
+    etag: str | None
+    expires_at: float
+
+
+_http_client: httpx.AsyncClient | None = None
+_response_cache: OrderedDict[tuple[str, str], _CacheEntry] = OrderedDict()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared pooled HTTP client, creating it on first use.
+
+    Returns:
+        Process-wide httpx.AsyncClient with keep-alive connection pooling
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=REGISTRY_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=REGISTRY_MAX_CONNECTIONS,
+                max_keepalive_connections=REGISTRY_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+    return _http_client
+
+
+async def _close_http_client() -> None:
+    """Close the shared HTTP client and drop the cached responses."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _response_cache.clear()
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """Close the pooled registry client when the server shuts down."""
+    try:
+        yield {}
+    finally:
+        await _close_http_client()
+        logger.info("Closed registry HTTP client")
+
+
 # Initialize FastMCP server
-mcp = FastMCP("mcpgw")
+mcp = FastMCP("mcpgw", lifespan=_lifespan)
+
+
+def _token_scope(token: str) -> str:
+    """Derive a cache scope from a bearer token without storing the token itself."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+async def _cached_registry_get(
+    path: str,
+    token: str,
+    transform: Callable[[Any], Any],
+) -> Any:
+    """GET a registry endpoint through the per-token response cache.
+
+    Fresh entries are returned without any request. Stale entries are
+    revalidated with If-None-Match; on 304 the cached parsed value is reused,
+    so neither the payload download nor the model validation is repeated.
+
+    Args:
+        path: Registry API path (e.g. "/api/servers")
+        token: Bearer token of the caller (also the cache scope)
+        transform: Converts the decoded JSON body into the cached value
+
+    Returns:
+        The transformed response value
+
+    Raises:
+        httpx.HTTPStatusError: If the registry returns an error status
+    """
+    key = (_token_scope(token), path)
+    entry = _response_cache.get(key)
+    now = time.monotonic()
+
+    if entry and entry.expires_at > now:
+        _response_cache.move_to_end(key)
+        logger.debug(f"Cache hit for {path}")
+        return entry.value
+
+    # Use X-Authorization header for internal registry API calls
+    headers = {"X-Authorization": f"Bearer {token}"}
+    if entry and entry.etag:
+        headers["If-None-Match"] = entry.etag
+
+    client = _get_http_client()
+    response = await client.get(f"{REGISTRY_URL}{path}", headers=headers)
+
+    if response.status_code == 304 and entry:
+        logger.debug(f"Cache revalidated for {path}")
+        entry.expires_at = now + CACHE_TTL_SECONDS
+        _response_cache.move_to_end(key)
+        return entry.value
+
+    response.raise_for_status()
+    value = transform(response.json())
+
+    if CACHE_TTL_SECONDS > 0:
+        _response_cache[key] = _CacheEntry(
+            value=value,
+            etag=response.headers.get("etag"),
+            expires_at=now + CACHE_TTL_SECONDS,
+        )
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+    return value
+
+
+def _parse_services(data: Any) -> list[dict[str, Any]]:
+    """Validate a /api/servers payload into ServerInfo dictionaries."""
+    if isinstance(data, dict) and "servers" in data:
+        servers = data["servers"]
+    elif isinstance(data, list):
+        servers = data
+    else:
+        servers = []
+
+    services = []
+    for s in servers:
+        try:
+            services.append(ServerInfo(**s).model_dump())
+        except Exception as e:
+            logger.warning(f"Failed to parse server {s.get('path', 'unknown')}: {e}")
+    return services
+
+
+def _parse_agents(data: Any) -> list[dict[str, Any]]:
+    """Validate a /api/agents payload into AgentInfo dictionaries."""
+    agents = data.get("agents", []) if isinstance(data, dict) else data
+    return [AgentInfo(**a).model_dump() for a in agents]
+
+
+def _parse_skills(data: Any) -> list[dict[str, Any]]:
+    """Validate a /api/skills payload into SkillInfo dictionaries."""
+    skills = data.get("skills", []) if isinstance(data, dict) else data
+    return [SkillInfo(**s).model_dump() for s in skills]
 
 
 def _validate_top_n(top_n: int) -> int:
@@ -143,31 +306,7 @@ async def list_services(ctx: Context | None = None) -> dict[str, Any]:
 
     try:
         token = _extract_bearer_token(ctx)
-        # Use X-Authorization header for internal registry API calls
-        headers = {"X-Authorization": f"Bearer {token}"}
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{REGISTRY_URL}/api/servers", headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        # Parse response
-        if isinstance(data, dict) and "servers" in data:
-            servers = data["servers"]
-        elif isinstance(data, list):
-            servers = data
-        else:
-            servers = []
-
-        # Validate and convert to ServerInfo models
-        services = []
-        for s in servers:
-            try:
-                services.append(ServerInfo(**s).model_dump())
-            except Exception as e:
-                logger.warning(f"Failed to parse server {s.get('path', 'unknown')}: {e}")
+        services = await _cached_registry_get("/api/servers", token, _parse_services)
         enabled_count = sum(1 for s in services if s.get("enabled"))
 
         return {
@@ -215,16 +354,7 @@ async def list_agents(ctx: Context | None = None) -> dict[str, Any]:
 
     try:
         token = _extract_bearer_token(ctx)
-        # Use X-Authorization header for internal registry API calls
-        headers = {"X-Authorization": f"Bearer {token}"}
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(f"{REGISTRY_URL}/api/agents", headers=headers)
-            response.raise_for_status()
-            data = response.json()
-
-        agents = data.get("agents", []) if isinstance(data, dict) else data
-        agent_list = [AgentInfo(**a).model_dump() for a in agents]
+        agent_list = await _cached_registry_get("/api/agents", token, _parse_agents)
 
         return {
             "agents": agent_list,
@@ -270,16 +400,7 @@ async def list_skills(ctx: Context | None = None) -> dict[str, Any]:
 
     try:
         token = _extract_bearer_token(ctx)
-        # Use X-Authorization header for internal registry API calls
-        headers = {"X-Authorization": f"Bearer {token}"}
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(f"{REGISTRY_URL}/api/skills", headers=headers)
-            response.raise_for_status()
-            data = response.json()
-
-        skills = data.get("skills", []) if isinstance(data, dict) else data
-        skill_list = [SkillInfo(**s).model_dump() for s in skills]
+        skill_list = await _cached_registry_get("/api/skills", token, _parse_skills)
 
         return {
             "skills": skill_list,
@@ -339,14 +460,14 @@ async def intelligent_tool_finder(
         # Use X-Authorization header for internal registry API calls
         headers = {"X-Authorization": f"Bearer {token}"}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{REGISTRY_URL}/api/search/semantic",
-                headers=headers,
-                json={"query": query, "entity_type": "tool", "top_k": top_n},
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = _get_http_client()
+        response = await client.post(
+            f"{REGISTRY_URL}/api/search/semantic",
+            headers=headers,
+            json={"query": query, "entity_type": "tool", "top_k": top_n},
+        )
+        response.raise_for_status()
+        data = response.json()
 
         # Extract servers array from response
         servers = data.get("servers", []) if isinstance(data, dict) else []
@@ -418,12 +539,11 @@ async def healthcheck(ctx: Context | None = None) -> dict[str, Any]:
         # Use X-Authorization header for internal registry API calls
         headers = {"X-Authorization": f"Bearer {token}"}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{REGISTRY_URL}/api/servers/health", headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
+        # Health is not cached: callers expect the current state
+        client = _get_http_client()
+        response = await client.get(f"{REGISTRY_URL}/api/servers/health", headers=headers)
+        response.raise_for_status()
+        data = response.json()
 
         stats = RegistryStats(**data)
         return {**stats.model_dump(), "status": "success"}
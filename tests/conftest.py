@@ -322,6 +322,7 @@ def mock_server_repository():
     mock = AsyncMock()
     mock.load_all.return_value = {}  # Return empty dict of servers
     mock.list_all.return_value = {}  # Return empty dict of servers, not list
+    mock.list_page.return_value = []
     mock.get.return_value = None
     mock.save.return_value = None
     mock.delete.return_value = None
@@ -436,10 +437,12 @@ def mock_backend_session_repository():
     mock = AsyncMock()
     mock.ensure_indexes = AsyncMock()
     mock.get_backend_session.return_value = None
+    mock.get_backend_sessions.return_value = {}
     mock.store_backend_session = AsyncMock()
     mock.delete_backend_session = AsyncMock()
     mock.create_client_session = AsyncMock()
     mock.validate_client_session.return_value = False
+    mock.flush_touches.return_value = 0
     return mock
 
 
@@ -531,7 +534,12 @@ def mock_all_repositories(
         ),
     ):
         logger.debug("Auto-mocked all repository factory functions")
+        # Tool indexes cached from a previous test's repository must not leak
+        from registry.services.virtual_server_service import invalidate_backend_tools
+
+        invalidate_backend_tools()
         yield
+        invalidate_backend_tools()
 
 
 @pytest.fixture
@@ -683,7 +683,7 @@ class TestCheckAgentHealth:
         # Arrange
         with (
             patch("registry.api.agent_routes.agent_service") as mock_agent_service,
-            patch("httpx.AsyncClient") as mock_httpx_client,
+            patch("registry.api.agent_routes.get_http_client") as mock_get_http_client,
         ):
             mock_agent_service.get_agent_info = AsyncMock(return_value=sample_agent_card)
             mock_agent_service.is_agent_enabled.return_value = True
@@ -692,9 +692,9 @@ class TestCheckAgentHealth:
             mock_response = MagicMock()
             mock_response.status_code = 200
 
-            mock_client_instance = AsyncMock()
-            mock_client_instance.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            mock_httpx_client.return_value = mock_client_instance
+            mock_client = MagicMock()
+            mock_client.get = AsyncMock(return_value=mock_response)
+            mock_get_http_client.return_value = mock_client
 
             # Act
             response = test_app.post("/agents/test-agent/health")
@@ -716,17 +716,15 @@ class TestCheckAgentHealth:
 
         with (
             patch("registry.api.agent_routes.agent_service") as mock_agent_service,
-            patch("httpx.AsyncClient") as mock_httpx_client,
+            patch("registry.api.agent_routes.get_http_client") as mock_get_http_client,
         ):
             mock_agent_service.get_agent_info = AsyncMock(return_value=sample_agent_card)
             mock_agent_service.is_agent_enabled.return_value = True
 
             # Mock httpx timeout
-            mock_client_instance = AsyncMock()
-            mock_client_instance.__aenter__.return_value.get = AsyncMock(
-                side_effect=httpx.TimeoutException("Timeout")
-            )
-            mock_httpx_client.return_value = mock_client_instance
+            mock_client = MagicMock()
+            mock_client.get = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
+            mock_get_http_client.return_value = mock_client
 
             # Act
             response = test_app.post("/agents/test-agent/health")
@@ -1195,8 +1193,9 @@ class TestDiscoverAgentsBySkills:
         }
 
         with patch("registry.api.agent_routes.agent_service") as mock_agent_service:
-            mock_agent_service.get_all_agents = AsyncMock(return_value=[agent_with_skill])
-            mock_agent_service.is_agent_enabled.return_value = True
+            mock_agent_service.find_agents_by_skills.return_value = [
+                (agent_with_skill, {"data-retrieval"}, set()),
+            ]
 
             # Act - skills sent as body object, max_results as query param
             response = test_app.post("/agents/discover?max_results=10", json=request_body)
@@ -1256,10 +1255,10 @@ class TestDiscoverAgentsBySkills:
         }
 
         with patch("registry.api.agent_routes.agent_service") as mock_agent_service:
-            mock_agent_service.get_all_agents = AsyncMock(
-                return_value=[agent_with_tags, agent_without_tags]
-            )
-            mock_agent_service.is_agent_enabled.return_value = True
+            mock_agent_service.find_agents_by_skills.return_value = [
+                (agent_with_tags, {"data-retrieval"}, {"production"}),
+                (agent_without_tags, {"data-retrieval"}, set()),
+            ]
 
             # Act
             response = test_app.post("/agents/discover?max_results=10", json=request_body)
@@ -499,6 +499,33 @@ class TestGetServersJSON:
         assert data["servers"][0]["health_status"] == "healthy"
         assert data["servers"][0]["last_checked_iso"] == "2025-01-01T12:00:00Z"
 
+    def test_etag_revalidation_returns_304(self, test_client_admin, mock_server_service):
+        """Test that a matching If-None-Match returns 304 without a body."""
+        # Arrange
+        mock_server_service.get_all_servers.return_value = {
+            "/server1": {
+                "server_name": "Server 1",
+                "description": "Test",
+                "tags": [],
+                "num_tools": 3,
+                "license": "MIT",
+                "proxy_pass_url": "http://localhost:8080",
+            }
+        }
+
+        # Act
+        first = test_client_admin.get("/api/servers")
+        etag = first.headers["ETag"]
+        second = test_client_admin.get("/api/servers", headers={"If-None-Match": etag})
+        stale = test_client_admin.get("/api/servers", headers={"If-None-Match": '"stale"'})
+
+        # Assert
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+        assert stale.status_code == 200
+
 
 # =============================================================================
 # TEST POST /toggle/{service_path:path} - Toggle Service
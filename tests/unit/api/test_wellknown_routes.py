@@ -58,6 +58,18 @@ def sample_server_info() -> dict[str, Any]:
     }
 
 
+@pytest.fixture(autouse=True)
+def clear_discovery_cache():
+    """Start every test without a cached catalog or rendered document."""
+    from registry.api import wellknown_routes
+
+    wellknown_routes._catalog = None
+    wellknown_routes._documents.clear()
+    yield
+    wellknown_routes._catalog = None
+    wellknown_routes._documents.clear()
+
+
 # =============================================================================
 # UNIT TESTS FOR _get_normalized_health_status
 # =============================================================================
@@ -397,3 +409,83 @@ class TestWellKnownMcpServersEndpoint:
             assert server_statuses["Healthy Server"] == "healthy"
             assert server_statuses["Unhealthy Server"] == "unhealthy"
             assert server_statuses["Unknown Server"] == "unknown"
+
+
+class TestDiscoveryDocumentCache:
+    """Tests for serving the pre-rendered discovery document."""
+
+    @pytest.fixture
+    def client(self, mock_server_service, mock_health_service, mock_settings, sample_server_info):
+        """Test client with one enabled, healthy server."""
+        mock_server_service.get_all_servers = AsyncMock(
+            return_value={"test-server": sample_server_info}
+        )
+        mock_server_service.catalog_generation = 1
+        mock_health_service.server_health_status = {"test-server": "healthy"}
+        mock_settings.enable_wellknown_discovery = True
+        mock_settings.wellknown_cache_ttl = 300
+
+        with (
+            patch("registry.api.wellknown_routes.server_service", mock_server_service),
+            patch("registry.api.wellknown_routes.health_service", mock_health_service),
+            patch("registry.api.wellknown_routes.settings", mock_settings),
+        ):
+            from fastapi import FastAPI
+
+            from registry.api.wellknown_routes import router
+
+            app = FastAPI()
+            app.include_router(router, prefix="/.well-known")
+            yield TestClient(app)
+
+    def test_repeated_requests_reuse_the_document(self, client, mock_server_service):
+        """The catalog is loaded once and the same bytes and ETag are served."""
+        first = client.get("/.well-known/mcp-servers")
+        second = client.get("/.well-known/mcp-servers")
+
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["cache-control"] == "public, max-age=300"
+        mock_server_service.get_all_servers.assert_awaited_once()
+
+    def test_matching_etag_returns_304(self, client):
+        """A client revalidating with the current ETag gets an empty 304."""
+        etag = client.get("/.well-known/mcp-servers").headers["etag"]
+
+        response = client.get("/.well-known/mcp-servers", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_health_change_rerenders_without_reloading(
+        self, client, mock_server_service, mock_health_service
+    ):
+        """A health change produces a new document from the cached catalog."""
+        first = client.get("/.well-known/mcp-servers")
+        mock_health_service.server_health_status["test-server"] = "unhealthy: timeout"
+        second = client.get("/.well-known/mcp-servers")
+
+        assert second.headers["etag"] != first.headers["etag"]
+        assert second.json()["servers"][0]["health_status"] == "unhealthy"
+        mock_server_service.get_all_servers.assert_awaited_once()
+
+    def test_catalog_change_reloads_servers(self, client, mock_server_service):
+        """A new catalog generation reloads the servers."""
+        client.get("/.well-known/mcp-servers")
+        mock_server_service.catalog_generation = 2
+        mock_server_service.get_all_servers.return_value = {}
+
+        response = client.get("/.well-known/mcp-servers")
+
+        assert response.json()["servers"] == []
+        assert mock_server_service.get_all_servers.await_count == 2
+
+    def test_hosts_get_their_own_document(self, client):
+        """Server URLs follow the request host, so each host has its own document."""
+        first = client.get("/.well-known/mcp-servers", headers={"host": "a.example.com"})
+        second = client.get("/.well-known/mcp-servers", headers={"host": "b.example.com"})
+
+        assert first.json()["servers"][0]["url"] == "http://a.example.com/test-server/mcp"
+        assert second.json()["servers"][0]["url"] == "http://b.example.com/test-server/mcp"
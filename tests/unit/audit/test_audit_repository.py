@@ -7,6 +7,7 @@ Validates: Requirements 6.1, 6.2
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from pymongo.errors import DuplicateKeyError
 
 from registry.audit.models import Identity, RegistryApiAccessRecord, Request, Response
@@ -87,6 +88,74 @@ class TestFind:
             mock_cursor.limit.assert_called_once_with(25)
 
 
+class TestIterFind:
+    """Tests for iter_find() method."""
+
+    async def test_streams_events_in_batches(self):
+        """iter_find() yields normalized docs and sets the cursor batch size."""
+        mock_collection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.sort = MagicMock(return_value=mock_cursor)
+        mock_cursor.limit = MagicMock(return_value=mock_cursor)
+        mock_cursor.batch_size = MagicMock(return_value=mock_cursor)
+
+        naive = datetime(2026, 3, 1, 12, 0)
+        test_docs = [{"_id": 1, "request_id": "req-1", "timestamp": naive}]
+
+        async def async_iter():
+            for doc in test_docs:
+                yield doc
+
+        mock_cursor.__aiter__ = lambda self: async_iter()
+        mock_collection.find = MagicMock(return_value=mock_cursor)
+
+        repo = DocumentDBAuditRepository()
+        repo._collection = mock_collection
+
+        results = [doc async for doc in repo.iter_find({}, limit=5000, batch_size=250)]
+
+        assert results[0]["_id"] == "1"
+        assert results[0]["timestamp"].tzinfo is UTC
+        mock_cursor.limit.assert_called_once_with(5000)
+        mock_cursor.batch_size.assert_called_once_with(250)
+
+    async def test_raises_on_query_error(self):
+        """iter_find() re-raises when the query fails."""
+        mock_collection = MagicMock()
+        mock_collection.find = MagicMock(side_effect=Exception("DB error"))
+
+        repo = DocumentDBAuditRepository()
+        repo._collection = mock_collection
+
+        with pytest.raises(Exception, match="DB error"):
+            [doc async for doc in repo.iter_find({})]
+
+    async def test_raises_when_cursor_fails_partway(self):
+        """iter_find() yields what it read, then re-raises the cursor error."""
+        mock_collection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.sort = MagicMock(return_value=mock_cursor)
+        mock_cursor.limit = MagicMock(return_value=mock_cursor)
+        mock_cursor.batch_size = MagicMock(return_value=mock_cursor)
+
+        async def async_iter():
+            yield {"_id": 1, "request_id": "req-1"}
+            raise Exception("cursor lost")
+
+        mock_cursor.__aiter__ = lambda self: async_iter()
+        mock_collection.find = MagicMock(return_value=mock_cursor)
+
+        repo = DocumentDBAuditRepository()
+        repo._collection = mock_collection
+
+        received = []
+        with pytest.raises(Exception, match="cursor lost"):
+            async for doc in repo.iter_find({}):
+                received.append(doc)
+
+        assert [doc["request_id"] for doc in received] == ["req-1"]
+
+
 class TestInsert:
     """Tests for insert() method."""
 
@@ -135,3 +204,149 @@ class TestInsert:
             result = await repo.insert(make_test_record())
 
             assert result is True
+
+
+class TestRollups:
+    """Tests for hourly/daily statistics rollups."""
+
+    async def test_insert_increments_hourly_and_daily_rollups(self):
+        """insert() upserts one hourly and one daily rollup counter."""
+        mock_collection = AsyncMock()
+        mock_rollups = AsyncMock()
+
+        repo = DocumentDBAuditRepository()
+        repo._collection = mock_collection
+        repo._rollup_collection = mock_rollups
+
+        record = make_test_record()
+        record.identity.username = " TestUser "
+        record.timestamp = datetime(2026, 3, 1, 13, 45, 12, tzinfo=UTC)
+
+        result = await repo.insert(record)
+
+        assert result is True
+        operations = mock_rollups.bulk_write.await_args.args[0]
+        filters = {op._filter["granularity"]: op._filter for op in operations}
+        assert filters["hour"]["bucket"] == datetime(2026, 3, 1, 13)
+        assert filters["day"]["bucket"] == datetime(2026, 3, 1)
+        assert filters["hour"]["username"] == "testuser"
+        assert filters["hour"]["status"] == "2xx"
+        assert filters["hour"]["log_type"] == "registry_api_access"
+        assert all(op._doc == {"$inc": {"count": 1}} for op in operations)
+
+    async def test_duplicate_insert_does_not_increment_rollups(self):
+        """Duplicate events are not counted twice."""
+        mock_collection = AsyncMock()
+        mock_collection.insert_one.side_effect = DuplicateKeyError("duplicate key error")
+        mock_rollups = AsyncMock()
+
+        repo = DocumentDBAuditRepository()
+        repo._collection = mock_collection
+        repo._rollup_collection = mock_rollups
+
+        assert await repo.insert(make_test_record()) is True
+        mock_rollups.bulk_write.assert_not_called()
+
+    async def test_rollup_failure_does_not_fail_insert(self):
+        """A rollup write error still reports the audit event as written."""
+        mock_collection = AsyncMock()
+        mock_rollups = AsyncMock()
+        mock_rollups.bulk_write.side_effect = Exception("rollup error")
+
+        repo = DocumentDBAuditRepository()
+        repo._collection = mock_collection
+        repo._rollup_collection = mock_rollups
+
+        assert await repo.insert(make_test_record()) is True
+        mock_collection.insert_one.assert_called_once()
+
+    async def test_rebuild_replaces_rollups_from_raw_events(self):
+        """rebuild_rollups() replaces rollup docs with server-side grouped counts."""
+        rows = [
+            {
+                "_id": {
+                    "log_type": "registry_api_access",
+                    "username": "admin",
+                    "operation": "list",
+                    "status": "2xx",
+                    "server": None,
+                    "bucket": datetime(2026, 3, 1),
+                },
+                "count": 7,
+            }
+        ]
+
+        async def async_iter():
+            for row in rows:
+                yield row
+
+        mock_collection = MagicMock()
+        mock_collection.aggregate = MagicMock(side_effect=lambda pipeline: async_iter())
+        mock_rollups = AsyncMock()
+
+        repo = DocumentDBAuditRepository()
+        repo._collection = mock_collection
+        repo._rollup_collection = mock_rollups
+
+        written = await repo.rebuild_rollups(datetime(2026, 3, 1), datetime(2026, 3, 3, 10, 30))
+
+        assert written == 2
+        assert mock_rollups.bulk_write.await_count == 2
+        replacement = mock_rollups.bulk_write.await_args.args[0][0]._doc
+        assert replacement["count"] == 7
+        assert replacement["granularity"] == "day"
+
+    async def test_rebuild_skips_buckets_still_filling(self):
+        """rebuild_rollups() only recounts closed hours and days."""
+        pipelines = []
+
+        async def async_iter():
+            return
+            yield
+
+        def aggregate(pipeline):
+            pipelines.append(pipeline)
+            return async_iter()
+
+        mock_collection = MagicMock()
+        mock_collection.aggregate = MagicMock(side_effect=aggregate)
+
+        repo = DocumentDBAuditRepository()
+        repo._collection = mock_collection
+        repo._rollup_collection = AsyncMock()
+
+        await repo.rebuild_rollups(datetime(2026, 3, 1), datetime(2026, 3, 3, 10, 30))
+
+        hour_match, day_match = (pipeline[0]["$match"]["timestamp"] for pipeline in pipelines)
+        assert hour_match["$lt"] == datetime(2026, 3, 3, 10)
+        assert day_match["$lt"] == datetime(2026, 3, 3)
+
+    async def test_rebuild_within_first_day_skips_daily_rollups(self):
+        """No daily bucket has closed since a watermark set earlier the same day."""
+
+        async def async_iter():
+            return
+            yield
+
+        mock_collection = MagicMock()
+        mock_collection.aggregate = MagicMock(side_effect=lambda pipeline: async_iter())
+
+        repo = DocumentDBAuditRepository()
+        repo._collection = mock_collection
+        repo._rollup_collection = AsyncMock()
+
+        await repo.rebuild_rollups(datetime(2026, 3, 3), datetime(2026, 3, 3, 10, 30))
+
+        assert mock_collection.aggregate.call_count == 1
+
+    async def test_rebuild_raises_on_error(self):
+        """rebuild_rollups() re-raises so the watermark is not advanced."""
+        mock_collection = MagicMock()
+        mock_collection.aggregate = MagicMock(side_effect=Exception("DB error"))
+
+        repo = DocumentDBAuditRepository()
+        repo._collection = mock_collection
+        repo._rollup_collection = AsyncMock()
+
+        with pytest.raises(Exception, match="DB error"):
+            await repo.rebuild_rollups(datetime(2026, 3, 1), datetime(2026, 3, 3))
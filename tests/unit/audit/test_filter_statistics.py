@@ -7,8 +7,12 @@ endpoints, plus the repository distinct() and aggregate() methods.
 Validates: Issue #572
 """
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
+from registry.core.config import settings
 from registry.repositories.audit_repository import DocumentDBAuditRepository
 
 # =============================================================================
@@ -243,7 +247,12 @@ class TestFilterOptionsEndpoint:
 
 
 class TestStatisticsEndpoint:
-    """Tests for GET /api/audit/statistics endpoint."""
+    """Tests for GET /api/audit/statistics endpoint (raw event aggregation)."""
+
+    @pytest.fixture(autouse=True)
+    def _disable_rollups(self):
+        with patch.object(settings, "audit_statistics_use_rollups", False):
+            yield
 
     async def test_returns_statistics_for_registry_stream(self):
         """Returns aggregated statistics for registry_api stream."""
@@ -401,3 +410,139 @@ class TestStatisticsEndpoint:
             assert result.status_distribution.status_4xx == 0
             assert result.status_distribution.status_5xx == 0
             assert result.user_activity == []
+
+
+# =============================================================================
+# API Endpoint: GET /audit/statistics served from rollups
+# =============================================================================
+
+
+class TestStatisticsFromRollups:
+    """Tests for GET /api/audit/statistics served from hourly/daily rollups."""
+
+    @pytest.fixture(autouse=True)
+    def _enable_rollups(self):
+        with patch.object(settings, "audit_statistics_use_rollups", True):
+            yield
+
+    async def test_reads_rollups_instead_of_raw_events(self):
+        """Statistics are computed from rollups without touching raw events."""
+        mock_repo = MagicMock()
+        mock_repo.count = AsyncMock()
+        mock_repo.aggregate = AsyncMock()
+        mock_repo.aggregate_rollups = AsyncMock(
+            side_effect=[
+                [{"_id": None, "total": 500}],
+                [{"_id": "admin", "count": 300}],
+                [{"_id": "list", "count": 250}],
+                [{"_id": "2026-02-28", "count": 500}],
+                [{"_id": "2xx", "count": 450}, {"_id": "4xx", "count": 50}],
+                [
+                    {
+                        "_id": "admin",
+                        "total": 300,
+                        "operations": [{"name": "list", "count": 250}],
+                    }
+                ],
+            ]
+        )
+
+        with patch(
+            "registry.audit.routes.get_audit_repository",
+            return_value=mock_repo,
+        ):
+            from registry.audit.routes import get_statistics
+
+            result = await get_statistics(
+                user_context={"is_admin": True, "username": "admin"},
+                stream="registry_api",
+                days=7,
+                username=None,
+            )
+
+        assert result.total_events == 500
+        assert result.top_users[0].name == "admin"
+        assert result.status_distribution.status_2xx == 450
+        assert result.status_distribution.status_4xx == 50
+        assert result.user_activity[0].operations[0].name == "list"
+        assert mock_repo.aggregate_rollups.await_count == 6
+        mock_repo.count.assert_not_called()
+        mock_repo.aggregate.assert_not_called()
+
+    async def test_mcp_stream_includes_server_rollup(self):
+        """MCP stream adds a top-servers rollup query grouped by server."""
+        mock_repo = MagicMock()
+        mock_repo.aggregate_rollups = AsyncMock(
+            side_effect=[
+                [],
+                [],
+                [],
+                [],
+                [{"_id": "success", "count": 9}, {"_id": "error", "count": 1}],
+                [],
+                [{"_id": "fininfo-server", "count": 10}],
+            ]
+        )
+
+        with patch(
+            "registry.audit.routes.get_audit_repository",
+            return_value=mock_repo,
+        ):
+            from registry.audit.routes import get_statistics
+
+            result = await get_statistics(
+                user_context={"is_admin": True, "username": "admin"},
+                stream="mcp_access",
+                days=1,
+                username=None,
+            )
+
+        assert result.total_events == 0
+        assert result.top_servers[0].name == "fininfo-server"
+        assert result.status_distribution.status_2xx == 9
+        assert result.status_distribution.status_5xx == 1
+        server_pipeline = mock_repo.aggregate_rollups.await_args_list[6].args[0]
+        assert server_pipeline[1]["$group"]["_id"] == "$server"
+
+    async def test_username_filter_uses_normalized_equality(self):
+        """Username filter is a normalized equality match, not a regex."""
+        mock_repo = MagicMock()
+        mock_repo.aggregate_rollups = AsyncMock(return_value=[])
+
+        with patch(
+            "registry.audit.routes.get_audit_repository",
+            return_value=mock_repo,
+        ):
+            from registry.audit.routes import get_statistics
+
+            await get_statistics(
+                user_context={"is_admin": True, "username": "admin"},
+                stream="registry_api",
+                days=7,
+                username="  Alice@Example.COM ",
+            )
+
+        match = mock_repo.aggregate_rollups.await_args_list[0].args[0][0]["$match"]
+        assert match["username"] == "alice@example.com"
+        assert match["log_type"] == "registry_api_access"
+
+    def test_window_uses_hourly_partial_day_and_daily_buckets(self):
+        """The first partial day is read from hourly rollups, the rest from daily."""
+        from registry.audit.routes import _rollup_window_match
+
+        cutoff = datetime(2026, 3, 1, 13, 45, tzinfo=UTC)
+        match = _rollup_window_match("registry_api_access", cutoff, None)
+
+        day_clause, hour_clause = match["$or"]
+        assert day_clause == {
+            "granularity": "day",
+            "bucket": {"$gte": datetime(2026, 3, 2, tzinfo=UTC)},
+        }
+        assert hour_clause == {
+            "granularity": "hour",
+            "bucket": {
+                "$gte": datetime(2026, 3, 1, 13, tzinfo=UTC),
+                "$lt": datetime(2026, 3, 2, tzinfo=UTC),
+            },
+        }
+        assert "username" not in match
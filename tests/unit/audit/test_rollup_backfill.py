@@ -0,0 +1,55 @@
+"""
+Unit tests for the audit rollup backfill run on startup.
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from registry.main import _backfill_audit_rollups
+
+
+def _repository(watermark: datetime | None) -> MagicMock:
+    repo = MagicMock()
+    repo.get_rollup_watermark = AsyncMock(return_value=watermark)
+    repo.set_rollup_watermark = AsyncMock()
+    repo.rebuild_rollups = AsyncMock(return_value=3)
+    return repo
+
+
+@pytest.mark.unit
+class TestBackfillAuditRollups:
+    """Tests for _backfill_audit_rollups."""
+
+    @pytest.mark.asyncio
+    async def test_first_run_rebuilds_retention_window(self):
+        """Without a watermark the whole retention window is rebuilt."""
+        repo = _repository(None)
+
+        await _backfill_audit_rollups(repo)
+
+        since, until = repo.rebuild_rollups.await_args.args
+        watermark = repo.set_rollup_watermark.await_args.args[0]
+        assert watermark == until.replace(hour=0, minute=0, second=0, microsecond=0)
+        assert since < watermark
+        assert since.hour == 0
+
+    @pytest.mark.asyncio
+    async def test_later_runs_start_at_watermark(self):
+        """Existing rollups do not skip the rebuild; it resumes from the watermark."""
+        repo = _repository(datetime(2026, 3, 1))
+
+        await _backfill_audit_rollups(repo)
+
+        assert repo.rebuild_rollups.await_args.args[0] == datetime(2026, 3, 1)
+
+    @pytest.mark.asyncio
+    async def test_failed_rebuild_keeps_watermark(self):
+        """The watermark only advances once the rebuild completed."""
+        repo = _repository(None)
+        repo.rebuild_rollups.side_effect = Exception("DB error")
+
+        await _backfill_audit_rollups(repo)
+
+        repo.set_rollup_watermark.assert_not_awaited()
@@ -12,7 +12,26 @@ from fastapi import HTTPException
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
-from registry.audit.routes import _build_query, _generate_csv, _generate_jsonl, require_admin
+from registry.audit.routes import (
+    EXPORT_CHUNK_ROWS,
+    _build_query,
+    _generate_csv,
+    _generate_jsonl,
+    _gzip_stream,
+    require_admin,
+)
+
+
+async def _aiter(items):
+    """Wrap a list in an async iterator, like a Motor cursor."""
+    for item in items:
+        yield item
+
+
+async def _collect(agen):
+    """Drain an async iterator into a list."""
+    return [chunk async for chunk in agen]
+
 
 # =============================================================================
 # Property 11: Admin-Only Audit API Access
@@ -99,14 +118,22 @@ class TestBuildQuery:
 class TestExportFormats:
     """Tests for export format generation."""
 
-    def test_generate_jsonl(self):
+    async def test_generate_jsonl(self):
         """Generate JSONL from events."""
         events = [{"request_id": "req-1"}, {"request_id": "req-2"}]
-        result = list(_generate_jsonl(events))
-        assert len(result) == 2
-        assert all(line.endswith("\n") for line in result)
-
-    def test_generate_csv(self):
+        result = await _collect(_generate_jsonl(_aiter(events)))
+        lines = "".join(result).splitlines(keepends=True)
+        assert len(lines) == 2
+        assert all(line.endswith("\n") for line in lines)
+
+    async def test_generate_jsonl_yields_in_chunks(self):
+        """JSONL is yielded incrementally rather than as one payload."""
+        events = [{"request_id": f"req-{i}"} for i in range(EXPORT_CHUNK_ROWS * 2 + 1)]
+        result = await _collect(_generate_jsonl(_aiter(events)))
+        assert len(result) == 3
+        assert result[0].count("\n") == EXPORT_CHUNK_ROWS
+
+    async def test_generate_csv(self):
         """Generate CSV from events."""
         events = [
             {
@@ -118,11 +145,32 @@ class TestExportFormats:
                 "action": {"operation": "read", "resource_type": "server"},
             }
         ]
-        result = list(_generate_csv(events))
+        result = await _collect(_generate_csv(_aiter(events)))
         csv_content = result[0]
         assert "timestamp" in csv_content
         assert "req-1" in csv_content
 
+    async def test_generate_csv_header_written_once(self):
+        """CSV header appears only in the first chunk."""
+        events = [{"request_id": f"req-{i}"} for i in range(EXPORT_CHUNK_ROWS + 1)]
+        result = await _collect(_generate_csv(_aiter(events)))
+        assert len(result) == 2
+        assert result[0].startswith("timestamp,")
+        assert "timestamp," not in result[1]
+
+    async def test_generate_csv_empty(self):
+        """Empty export yields a single empty chunk."""
+        result = await _collect(_generate_csv(_aiter([])))
+        assert result == [""]
+
+    async def test_gzip_stream_round_trips(self):
+        """Gzip stream decompresses back to the original content."""
+        import gzip
+
+        chunks = ["a" * 1000, "b" * 1000]
+        compressed = b"".join(await _collect(_gzip_stream(_aiter(chunks))))
+        assert gzip.decompress(compressed).decode() == "".join(chunks)
+
 
 # =============================================================================
 # API Endpoints
@@ -181,3 +229,58 @@ class TestAuditEventDetailEndpoint:
                 )
 
             assert exc_info.value.status_code == 404
+
+
+class TestExportEndpoint:
+    """Tests for GET /api/audit/export endpoint."""
+
+    async def _call_export(self, mock_repo, **overrides):
+        from registry.audit.routes import export_audit_events
+
+        params = {
+            "user_context": {"is_admin": True},
+            "format": "jsonl",
+            "stream": "registry_api",
+            "from_time": None,
+            "to_time": None,
+            "username": None,
+            "operation": None,
+            "resource_type": None,
+            "resource_id": None,
+            "status_min": None,
+            "status_max": None,
+            "auth_decision": None,
+            "limit": 100000,
+            "compress": False,
+        }
+        params.update(overrides)
+        with patch("registry.audit.routes.get_audit_repository", return_value=mock_repo):
+            return await export_audit_events(**params)
+
+    async def test_streams_from_cursor_iterator(self):
+        """Export reads events through iter_find instead of materializing them."""
+        mock_repo = MagicMock()
+        mock_repo.find = AsyncMock()
+        mock_repo.iter_find = MagicMock(return_value=_aiter([{"request_id": "req-1"}]))
+
+        response = await self._call_export(mock_repo)
+
+        body = "".join(await _collect(response.body_iterator))
+        assert '"request_id": "req-1"' in body
+        assert response.media_type == "application/x-ndjson"
+        mock_repo.find.assert_not_called()
+        assert mock_repo.iter_find.call_args.kwargs["limit"] == 100000
+
+    async def test_gzip_export(self):
+        """compress=true returns a gzip file with a .gz filename."""
+        import gzip
+
+        mock_repo = MagicMock()
+        mock_repo.iter_find = MagicMock(return_value=_aiter([{"request_id": "req-1"}]))
+
+        response = await self._call_export(mock_repo, format="csv", compress=True)
+
+        body = b"".join(await _collect(response.body_iterator))
+        assert "req-1" in gzip.decompress(body).decode()
+        assert response.media_type == "application/gzip"
+        assert response.headers["Content-Disposition"].endswith(".csv.gz")
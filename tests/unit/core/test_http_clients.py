@@ -0,0 +1,100 @@
+"""
+Unit tests for the shared outbound HTTP client registry.
+"""
+
+import httpx
+import pytest
+
+from registry.core.http_clients import (
+    CLIENT_BACKEND,
+    CLIENT_IDP,
+    CLIENT_INTERNAL,
+    HttpClientProfile,
+    HttpClientRegistry,
+)
+
+PROFILES = {
+    CLIENT_INTERNAL: HttpClientProfile(
+        timeout_seconds=10.0, max_connections=5, max_keepalive_connections=5
+    ),
+    CLIENT_BACKEND: HttpClientProfile(
+        timeout_seconds=2.0, max_connections=10, max_keepalive_connections=2
+    ),
+    CLIENT_IDP: HttpClientProfile(
+        timeout_seconds=10.0, max_connections=5, max_keepalive_connections=5
+    ),
+}
+
+
+def _mock_transport() -> httpx.MockTransport:
+    """Transport answering every request with a Set-Cookie header."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"Set-Cookie": "session=abc"},
+            json={"cookie": request.headers.get("cookie")},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.unit
+class TestHttpClientRegistry:
+    """Tests for HttpClientRegistry."""
+
+    def test_get_returns_same_client_per_profile(self):
+        """Each profile has exactly one client with its own timeout."""
+        registry = HttpClientRegistry(PROFILES)
+
+        backend = registry.get(CLIENT_BACKEND)
+
+        assert registry.get(CLIENT_BACKEND) is backend
+        assert registry.get(CLIENT_INTERNAL) is not backend
+        assert backend.timeout.read == 2.0
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_clients_and_get_recreates(self):
+        """Closed clients are replaced on the next get."""
+        registry = HttpClientRegistry(PROFILES)
+        registry.startup()
+        idp = registry.get(CLIENT_IDP)
+
+        await registry.aclose()
+
+        assert idp.is_closed
+        assert registry.get_pool_stats() == {}
+        assert registry.get(CLIENT_IDP) is not idp
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cookies_are_not_shared_between_requests(self):
+        """A Set-Cookie from one upstream is not replayed on later requests."""
+        registry = HttpClientRegistry(PROFILES)
+        client = registry.get(CLIENT_BACKEND)
+        client._transport = _mock_transport()
+
+        await client.get("http://backend-a/")
+        response = await client.get("http://backend-a/")
+
+        assert response.json()["cookie"] is None
+        await registry.aclose()
+
+    def test_pool_stats_for_idle_client(self):
+        """A client without connections reports an empty pool."""
+        registry = HttpClientRegistry(PROFILES)
+        registry.get(CLIENT_INTERNAL)
+
+        stats = registry.get_pool_stats()
+
+        assert stats[CLIENT_INTERNAL] == {"connections": 0, "active": 0, "idle": 0, "queued": 0}
+
+    def test_pool_stats_tolerate_unexpected_pool(self):
+        """A pool without the expected internals reports zero instead of raising."""
+        registry = HttpClientRegistry(PROFILES)
+        client = registry.get(CLIENT_BACKEND)
+        client._transport._pool = object()
+
+        stats = registry.get_pool_stats()
+
+        assert stats[CLIENT_BACKEND] == {"connections": 0, "active": 0, "idle": 0, "queued": 0}
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from registry.core import mcp_client as mcp_client_module
 from registry.core.mcp_client import (
     MCPClientService,
     _build_headers_for_server,
@@ -17,11 +18,14 @@ from registry.core.mcp_client import (
     _get_tools_streamable_http,
     detect_server_transport,
     detect_server_transport_aware,
+    get_cached_transport,
+    get_mcp_connection_result,
     get_tools_from_server_with_server_info,
     get_tools_from_server_with_transport,
     mcp_client_service,
     normalize_sse_endpoint_url,
     normalize_sse_endpoint_url_for_request,
+    remember_transport,
 )
 
 # =============================================================================
@@ -29,6 +33,14 @@ from registry.core.mcp_client import (
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def clear_transport_cache():
+    """Start every test without detected transports."""
+    mcp_client_module._transport_cache.clear()
+    yield
+    mcp_client_module._transport_cache.clear()
+
+
 @pytest.fixture
 def mock_server_info():
     """Create mock server info."""
@@ -836,3 +848,125 @@ async def test_full_tool_discovery_flow_sse(mock_tools_response):
 
                 assert result is not None
                 assert len(result) == 1
+
+
+# =============================================================================
+# TRANSPORT CACHE TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_detect_server_transport_probes_once():
+    """A detected transport is reused without probing the server again."""
+    url = "http://localhost:8000"
+
+    with patch("registry.core.mcp_client.streamablehttp_client") as mock_client:
+        mock_client.return_value.__aenter__.return_value = MagicMock()
+
+        assert await detect_server_transport(url) == "streamable-http"
+        assert await detect_server_transport(url) == "streamable-http"
+
+    assert mock_client.call_count == 1
+    assert get_cached_transport(url)["endpoint"] == "http://localhost:8000/mcp/"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_detect_server_transport_default_is_not_cached():
+    """A failed probe falls back to streamable-http without caching the guess."""
+    url = "http://localhost:8000"
+
+    with (
+        patch("registry.core.mcp_client.streamablehttp_client", side_effect=Exception("down")),
+        patch("registry.core.mcp_client.sse_client", side_effect=Exception("down")),
+    ):
+        await detect_server_transport(url)
+
+    assert get_cached_transport(url) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_detect_server_transport_aware_uses_persisted_detection():
+    """A detection stored on the server document for the same URL skips the probe."""
+    url = "http://localhost:8000"
+    server_info = {"detected_transport": {"url": url, "transport": "sse", "endpoint": None}}
+
+    with patch("registry.core.mcp_client.detect_server_transport") as mock_detect:
+        result = await detect_server_transport_aware(url, server_info)
+
+    assert result == "sse"
+    mock_detect.assert_not_called()
+
+
+@pytest.mark.unit
+def test_persisted_detection_for_another_url_is_ignored():
+    """A detection made before the proxy URL changed is not trusted."""
+    server_info = {
+        "detected_transport": {"url": "http://old:8000", "transport": "sse", "endpoint": None}
+    }
+
+    assert get_cached_transport("http://new:8000", server_info) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cached_endpoint_is_used_directly(mock_tools_response):
+    """Streamable-HTTP connects straight to the endpoint that worked last time."""
+    url = "http://localhost:8000"
+    remember_transport(url, "streamable-http", "http://localhost:8000/")
+
+    mock_session = AsyncMock()
+    mock_session.list_tools = AsyncMock(return_value=mock_tools_response)
+
+    with patch("registry.core.mcp_client.streamablehttp_client") as mock_client:
+        mock_client.return_value.__aenter__.return_value = (MagicMock(), MagicMock(), MagicMock())
+
+        with patch("registry.core.mcp_client.ClientSession") as mock_session_class:
+            mock_session_class.return_value.__aenter__.return_value = mock_session
+
+            result = await _get_tools_streamable_http(url, None)
+
+    assert len(result) == 1
+    assert [call.kwargs["url"] for call in mock_client.call_args_list] == ["http://localhost:8000/"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_connection_invalidates_cached_transport():
+    """A failed tool fetch drops the cached transport so the next call probes again."""
+    url = "http://localhost:8000"
+    remember_transport(url, "sse", "http://localhost:8000/sse")
+
+    with patch("registry.core.mcp_client._get_tools_sse", return_value=None):
+        result = await get_tools_from_server_with_server_info(url, None)
+
+    assert result is None
+    assert get_cached_transport(url) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_connection_result_reports_detected_transport(mock_tools_response):
+    """The connection result carries the transport and endpoint to persist."""
+    url = "http://localhost:8000"
+    server_info = {"supported_transports": ["streamable-http"]}
+
+    mock_session = AsyncMock()
+    mock_session.initialize = AsyncMock(return_value=None)
+    mock_session.list_tools = AsyncMock(return_value=mock_tools_response)
+
+    with patch("registry.core.mcp_client.streamablehttp_client") as mock_client:
+        mock_client.return_value.__aenter__.return_value = (MagicMock(), MagicMock(), MagicMock())
+
+        with patch("registry.core.mcp_client.ClientSession") as mock_session_class:
+            mock_session_class.return_value.__aenter__.return_value = mock_session
+
+            result = await get_mcp_connection_result(url, server_info)
+
+    assert result["transport"] == {
+        "url": url,
+        "transport": "streamable-http",
+        "endpoint": "http://localhost:8000/mcp/",
+    }
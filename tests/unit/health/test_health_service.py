@@ -1338,3 +1338,225 @@ def test_health_service_get_service_health_data_legacy_method(health_service, mo
     health_data = health_service._get_service_health_data(service_path, mock_server_info)
 
     assert health_data["status"] == HealthStatus.HEALTHY
+
+
+# =============================================================================
+# TOOL DISCOVERY SCHEDULING TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_schedule_tool_discovery_coalesces_per_server(health_service):
+    """A second fetch for a server with one in flight is not scheduled."""
+    release = asyncio.Event()
+
+    async def wait_for_release(*args):
+        await release.wait()
+
+    fetch = AsyncMock(side_effect=wait_for_release)
+
+    with patch.object(health_service, "_update_tools_background", fetch):
+        assert health_service._schedule_tool_discovery("/a", "http://a/mcp") is True
+        assert health_service._schedule_tool_discovery("/a", "http://a/mcp") is False
+        assert health_service._schedule_tool_discovery("/b", "http://b/mcp") is True
+
+        release.set()
+        await asyncio.gather(*health_service._tool_discovery_tasks.values())
+        await asyncio.sleep(0)
+
+        assert fetch.await_count == 2
+        assert health_service._tool_discovery_tasks == {}
+        assert health_service._schedule_tool_discovery("/a", "http://a/mcp") is True
+        await asyncio.gather(*health_service._tool_discovery_tasks.values())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_schedule_tool_discovery_bounds_concurrency(health_service):
+    """No more than tool_discovery_max_concurrency fetches run at once."""
+    health_service._tool_discovery_semaphore = asyncio.Semaphore(2)
+    in_flight = 0
+    peak = 0
+
+    async def fetch(*args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    with patch.object(health_service, "_update_tools_background", side_effect=fetch):
+        for i in range(6):
+            health_service._schedule_tool_discovery(f"/s{i}", f"http://s{i}/mcp")
+        await asyncio.gather(*health_service._tool_discovery_tasks.values())
+
+    assert peak == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_shutdown_cancels_pending_tool_discovery(health_service):
+    """Shutdown cancels fetches that are still running or waiting for a slot."""
+    health_service._tool_discovery_semaphore = asyncio.Semaphore(1)
+
+    async def hang(*args):
+        await asyncio.Event().wait()
+
+    with patch.object(health_service, "_update_tools_background", side_effect=hang):
+        health_service._schedule_tool_discovery("/a", "http://a/mcp")
+        health_service._schedule_tool_discovery("/b", "http://b/mcp")
+        tasks = list(health_service._tool_discovery_tasks.values())
+        await asyncio.sleep(0)
+
+        await health_service.shutdown()
+
+    assert all(task.cancelled() for task in tasks)
+    assert health_service._tool_discovery_tasks == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_check_single_service_passes_loaded_server_info(health_service, mock_server_info):
+    """The health check hands its credentialed server info to the tool fetch."""
+    with (
+        patch.object(
+            health_service,
+            "_check_server_endpoint_transport_aware",
+            return_value=(True, HealthStatus.HEALTHY),
+        ),
+        patch.object(health_service, "_schedule_tool_discovery") as schedule,
+    ):
+        await health_service._check_single_service(
+            AsyncMock(spec=httpx.AsyncClient), "/test-server", mock_server_info
+        )
+
+    schedule.assert_called_once_with(
+        "/test-server", mock_server_info["proxy_pass_url"], mock_server_info
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_update_tools_background_skips_unchanged_tool_list(health_service, mock_server_info):
+    """An identical tool list and version causes no write and no scope update."""
+    mock_server_info["mcp_server_version"] = "1.0.0"
+
+    with (
+        patch("registry.core.mcp_client.mcp_client_service") as mock_mcp,
+        patch("registry.services.server_service.server_service") as mock_server_service,
+        patch(
+            "registry.services.scope_service.update_server_scopes", new=AsyncMock()
+        ) as update_scopes,
+        patch("registry.health.service.asyncio.sleep", new=AsyncMock()),
+    ):
+        mock_mcp.get_mcp_connection_result = AsyncMock(
+            return_value={
+                "tools": [dict(tool) for tool in mock_server_info["tool_list"]],
+                "server_info": {"version": "1.0.0"},
+            }
+        )
+        mock_server_service.get_server_info = AsyncMock(return_value=mock_server_info)
+        mock_server_service.update_server = AsyncMock()
+
+        await health_service._update_tools_background(
+            "/test-server", "http://localhost:8000/mcp", mock_server_info
+        )
+
+    mock_server_service.update_server.assert_not_awaited()
+    update_scopes.assert_not_awaited()
+    # Only the current state is read; the credentialed info was passed in
+    mock_server_service.get_server_info.assert_awaited_once_with("/test-server")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_update_tools_background_changed_descriptions_keep_scopes(
+    health_service, mock_server_info
+):
+    """Changed tool details are stored, but scopes are only rewritten for new names."""
+    with (
+        patch("registry.core.mcp_client.mcp_client_service") as mock_mcp,
+        patch("registry.services.server_service.server_service") as mock_server_service,
+        patch(
+            "registry.services.scope_service.update_server_scopes", new=AsyncMock()
+        ) as update_scopes,
+        patch("registry.health.service.asyncio.sleep", new=AsyncMock()),
+        patch.object(health_service, "broadcast_health_update", new=AsyncMock()),
+    ):
+        mock_mcp.get_mcp_connection_result = AsyncMock(
+            return_value={
+                "tools": [{"name": "test_tool", "description": "A better description"}],
+                "server_info": None,
+            }
+        )
+        mock_server_service.get_server_info = AsyncMock(return_value=mock_server_info)
+        mock_server_service.update_server = AsyncMock()
+
+        await health_service._update_tools_background(
+            "/test-server", "http://localhost:8000/mcp", mock_server_info
+        )
+
+    mock_server_service.update_server.assert_awaited_once()
+    update_scopes.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_update_tools_background_persists_detected_transport(
+    health_service, mock_server_info
+):
+    """A newly detected transport is stored on the server document."""
+    detection = {"url": "http://localhost:8000", "transport": "sse", "endpoint": None}
+
+    with (
+        patch("registry.core.mcp_client.mcp_client_service") as mock_mcp,
+        patch("registry.services.server_service.server_service") as mock_server_service,
+        patch("registry.health.service.asyncio.sleep", new=AsyncMock()),
+        patch.object(health_service, "broadcast_health_update", new=AsyncMock()),
+    ):
+        mock_mcp.get_mcp_connection_result = AsyncMock(
+            return_value={
+                "tools": [dict(tool) for tool in mock_server_info["tool_list"]],
+                "server_info": None,
+                "transport": detection,
+            }
+        )
+        mock_server_service.get_server_info = AsyncMock(return_value=mock_server_info)
+        mock_server_service.update_server = AsyncMock()
+
+        await health_service._update_tools_background(
+            "/test-server", "http://localhost:8000", mock_server_info
+        )
+
+    stored = mock_server_service.update_server.await_args.args[1]
+    assert stored["detected_transport"] == detection
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_update_tools_background_clears_transport_after_failure(
+    health_service, mock_server_info
+):
+    """A failed connection removes the persisted transport so it is probed again."""
+    mock_server_info["detected_transport"] = {
+        "url": "http://localhost:8000",
+        "transport": "sse",
+        "endpoint": None,
+    }
+
+    with (
+        patch("registry.core.mcp_client.mcp_client_service") as mock_mcp,
+        patch("registry.services.server_service.server_service") as mock_server_service,
+        patch("registry.health.service.asyncio.sleep", new=AsyncMock()),
+    ):
+        mock_mcp.get_mcp_connection_result = AsyncMock(return_value=None)
+        mock_server_service.get_server_info = AsyncMock(return_value=mock_server_info)
+        mock_server_service.update_server = AsyncMock()
+
+        await health_service._update_tools_background(
+            "/test-server", "http://localhost:8000", mock_server_info
+        )
+
+    stored = mock_server_service.update_server.await_args.args[1]
+    assert stored["detected_transport"] is None
@@ -0,0 +1 @@
+"""Metrics unit tests package."""
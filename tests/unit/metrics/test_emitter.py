@@ -0,0 +1,169 @@
+"""
+Unit tests for registry.metrics.emitter module.
+
+Tests batching, size/time flush triggers, queue overflow and shutdown flush
+of the shared metrics emitter.
+"""
+
+import asyncio
+import json
+import logging
+
+import httpx
+import pytest
+
+from registry.metrics.emitter import (
+    MAX_BATCH_SIZE,
+    MetricsEmitter,
+    get_metrics_emitter,
+    shutdown_metrics_emitters,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def sent_batches() -> list[list[dict]]:
+    """Collects the metrics arrays POSTed to the fake metrics service."""
+    return []
+
+
+@pytest.fixture
+def make_emitter(sent_batches):
+    """Factory for emitters whose HTTP client records requests instead of sending them."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_batches.append(json.loads(request.content)["metrics"])
+        return httpx.Response(200, json={"accepted": True})
+
+    def _make(**kwargs) -> MetricsEmitter:
+        kwargs.setdefault("api_key", "test-key")
+        kwargs.setdefault("metrics_url", "http://metrics")
+        emitter = MetricsEmitter(service_name="test", **kwargs)
+        emitter._get_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return emitter
+
+    return _make
+
+
+def _metric(i: int) -> dict:
+    return {"type": "custom", "value": float(i), "dimensions": {}, "metadata": {}}
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestMetricsEmitter:
+    """Tests for MetricsEmitter."""
+
+    @pytest.mark.asyncio
+    async def test_size_trigger_sends_multi_metric_batches(self, make_emitter, sent_batches):
+        """Test that reaching batch_size flushes without waiting for the interval."""
+        emitter = make_emitter(batch_size=5, flush_interval_seconds=60)
+
+        for i in range(10):
+            emitter.enqueue(_metric(i))
+        await asyncio.sleep(0.05)
+
+        assert [len(batch) for batch in sent_batches] == [5, 5]
+        assert emitter.sent == 10
+        await emitter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_time_trigger_flushes_partial_batch(self, make_emitter, sent_batches):
+        """Test that a partial batch is sent once the flush interval elapses."""
+        emitter = make_emitter(batch_size=50, flush_interval_seconds=0.02)
+
+        emitter.enqueue(_metric(1))
+        await asyncio.sleep(0.1)
+
+        assert sent_batches == [[_metric(1)]]
+        await emitter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_counts(self, make_emitter):
+        """Test that metrics beyond max_queue_size are dropped and counted."""
+        emitter = make_emitter(max_queue_size=3, batch_size=50, flush_interval_seconds=60)
+
+        results = [emitter.enqueue(_metric(i)) for i in range(5)]
+
+        assert results == [True, True, True, False, False]
+        assert emitter.get_stats()["dropped"] == 2
+        await emitter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_flushes_queued_metrics(self, make_emitter, sent_batches):
+        """Test that shutdown sends everything still queued."""
+        emitter = make_emitter(batch_size=50, flush_interval_seconds=60)
+        for i in range(3):
+            emitter.enqueue(_metric(i))
+
+        await emitter.aclose()
+
+        assert sum(len(batch) for batch in sent_batches) == 3
+        assert emitter.enqueue(_metric(4)) is False
+
+    @pytest.mark.asyncio
+    async def test_aclose_tolerates_cancelled_flusher(self, make_emitter, sent_batches):
+        """Test that a flusher cancelled elsewhere does not fail shutdown."""
+        emitter = make_emitter(batch_size=50, flush_interval_seconds=60)
+        emitter.enqueue(_metric(1))
+        emitter._flusher_task.cancel()
+
+        await emitter.aclose()
+
+        assert sent_batches == [[_metric(1)]]
+
+    @pytest.mark.asyncio
+    async def test_aclose_propagates_its_own_cancellation(self, make_emitter):
+        """Test that cancelling the task running aclose is not swallowed."""
+        emitter = make_emitter(batch_size=1, flush_interval_seconds=60, timeout=5)
+        release = asyncio.Event()
+
+        async def slow_send(batch):
+            await release.wait()
+
+        emitter._send_batch = slow_send
+        emitter.enqueue(_metric(1))
+        flusher = emitter._flusher_task
+        await asyncio.sleep(0.01)
+        closing = asyncio.create_task(emitter.aclose())
+        await asyncio.sleep(0.01)
+        closing.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await closing
+        await asyncio.sleep(0)
+        assert flusher.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_api_key(self, make_emitter):
+        """Test that nothing is queued when no API key is configured."""
+        emitter = make_emitter(api_key="")
+
+        assert emitter.enqueue(_metric(1)) is False
+        assert emitter.get_stats()["queued"] == 0
+
+    def test_batch_size_capped_at_service_limit(self, make_emitter):
+        """Test that batches never exceed what the metrics service accepts."""
+        emitter = make_emitter(batch_size=1000)
+
+        assert emitter.batch_size == MAX_BATCH_SIZE
+
+    @pytest.mark.asyncio
+    async def test_shared_emitter_per_service(self):
+        """Test that callers for the same service share one emitter."""
+        first = get_metrics_emitter("shared-test", api_key="")
+        second = get_metrics_emitter("shared-test")
+
+        assert first is second
+        await shutdown_metrics_emitters()
+        assert get_metrics_emitter("shared-test", api_key="") is not first
+        await shutdown_metrics_emitters()
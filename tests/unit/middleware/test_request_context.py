@@ -0,0 +1,85 @@
+"""
+Unit tests for the shared request context used by the ASGI middlewares.
+"""
+
+import pytest
+
+from registry.middleware.request_context import (
+    REQUEST_CONTEXT_SCOPE_KEY,
+    bind_request_context,
+    get_request_context,
+)
+
+
+def _http_scope(
+    headers: dict[str, str] | None = None,
+) -> dict:
+    """Build a minimal ASGI HTTP scope."""
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/servers",
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "client": ("10.0.0.1", 12345),
+    }
+
+
+class TestBindRequestContext:
+    """Tests for creating and reusing the per-request context."""
+
+    def test_outermost_middleware_creates_context_and_wraps_send(self):
+        """The first bind stores the context in the scope and wraps send."""
+        scope = _http_scope()
+
+        async def send(message):
+            pass
+
+        context, wrapped = bind_request_context(scope, send)
+
+        assert scope[REQUEST_CONTEXT_SCOPE_KEY] is context
+        assert get_request_context(scope) is context
+        assert wrapped is not send
+
+    def test_inner_middleware_reuses_context_without_wrapping(self):
+        """Later binds return the same context and the unwrapped send."""
+        scope = _http_scope()
+
+        async def send(message):
+            pass
+
+        outer, wrapped = bind_request_context(scope, send)
+        inner, inner_send = bind_request_context(scope, wrapped)
+
+        assert inner is outer
+        assert inner_send is wrapped
+
+    @pytest.mark.asyncio
+    async def test_send_wrapper_records_status_and_headers(self):
+        """Status and headers of the response start message are recorded."""
+        scope = _http_scope()
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        context, wrapped = bind_request_context(scope, send)
+        await wrapped(
+            {
+                "type": "http.response.start",
+                "status": 201,
+                "headers": [(b"x-username", b"alice")],
+            }
+        )
+        await wrapped({"type": "http.response.body", "body": b"chunk", "more_body": True})
+
+        assert context.status_code == 201
+        assert context.response_headers["X-Username"] == "alice"
+        assert len(sent) == 2
+
+    def test_request_id_uses_header_when_present(self):
+        """X-Request-ID from the client is reused."""
+        context, _ = bind_request_context(_http_scope({"X-Request-ID": "abc"}), None)
+
+        assert context.request_id == "abc"
+        assert context.user_context is None
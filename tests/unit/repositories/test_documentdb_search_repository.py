@@ -0,0 +1,155 @@
+"""
+Unit tests for incremental indexing in the DocumentDB search repository.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from registry.repositories.documentdb.search_repository import (
+    DocumentDBSearchRepository,
+    _compute_content_hash,
+)
+from registry.schemas.skill_models import SkillCard
+
+SERVER_INFO = {
+    "server_name": "Docs",
+    "description": "Search documentation",
+    "tags": ["docs"],
+    "tool_list": [{"name": "search", "description": "Search docs"}],
+}
+
+
+class _AsyncCursor:
+    """Minimal async iterator standing in for a Motor cursor."""
+
+    def __init__(self, docs):
+        self._docs = list(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._docs:
+            raise StopAsyncIteration
+        return self._docs.pop(0)
+
+
+@pytest.fixture
+def repository() -> DocumentDBSearchRepository:
+    """Create a repository with a mocked collection and embedding model."""
+    with patch(
+        "registry.repositories.documentdb.search_repository.get_collection_name",
+        return_value="mcp_embeddings_test",
+    ):
+        repo = DocumentDBSearchRepository()
+
+    repo._collection = MagicMock()
+    repo._collection.bulk_write = AsyncMock()
+    model = MagicMock()
+    model.encode.side_effect = lambda texts: np.zeros((len(texts), 3), dtype=np.float32)
+    repo._embedding_model = model
+    return repo
+
+
+class TestIncrementalIndexing:
+    """Tests for skipping unchanged entities during bulk indexing."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_servers_are_skipped(self, repository):
+        """Servers whose stored hash matches are neither embedded nor written."""
+        doc = repository._build_server_document("/docs", SERVER_INFO, True)
+        stored_hash = _compute_content_hash(doc)
+        repository._collection.find.return_value = _AsyncCursor(
+            [{"_id": "/docs", "content_hash": stored_hash}]
+        )
+
+        indexed = await repository.index_servers([("/docs", SERVER_INFO, True)])
+
+        assert indexed == 0
+        repository._embedding_model.encode.assert_not_called()
+        repository._collection.bulk_write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_changed_servers_are_embedded_in_batches(self, repository):
+        """Changed servers are embedded with one model call per batch."""
+        repository._collection.find.return_value = _AsyncCursor(
+            [{"_id": "/s0", "content_hash": "stale"}]
+        )
+        entries = [(f"/s{i}", SERVER_INFO, i % 2 == 0) for i in range(5)]
+
+        with patch(
+            "registry.repositories.documentdb.search_repository.settings.search_index_batch_size",
+            2,
+        ):
+            indexed = await repository.index_servers(entries)
+
+        assert indexed == 5
+        assert repository._embedding_model.encode.call_count == 3
+        assert repository._collection.bulk_write.await_count == 3
+
+    def test_hash_changes_with_enabled_state(self, repository):
+        """Toggling a server changes its hash so the stored flag is refreshed."""
+        enabled = repository._build_server_document("/docs", SERVER_INFO, True)
+        disabled = repository._build_server_document("/docs", SERVER_INFO, False)
+
+        assert _compute_content_hash(enabled) != _compute_content_hash(disabled)
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_leaves_hash_unset(self, repository):
+        """Documents indexed without embeddings are retried on the next reindex."""
+        repository._collection.find.return_value = _AsyncCursor([])
+        repository._embedding_model.encode.side_effect = RuntimeError("model down")
+
+        await repository.index_servers([("/docs", SERVER_INFO, True)])
+
+        operation = repository._collection.bulk_write.await_args.args[0][0]
+        assert operation._doc["content_hash"] is None
+        assert operation._doc["embedding"] == []
+
+
+class TestSkillEmbeddingReuse:
+    """Tests for reusing stored skill embeddings when their inputs are unchanged."""
+
+    @staticmethod
+    def _skill() -> SkillCard:
+        return SkillCard(
+            path="/skills/pdf",
+            name="pdf",
+            description="Process PDF files",
+            skill_md_url="https://raw.githubusercontent.com/org/repo/main/pdf/SKILL.md",
+        )
+
+    @pytest.mark.asyncio
+    async def test_unchanged_skill_reuses_stored_embedding(self, repository):
+        """Re-indexing a skill with the same text does not call the model."""
+        repository._collection.find_one = AsyncMock(return_value=None)
+        repository._collection.replace_one = AsyncMock()
+        await repository.index_skill("/skills/pdf", self._skill())
+        stored = repository._collection.replace_one.await_args.args[1]
+        repository._embedding_model.encode.reset_mock()
+        repository._collection.find_one = AsyncMock(
+            return_value={"embedding_hash": stored["embedding_hash"], "embedding": [0.5, 0.5]}
+        )
+
+        await repository.index_skill("/skills/pdf", self._skill(), is_enabled=True)
+
+        repository._embedding_model.encode.assert_not_called()
+        reindexed = repository._collection.replace_one.await_args.args[1]
+        assert reindexed["embedding"] == [0.5, 0.5]
+        assert reindexed["is_enabled"] is True
+
+    @pytest.mark.asyncio
+    async def test_changed_text_is_embedded_again(self, repository):
+        """A skill whose embedded text changed gets a new embedding."""
+        repository._collection.find_one = AsyncMock(
+            return_value={"embedding_hash": "stale", "embedding": [0.5, 0.5]}
+        )
+        repository._collection.replace_one = AsyncMock()
+
+        await repository.index_skill("/skills/pdf", self._skill())
+
+        repository._embedding_model.encode.assert_called_once()
+        stored = repository._collection.replace_one.await_args.args[1]
+        assert stored["embedding"] == [0.0, 0.0, 0.0]
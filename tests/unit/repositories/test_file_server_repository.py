@@ -5,11 +5,11 @@ Tests the file-based repository implementation for MCP server storage.
 This includes file I/O operations, state management, and path conversions.
 """
 
+import asyncio
 import json
 import logging
-from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -24,19 +24,13 @@ logger = logging.getLogger(__name__)
 
 
 @pytest.fixture
-def mock_settings():
-    """Mock settings with test directories."""
+def mock_settings(tmp_path):
+    """Mock settings pointing at a temporary servers directory."""
     with patch("registry.repositories.file.server_repository.settings") as mock_settings:
-        # Create mock Path objects
-        mock_servers_dir = MagicMock(spec=Path)
-        mock_servers_dir.__truediv__ = lambda self, other: MagicMock(spec=Path)
-        mock_servers_dir.mkdir = MagicMock()
-
-        mock_state_path = MagicMock(spec=Path)
-        mock_state_path.exists = MagicMock(return_value=False)
-
-        mock_settings.servers_dir = mock_servers_dir
-        mock_settings.state_file_path = mock_state_path
+        servers_dir = tmp_path / "servers"
+        mock_settings.servers_dir = servers_dir
+        mock_settings.state_file_path = servers_dir / "server_state.json"
+        mock_settings.file_state_write_delay_seconds = 0
         yield mock_settings
 
 
@@ -58,6 +52,15 @@ def sample_server_dict() -> dict[str, Any]:
     }
 
 
+def _write_state_file(
+    mock_settings,
+    content: str,
+) -> None:
+    """Write raw content to the state file."""
+    mock_settings.servers_dir.mkdir(parents=True, exist_ok=True)
+    mock_settings.state_file_path.write_text(content)
+
+
 # =============================================================================
 # TEST: _path_to_filename Method
 # =============================================================================
@@ -122,49 +125,47 @@ class TestSaveToFile:
     @pytest.mark.asyncio
     async def test_save_to_file_success(self, server_repository, sample_server_dict, mock_settings):
         """Test successful file save."""
-        # Arrange
-        m = mock_open()
-
-        with patch("builtins.open", m):
-            # Act
-            result = await server_repository._save_to_file(sample_server_dict)
+        # Act
+        result = await server_repository._save_to_file(sample_server_dict)
 
-            # Assert
-            assert result is True
-            mock_settings.servers_dir.mkdir.assert_called_with(parents=True, exist_ok=True)
-            m.assert_called_once()
-            # Verify JSON was written
-            handle = m()
-            written_data = "".join(call.args[0] for call in handle.write.call_args_list)
-            assert "Test Server" in written_data
+        # Assert
+        assert result is True
+        written = json.loads((mock_settings.servers_dir / "test-server.json").read_text())
+        assert written["server_name"] == "Test Server"
+        assert [f.name for f in mock_settings.servers_dir.iterdir()] == ["test-server.json"]
 
     @pytest.mark.asyncio
     async def test_save_to_file_creates_directory(
         self, server_repository, sample_server_dict, mock_settings
     ):
         """Test that save creates directory if missing."""
-        # Arrange
-        m = mock_open()
-
-        with patch("builtins.open", m):
-            # Act
-            await server_repository._save_to_file(sample_server_dict)
+        # Act
+        await server_repository._save_to_file(sample_server_dict)
 
-            # Assert
-            mock_settings.servers_dir.mkdir.assert_called_with(parents=True, exist_ok=True)
+        # Assert
+        assert mock_settings.servers_dir.is_dir()
 
     @pytest.mark.asyncio
     async def test_save_to_file_handles_errors(
         self, server_repository, sample_server_dict, mock_settings
     ):
-        """Test error handling when save fails."""
+        """A failed write returns False and leaves the previous file intact."""
         # Arrange
-        with patch("builtins.open", side_effect=OSError("Disk full")):
+        await server_repository._save_to_file(sample_server_dict)
+        changed = {**sample_server_dict, "server_name": "Changed"}
+
+        with patch(
+            "registry.repositories.file.json_store.os.replace",
+            side_effect=OSError("Disk full"),
+        ):
             # Act
-            result = await server_repository._save_to_file(sample_server_dict)
+            result = await server_repository._save_to_file(changed)
 
-            # Assert
-            assert result is False
+        # Assert
+        assert result is False
+        written = json.loads((mock_settings.servers_dir / "test-server.json").read_text())
+        assert written["server_name"] == "Test Server"
+        assert [f.name for f in mock_settings.servers_dir.iterdir()] == ["test-server.json"]
 
 
 # =============================================================================
@@ -182,18 +183,14 @@ class TestSaveState:
         """Test successful state persistence."""
         # Arrange
         server_repository._state = {"/test1": True, "/test2": False}
-        m = mock_open()
+        mock_settings.servers_dir.mkdir()
 
-        with patch("builtins.open", m):
-            # Act
-            await server_repository._save_state()
+        # Act
+        await server_repository._save_state()
 
-            # Assert
-            m.assert_called_once_with(mock_settings.state_file_path, "w")
-            handle = m()
-            written_data = "".join(call.args[0] for call in handle.write.call_args_list)
-            parsed_data = json.loads(written_data)
-            assert parsed_data == {"/test1": True, "/test2": False}
+        # Assert
+        parsed_data = json.loads(mock_settings.state_file_path.read_text())
+        assert parsed_data == {"/test1": True, "/test2": False}
 
     @pytest.mark.asyncio
     async def test_save_state_handles_errors(self, server_repository, mock_settings):
@@ -201,12 +198,11 @@ class TestSaveState:
         # Arrange
         server_repository._state = {"/test": True}
 
-        with patch("builtins.open", side_effect=OSError("Permission denied")):
-            # Act - should not raise exception
-            await server_repository._save_state()
+        # Act - the servers directory does not exist; should not raise exception
+        await server_repository._save_state()
 
-            # Assert - just verify it doesn't crash
-            # Error is logged, operation continues
+        # Assert - error is logged, nothing is written
+        assert not mock_settings.state_file_path.exists()
 
 
 # =============================================================================
@@ -225,22 +221,19 @@ class TestLoadState:
         # Arrange
         server_repository._servers = {"/test1": {}, "/test2": {}}
         state_data = {"/test1": True, "/test2": False}
-        mock_settings.state_file_path.exists.return_value = True
-        m = mock_open(read_data=json.dumps(state_data))
+        _write_state_file(mock_settings, json.dumps(state_data))
 
-        with patch("builtins.open", m):
-            # Act
-            await server_repository._load_state()
+        # Act
+        await server_repository._load_state()
 
-            # Assert
-            assert server_repository._state == {"/test1": True, "/test2": False}
+        # Assert
+        assert server_repository._state == {"/test1": True, "/test2": False}
 
     @pytest.mark.asyncio
     async def test_load_state_no_file(self, server_repository, mock_settings):
         """Test loading state when file doesn't exist."""
         # Arrange
         server_repository._servers = {"/test1": {}, "/test2": {}}
-        mock_settings.state_file_path.exists.return_value = False
 
         # Act
         await server_repository._load_state()
@@ -257,31 +250,27 @@ class TestLoadState:
         # Arrange
         server_repository._servers = {"/test": {}}
         state_data = {"/test/": True}  # State has trailing slash
-        mock_settings.state_file_path.exists.return_value = True
-        m = mock_open(read_data=json.dumps(state_data))
+        _write_state_file(mock_settings, json.dumps(state_data))
 
-        with patch("builtins.open", m):
-            # Act
-            await server_repository._load_state()
+        # Act
+        await server_repository._load_state()
 
-            # Assert
-            assert server_repository._state["/test"] is True
+        # Assert
+        assert server_repository._state["/test"] is True
 
     @pytest.mark.asyncio
     async def test_load_state_handles_corrupt_file(self, server_repository, mock_settings):
         """Test loading state when file is corrupted."""
         # Arrange
         server_repository._servers = {"/test": {}}
-        mock_settings.state_file_path.exists.return_value = True
-        m = mock_open(read_data="invalid json {{{")
+        _write_state_file(mock_settings, "invalid json {{{")
 
-        with patch("builtins.open", m):
-            # Act
-            await server_repository._load_state()
+        # Act
+        await server_repository._load_state()
 
-            # Assert
-            # Should fall back to default (disabled)
-            assert server_repository._state == {"/test": False}
+        # Assert
+        # Should fall back to default (disabled)
+        assert server_repository._state == {"/test": False}
 
 
 # =============================================================================
@@ -299,18 +288,15 @@ class TestFileServerRepositoryIntegration:
         self, server_repository, sample_server_dict, mock_settings
     ):
         """Test creating and retrieving a server."""
-        # Arrange
-        m = mock_open()
-
-        with patch("builtins.open", m):
-            # Act
-            create_result = await server_repository.create(sample_server_dict)
-            get_result = await server_repository.get("/test-server")
+        # Act
+        create_result = await server_repository.create(sample_server_dict)
+        get_result = await server_repository.get("/test-server")
 
-            # Assert
-            assert create_result is True
-            assert get_result == sample_server_dict
-            assert server_repository._state["/test-server"] is False  # Disabled by default
+        # Assert
+        assert create_result is True
+        assert get_result == sample_server_dict
+        assert server_repository._state["/test-server"] is False  # Disabled by default
+        assert json.loads(mock_settings.state_file_path.read_text()) == {"/test-server": False}
 
     @pytest.mark.asyncio
     async def test_update_server_saves_to_file(
@@ -322,13 +308,126 @@ class TestFileServerRepositoryIntegration:
         updated_data = sample_server_dict.copy()
         updated_data["description"] = "Updated description"
 
-        m = mock_open()
+        # Act
+        result = await server_repository.update("/test-server", updated_data)
 
-        with patch("builtins.open", m):
-            # Act
-            result = await server_repository.update("/test-server", updated_data)
+        # Assert
+        assert result is True
+        written = json.loads((mock_settings.servers_dir / "test-server.json").read_text())
+        assert written["description"] == "Updated description"
+
+    @pytest.mark.asyncio
+    async def test_load_all_reads_written_servers(
+        self, server_repository, sample_server_dict, mock_settings
+    ):
+        """Servers and state written by one instance are loaded by the next."""
+        # Arrange
+        await server_repository.create(sample_server_dict)
+        await server_repository.set_state("/test-server", True)
+        (mock_settings.servers_dir / "broken.json").write_text("{not json")
+
+        # Act
+        reloaded = FileServerRepository()
+        await reloaded.load_all()
+
+        # Assert
+        assert list(await reloaded.list_all()) == ["/test-server"]
+        assert await reloaded.get_state("/test-server") is True
+
+
+# =============================================================================
+# TEST: list_page Method
+# =============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.repositories
+class TestListPage:
+    """Tests for keyset pagination over the sorted name index."""
+
+    @pytest.fixture
+    async def populated_repository(self, server_repository):
+        """Repository with five servers, one inactive version and one enabled server."""
+        for name in ("delta", "alpha", "echo", "charlie", "bravo"):
+            await server_repository.create({"path": f"/{name}", "server_name": name})
+        await server_repository.create(
+            {"path": "/bravo:v2", "server_name": "bravo", "is_active": False}
+        )
+        await server_repository.set_state("/charlie", True)
+        return server_repository
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_name_order(self, populated_repository):
+        """Consecutive pages continue after the cursor and skip inactive versions."""
+        first = await populated_repository.list_page(limit=2)
+        second = await populated_repository.list_page(after="bravo", limit=2)
+        last = await populated_repository.list_page(after="delta", limit=2)
+
+        assert [s["path"] for s in first] == ["/alpha", "/bravo"]
+        assert [s["path"] for s in second] == ["/charlie", "/delta"]
+        assert [s["path"] for s in last] == ["/echo"]
+        assert second[0]["is_enabled"] is True
+        assert second[1]["is_enabled"] is False
+
+    @pytest.mark.asyncio
+    async def test_name_keys_restrict_the_page(self, populated_repository):
+        """Only servers in name_keys are listed, still in name order."""
+        page = await populated_repository.list_page(
+            after="alpha", limit=10, name_keys=["echo", "alpha", "charlie", "missing"]
+        )
+
+        assert [s["path"] for s in page] == ["/charlie", "/echo"]
+
+    @pytest.mark.asyncio
+    async def test_deleted_server_leaves_the_index(self, populated_repository):
+        """Deleting a server removes it from later pages."""
+        await populated_repository.delete("/charlie")
+        await populated_repository.delete_with_versions("/bravo")
+
+        page = await populated_repository.list_page(limit=10)
+
+        assert [s["path"] for s in page] == ["/alpha", "/delta", "/echo"]
+
+
+# =============================================================================
+# TEST: Debounced State Writes
+# =============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.repositories
+class TestDebouncedStateWrites:
+    """Tests for coalescing state file writes."""
+
+    @pytest.fixture
+    async def debounced_repository(self, mock_settings, sample_server_dict):
+        """Repository with one server whose state writes are delayed."""
+        mock_settings.file_state_write_delay_seconds = 0.01
+        repository = FileServerRepository()
+        await repository.create(sample_server_dict)
+        await repository.flush()
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_burst_of_changes_is_written_once(self, debounced_repository):
+        """Several toggles within the delay produce one write of the final state."""
+        with patch(
+            "registry.repositories.file.server_repository.write_json", new=AsyncMock()
+        ) as write_json:
+            for enabled in (True, False, True):
+                await debounced_repository.set_state("/test-server", enabled)
+            await asyncio.sleep(0.05)
+
+        write_json.assert_awaited_once()
+        assert write_json.await_args.args[1] == {"/test-server": True}
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_pending_state(self, debounced_repository, mock_settings):
+        """flush() writes a pending change without waiting for the delay."""
+        await debounced_repository.set_state("/test-server", True)
+
+        await debounced_repository.flush()
 
-            # Assert
-            assert result is True
-            # Verify file was written
-            m.assert_called()
+        assert json.loads(mock_settings.state_file_path.read_text()) == {"/test-server": True}
+        assert not debounced_repository._state_writer.pending
+        await asyncio.sleep(0.02)
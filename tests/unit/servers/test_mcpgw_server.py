@@ -0,0 +1,201 @@
+"""
+Unit tests for the pooled client and response cache of the mcpgw server.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+pytest.importorskip("fastmcp")
+
+MCPGW_DIR = Path(__file__).resolve().parents[3] / "servers" / "mcpgw"
+
+
+def _load_module(
+    name: str,
+    filename: str,
+):
+    spec = importlib.util.spec_from_file_location(name, MCPGW_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# server.py imports its sibling as the top-level `models` module; load both
+# under private names so they cannot clash with other `models` modules.
+with patch.dict(sys.modules):
+    sys.modules["models"] = _load_module("mcpgw_models", "models.py")
+    mcpgw = _load_module("mcpgw_server", "server.py")
+
+SERVERS = {"servers": [{"server_name": "Docs", "path": "/docs", "is_enabled": True}]}
+
+
+class _Registry:
+    """Mock registry answering GETs with a fixed payload and ETag."""
+
+    def __init__(
+        self,
+        payload: dict,
+        etag: str | None = '"v1"',
+    ):
+        self.payload = payload
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+
+    def handler(
+        self,
+        request: httpx.Request,
+    ) -> httpx.Response:
+        self.requests.append(request)
+        if self.etag and request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        headers = {"ETag": self.etag} if self.etag else {}
+        return httpx.Response(200, json=self.payload, headers=headers)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Route the shared client to a mock registry and start with an empty cache."""
+    mock = _Registry(SERVERS)
+    monkeypatch.setattr(
+        mcpgw,
+        "_http_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(mock.handler)),
+    )
+    mcpgw._response_cache.clear()
+    yield mock
+    mcpgw._response_cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for TTL tests."""
+    now = [1000.0]
+    monkeypatch.setattr(mcpgw.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+class TestCachedRegistryGet:
+    """Tests for _cached_registry_get."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_is_served_without_a_request(self, registry, clock):
+        """A second call within the TTL does not reach the registry."""
+        first = await mcpgw._cached_registry_get("/api/servers", "token-a", mcpgw._parse_services)
+        second = await mcpgw._cached_registry_get("/api/servers", "token-a", mcpgw._parse_services)
+
+        assert first == second
+        assert len(registry.requests) == 1
+        assert registry.requests[0].headers["x-authorization"] == "Bearer token-a"
+
+    @pytest.mark.asyncio
+    async def test_cache_is_scoped_per_token(self, registry, clock):
+        """Different tokens never share an entry."""
+        await mcpgw._cached_registry_get("/api/servers", "token-a", mcpgw._parse_services)
+        await mcpgw._cached_registry_get("/api/servers", "token-b", mcpgw._parse_services)
+
+        assert len(registry.requests) == 2
+        assert "if-none-match" not in registry.requests[1].headers
+        assert all("token" not in scope for scope, _ in mcpgw._response_cache)
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_revalidated_with_etag(self, registry, clock):
+        """After the TTL a 304 reuses the cached value and extends its lifetime."""
+        transform_calls = []
+
+        def transform(data):
+            transform_calls.append(data)
+            return mcpgw._parse_services(data)
+
+        await mcpgw._cached_registry_get("/api/servers", "token-a", transform)
+        clock[0] += mcpgw.CACHE_TTL_SECONDS + 1
+        value = await mcpgw._cached_registry_get("/api/servers", "token-a", transform)
+        await mcpgw._cached_registry_get("/api/servers", "token-a", transform)
+
+        assert registry.requests[1].headers["if-none-match"] == '"v1"'
+        assert len(registry.requests) == 2
+        assert len(transform_calls) == 1
+        assert value[0]["path"] == "/docs"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_without_etag_is_downloaded_again(self, registry, clock):
+        """Without an ETag the stale entry is fetched unconditionally."""
+        registry.etag = None
+
+        await mcpgw._cached_registry_get("/api/servers", "token-a", mcpgw._parse_services)
+        clock[0] += mcpgw.CACHE_TTL_SECONDS + 1
+        await mcpgw._cached_registry_get("/api/servers", "token-a", mcpgw._parse_services)
+
+        assert len(registry.requests) == 2
+        assert "if-none-match" not in registry.requests[1].headers
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, registry, clock, monkeypatch):
+        """The cache never holds more than CACHE_MAX_ENTRIES entries."""
+        monkeypatch.setattr(mcpgw, "CACHE_MAX_ENTRIES", 2)
+
+        for token in ("a", "b", "a", "c"):
+            await mcpgw._cached_registry_get("/api/servers", token, mcpgw._parse_services)
+
+        scopes = [scope for scope, _ in mcpgw._response_cache]
+        assert scopes == [mcpgw._token_scope("a"), mcpgw._token_scope("c")]
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises_and_is_not_cached(self, registry, clock):
+        """Registry errors propagate and leave the cache empty."""
+        registry.handler = lambda request: httpx.Response(403)
+        mcpgw._http_client._transport = httpx.MockTransport(registry.handler)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await mcpgw._cached_registry_get("/api/servers", "token-a", mcpgw._parse_services)
+
+        assert not mcpgw._response_cache
+
+
+@pytest.mark.unit
+class TestParsers:
+    """Tests for the registry payload parsers."""
+
+    def test_parse_services_accepts_wrapped_and_bare_lists(self):
+        """Both {"servers": [...]} and a bare list are accepted."""
+        wrapped = mcpgw._parse_services(SERVERS)
+        bare = mcpgw._parse_services(SERVERS["servers"])
+
+        assert wrapped == bare
+        assert wrapped[0]["path"] == "/docs"
+        assert mcpgw._parse_services("unexpected") == []
+
+    def test_parse_services_skips_invalid_entries(self):
+        """An invalid server is skipped instead of failing the whole list."""
+        data = {"servers": [{"path": "/broken"}, SERVERS["servers"][0]]}
+
+        assert [s["path"] for s in mcpgw._parse_services(data)] == ["/docs"]
+
+    def test_parse_agents_and_skills(self):
+        """Agents and skills are read from their wrapper key or a bare list."""
+        agents = mcpgw._parse_agents({"agents": [{"name": "planner", "tags": ["a"]}]})
+        skills = mcpgw._parse_skills([{"path": "/skills/pdf", "name": "pdf"}])
+
+        assert agents[0]["name"] == "planner"
+        assert skills[0]["path"] == "/skills/pdf"
+
+
+@pytest.mark.unit
+class TestLifespan:
+    """Tests for closing the shared client on shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_shared_client(self, registry):
+        """Leaving the lifespan closes the client and clears the cache."""
+        async with mcpgw._lifespan(mcpgw.mcp):
+            client = mcpgw._get_http_client()
+            mcpgw._response_cache[("scope", "/api/servers")] = None
+
+        assert client.is_closed
+        assert mcpgw._http_client is None
+        assert not mcpgw._response_cache
@@ -24,7 +24,7 @@ from tests.fixtures.constants import (
     TRUST_UNVERIFIED,
     VISIBILITY_PUBLIC,
 )
-from tests.fixtures.factories import AgentCardFactory
+from tests.fixtures.factories import AgentCardFactory, SkillFactory
 
 logger = logging.getLogger(__name__)
 
@@ -226,7 +226,7 @@ class TestAgentServiceInstantiation:
         """Test that __init__ creates empty registries."""
         # Assert
         assert agent_service.registered_agents == {}
-        assert agent_service.agent_state == {"enabled": [], "disabled": []}
+        assert agent_service.agent_state == {"enabled": set(), "disabled": set()}
 
     def test_init_does_not_load_agents(
         self,
@@ -665,7 +665,7 @@ class TestDeleteAgent:
         # Arrange
         agent_card = AgentCardFactory(path="/test-agent")
         agent_service.registered_agents["/test-agent"] = agent_card
-        agent_service.agent_state["disabled"].append("/test-agent")
+        agent_service.agent_state["disabled"].add("/test-agent")
         mock_agent_repository.delete.return_value = True
 
         # Act
@@ -687,7 +687,7 @@ class TestDeleteAgent:
         # Arrange
         agent_card = AgentCardFactory(path="/test-agent")
         agent_service.registered_agents["/test-agent"] = agent_card
-        agent_service.agent_state["enabled"].append("/test-agent")
+        agent_service.agent_state["enabled"].add("/test-agent")
         mock_agent_repository.delete.return_value = True
 
         # Act
@@ -720,7 +720,7 @@ class TestDeleteAgent:
         # Arrange
         agent_card = AgentCardFactory(path="/test-agent")
         agent_service.registered_agents["/test-agent"] = agent_card
-        agent_service.agent_state["disabled"].append("/test-agent")
+        agent_service.agent_state["disabled"].add("/test-agent")
         mock_agent_repository.delete.return_value = True
 
         # Act
@@ -766,7 +766,7 @@ class TestEnableDisableAgent:
         # Arrange
         agent_card = AgentCardFactory(path="/test-agent")
         agent_service.registered_agents["/test-agent"] = agent_card
-        agent_service.agent_state["disabled"].append("/test-agent")
+        agent_service.agent_state["disabled"].add("/test-agent")
 
         # Act
         await agent_service.enable_agent("/test-agent")
@@ -786,7 +786,7 @@ class TestEnableDisableAgent:
         # Arrange
         agent_card = AgentCardFactory(path="/test-agent")
         agent_service.registered_agents["/test-agent"] = agent_card
-        agent_service.agent_state["enabled"].append("/test-agent")
+        agent_service.agent_state["enabled"].add("/test-agent")
 
         # Act - enable again
         await agent_service.enable_agent("/test-agent")
@@ -794,7 +794,7 @@ class TestEnableDisableAgent:
         # Assert
         assert "/test-agent" in agent_service.agent_state["enabled"]
         # Should only appear once
-        assert agent_service.agent_state["enabled"].count("/test-agent") == 1
+        assert len(agent_service.agent_state["enabled"]) == 1
 
     @pytest.mark.asyncio
     async def test_enable_agent_not_found(
@@ -819,7 +819,7 @@ class TestEnableDisableAgent:
         # Arrange
         agent_card = AgentCardFactory(path="/test-agent")
         agent_service.registered_agents["/test-agent"] = agent_card
-        agent_service.agent_state["enabled"].append("/test-agent")
+        agent_service.agent_state["enabled"].add("/test-agent")
 
         # Act
         await agent_service.disable_agent("/test-agent")
@@ -839,7 +839,7 @@ class TestEnableDisableAgent:
         # Arrange
         agent_card = AgentCardFactory(path="/test-agent")
         agent_service.registered_agents["/test-agent"] = agent_card
-        agent_service.agent_state["disabled"].append("/test-agent")
+        agent_service.agent_state["disabled"].add("/test-agent")
 
         # Act - disable again (already disabled by default)
         await agent_service.disable_agent("/test-agent")
@@ -847,7 +847,7 @@ class TestEnableDisableAgent:
         # Assert
         assert "/test-agent" in agent_service.agent_state["disabled"]
         # Should only appear once
-        assert agent_service.agent_state["disabled"].count("/test-agent") == 1
+        assert len(agent_service.agent_state["disabled"]) == 1
 
     @pytest.mark.asyncio
     async def test_disable_agent_not_found(
@@ -872,7 +872,7 @@ class TestEnableDisableAgent:
         # Arrange
         agent_card = AgentCardFactory(path="/test-agent")
         agent_service.registered_agents["/test-agent"] = agent_card
-        agent_service.agent_state["disabled"].append("/test-agent")
+        agent_service.agent_state["disabled"].add("/test-agent")
 
         # Act
         result = await agent_service.toggle_agent("/test-agent", enabled=True)
@@ -892,7 +892,7 @@ class TestEnableDisableAgent:
         # Arrange
         agent_card = AgentCardFactory(path="/test-agent")
         agent_service.registered_agents["/test-agent"] = agent_card
-        agent_service.agent_state["enabled"].append("/test-agent")
+        agent_service.agent_state["enabled"].add("/test-agent")
 
         # Act
         result = await agent_service.toggle_agent("/test-agent", enabled=False)
@@ -934,7 +934,7 @@ class TestAgentStateQueries:
     ):
         """Test checking if agent is enabled."""
         # Arrange
-        agent_service.agent_state["enabled"].append("/test-agent")
+        agent_service.agent_state["enabled"].add("/test-agent")
 
         # Act
         result = agent_service.is_agent_enabled("/test-agent")
@@ -950,7 +950,7 @@ class TestAgentStateQueries:
     ):
         """Test checking if agent is disabled."""
         # Arrange
-        agent_service.agent_state["disabled"].append("/test-agent")
+        agent_service.agent_state["disabled"].add("/test-agent")
 
         # Act
         result = agent_service.is_agent_enabled("/test-agent")
@@ -966,7 +966,7 @@ class TestAgentStateQueries:
     ):
         """Test is_agent_enabled with trailing slash."""
         # Arrange
-        agent_service.agent_state["enabled"].append("/test-agent")
+        agent_service.agent_state["enabled"].add("/test-agent")
 
         # Act
         result = agent_service.is_agent_enabled("/test-agent/")
@@ -982,8 +982,8 @@ class TestAgentStateQueries:
     ):
         """Test getting list of enabled agents."""
         # Arrange
-        agent_service.agent_state["enabled"].append("/agent-1")
-        agent_service.agent_state["disabled"].append("/agent-2")
+        agent_service.agent_state["enabled"].add("/agent-1")
+        agent_service.agent_state["disabled"].add("/agent-2")
 
         # Act
         result = agent_service.get_enabled_agents()
@@ -1001,8 +1001,8 @@ class TestAgentStateQueries:
     ):
         """Test getting list of disabled agents."""
         # Arrange
-        agent_service.agent_state["enabled"].append("/agent-1")
-        agent_service.agent_state["disabled"].append("/agent-2")
+        agent_service.agent_state["enabled"].add("/agent-1")
+        agent_service.agent_state["disabled"].add("/agent-2")
 
         # Act
         result = agent_service.get_disabled_agents()
@@ -1011,3 +1011,82 @@ class TestAgentStateQueries:
         assert len(result) == 1
         assert "/agent-2" in result
         assert "/agent-1" not in result
+
+
+# =============================================================================
+# TEST: Skill Discovery Index
+# =============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.agents
+class TestSkillDiscoveryIndex:
+    """Test the inverted skill/tag index used for agent discovery."""
+
+    @pytest.mark.asyncio
+    async def test_registered_agent_is_discoverable_once_enabled(
+        self,
+        agent_service: AgentService,
+        mock_agent_repository,
+        mock_search_repository,
+    ):
+        """Test that registration indexes skills and discovery honours enabled state."""
+        # Arrange
+        agent_card = AgentCardFactory(
+            path="/data-agent",
+            skills=[SkillFactory(id="data-retrieval", name="Data Retrieval")],
+            tags=["Production"],
+        )
+        mock_agent_repository.create.return_value = agent_card
+
+        # Act
+        await agent_service.register_agent(agent_card)
+        before_enable = agent_service.find_agents_by_skills(["DATA-RETRIEVAL"])
+        await agent_service.enable_agent("/data-agent")
+        after_enable = agent_service.find_agents_by_skills(
+            ["data retrieval", "unknown"], tags=["production"]
+        )
+
+        # Assert
+        assert before_enable == []
+        assert len(after_enable) == 1
+        agent, skill_matches, tag_matches = after_enable[0]
+        assert agent.path == "/data-agent"
+        assert skill_matches == {"data retrieval"}
+        assert tag_matches == {"production"}
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_maintain_index(
+        self,
+        agent_service: AgentService,
+        mock_agent_repository,
+        mock_search_repository,
+    ):
+        """Test that updates replace indexed skills and deletes remove them."""
+        # Arrange
+        agent_card = AgentCardFactory(
+            path="/data-agent",
+            skills=[SkillFactory(id="old-skill", name="Old Skill")],
+        )
+        agent_service.registered_agents["/data-agent"] = agent_card
+        agent_service.agent_state["enabled"].add("/data-agent")
+        agent_service._rebuild_discovery_index()
+        mock_agent_repository.save.side_effect = lambda agent: agent
+
+        # Act
+        await agent_service.update_agent(
+            "/data-agent",
+            {
+                "skills": [
+                    {"id": "new-skill", "name": "New Skill", "description": "New", "tags": []}
+                ]
+            },
+        )
+
+        # Assert
+        assert agent_service.find_agents_by_skills(["old-skill"]) == []
+        assert len(agent_service.find_agents_by_skills(["new-skill"])) == 1
+
+        await agent_service.delete_agent("/data-agent")
+        assert agent_service.find_agents_by_skills(["new-skill"]) == []
+        assert "new-skill" not in agent_service._skill_index
@@ -0,0 +1,208 @@
+"""
+Unit tests for registry.services.security_scanner module.
+
+This module tests scan concurrency limits, subprocess timeouts and the
+result cache keyed by server URL, tool-list hash and analyzers.
+"""
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from registry.services.security_scanner import (
+    SecurityScannerService,
+    _get_backend_key,
+)
+from registry.utils.tool_hash import compute_tool_list_hash
+
+logger = logging.getLogger(__name__)
+
+
+TOOL_LIST = [{"name": "search", "description": "Search docs"}]
+CLEAN_OUTPUT = {"analysis_results": {}, "tool_results": []}
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def scanner_service() -> SecurityScannerService:
+    """Create a SecurityScannerService with a mocked scan repository."""
+    with patch(
+        "registry.services.security_scanner.get_security_scan_repository",
+        return_value=MagicMock(create=AsyncMock(return_value=True)),
+    ):
+        service = SecurityScannerService()
+    return service
+
+
+# =============================================================================
+# HELPER TESTS
+# =============================================================================
+
+
+class TestHelpers:
+    """Tests for module-level helpers."""
+
+    def test_tool_list_hash_is_order_insensitive_for_keys(self):
+        """Test that key order inside tool definitions does not change the hash."""
+        first = [{"name": "a", "description": "x"}]
+        second = [{"description": "x", "name": "a"}]
+
+        assert compute_tool_list_hash(first) == compute_tool_list_hash(second)
+
+    def test_tool_list_hash_none_for_empty(self):
+        """Test that servers without known tools are not hashed."""
+        assert compute_tool_list_hash(None) is None
+        assert compute_tool_list_hash([]) is None
+
+    def test_backend_key_uses_host_and_port(self):
+        """Test that scans are grouped by backend host."""
+        assert _get_backend_key("http://Example.com:8080/a/mcp") == "example.com:8080"
+
+
+# =============================================================================
+# RESULT CACHE TESTS
+# =============================================================================
+
+
+class TestResultCache:
+    """Tests for reusing scan results of unchanged servers."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_server_is_not_rescanned(self, scanner_service):
+        """Test that a second scan with the same tool list reuses the result."""
+        with patch.object(
+            scanner_service, "_run_mcp_scanner", AsyncMock(return_value=CLEAN_OUTPUT)
+        ) as mock_run:
+            first = await scanner_service.scan_server(
+                "http://backend:8000", server_path="/a", tool_list=TOOL_LIST
+            )
+            second = await scanner_service.scan_server(
+                "http://backend:8000", server_path="/a", tool_list=TOOL_LIST
+            )
+
+        assert mock_run.await_count == 1
+        assert second.scan_timestamp == first.scan_timestamp
+
+    @pytest.mark.asyncio
+    async def test_changed_tool_list_triggers_scan(self, scanner_service):
+        """Test that a different tool list bypasses the cache."""
+        with patch.object(
+            scanner_service, "_run_mcp_scanner", AsyncMock(return_value=CLEAN_OUTPUT)
+        ) as mock_run:
+            await scanner_service.scan_server("http://backend:8000", tool_list=TOOL_LIST)
+            await scanner_service.scan_server(
+                "http://backend:8000", tool_list=TOOL_LIST + [{"name": "new"}]
+            )
+
+        assert mock_run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_force_bypasses_cache(self, scanner_service):
+        """Test that forced scans always run the scanner."""
+        with patch.object(
+            scanner_service, "_run_mcp_scanner", AsyncMock(return_value=CLEAN_OUTPUT)
+        ) as mock_run:
+            await scanner_service.scan_server("http://backend:8000", tool_list=TOOL_LIST)
+            await scanner_service.scan_server(
+                "http://backend:8000", tool_list=TOOL_LIST, force=True
+            )
+
+        assert mock_run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_scans_are_not_cached(self, scanner_service):
+        """Test that scanner failures are retried on the next scan."""
+        with patch.object(
+            scanner_service,
+            "_run_mcp_scanner",
+            AsyncMock(side_effect=RuntimeError("scanner failed")),
+        ) as mock_run:
+            result = await scanner_service.scan_server("http://backend:8000", tool_list=TOOL_LIST)
+            await scanner_service.scan_server("http://backend:8000", tool_list=TOOL_LIST)
+
+        assert result.scan_failed is True
+        assert mock_run.await_count == 2
+
+
+# =============================================================================
+# CONCURRENCY AND SUBPROCESS TESTS
+# =============================================================================
+
+
+class TestScanExecution:
+    """Tests for scan concurrency limits and subprocess handling."""
+
+    @pytest.mark.asyncio
+    async def test_per_backend_limit(self, scanner_service):
+        """Test that scans against one backend respect the per-backend limit."""
+        scanner_service._backend_semaphores.clear()
+        running = 0
+        peak = 0
+
+        async def fake_run(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return CLEAN_OUTPUT
+
+        with (
+            patch("registry.services.security_scanner.settings.security_scan_max_per_backend", 1),
+            patch.object(scanner_service, "_run_mcp_scanner", side_effect=fake_run),
+        ):
+            await asyncio.gather(
+                *(
+                    scanner_service.scan_server(f"http://backend:8000/s{i}", force=True)
+                    for i in range(3)
+                )
+            )
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_subprocess(self, scanner_service):
+        """Test that a scan exceeding its timeout kills the scanner process."""
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        process = MagicMock()
+        process.returncode = None
+        process.communicate = AsyncMock(side_effect=hang)
+        process.wait = AsyncMock(return_value=-9)
+
+        with patch(
+            "registry.services.security_scanner.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=process),
+        ):
+            with pytest.raises(RuntimeError, match="timed out"):
+                await scanner_service._run_mcp_scanner(
+                    server_url="http://backend:8000/mcp", analyzers="yara", timeout=0.01
+                )
+
+        process.kill.assert_called_once()
+        process.wait.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_nonzero_exit_returns_failed_result(self, scanner_service):
+        """Test that a scanner exiting non-zero yields a failed, unsafe result."""
+        process = MagicMock()
+        process.returncode = 2
+        process.communicate = AsyncMock(return_value=(b"", b"connection refused"))
+
+        with patch(
+            "registry.services.security_scanner.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=process),
+        ):
+            result = await scanner_service.scan_server("http://backend:8000/mcp", force=True)
+
+        assert result.scan_failed is True
+        assert result.is_safe is False
+        assert "connection refused" in result.error_message
@@ -0,0 +1,304 @@
+"""
+Unit tests for batch skill health refresh and the SKILL.md content cache.
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from registry.schemas.skill_models import SkillCard
+from registry.services import skill_service as skill_service_module
+from registry.services.skill_service import (
+    SkillService,
+    _fetch_skill_md,
+    _is_safe_url,
+    _probe_skill_md,
+)
+
+SKILL_MD = b"---\nname: pdf-processing\n---\n# PDF processing\n"
+
+
+def _skill(
+    name: str,
+    **kwargs,
+) -> SkillCard:
+    """Build a skill hosted on raw.githubusercontent.com."""
+    return SkillCard(
+        path=f"/skills/{name}",
+        name=name,
+        description="Test skill",
+        skill_md_url=f"https://raw.githubusercontent.com/org/repo/main/{name}/SKILL.md",
+        **kwargs,
+    )
+
+
+def _client(handler) -> httpx.AsyncClient:
+    """Create a client answering requests with the given handler."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture(autouse=True)
+def clear_host_verdicts():
+    """Start every test with an empty SSRF verdict cache."""
+    skill_service_module._host_verdicts.clear()
+    yield
+    skill_service_module._host_verdicts.clear()
+
+
+@pytest.mark.unit
+class TestHostVerdictCache:
+    """Tests for caching SSRF verdicts per host during the health refresh."""
+
+    def test_host_is_resolved_once_within_ttl(self):
+        """Repeated cached checks for the same host do not resolve it again."""
+        addr_info = [(2, 1, 6, "", ("93.184.216.34", 443))]
+        with patch.object(
+            skill_service_module.socket, "getaddrinfo", return_value=addr_info
+        ) as getaddrinfo:
+            assert _is_safe_url("https://skills.example.com/a/SKILL.md", use_cached_verdict=True)
+            assert _is_safe_url("https://skills.example.com/b/SKILL.md", use_cached_verdict=True)
+
+        assert getaddrinfo.call_count == 1
+
+    def test_uncached_checks_always_resolve(self):
+        """Registration-time checks ignore the cache, so a rebound host is blocked."""
+        public = [(2, 1, 6, "", ("93.184.216.34", 443))]
+        private = [(2, 1, 6, "", ("10.0.0.5", 443))]
+        with patch.object(skill_service_module.socket, "getaddrinfo", return_value=public):
+            assert _is_safe_url("https://skills.example.com/SKILL.md", use_cached_verdict=True)
+
+        with patch.object(skill_service_module.socket, "getaddrinfo", return_value=private):
+            assert not _is_safe_url("https://skills.example.com/SKILL.md")
+
+    def test_cache_evicts_least_recently_used_host(self):
+        """The cache never holds more than skill_url_verdict_cache_size hosts."""
+        addr_info = [(2, 1, 6, "", ("93.184.216.34", 443))]
+        with (
+            patch.object(skill_service_module.socket, "getaddrinfo", return_value=addr_info),
+            patch.object(skill_service_module.settings, "skill_url_verdict_cache_size", 2),
+        ):
+            for host in ("a", "b", "c"):
+                _is_safe_url(f"https://{host}.example.com/SKILL.md", use_cached_verdict=True)
+
+        assert list(skill_service_module._host_verdicts) == [
+            ("b.example.com", 443),
+            ("c.example.com", 443),
+        ]
+
+
+@pytest.mark.unit
+class TestProbeSkillMd:
+    """Tests for conditional SKILL.md probes."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_is_healthy_and_unchanged(self):
+        """A 304 reports healthy without a new content version."""
+        seen_headers = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.update(request.headers)
+            return httpx.Response(304)
+
+        with patch.object(skill_service_module, "get_http_client", return_value=_client(handler)):
+            result = await _probe_skill_md(
+                "https://raw.githubusercontent.com/org/repo/main/SKILL.md", '"abc"', None
+            )
+
+        assert seen_headers["if-none-match"] == '"abc"'
+        assert result["healthy"] is True
+        assert result["content_version"] is None
+        assert result["etag"] == '"abc"'
+
+    @pytest.mark.asyncio
+    async def test_changed_content_returns_hash_and_validators(self):
+        """A 200 returns the content hash and the new validators."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=SKILL_MD, headers={"ETag": '"def"'})
+
+        with patch.object(skill_service_module, "get_http_client", return_value=_client(handler)):
+            result = await _probe_skill_md(
+                "https://raw.githubusercontent.com/org/repo/main/SKILL.md"
+            )
+
+        assert result["healthy"] is True
+        assert result["content_version"] is not None
+        assert result["etag"] == '"def"'
+
+
+@pytest.mark.unit
+class TestRefreshAllSkillHealth:
+    """Tests for the batch health refresh job."""
+
+    @pytest.mark.asyncio
+    async def test_results_are_persisted_in_one_bulk_update(self):
+        """Health and changed content versions are written with one update_many call."""
+        unchanged = _skill("unchanged", content_version="old", content_etag='"same"')
+        changed = _skill("changed", content_version="old", content_etag='"stale"')
+        missing = _skill("missing")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "/unchanged/" in request.url.path:
+                return httpx.Response(304)
+            if "/changed/" in request.url.path:
+                return httpx.Response(200, content=SKILL_MD, headers={"ETag": '"new"'})
+            return httpx.Response(404)
+
+        repo = MagicMock()
+        repo.list_filtered = AsyncMock(return_value=[unchanged, changed, missing])
+        repo.update_many = AsyncMock(return_value=3)
+        service = SkillService()
+        service._repo = repo
+
+        with patch.object(skill_service_module, "get_http_client", return_value=_client(handler)):
+            summary = await service.refresh_all_skill_health(concurrency=2)
+
+        assert summary == {"checked": 3, "healthy": 2, "unhealthy": 1, "changed": 1}
+        repo.update_many.assert_awaited_once()
+        updates = repo.update_many.await_args.args[0]
+        assert repo.update_many.await_args.kwargs == {"upsert": False}
+        assert "content_version" not in updates["/skills/unchanged"]
+        assert updates["/skills/changed"]["content_etag"] == '"new"'
+        assert updates["/skills/changed"]["content_version"] != "old"
+        assert updates["/skills/missing"]["health_status"] == "unhealthy"
+
+
+@pytest.mark.unit
+class TestSkillMdContentCache:
+    """Tests for fetching SKILL.md through the content cache."""
+
+    URL = "https://raw.githubusercontent.com/org/repo/main/pdf/SKILL.md"
+
+    def _cached(
+        self,
+        age_seconds: float,
+    ) -> dict:
+        return {
+            "url": self.URL,
+            "content": SKILL_MD.decode(),
+            "content_hash": "cachedhash",
+            "etag": '"abc"',
+            "last_modified": None,
+            "metadata": {"name": "cached-name"},
+            "fetched_at": time.time() - age_seconds,
+        }
+
+    @staticmethod
+    def _repo(cached) -> MagicMock:
+        repo = MagicMock()
+        repo.get_cached_content = AsyncMock(return_value=cached)
+        repo.put_cached_content = AsyncMock()
+        return repo
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_is_served_without_a_request(self):
+        """Entries younger than the TTL never hit the network."""
+        repo = self._repo(self._cached(age_seconds=1))
+        client = MagicMock()
+
+        with (
+            patch.object(skill_service_module, "get_skill_repository", return_value=repo),
+            patch.object(skill_service_module, "get_http_client", return_value=client),
+        ):
+            entry = await _fetch_skill_md(self.URL, self.URL)
+
+        assert entry["metadata"] == {"name": "cached-name"}
+        client.get.assert_not_called()
+        repo.put_cached_content.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_revalidated_with_etag(self):
+        """A 304 keeps the cached content and only refreshes fetched_at."""
+        cached = self._cached(age_seconds=10_000)
+        repo = self._repo(cached)
+        seen_headers = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.update(request.headers)
+            return httpx.Response(304)
+
+        with (
+            patch.object(skill_service_module, "get_skill_repository", return_value=repo),
+            patch.object(skill_service_module, "get_http_client", return_value=_client(handler)),
+            patch.object(skill_service_module, "_is_safe_url", return_value=True),
+        ):
+            entry = await _fetch_skill_md(self.URL, self.URL)
+
+        assert seen_headers["if-none-match"] == '"abc"'
+        assert entry["content"] == cached["content"]
+        assert entry["fetched_at"] > cached["fetched_at"]
+        repo.put_cached_content.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_changed_content_is_parsed_and_stored(self):
+        """A 200 with a new body re-extracts metadata and stores the new validators."""
+        repo = self._repo(self._cached(age_seconds=10_000))
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=SKILL_MD, headers={"ETag": '"new"'})
+
+        with (
+            patch.object(skill_service_module, "get_skill_repository", return_value=repo),
+            patch.object(skill_service_module, "get_http_client", return_value=_client(handler)),
+            patch.object(skill_service_module, "_is_safe_url", return_value=True),
+        ):
+            entry = await _fetch_skill_md(self.URL, self.URL)
+
+        assert entry["metadata"]["name"] == "pdf-processing"
+        assert entry["etag"] == '"new"'
+        assert repo.put_cached_content.await_args.args[0]["content_hash"] != "cachedhash"
+
+
+@pytest.mark.unit
+class TestSkillMdCacheCleanup:
+    """Tests for dropping cached SKILL.md bodies."""
+
+    @pytest.mark.asyncio
+    async def test_delete_skill_drops_cached_content(self):
+        """Deleting a skill removes the cache entries of its SKILL.md URLs."""
+        skill = _skill(
+            "pdf",
+            skill_md_raw_url="https://raw.githubusercontent.com/org/repo/main/pdf/SKILL.md?raw",
+        )
+        repo = AsyncMock()
+        repo.get.return_value = skill
+        repo.delete.return_value = True
+        service = SkillService()
+        service._repo = repo
+        service._search_repo = AsyncMock()
+
+        assert await service.delete_skill("/skills/pdf") is True
+
+        repo.delete_cached_content.assert_awaited_once_with(
+            sorted([str(skill.skill_md_url), str(skill.skill_md_raw_url)])
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_stores_fetched_at_as_datetime(self):
+        """The DocumentDB cache stores a datetime for the TTL index and returns epoch seconds."""
+        from registry.repositories.documentdb.skill_repository import (
+            DocumentDBSkillRepository,
+        )
+
+        stored = {}
+
+        async def replace_one(query, doc, upsert):
+            stored.update(doc)
+
+        collection = MagicMock()
+        collection.replace_one = AsyncMock(side_effect=replace_one)
+        collection.find_one = AsyncMock(side_effect=lambda query: dict(stored))
+        repo = DocumentDBSkillRepository()
+        repo._indexes_created = True
+        repo._content_cache_collection = collection
+        fetched_at = time.time()
+
+        await repo.put_cached_content(
+            {"url": "https://example.com/SKILL.md", "fetched_at": fetched_at}
+        )
+        entry = await repo.get_cached_content("https://example.com/SKILL.md")
+
+        assert stored["fetched_at"].tzinfo is not None
+        assert entry["fetched_at"] == pytest.approx(fetched_at)
@@ -0,0 +1,86 @@
+"""
+Unit tests for keyset pages and the ServerResponse cache of the transform service.
+"""
+
+import pytest
+
+from registry.constants import REGISTRY_CONSTANTS
+from registry.services import transform_service
+from registry.services.transform_service import (
+    cursor_to_name_key,
+    get_cached_server_response,
+    transform_to_server_page,
+)
+
+NAMESPACE = REGISTRY_CONSTANTS.ANTHROPIC_SERVER_NAMESPACE
+
+
+def _server(
+    name: str,
+    **kwargs,
+) -> dict:
+    return {"path": f"/{name}", "server_name": name, "health_status": "healthy", **kwargs}
+
+
+@pytest.fixture(autouse=True)
+def clear_server_responses():
+    """Start every test with an empty ServerResponse cache."""
+    transform_service._server_responses.clear()
+    yield
+    transform_service._server_responses.clear()
+
+
+@pytest.mark.unit
+class TestTransformToServerPage:
+    """Tests for building a ServerList from one keyset page."""
+
+    def test_extra_server_sets_next_cursor(self):
+        """A page with limit + 1 servers returns limit servers and a cursor."""
+        result = transform_to_server_page([_server("a"), _server("b"), _server("c")], limit=2)
+
+        assert [s.server.name for s in result.servers] == [f"{NAMESPACE}/a", f"{NAMESPACE}/b"]
+        assert result.metadata.nextCursor == f"{NAMESPACE}/b"
+        assert result.metadata.count == 2
+
+    def test_last_page_has_no_cursor(self):
+        """A short page ends the listing."""
+        result = transform_to_server_page([_server("a")], limit=2)
+
+        assert result.metadata.nextCursor is None
+
+    def test_cursor_maps_to_name_key(self):
+        """Cursors are names in our namespace; anything else restarts the listing."""
+        assert cursor_to_name_key(f"{NAMESPACE}/team/docs") == "team/docs"
+        assert cursor_to_name_key("com.example/other") is None
+        assert cursor_to_name_key(None) is None
+
+
+@pytest.mark.unit
+class TestServerResponseCache:
+    """Tests for caching transformed servers per generation."""
+
+    def test_unchanged_server_reuses_response(self):
+        """The same generation returns the cached object."""
+        first = get_cached_server_response(_server("a", tags=["x"]))
+        second = get_cached_server_response(_server("a", tags=["x"]))
+
+        assert second is first
+
+    def test_changed_server_is_transformed_again(self):
+        """A health or content change yields a new response."""
+        first = get_cached_server_response(_server("a"))
+        unhealthy = get_cached_server_response(_server("a", health_status="unhealthy"))
+        retagged = get_cached_server_response(_server("a", health_status="unhealthy", tags=["y"]))
+
+        assert unhealthy is not first
+        assert retagged is not unhealthy
+        assert retagged.server.meta[f"{NAMESPACE}/internal"]["tags"] == ["y"]
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Least recently used servers are evicted."""
+        monkeypatch.setattr(transform_service, "SERVER_RESPONSE_CACHE_MAX_ENTRIES", 2)
+
+        for name in ("a", "b", "a", "c"):
+            get_cached_server_response(_server(name))
+
+        assert list(transform_service._server_responses) == ["/a", "/c"]
@@ -0,0 +1,169 @@
+"""
+Unit tests for the pooled sync and async clients in api/registry_client.py.
+"""
+
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+import requests
+
+# Load api/registry_client.py under its own name: other tests preload
+# agents/registry_client.py as the `registry_client` module.
+_spec = importlib.util.spec_from_file_location(
+    "api_registry_client",
+    Path(__file__).resolve().parents[2] / "api" / "registry_client.py",
+)
+api_client = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(api_client)
+
+
+def _agent_payload(path: str) -> dict:
+    return {
+        "protocolVersion": "0.3.0",
+        "name": path.strip("/"),
+        "description": "Test agent",
+        "url": f"http://agents{path}",
+        "version": "1.0.0",
+        "path": path,
+    }
+
+
+def _requests_response(
+    status_code: int,
+    payload: dict | None = None,
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = "OK" if status_code < 400 else "Error"
+    response.url = "http://registry/api/agents"
+    response._content = json.dumps(payload or {}).encode()
+    return response
+
+
+@pytest.mark.unit
+class TestRegistryClientSession:
+    """Tests for the pooled requests session of RegistryClient."""
+
+    def test_adapter_is_mounted_with_retry_settings(self):
+        """Both schemes share one pooled adapter that retries only idempotent methods."""
+        client = api_client.RegistryClient("http://registry/", "token", max_retries=4, pool_size=7)
+
+        http_adapter = client._session.get_adapter("http://registry")
+        https_adapter = client._session.get_adapter("https://registry")
+        retry = http_adapter.max_retries
+
+        assert http_adapter is https_adapter
+        assert http_adapter._pool_maxsize == 7
+        assert retry.total == 4
+        assert set(retry.status_forcelist) == {502, 503, 504}
+        assert "POST" not in retry.allowed_methods
+        assert "GET" in retry.allowed_methods
+        client.close()
+
+    def test_context_manager_closes_session(self):
+        """Leaving the with block closes the session."""
+        with patch.object(requests.Session, "close") as close:
+            with api_client.RegistryClient("http://registry", "token"):
+                pass
+
+        close.assert_called_once()
+
+
+@pytest.mark.unit
+class TestRegistryClientBatch:
+    """Tests for RegistryClient batch helpers."""
+
+    def test_partial_failure_keeps_input_order(self):
+        """A failed item yields its exception without affecting the others."""
+        client = api_client.RegistryClient("http://registry", "token")
+
+        def fake_request(method, url, **kwargs):
+            if url.endswith("/missing"):
+                return _requests_response(404)
+            return _requests_response(200, _agent_payload(url.rsplit("/agents", 1)[1]))
+
+        with patch.object(client._session, "request", side_effect=fake_request):
+            results = client.get_many_agents(["/a", "/missing", "/b"], max_concurrency=2)
+
+        assert results[0].path == "/a"
+        assert isinstance(results[1], requests.HTTPError)
+        assert results[2].path == "/b"
+        client.close()
+
+    def test_empty_batch(self):
+        """An empty batch returns no results."""
+        with api_client.RegistryClient("http://registry", "token") as client:
+            assert client.get_many_agents([]) == []
+
+
+@pytest.mark.unit
+class TestAsyncRegistryClient:
+    """Tests for AsyncRegistryClient lifecycle and batch helpers."""
+
+    @staticmethod
+    def _client(handler) -> "api_client.AsyncRegistryClient":
+        client = api_client.AsyncRegistryClient("http://registry", "token")
+        client._client._transport = httpx.MockTransport(handler)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_keeps_input_order(self):
+        """Failed lookups yield their exception in place; others succeed."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path.removeprefix("/api/agents")
+            if path == "/missing":
+                return httpx.Response(404)
+            return httpx.Response(200, json=_agent_payload(path))
+
+        async with self._client(handler) as client:
+            results = await client.get_many_agents(["/a", "/missing", "/b"], max_concurrency=2)
+
+        assert results[0].path == "/a"
+        assert isinstance(results[1], httpx.HTTPStatusError)
+        assert results[2].path == "/b"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than max_concurrency calls are in flight."""
+        client = self._client(lambda request: httpx.Response(200))
+        in_flight = 0
+        peak = 0
+
+        async def call(item: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return item
+
+        results = await client._run_batch(call, range(6), max_concurrency=2)
+
+        assert results == list(range(6))
+        assert peak == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_client(self):
+        """Leaving the async with block closes the pooled httpx client."""
+        async with self._client(lambda request: httpx.Response(200)) as client:
+            inner = client._client
+            assert not inner.is_closed
+
+        assert inner.is_closed
+
+    @pytest.mark.asyncio
+    async def test_close_is_idempotent(self):
+        """close() can be called after the context manager has closed the client."""
+        async with self._client(lambda request: httpx.Response(200)) as client:
+            pass
+
+        await client.close()
+
+        assert client._client.is_closed
@@ -1,7 +1,7 @@
 """Unit tests for backend session Pydantic models and internal API routes."""
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic import ValidationError
@@ -12,6 +12,7 @@ from registry.schemas.backend_session_models import (
     CreateClientSessionRequest,
     CreateClientSessionResponse,
     GetBackendSessionResponse,
+    GetBackendSessionsRequest,
     StoreSessionRequest,
 )
 
@@ -386,6 +387,31 @@ class TestBackendSessionInternalAPI:
                 backend_key="/_vs_backend_weather_",
             )
 
+    @pytest.mark.asyncio
+    async def test_get_backend_sessions(self, mock_repo):
+        """Test multi-key lookup returns the sessions found by the repository."""
+        mock_repo.get_backend_sessions = AsyncMock(
+            return_value={"/_vs_backend_weather_": "backend-sess-xyz"}
+        )
+
+        with patch(
+            "registry.api.internal_routes.get_backend_session_repository",
+            return_value=mock_repo,
+        ):
+            from registry.api.internal_routes import get_backend_sessions
+
+            request = GetBackendSessionsRequest(
+                client_session_id="vs-abc123",
+                backend_keys=["/_vs_backend_weather_", "/_vs_backend_time_"],
+            )
+            result = await get_backend_sessions(request)
+
+            assert result.sessions == {"/_vs_backend_weather_": "backend-sess-xyz"}
+            mock_repo.get_backend_sessions.assert_called_once_with(
+                client_session_id="vs-abc123",
+                backend_keys=["/_vs_backend_weather_", "/_vs_backend_time_"],
+            )
+
     @pytest.mark.asyncio
     async def test_repo_unavailable_returns_503(self):
         """Test that 503 is returned when repo is None."""
@@ -401,3 +427,137 @@ class TestBackendSessionInternalAPI:
             with pytest.raises(HTTPException) as exc_info:
                 await create_client_session(request)
             assert exc_info.value.status_code == 503
+
+
+class _Cursor:
+    """Async iterator over a fixed list of documents."""
+
+    def __init__(self, docs: list[dict]):
+        self._docs = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class TestDocumentDBBackendSessionCache:
+    """Tests for the session cache and batched last_used_at bumps."""
+
+    @pytest.fixture
+    def collection(self):
+        """Mock collection holding one backend session and one client session."""
+        docs = {
+            "vs-abc123:/_vs_backend_weather_": {
+                "_id": "vs-abc123:/_vs_backend_weather_",
+                "backend_session_id": "backend-sess-xyz",
+            },
+            "client:vs-abc123": {"_id": "client:vs-abc123"},
+        }
+        mock = MagicMock()
+        mock.find_one = AsyncMock(side_effect=lambda query, projection: docs.get(query["_id"]))
+        mock.find = MagicMock(
+            side_effect=lambda query, projection: _Cursor(
+                [docs[doc_id] for doc_id in query["_id"]["$in"] if doc_id in docs]
+            )
+        )
+        mock.bulk_write = AsyncMock()
+        mock.replace_one = AsyncMock()
+        mock.delete_one = AsyncMock(return_value=MagicMock(deleted_count=1))
+        return mock
+
+    @pytest.fixture
+    def repo(self, collection):
+        """Repository wired to the mock collection."""
+        from registry.repositories.documentdb.backend_session_repository import (
+            DocumentDBBackendSessionRepository,
+        )
+
+        repo = DocumentDBBackendSessionRepository()
+        repo._collection = collection
+        repo._indexes_created = True
+        return repo
+
+    @pytest.mark.asyncio
+    async def test_reads_are_cached_and_do_not_write(self, repo, collection):
+        """Repeated reads query once and never update the document."""
+        for _ in range(3):
+            assert await repo.get_backend_session("vs-abc123", "/_vs_backend_weather_") == (
+                "backend-sess-xyz"
+            )
+            assert await repo.validate_client_session("vs-abc123") is True
+
+        assert collection.find_one.await_count == 2
+        collection.bulk_write.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_misses_are_not_cached(self, repo, collection):
+        """A missing session is looked up again, so a later store is visible."""
+        assert await repo.get_backend_session("vs-abc123", "/_vs_backend_time_") is None
+        assert await repo.get_backend_session("vs-abc123", "/_vs_backend_time_") is None
+        assert await repo.validate_client_session("vs-unknown") is False
+
+        assert collection.find_one.await_count == 3
+        assert not repo._pending_touches
+
+    @pytest.mark.asyncio
+    async def test_touches_are_flushed_in_one_bulk_write(self, repo, collection):
+        """Accesses are coalesced per session into one unordered bulk_write."""
+        for _ in range(3):
+            await repo.get_backend_session("vs-abc123", "/_vs_backend_weather_")
+            await repo.validate_client_session("vs-abc123")
+
+        assert await repo.flush_touches() == 2
+        assert await repo.flush_touches() == 0
+
+        collection.bulk_write.assert_awaited_once()
+        operations = collection.bulk_write.await_args.args[0]
+        assert collection.bulk_write.await_args.kwargs == {"ordered": False}
+        assert {op._filter["_id"] for op in operations} == {
+            "vs-abc123:/_vs_backend_weather_",
+            "client:vs-abc123",
+        }
+        assert all("$max" in op._doc for op in operations)
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_touches(self, repo, collection):
+        """Bumps that fail to write are retried by the next flush."""
+        collection.bulk_write.side_effect = [Exception("connection reset"), None]
+        await repo.validate_client_session("vs-abc123")
+
+        assert await repo.flush_touches() == 0
+        assert await repo.flush_touches() == 1
+
+    @pytest.mark.asyncio
+    async def test_multi_key_lookup_uses_one_query(self, repo, collection):
+        """Uncached keys are fetched with a single $in query and then cached."""
+        keys = ["/_vs_backend_weather_", "/_vs_backend_time_"]
+
+        first = await repo.get_backend_sessions("vs-abc123", keys)
+        second = await repo.get_backend_sessions("vs-abc123", keys)
+
+        assert first == second == {"/_vs_backend_weather_": "backend-sess-xyz"}
+        assert collection.find.call_count == 2
+        assert collection.find.call_args.args[0] == {
+            "_id": {"$in": ["vs-abc123:/_vs_backend_time_"]}
+        }
+
+    @pytest.mark.asyncio
+    async def test_store_and_delete_update_the_cache(self, repo, collection):
+        """A stored session is served from the cache; a deleted one is evicted."""
+        await repo.store_backend_session(
+            "vs-abc123", "/_vs_backend_time_", "backend-sess-new", "admin", "/virtual/my-server"
+        )
+        assert await repo.get_backend_session("vs-abc123", "/_vs_backend_time_") == (
+            "backend-sess-new"
+        )
+        collection.find_one.assert_not_awaited()
+
+        await repo.delete_backend_session("vs-abc123", "/_vs_backend_time_")
+
+        assert await repo.get_backend_session("vs-abc123", "/_vs_backend_time_") is None
+        assert not repo._pending_touches
@@ -0,0 +1,89 @@
+"""
+Unit tests for registry.common.scopes_loader.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from registry.common.scopes_loader import build_scopes_config, load_scopes_from_repository
+
+GROUPS = [
+    {
+        "scope_name": "mcp-servers-read",
+        "group_mappings": ["developers", "admins"],
+        "server_access": [
+            {"server": "docs", "methods": ["tools/list"]},
+            {"server": "search", "methods": ["all"]},
+        ],
+        "ui_permissions": {"list_service": ["docs"]},
+    },
+    {
+        "scope_name": "mcp-servers-admin",
+        "group_mappings": ["admins", "admins"],
+        "server_access": [{"server": "docs", "methods": ["all"]}],
+        "ui_permissions": {},
+    },
+]
+
+
+class TestBuildScopesConfig:
+    """Tests for building scopes config lookups from group documents."""
+
+    def test_builds_all_lookups(self):
+        """Group mappings, scope rules and UI scopes are built together."""
+        config, _ = build_scopes_config(GROUPS)
+
+        assert config["group_mappings"] == {
+            "developers": ["mcp-servers-read"],
+            "admins": ["mcp-servers-read", "mcp-servers-admin"],
+        }
+        assert config["mcp-servers-admin"] == [{"server": "docs", "methods": ["all"]}]
+        assert config["UI-Scopes"] == {"mcp-servers-read": {"list_service": ["docs"]}}
+
+    def test_builds_server_scopes(self):
+        """The server -> scopes table is returned alongside the config."""
+        _, server_scopes = build_scopes_config(GROUPS)
+
+        assert server_scopes == {
+            "docs": ["mcp-servers-read", "mcp-servers-admin"],
+            "search": ["mcp-servers-read"],
+        }
+
+    def test_only_yaml_keys_are_returned(self):
+        """The config has the same keys as scopes.yml, so every other key is a scope."""
+        config, _ = build_scopes_config(GROUPS)
+
+        assert set(config) == {
+            "group_mappings",
+            "UI-Scopes",
+            "mcp-servers-read",
+            "mcp-servers-admin",
+        }
+
+    def test_empty_groups(self):
+        """No groups produce empty lookups."""
+        config, server_scopes = build_scopes_config([])
+
+        assert config == {"group_mappings": {}, "UI-Scopes": {}}
+        assert server_scopes == {}
+
+
+class TestLoadScopesFromRepository:
+    """Tests for loading scopes through the repository."""
+
+    @pytest.mark.asyncio
+    async def test_uses_single_bulk_load(self):
+        """The loader reads every group with one load_all_groups() call."""
+        scope_repo = MagicMock()
+        scope_repo.load_all_groups = AsyncMock(return_value=GROUPS)
+
+        with patch(
+            "registry.repositories.factory.get_scope_repository",
+            return_value=scope_repo,
+        ):
+            config = await load_scopes_from_repository(max_retries=1)
+
+        scope_repo.load_all_groups.assert_awaited_once()
+        scope_repo.get_group.assert_not_called()
+        assert "mcp-servers-read" in config
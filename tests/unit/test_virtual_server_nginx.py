@@ -378,6 +378,46 @@ class TestWriteVirtualServerMappings:
         assert "search" in written_data["tool_backend_map"]
         assert "/_vs_backend" in written_data["tool_backend_map"]["search"]["backend_location"]
 
+    @pytest.mark.asyncio
+    async def test_shared_backend_is_read_once(self, mock_server_repository):
+        """Virtual servers sharing a backend read its document once per regeneration."""
+        servers = [
+            _make_vs_config(
+                path=f"/virtual/vs{i}",
+                server_name=f"VS {i}",
+                tool_mappings=[
+                    ToolMapping(tool_name="search", backend_server_path="/github"),
+                    ToolMapping(tool_name="issues", backend_server_path="/github"),
+                ],
+            )
+            for i in range(3)
+        ]
+        mock_server_repository.get.return_value = {
+            "server_name": "GitHub",
+            "tool_list": [
+                {"name": "search", "description": "Search", "inputSchema": {}},
+                {"name": "issues", "description": "Issues", "inputSchema": {}},
+            ],
+        }
+
+        written = []
+
+        with (
+            patch("registry.core.nginx_service.Path") as mock_path_cls,
+            patch("json.dump", side_effect=lambda data, f, **kwargs: written.append(data)),
+            patch("builtins.open", mock_open()),
+        ):
+            mock_path_cls.return_value = MagicMock()
+
+            from registry.core.nginx_service import NginxConfigService
+
+            service = NginxConfigService()
+            await service._write_virtual_server_mappings(servers)
+
+        mock_server_repository.get.assert_awaited_once_with("/github")
+        assert len(written) == 3
+        assert [t["description"] for t in written[0]["tools"]] == ["Search", "Issues"]
+
 
 class TestSanitizePathForLocation:
     """Tests for _sanitize_path_for_location."""
@@ -1,10 +1,12 @@
 """Unit tests for virtual server service layer."""
 
 import logging
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from registry.core.config import settings
 from registry.exceptions import (
     VirtualServerAlreadyExistsError,
     VirtualServerNotFoundError,
@@ -21,6 +23,7 @@ from registry.services.virtual_server_service import (
     _generate_path_from_name,
     _get_effective_tool_name,
     _get_unique_backends,
+    invalidate_backend_tools,
 )
 
 # --- Unit tests for helper functions ---
@@ -1579,3 +1582,133 @@ class TestVirtualServerRating:
         assert len(result) == 1
         assert result[0].num_stars == 4.5
         assert len(result[0].rating_details) == 1
+
+
+# --- Unit tests for the backend tool index and resolved tool cache ---
+
+
+class TestToolResolutionCache:
+    """Tests for caching backend tool indexes and resolved tool lists."""
+
+    BACKENDS = {
+        "/github": {
+            "tool_list": [
+                {"name": "search", "description": "Search repos"},
+                {"name": "issues", "description": "List issues"},
+            ],
+        },
+        "/github:v2.0.0": {
+            "tool_list": [{"name": "search", "description": "Search repos (v2)"}],
+        },
+        "/jira": {"tool_list": [{"name": "tickets", "description": "List tickets"}]},
+    }
+
+    @pytest.fixture
+    def mock_vs_repo(self):
+        """Create mock virtual server repository returning one config."""
+        repo = AsyncMock()
+        repo.get.return_value = VirtualServerConfig(
+            path="/virtual/dev",
+            server_name="Dev",
+            tool_mappings=[
+                ToolMapping(tool_name="search", backend_server_path="/github"),
+                ToolMapping(tool_name="issues", backend_server_path="/github"),
+                ToolMapping(
+                    tool_name="search",
+                    alias="search_v2",
+                    backend_server_path="/github",
+                    backend_version="v2.0.0",
+                ),
+                ToolMapping(tool_name="tickets", backend_server_path="/jira"),
+            ],
+        )
+        return repo
+
+    @pytest.fixture
+    def mock_server_repo(self):
+        """Create mock server repository serving BACKENDS."""
+        repo = AsyncMock()
+        repo.get.side_effect = lambda server_id: self.BACKENDS.get(server_id)
+        return repo
+
+    @pytest.fixture
+    def service(self, mock_vs_repo, mock_server_repo):
+        """Create service with mocked repos."""
+        with (
+            patch(
+                "registry.services.virtual_server_service.get_virtual_server_repository",
+                return_value=mock_vs_repo,
+            ),
+            patch(
+                "registry.services.virtual_server_service.get_server_repository",
+                return_value=mock_server_repo,
+            ),
+        ):
+            return VirtualServerService()
+
+    @pytest.mark.asyncio
+    async def test_each_backend_document_is_read_once(self, service, mock_server_repo):
+        """Mappings sharing a backend read its document once; pins read the version."""
+        tools = await service.resolve_tools("/virtual/dev")
+
+        read_ids = sorted(call.args[0] for call in mock_server_repo.get.await_args_list)
+        assert read_ids == ["/github", "/github:v2.0.0", "/jira"]
+        assert [t.description for t in tools] == [
+            "Search repos",
+            "List issues",
+            "Search repos (v2)",
+            "List tickets",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resolved_list_is_reused(self, service, mock_vs_repo, mock_server_repo):
+        """A second resolve returns the materialized list without any reads."""
+        first = await service.resolve_tools("/virtual/dev")
+        second = await service.resolve_tools("/virtual/dev")
+
+        assert first == second
+        mock_vs_repo.get.assert_awaited_once()
+        assert mock_server_repo.get.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_backend_update_invalidates_its_documents(self, service, mock_server_repo):
+        """Invalidating a backend drops its version documents and resolved lists."""
+        await service.resolve_tools("/virtual/dev")
+        mock_server_repo.get.reset_mock()
+
+        invalidate_backend_tools("/github")
+        await service.resolve_tools("/virtual/dev")
+
+        read_ids = sorted(call.args[0] for call in mock_server_repo.get.await_args_list)
+        assert read_ids == ["/github", "/github:v2.0.0"]
+
+    @pytest.mark.asyncio
+    async def test_cached_tools_expire_after_ttl(self, service, mock_vs_repo, mock_server_repo):
+        """Entries older than the TTL are read again (writes by other replicas)."""
+        await service.resolve_tools("/virtual/dev")
+        mock_server_repo.get.reset_mock()
+
+        later = time.monotonic() + settings.virtual_server_tools_cache_ttl + 1
+        with patch("registry.services.virtual_server_service.time.monotonic", return_value=later):
+            await service.resolve_tools("/virtual/dev")
+
+        assert mock_vs_repo.get.await_count == 2
+        read_ids = sorted(call.args[0] for call in mock_server_repo.get.await_args_list)
+        assert read_ids == ["/github", "/github:v2.0.0", "/jira"]
+
+    @pytest.mark.asyncio
+    async def test_virtual_server_update_invalidates_resolved_list(self, service, mock_vs_repo):
+        """Updating the virtual server resolves its tools again on the next call."""
+        await service.resolve_tools("/virtual/dev")
+        mock_vs_repo.update.return_value = mock_vs_repo.get.return_value
+
+        with (
+            patch.object(service, "_trigger_nginx_reload", new=AsyncMock()),
+            patch.object(service, "_index_for_search", new=AsyncMock()),
+        ):
+            await service.update_virtual_server(
+                "/virtual/dev", UpdateVirtualServerRequest(description="Updated")
+            )
+        await service.resolve_tools("/virtual/dev")
+
+        assert mock_vs_repo.get.await_count == 3
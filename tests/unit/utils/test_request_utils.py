@@ -1,12 +1,18 @@
 """
 Unit tests for registry.utils.request_utils.
 
-Validates IP extraction and sanitization from proxied requests.
+Validates IP extraction and sanitization from proxied requests,
+and ETag conditional request helpers.
 """
 
 from unittest.mock import MagicMock
 
-from registry.utils.request_utils import get_client_ip
+from registry.utils.request_utils import (
+    compute_etag,
+    conditional_json_response,
+    etag_matches,
+    get_client_ip,
+)
 
 
 def _make_request(headers=None, client_host="127.0.0.1", client=None):
@@ -85,3 +91,42 @@ class TestGetClientIp:
             client_host="10.0.0.1",
         )
         assert get_client_ip(request) == "10.0.0.1"
+
+
+class TestEtagHelpers:
+    """Tests for compute_etag and etag_matches."""
+
+    def test_etag_is_quoted_and_stable(self):
+        """Same body yields the same quoted ETag, different body a different one."""
+        etag = compute_etag(b'{"servers": []}')
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == compute_etag(b'{"servers": []}')
+        assert etag != compute_etag(b'{"servers": [1]}')
+
+    def test_matches_exact_weak_and_list(self):
+        """If-None-Match matches exact, weak and comma-separated validators."""
+        etag = compute_etag(b"body")
+        assert etag_matches(_make_request(headers={"If-None-Match": etag}), etag)
+        assert etag_matches(_make_request(headers={"If-None-Match": f"W/{etag}"}), etag)
+        assert etag_matches(_make_request(headers={"If-None-Match": f'"other", {etag}'}), etag)
+        assert etag_matches(_make_request(headers={"If-None-Match": "*"}), etag)
+
+    def test_no_match(self):
+        """Missing or different If-None-Match does not match."""
+        etag = compute_etag(b"body")
+        assert not etag_matches(_make_request(), etag)
+        assert not etag_matches(_make_request(headers={"If-None-Match": '"stale"'}), etag)
+
+    def test_conditional_json_response(self):
+        """The payload is served with its ETag, or as an empty 304 once the client has it."""
+        payload = {"agents": [{"path": "/a"}], "total_count": 1}
+
+        response = conditional_json_response(_make_request(), payload)
+        etag = response.headers["ETag"]
+        cached = conditional_json_response(_make_request(headers={"If-None-Match": etag}), payload)
+
+        assert response.status_code == 200
+        assert response.body == b'{"agents": [{"path": "/a"}], "total_count": 1}'
+        assert cached.status_code == 304
+        assert cached.body == b""
+        assert cached.headers["ETag"] == etag